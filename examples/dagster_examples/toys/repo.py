@@ -2,6 +2,7 @@ from dagster import RepositoryDefinition
 
 from dagster_examples.toys.error_monster import define_error_monster_pipeline
 from dagster_examples.toys.sleepy import define_sleepy_pipeline
+from dagster_examples.toys.stragglers import define_stragglers_pipeline
 from dagster_examples.toys.log_spew import define_spew_pipeline
 from dagster_examples.toys.many_events import define_many_events_pipeline
 from dagster_examples.toys.composition import define_composition_pipeline
@@ -12,6 +13,7 @@ def define_repo():
         name='toys_repository',
         pipeline_dict={
             'sleepy': define_sleepy_pipeline,
+            'stragglers': define_stragglers_pipeline,
             'error_monster': define_error_monster_pipeline,
             'log_spew': define_spew_pipeline,
             'many_events': define_many_events_pipeline,
@@ -0,0 +1,107 @@
+'''A skewed DAG for measuring the makespan of the parallel engines.
+
+Two chains of sleeping solids run side by side. The first chain starts with a long step and the
+second chain ends with one, so a level-by-level scheduler waits on a straggler twice while a
+dependency-driven scheduler only has to wait on each chain once:
+
+    level barrier makespan:      2 * long + (chain_length - 2) * short
+    dependency driven makespan:  long + (chain_length - 1) * short
+
+Run this module directly to benchmark the multiprocess engine against those two bounds.
+'''
+import time
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    Field,
+    Float,
+    InputDefinition,
+    Int,
+    ModeDefinition,
+    MultiprocessExecutorConfig,
+    OutputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    RunStorageMode,
+    SolidInstance,
+    execute_pipeline,
+    solid,
+)
+
+CHAIN_LENGTH = 4
+LONG_SECONDS = 4.0
+SHORT_SECONDS = 0.5
+
+
+@solid(
+    inputs=[InputDefinition('units', Int)],
+    outputs=[OutputDefinition(Int)],
+    config_field=Field(Float, is_optional=True, default_value=SHORT_SECONDS),
+)
+def straggler_sleep(context, units):
+    time.sleep(context.solid_config)
+    return units + 1
+
+
+@solid(outputs=[OutputDefinition(Int)])
+def straggler_start(_context):
+    return 0
+
+
+def _chain_name(chain, index):
+    return 'chain_{chain}_{index}'.format(chain=chain, index=index)
+
+
+def define_stragglers_pipeline():
+    dependencies = {SolidInstance('straggler_start', alias='start'): {}}
+    for chain in ('a', 'b'):
+        for index in range(CHAIN_LENGTH):
+            upstream = 'start' if index == 0 else _chain_name(chain, index - 1)
+            dependencies[SolidInstance('straggler_sleep', alias=_chain_name(chain, index))] = {
+                'units': DependencyDefinition(upstream)
+            }
+
+    return PipelineDefinition(
+        name='stragglers',
+        solids=[straggler_start, straggler_sleep],
+        dependencies=dependencies,
+        mode_definitions=[ModeDefinition()],
+    )
+
+
+def stragglers_environment(long_seconds=LONG_SECONDS, short_seconds=SHORT_SECONDS):
+    solids = {}
+    for chain in ('a', 'b'):
+        for index in range(CHAIN_LENGTH):
+            solids[_chain_name(chain, index)] = {'config': short_seconds}
+
+    solids[_chain_name('a', 0)] = {'config': long_seconds}
+    solids[_chain_name('b', CHAIN_LENGTH - 1)] = {'config': long_seconds}
+    return {'solids': solids, 'storage': {'filesystem': {}}}
+
+
+if __name__ == '__main__':
+    start_time = time.time()
+    result = execute_pipeline(
+        define_stragglers_pipeline(),
+        environment_dict=stragglers_environment(),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_stragglers_pipeline), max_concurrent=4
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    makespan = time.time() - start_time
+    assert result.success
+
+    print(
+        'Level barrier makespan (compute only): ',
+        2 * LONG_SECONDS + (CHAIN_LENGTH - 2) * SHORT_SECONDS,
+    )
+    print(
+        'Dependency driven makespan (compute only): ',
+        LONG_SECONDS + (CHAIN_LENGTH - 1) * SHORT_SECONDS,
+    )
+    print('Measured makespan (including process startup): ', makespan)
@@ -10,6 +10,7 @@ from dagster_examples.toys.many_events import define_many_events_pipeline
 from dagster_examples.toys.resources import define_resource_pipeline
 from dagster_examples.toys.error_monster import define_error_monster_pipeline
 from dagster_examples.toys.sleepy import define_sleepy_pipeline
+from dagster_examples.toys.stragglers import define_stragglers_pipeline, stragglers_environment
 from dagster_examples.toys.hammer import define_hammer_pipeline
 from dagster_examples.toys.log_spew import define_spew_pipeline
 
@@ -28,6 +29,13 @@ def test_sleepy_pipeline():
     assert execute_pipeline(define_sleepy_pipeline()).success
 
 
+def test_stragglers_pipeline():
+    assert execute_pipeline(
+        define_stragglers_pipeline(),
+        environment_dict=stragglers_environment(long_seconds=0.01, short_seconds=0.0),
+    ).success
+
+
 def test_hammer_pipeline():
     assert execute_pipeline(define_hammer_pipeline()).success
 
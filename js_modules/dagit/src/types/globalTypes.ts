@@ -36,6 +36,7 @@ export enum StepKind {
   INPUT_EXPECTATION = "INPUT_EXPECTATION",
   INPUT_THUNK = "INPUT_THUNK",
   JOIN = "JOIN",
+  MAPPED_COMPUTE = "MAPPED_COMPUTE",
   MARSHAL_OUTPUT = "MARSHAL_OUTPUT",
   MATERIALIZATION_THUNK = "MATERIALIZATION_THUNK",
   OUTPUT_EXPECTATION = "OUTPUT_EXPECTATION",
@@ -1,113 +1,156 @@
+from collections import namedtuple
 import itertools
+import threading
 
 import dask
 import dask.distributed
 
 from dagster import check, ExecutionTargetHandle, RunConfig, RunStorageMode
-
+from dagster.core.engine.engine_inprocess import execute_step_group_in_process
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.api import create_execution_plan, scoped_pipeline_context
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.execution.results import PipelineExecutionResult
-
-from dagster_graphql.cli import execute_query
-from dagster_graphql.util import (
-    dagster_event_from_dict,
-    get_log_message_event_fragment,
-    get_step_event_fragment,
-)
+from dagster.core.storage.intermediates_manager import InMemoryIntermediatesManager
+from dagster.utils import merge_dicts
 
 from .config import DaskConfig
-from .query import QUERY_TEMPLATE
 
 
-def query_on_dask_worker(handle, query, variables, dependencies):  # pylint: disable=unused-argument
-    '''Note that we need to pass "dependencies" to ensure Dask sequences futures during task
-    scheduling, even though we do not use this argument within the function.
-
-    We also pass in 'raise_on_error' here, because otherwise (currently) very little information
-    is propagated to the dask master from the workers about the state of execution; we should at
-    least inform the user of exceptions.
+class _WorkerPipelineContext(
+    namedtuple('_WorkerPipelineContext', 'context_manager pipeline_context execution_plan')
+):
+    '''The pipeline context and execution plan of a run, as created by a Dask worker the first
+    time it executes a step of the run. pipeline_context is a failure event instead if the
+    context could not be created.
     '''
-    res = execute_query(handle, query, variables, raise_on_error=True)
-    handle_errors(res)
-    return handle_result(res)
 
 
-def handle_errors(res):
-    if res.get('errors'):
-        raise Exception('Internal error in GraphQL request. Response: {}'.format(res))
+class DaskStepResult(namedtuple('_DaskStepResult', 'events values')):
+    '''The result of the Dask task executing a step.
 
-    if not res.get('data', {}).get('startPipelineExecution', {}).get('__typename'):
-        raise Exception('Unexpected response type. Response: {}'.format(res))
+    Args:
+        events (List[DagsterEvent]): The events of the step.
+        values (Dict[StepOutputHandle, Any]): The values of the outputs of the step, when the run
+            uses in-memory storage. Dask hands them to the tasks of the steps consuming them,
+            and keeps, moves or spills them to disk as it does the result of any other task.
+    '''
 
 
-def handle_result(res):
-    res_data = res['data']['startPipelineExecution']
+# run id -> _WorkerPipelineContext, for each run this worker process has executed steps of
+_worker_pipeline_contexts = {}
+_worker_pipeline_contexts_lock = threading.Lock()
+
+
+def _get_worker_pipeline_context(handle, env_config, run_config):
+    # Dask workers execute tasks from a pool of threads, which share the pipeline context of a
+    # run just like the steps executed by the ThreadPoolEngine do
+    with _worker_pipeline_contexts_lock:
+        if run_config.run_id not in _worker_pipeline_contexts:
+            pipeline = handle.build_pipeline_definition()
+            context_manager = scoped_pipeline_context(pipeline, env_config, run_config)
+            pipeline_context = context_manager.__enter__()
+            execution_plan = (
+                None
+                if isinstance(pipeline_context, DagsterEvent)
+                else ExecutionPlan.build(
+                    pipeline_context.pipeline_def, pipeline_context.environment_config
+                )
+            )
+            _worker_pipeline_contexts[run_config.run_id] = _WorkerPipelineContext(
+                context_manager, pipeline_context, execution_plan
+            )
+        return _worker_pipeline_contexts[run_config.run_id]
 
-    res_type = res_data['__typename']
 
-    if res_type == 'InvalidStepError':
-        raise Exception('invalid step {step_key}'.format(step_key=res_data['invalidStepKey']))
+def release_worker_pipeline_context(run_id):
+    '''Tears down the pipeline context this worker created for the run, releasing its resources.
+    Run on every worker once the run has completed.
+    '''
+    with _worker_pipeline_contexts_lock:
+        worker_pipeline_context = _worker_pipeline_contexts.pop(run_id, None)
 
-    if res_type == 'InvalidOutputError':
-        raise Exception(
-            'invalid output {output} for step {step_key}'.format(
-                output=res_data['invalidOutputName'], step_key=res_data['stepKey']
-            )
-        )
+    if worker_pipeline_context is not None:
+        worker_pipeline_context.context_manager.__exit__(None, None, None)
 
-    if res_type == 'PipelineConfigValidationInvalid':
-        errors = [err['message'] for err in res_data['errors']]
-        raise Exception(
-            'Pipeline configuration invalid:\n{errors}'.format(errors='\n'.join(errors))
-        )
 
-    if res_type == 'PipelineNotFoundError':
-        raise Exception(
-            'Pipeline "{pipeline_name}" not found: {message}:'.format(
-                pipeline_name=res_data['pipelineName'], message=res_data['message']
-            )
-        )
+def execute_step_on_dask_worker(handle, env_config, run_config, step_key, dependencies):
+    '''Executes a single step against the pipeline context this worker caches for the run, and
+    returns its DaskStepResult.
 
-    if res_type == 'PythonError':
-        raise Exception(
-            'Subplan execution failed: {message}\n{stack}'.format(
-                message=res_data['message'], stack=res_data['stack']
+    dependencies holds the DaskStepResults of the steps this step depends on. Passing their
+    futures ensures Dask schedules this step after them. If any of them did not succeed, the step
+    is skipped.
+    '''
+    worker_pipeline_context = _get_worker_pipeline_context(handle, env_config, run_config)
+    pipeline_context = worker_pipeline_context.pipeline_context
+    if isinstance(pipeline_context, DagsterEvent):
+        return DaskStepResult([pipeline_context], {})
+
+    execution_plan = worker_pipeline_context.execution_plan
+    step = execution_plan.get_step_by_key(step_key)
+
+    failed_inputs = sorted(
+        set(
+            event.step_key
+            for dependency in dependencies
+            for event in dependency.events
+            if event.is_step_failure or event.event_type == DagsterEventType.STEP_SKIPPED
+        )
+    )
+    if failed_inputs:
+        step_context = pipeline_context.for_step(step)
+        step_context.log.info(
+            ('Dependencies for step {step} failed: {failed_inputs}. Not executing.').format(
+                step=step_key, failed_inputs=failed_inputs
             )
         )
+        return DaskStepResult([DagsterEvent.step_skipped_event(step_context)], {})
 
-    if res_type == 'StartPipelineExecutionSuccess':
-        pipeline_name = res_data['run']['pipeline']['name']
-
-        skip_events = {
-            'LogMessageEvent',
-            'PipelineStartEvent',
-            'PipelineSuccessEvent',
-            'PipelineInitFailureEvent',
-            'PipelineFailureEvent',
-        }
-
-        return [
-            dagster_event_from_dict(e, pipeline_name)
-            for e in res_data['run']['logs']['nodes']
-            if e['__typename'] not in skip_events
-        ]
+    if pipeline_context.intermediates_manager.storage_mode != RunStorageMode.IN_MEMORY:
+        return DaskStepResult(
+            list(execute_step_group_in_process(pipeline_context, execution_plan, [step_key])), {}
+        )
 
-    raise Exception('unexpected result type')
+    # Rather than in the memory of whichever worker produced them, the inputs of the step are
+    # the values Dask handed over from the tasks it depends on
+    intermediates_manager = InMemoryIntermediatesManager()
+    for dependency in dependencies:
+        for step_output_handle, value in dependency.values.items():
+            intermediates_manager.set_intermediate(None, None, step_output_handle, value)
+
+    events = list(
+        execute_step_group_in_process(
+            pipeline_context.with_intermediates_manager(intermediates_manager),
+            execution_plan,
+            [step_key],
+        )
+    )
 
+    step_output_handles = [
+        StepOutputHandle.from_step(step, step_output.name) for step_output in step.step_outputs
+    ]
+    return DaskStepResult(
+        events,
+        {
+            step_output_handle: intermediates_manager.values[step_output_handle]
+            for step_output_handle in step_output_handles
+            if step_output_handle in intermediates_manager.values
+        },
+    )
 
-def build_graphql_query():
-    log_message_event_fragment = get_log_message_event_fragment()
-    step_event_fragment = get_step_event_fragment()
 
-    return '\n'.join(
-        (
-            QUERY_TEMPLATE.format(
-                step_event_fragment=step_event_fragment.include_key,
-                log_message_event_fragment=log_message_event_fragment.include_key,
-            ),
-            step_event_fragment.fragment,
-            log_message_event_fragment.fragment,
-        )
+def _client_step_result(step_result, step_output_handles):
+    # What the client gathers for a step: its events, and only those of its values that are
+    # results of the run
+    return DaskStepResult(
+        step_result.events,
+        {
+            step_output_handle: value
+            for step_output_handle, value in step_result.values.items()
+            if step_output_handle in step_output_handles
+        },
     )
 
 
@@ -118,84 +161,99 @@ def execute_on_dask(
 
     env_config = check.opt_dict_param(env_config, 'env_config', key_type=str)
     dask_config = check.opt_inst_param(dask_config, 'dask_config', DaskConfig, DaskConfig())
-    run_config = check.opt_inst_param(
-        run_config, 'run_config', RunConfig, RunConfig(storage_mode=RunStorageMode.FILESYSTEM)
-    )
+    # The storage of the run is selected by the storage section of env_config, unless run_config
+    # overrides it
+    run_config = check.opt_inst_param(run_config, 'run_config', RunConfig, RunConfig())
     pipeline = handle.build_pipeline_definition()
     mode = check.opt_str_param(mode, 'mode', pipeline.get_default_mode_name())
+    run_config = RunConfig(**merge_dicts(run_config._asdict(), {'mode': mode}))
 
     # Checks to ensure storage is compatible with Dask configuration
     storage = env_config.get('storage')
     check.invariant(storage.keys(), 'Must specify storage to use Dask execution')
 
+    # With in-memory storage, values are handed from step to step by Dask itself
     if dask_config.is_remote_execution:
         check.invariant(
-            storage.get('s3'),
-            'Must use S3 storage with non-local Dask address {dask_address}'.format(
+            storage.get('s3') or 'in_memory' in storage,
+            'Must use S3 or in-memory storage with non-local Dask address {dask_address}'.format(
                 dask_address=dask_config.address
             ),
         )
-    else:
-        check.invariant(
-            not storage.get('in_memory'),
-            'Cannot use in-memory storage with Dask, use filesystem or S3',
-        )
+
+    check.invariant(
+        not run_config.loggers, 'Cannot inject loggers via RunConfig with the Dask executor'
+    )
+    check.invariant(not run_config.event_callback, 'Cannot use event_callback with Dask executor')
 
     execution_plan = create_execution_plan(pipeline, env_config, mode=mode)
 
     step_levels = execution_plan.topological_step_levels()
 
-    query = build_graphql_query()
-
     with scoped_pipeline_context(pipeline, env_config, run_config) as pipeline_context:
+        # The values of these outputs are brought back to the client, so that they can be read
+        # from the result of the run when it uses in-memory storage
+        result_output_handles = set(execution_plan.get_solid_result_outputs())
+
         with dask.distributed.Client(**dask_config.build_dict(pipeline.name)) as client:
-            execution_futures = []
+            client_futures = []
             execution_futures_dict = {}
 
-            for step_level in step_levels:
-                for step in step_level:
-                    step_context = pipeline_context.for_step(step)
-
-                    check.invariant(
-                        not step_context.run_config.loggers,
-                        'Cannot inject loggers via RunConfig with the Dask executor',
-                    )
-
-                    check.invariant(
-                        not step_context.event_callback,
-                        'Cannot use event_callback with Dask executor',
-                    )
-
-                    # We ensure correctness in sequencing by letting Dask schedule futures and
-                    # awaiting dependencies within each step.
-                    dependencies = [
-                        execution_futures_dict[ni.prev_output_handle.step_key]
-                        for ni in step.step_inputs
-                    ]
-
-                    variables = {
-                        'executionParams': {
-                            'selector': {'name': pipeline.name},
-                            'environmentConfigData': env_config,
-                            'mode': mode,
-                            'executionMetadata': {'runId': run_config.run_id},
-                            'stepKeys': [step.key],
-                        }
-                    }
-
-                    future = client.submit(
-                        query_on_dask_worker, handle, query, variables, dependencies
-                    )
-
-                    execution_futures.append(future)
-                    execution_futures_dict[step.key] = future
-
-            # This tells Dask to awaits the step executions and retrieve their results to the master
-            execution_step_events = client.gather(execution_futures)
-
-            # execution_step_events is now a list of lists, the inner lists contain the dagster
-            # events emitted by each step
-            event_list = list(itertools.chain.from_iterable(execution_step_events))
+            try:
+                for step_level in step_levels:
+                    for step in step_level:
+                        # We ensure correctness in sequencing by letting Dask schedule futures and
+                        # awaiting dependencies within each step.
+                        dependencies = [
+                            execution_futures_dict[ni.prev_output_handle.step_key]
+                            for ni in step.step_inputs
+                        ]
+
+                        future = client.submit(
+                            execute_step_on_dask_worker,
+                            handle,
+                            env_config,
+                            run_config,
+                            step.key,
+                            dependencies,
+                            # The key of a task must be unique within the cluster
+                            key='{run_id}.{step_key}'.format(
+                                run_id=run_config.run_id, step_key=step.key
+                            ),
+                        )
+
+                        execution_futures_dict[step.key] = future
+                        client_futures.append(
+                            client.submit(
+                                _client_step_result,
+                                future,
+                                result_output_handles,
+                                key='{run_id}.{step_key}.client'.format(
+                                    run_id=run_config.run_id, step_key=step.key
+                                ),
+                            )
+                        )
+
+                # Once the steps consuming them have completed, Dask can release the values of
+                # outputs that are not results of the run
+                execution_futures_dict.clear()
+
+                # This tells Dask to awaits the step executions and retrieve their results to the
+                # master
+                step_results = client.gather(client_futures)
+            finally:
+                client.run(release_worker_pipeline_context, run_config.run_id)
+
+            event_list = list(
+                itertools.chain.from_iterable(step_result.events for step_result in step_results)
+            )
+
+            if pipeline_context.intermediates_manager.storage_mode == RunStorageMode.IN_MEMORY:
+                for step_result in step_results:
+                    for step_output_handle, value in step_result.values.items():
+                        pipeline_context.intermediates_manager.set_intermediate(
+                            None, None, step_output_handle, value
+                        )
 
             return PipelineExecutionResult(
                 pipeline,
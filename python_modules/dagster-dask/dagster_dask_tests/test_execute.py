@@ -1,6 +1,14 @@
 from tornado import gen
 
-from dagster import solid, ExecutionTargetHandle, ModeDefinition, PipelineDefinition
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    ModeDefinition,
+    PipelineDefinition,
+    lambda_solid,
+    solid,
+)
 from dagster.core.execution.config import RunConfig
 from dagster.core.storage.runs import RunStorageMode
 from dagster.core.test_utils import retry
@@ -31,3 +39,31 @@ def test_execute_on_dask():
         dask_config=DaskConfig(timeout=30),
     )
     assert result.result_for_solid('simple').transformed_value() == 1
+
+
+def define_dask_in_memory_test_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='test_dask_in_memory',
+        solids=[return_two, add_one],
+        dependencies={'add_one': {'num': DependencyDefinition('return_two')}},
+    )
+
+
+@retry(gen.TimeoutError, tries=3)
+def test_execute_on_dask_in_memory():
+    result = execute_on_dask(
+        ExecutionTargetHandle.for_pipeline_fn(define_dask_in_memory_test_pipeline),
+        env_config={'storage': {'in_memory': {}}},
+        dask_config=DaskConfig(timeout=30),
+    )
+    assert result.success
+    # only the results of the run are brought back to the client
+    assert result.result_for_solid('add_one').transformed_value() == 3
@@ -46,7 +46,6 @@ def _do_setup(name='dagster-dask'):
         install_requires=[
             'bokeh',
             'dagster',
-            'dagster_graphql',
             'dask==1.2.2',
             'distributed==1.28.1',
         ],
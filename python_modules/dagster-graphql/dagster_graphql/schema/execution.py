@@ -86,6 +86,7 @@ class DauphinStepKind(dauphin.Enum):
     MATERIALIZATION_THUNK = 'MATERIALIZATION_THUNK'
     UNMARSHAL_INPUT = 'UNMARSHAL_INPUT'
     MARSHAL_OUTPUT = 'MARSHAL_OUTPUT'
+    MAPPED_COMPUTE = 'MAPPED_COMPUTE'
 
     @property
     def description(self):
@@ -116,6 +117,11 @@ class DauphinStepKind(dauphin.Enum):
                 'Special system-defined step to represent an output materialization specified in '
                 'the environment'
             )
+        elif self == DauphinStepKind.MAPPED_COMPUTE:
+            return (
+                'The user-defined computation of a solid mapped over the items of one of its '
+                'inputs, executing a single item. These steps are created at runtime.'
+            )
         else:
             return None
 
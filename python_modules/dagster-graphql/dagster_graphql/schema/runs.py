@@ -229,6 +229,12 @@ class DauphinExecutionStepSkippedEvent(dauphin.ObjectType):
         interfaces = (DauphinMessageEvent, DauphinStepEvent)
 
 
+class DauphinExecutionStepCacheHitEvent(dauphin.ObjectType):
+    class Meta:
+        name = 'ExecutionStepCacheHitEvent'
+        interfaces = (DauphinMessageEvent, DauphinStepEvent)
+
+
 class DauphinMaterialization(dauphin.ObjectType):
     class Meta:
         name = 'Materialization'
@@ -302,6 +308,7 @@ class DauphinPipelineRunEvent(dauphin.Union):
             DauphinExecutionStepOutputEvent,
             DauphinExecutionStepFailureEvent,
             DauphinExecutionStepSkippedEvent,
+            DauphinExecutionStepCacheHitEvent,
             DauphinPipelineProcessStartEvent,
             DauphinPipelineProcessStartedEvent,
             DauphinStepMaterializationEvent,
@@ -325,6 +332,8 @@ def from_dagster_event_record(graphene_info, event_record, dauphin_pipeline, exe
         return graphene_info.schema.type_named('ExecutionStepStartEvent')(**basic_params)
     elif dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
         return graphene_info.schema.type_named('ExecutionStepSkippedEvent')(**basic_params)
+    elif dagster_event.event_type == DagsterEventType.STEP_CACHE_HIT:
+        return graphene_info.schema.type_named('ExecutionStepCacheHitEvent')(**basic_params)
     elif dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
         return graphene_info.schema.type_named('ExecutionStepSuccessEvent')(**basic_params)
     elif dagster_event.event_type == DagsterEventType.STEP_OUTPUT:
@@ -28,6 +28,9 @@ snapshots['test_query_multi_mode 1'] = {
             {
                 'name': 'Bool.MaterializationSchema'
             },
+            {
+                'name': 'CompressionCodec'
+            },
             {
                 'name': None
             },
@@ -154,6 +157,9 @@ snapshots['test_query_multi_mode 1'] = {
             {
                 'name': 'MultiModeWithResources.StorageConfig.S3'
             },
+            {
+                'name': 'MultiModeWithResources.StorageConfig.SharedMem'
+            },
             {
                 'name': 'Path'
             },
@@ -169,6 +175,9 @@ snapshots['test_query_multi_mode 1'] = {
             {
                 'name': 'String.MaterializationSchema'
             },
+            {
+                'name': 'TypeCheckPolicy'
+            },
             {
                 'name': 'multi_mode_with_resources.LoggerConfig.console'
             }
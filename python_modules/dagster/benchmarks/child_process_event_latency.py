@@ -0,0 +1,131 @@
+'''Microbenchmark for the transport between the multiprocess engine and its child processes.
+
+Each child process sends a fixed number of timestamped events at a fixed interval. The parent
+multiplexes over all of the children the same way MultiprocessingEngine does and records, for
+every event, how long it took between the child sending it and the parent receiving it, as well
+as how much CPU time the parent spent doing so.
+
+For comparison, the "polling" transport reproduces the previous scheme, where the parent
+round-robins over one queue per child, blocking for up to TICK on each.
+
+Usage:
+
+    python child_process_event_latency.py [--concurrency 1 8 64] [--events 50] [--interval 0.01]
+'''
+import argparse
+import multiprocessing
+import time
+
+from dagster.core.engine.child_process_executor import (
+    TICK,
+    ChildProcessCommand,
+    start_child_process_command,
+    wait_for_child_process_events,
+)
+from dagster.utils import get_multiprocessing_context
+
+
+class TimestampedEventsCommand(ChildProcessCommand):
+    def __init__(self, start_at, num_events, interval):
+        self.start_at = start_at
+        self.num_events = num_events
+        self.interval = interval
+
+    def execute(self):
+        # Give every child time to start up so that interpreter startup of the others does not
+        # count against the latency of the events
+        time.sleep(max(0.0, self.start_at - time.time()))
+        for _ in range(self.num_events):
+            time.sleep(self.interval)
+            yield time.time()
+
+
+def _percentile(values, percentile):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+def run_multiplexed(concurrency, num_events, interval, start_at):
+    streams = [
+        start_child_process_command(TimestampedEventsCommand(start_at, num_events, interval))
+        for _ in range(concurrency)
+    ]
+
+    latencies = []
+    cpu_start = time.process_time()
+    while streams:
+        wait_for_child_process_events(streams)
+        for stream in list(streams):
+            for sent_at in stream:
+                if sent_at is None:
+                    break
+                latencies.append(time.time() - sent_at)
+            else:
+                streams.remove(stream)
+
+    return latencies, time.process_time() - cpu_start
+
+
+def _polling_child(queue, start_at, num_events, interval):
+    for sent_at in TimestampedEventsCommand(start_at, num_events, interval).execute():
+        queue.put(sent_at)
+    queue.put(None)
+    queue.close()
+
+
+def run_polling(concurrency, num_events, interval, start_at):
+    multiprocessing_context = get_multiprocessing_context()
+    queues = []
+    for _ in range(concurrency):
+        queue = multiprocessing_context.Queue()
+        multiprocessing_context.Process(
+            target=_polling_child, args=(queue, start_at, num_events, interval)
+        ).start()
+        queues.append(queue)
+
+    latencies = []
+    cpu_start = time.process_time()
+    while queues:
+        for queue in list(queues):
+            try:
+                sent_at = queue.get(block=True, timeout=TICK)
+            except multiprocessing.queues.Empty:
+                continue
+            if sent_at is None:
+                queues.remove(queue)
+            else:
+                latencies.append(time.time() - sent_at)
+
+    return latencies, time.process_time() - cpu_start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 64])
+    parser.add_argument('--events', type=int, default=50)
+    parser.add_argument('--interval', type=float, default=0.01)
+    parser.add_argument('--startup-seconds-per-process', type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(
+        '{:<12} {:>12} {:>16} {:>16} {:>16}'.format(
+            'transport', 'concurrency', 'mean latency ms', 'p99 latency ms', 'parent cpu ms'
+        )
+    )
+    for concurrency in args.concurrency:
+        for name, run_fn in (('multiplexed', run_multiplexed), ('polling', run_polling)):
+            start_at = time.time() + 1.0 + args.startup_seconds_per_process * concurrency
+            latencies, cpu_seconds = run_fn(concurrency, args.events, args.interval, start_at)
+            print(
+                '{:<12} {:>12} {:>16.2f} {:>16.2f} {:>16.1f}'.format(
+                    name,
+                    concurrency,
+                    1000 * sum(latencies) / len(latencies),
+                    1000 * _percentile(latencies, 0.99),
+                    1000 * cpu_seconds,
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
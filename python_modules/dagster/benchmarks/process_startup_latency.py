@@ -0,0 +1,96 @@
+'''Microbenchmark for the startup latency of the processes the multiprocess engine creates.
+
+For each start method, child processes are started one after the other, each importing a list
+of modules the way a step process imports dagster and the repository before it can execute
+anything. For every process we record how long it took from the parent starting it until the
+child had finished its imports and sent its first event back.
+
+With "forkserver", the same modules are preloaded by the server process, so children are forked
+from an interpreter that has imported them already.
+
+Usage:
+
+    python process_startup_latency.py [--processes 20] [--modules dagster my_repository pandas]
+'''
+import argparse
+import importlib
+import time
+
+from dagster.core.engine.child_process_executor import (
+    ChildProcessCommand,
+    execute_child_process_command,
+)
+from dagster.utils import get_multiprocessing_context
+
+
+class ImportModulesCommand(ChildProcessCommand):
+    def __init__(self, modules):
+        self.modules = modules
+
+    def execute(self):
+        for module in self.modules:
+            importlib.import_module(module)
+        yield time.time()
+
+
+def _percentile(values, percentile):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+def run_start_method(start_method, preload_modules, num_processes, modules):
+    multiprocessing_context = get_multiprocessing_context(start_method, preload_modules)
+
+    latencies = []
+    for _ in range(num_processes):
+        started_at = time.time()
+        command = ImportModulesCommand(modules)
+        for event in execute_child_process_command(
+            command, multiprocessing_context=multiprocessing_context
+        ):
+            if event is not None:
+                latencies.append(event - started_at)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--processes', type=int, default=20)
+    parser.add_argument(
+        '--modules', nargs='+', default=['dagster', 'dagster.core.execution.api', 'sqlite3']
+    )
+    args = parser.parse_args()
+
+    print('{:<28} {:>16} {:>16}'.format('start method', 'mean startup ms', 'p99 startup ms'))
+    for name, start_method, preload_modules in (
+        ('spawn', 'spawn', None),
+        ('forkserver (dagster)', 'forkserver', []),
+        ('forkserver (all modules)', 'forkserver', args.modules),
+    ):
+        # The preloaded modules of the forkserver are fixed once it has started, so every
+        # configuration after the first one is run in a fresh process of its own
+        multiprocessing_context = get_multiprocessing_context()
+        result_queue = multiprocessing_context.Queue()
+        process = multiprocessing_context.Process(
+            target=_run_and_report,
+            args=(result_queue, start_method, preload_modules, args.processes, args.modules),
+        )
+        process.start()
+        latencies = result_queue.get()
+        process.join()
+
+        print(
+            '{:<28} {:>16.1f} {:>16.1f}'.format(
+                name,
+                1000 * sum(latencies) / len(latencies),
+                1000 * _percentile(latencies, 0.99),
+            )
+        )
+
+
+def _run_and_report(result_queue, start_method, preload_modules, num_processes, modules):
+    result_queue.put(run_start_method(start_method, preload_modules, num_processes, modules))
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ from dagster.core import types
 from dagster.core.definitions import (
     ExecutionTargetHandle,
     DependencyDefinition,
+    MappedDependencyDefinition,
     MultiDependencyDefinition,
     ExpectationDefinition,
     ExpectationResult,
@@ -26,12 +27,19 @@ from dagster.core.definitions.resource import resource, ResourceDefinition
 
 from dagster.core.events import DagsterEventType
 
-from dagster.core.execution.api import execute_pipeline, execute_pipeline_iterator
+from dagster.core.execution.api import (
+    execute_pipeline,
+    execute_pipeline_batch,
+    execute_pipeline_iterator,
+    resume_run,
+)
 
 from dagster.core.execution.config import (
+    AsyncioExecutorConfig,
     InProcessExecutorConfig,
     MultiprocessExecutorConfig,
     RunConfig,
+    ThreadPoolExecutorConfig,
 )
 
 from dagster.core.execution.context_creation_pipeline import PipelineConfigEvaluationError
@@ -89,7 +97,7 @@ from dagster.core.types.evaluator import DagsterEvaluateConfigValueError
 
 from dagster.core.types.marshal import SerializationStrategy
 
-from dagster.core.types.runtime import Bytes, RuntimeType
+from dagster.core.types.runtime import Bytes, RuntimeType, Stream, TypeCheckPolicy
 
 from dagster.utils import file_relative_path
 from dagster.utils.test import execute_solid, execute_solids
@@ -105,6 +113,7 @@ __all__ = [
     'Field',
     'InputDefinition',
     'LoggerDefinition',
+    'MappedDependencyDefinition',
     'Materialization',
     'ModeDefinition',
     'OutputDefinition',
@@ -123,6 +132,9 @@ __all__ = [
     # Execution
     'execute_pipeline_iterator',
     'execute_pipeline',
+    'execute_pipeline_batch',
+    'resume_run',
+    'AsyncioExecutorConfig',
     'DagsterEventType',
     'InitLoggerContext',
     'InitResourceContext',
@@ -133,6 +145,7 @@ __all__ = [
     'RunConfig',
     'RunStorageMode',
     'SolidExecutionResult',
+    'ThreadPoolExecutorConfig',
     # Errors
     'DagsterEvaluateConfigValueError',
     'DagsterExecutionStepExecutionError',
@@ -172,6 +185,8 @@ __all__ = [
     'PythonObjectType',
     'Selector',
     'String',
+    'Stream',
+    'TypeCheckPolicy',
     'SerializationStrategy',
     'Nothing',
     # type creation
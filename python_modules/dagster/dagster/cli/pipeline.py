@@ -6,7 +6,14 @@ import textwrap
 import click
 import yaml
 
-from dagster import InProcessExecutorConfig, PipelineDefinition, RunConfig, check, execute_pipeline
+from dagster import (
+    InProcessExecutorConfig,
+    PipelineDefinition,
+    RunConfig,
+    check,
+    execute_pipeline,
+    resume_run,
+)
 from dagster.cli.load_handle import handle_for_pipeline_cli_args, handle_for_repo_cli_args
 from dagster.core.definitions import solids_in_topological_order, Solid
 from dagster.utils import DEFAULT_REPOSITORY_YAML_FILENAME, load_yaml_from_glob_list
@@ -284,21 +291,33 @@ def pipeline_graphviz_command(only_solids, **kwargs):
     ).format(default_filename=DEFAULT_REPOSITORY_YAML_FILENAME),
 )
 @click.option('-d', '--mode', type=click.STRING)
-def pipeline_execute_command(env, raise_on_error, preset, mode, **kwargs):
+@click.option(
+    '--resume-run',
+    'resume_run_id',
+    type=click.STRING,
+    help=(
+        'Specify the id of an earlier run of the pipeline to resume. Only the steps that run did '
+        'not complete are executed, reusing the outputs it persisted. The environment files '
+        'should be those it was executed with.'
+    ),
+)
+def pipeline_execute_command(env, raise_on_error, preset, mode, resume_run_id, **kwargs):
     check.invariant(isinstance(env, tuple))
 
     if preset:
         if env:
             raise click.UsageError('Can not use --preset with --env.')
+        if resume_run_id:
+            raise click.UsageError('Can not use --preset with --resume-run.')
         return execute_execute_command_with_preset(preset, raise_on_error, kwargs, mode)
 
     env = list(env)
-    execute_execute_command(env, raise_on_error, kwargs, mode)
+    execute_execute_command(env, raise_on_error, kwargs, mode, resume_run_id)
 
 
-def execute_execute_command(env, raise_on_error, cli_args, mode=None):
+def execute_execute_command(env, raise_on_error, cli_args, mode=None, resume_run_id=None):
     pipeline = create_pipeline_from_cli_args(cli_args)
-    return do_execute_command(pipeline, env, raise_on_error, mode)
+    return do_execute_command(pipeline, env, raise_on_error, mode, resume_run_id)
 
 
 def execute_execute_command_with_preset(preset, raise_on_error, cli_args, mode):
@@ -315,20 +334,23 @@ def execute_execute_command_with_preset(preset, raise_on_error, cli_args, mode):
     )
 
 
-def do_execute_command(pipeline, env_file_list, raise_on_error, mode=None):
+def do_execute_command(pipeline, env_file_list, raise_on_error, mode=None, resume_run_id=None):
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     env_file_list = check.opt_list_param(env_file_list, 'env_file_list', of_type=str)
+    check.opt_str_param(resume_run_id, 'resume_run_id')
 
     environment_dict = load_yaml_from_glob_list(env_file_list) if env_file_list else {}
-
-    return execute_pipeline(
-        pipeline,
-        environment_dict=environment_dict,
-        run_config=RunConfig(
-            mode=mode, executor_config=InProcessExecutorConfig(raise_on_error=raise_on_error)
-        ),
+    run_config = RunConfig(
+        mode=mode, executor_config=InProcessExecutorConfig(raise_on_error=raise_on_error)
     )
 
+    if resume_run_id:
+        return resume_run(
+            pipeline, resume_run_id, environment_dict=environment_dict, run_config=run_config
+        )
+
+    return execute_pipeline(pipeline, environment_dict=environment_dict, run_config=run_config)
+
 
 @click.command(
     name='scaffold_config',
@@ -2,6 +2,7 @@ from .handle import ExecutionTargetHandle
 
 from .dependency import (
     DependencyDefinition,
+    MappedDependencyDefinition,
     MultiDependencyDefinition,
     Solid,
     SolidHandle,
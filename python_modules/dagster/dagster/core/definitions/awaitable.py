@@ -0,0 +1,80 @@
+import inspect
+import sys
+
+import six
+
+from dagster import check
+
+
+def is_awaitable(obj):
+    '''Whether obj is a coroutine, or another object that can be awaited, returned by an
+    ``async def`` compute function. Always False on Python 2.'''
+    isawaitable = getattr(inspect, 'isawaitable', None)
+    return bool(isawaitable and isawaitable(obj))
+
+
+def is_async_generator(obj):
+    '''Whether obj is an async generator returned by an ``async def`` compute function that
+    yields. Always False before Python 3.6.'''
+    isasyncgen = getattr(inspect, 'isasyncgen', None)
+    return bool(isasyncgen and isasyncgen(obj))
+
+
+class PendingAwaitable(object):
+    '''Yielded up through the generators that execute a step when a compute function needs an
+    awaitable resolved before it can continue, e.g. because it is a coroutine or an async
+    generator.
+
+    Whatever drives the step resolves the awaitable, either by running it to completion on an
+    event loop of its own or by awaiting it alongside other steps, and then resumes the step.
+    The compute function picks up the outcome through ``result``, so that exceptions are raised
+    from within the step's user code error boundary.
+    '''
+
+    def __init__(self, awaitable):
+        check.param_invariant(is_awaitable(awaitable), 'awaitable')
+        self.awaitable = awaitable
+        self._is_resolved = False
+        self._value = None
+        self._exc_info = None
+
+    @property
+    def is_resolved(self):
+        return self._is_resolved
+
+    def set_result(self, value):
+        check.invariant(not self._is_resolved, 'PendingAwaitable already resolved')
+        self._is_resolved = True
+        self._value = value
+
+    def set_exc_info(self, exc_info):
+        check.invariant(not self._is_resolved, 'PendingAwaitable already resolved')
+        check.tuple_param(exc_info, 'exc_info')
+        self._is_resolved = True
+        self._exc_info = exc_info
+
+    def resolve_from_future(self, future):
+        '''Resolve with the outcome of a completed asyncio future wrapping the awaitable.'''
+        try:
+            value = future.result()
+        except:  # pylint: disable=bare-except
+            self.set_exc_info(sys.exc_info())
+        else:
+            self.set_result(value)
+
+    def resolve_in_event_loop(self, event_loop):
+        '''Resolve by running the awaitable to completion on event_loop.'''
+        try:
+            value = event_loop.run_until_complete(self.awaitable)
+        except:  # pylint: disable=bare-except
+            self.set_exc_info(sys.exc_info())
+        else:
+            self.set_result(value)
+
+    @property
+    def result(self):
+        '''The value the awaitable resolved to. Raises whatever the awaitable raised.'''
+        check.invariant(self._is_resolved, 'PendingAwaitable has not been resolved')
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+        return self._value
@@ -7,7 +7,13 @@ from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.core.utils import toposort_flatten
 
-from .dependency import DependencyStructure, IDependencyDefinition, Solid, SolidInstance
+from .dependency import (
+    DependencyStructure,
+    IDependencyDefinition,
+    MappedDependencyDefinition,
+    Solid,
+    SolidInstance,
+)
 
 
 class IContainSolids(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
@@ -276,6 +282,45 @@ def _validate_dependencies(dependencies, solid_dict, alias_to_name):
 
                 _validate_input_output_pair(input_def, output_def, from_solid, dep)
 
+        mapped_inputs = [
+            from_input
+            for from_input, dep_def in dep_by_input.items()
+            if isinstance(dep_def, MappedDependencyDefinition)
+        ]
+        if mapped_inputs:
+            _validate_mapped_solid(solid_dict[from_solid], mapped_inputs)
+
+
+def _validate_mapped_solid(solid, mapped_inputs):
+    from .solid import CompositeSolidDefinition
+
+    if len(mapped_inputs) > 1:
+        raise DagsterInvalidDefinitionError(
+            'Solid "{solid}" is mapped over inputs {inputs}. A solid can only be mapped over a '
+            'single input.'.format(solid=solid.name, inputs=sorted(mapped_inputs))
+        )
+
+    if isinstance(solid.definition, CompositeSolidDefinition):
+        raise DagsterInvalidDefinitionError(
+            'Composite solid "{solid}" can not be mapped over input "{input_name}". Only solids '
+            'with a compute function can be mapped.'.format(
+                solid=solid.name, input_name=mapped_inputs[0]
+            )
+        )
+
+    # Expectations apply to a single value, while the mapped input is received as a list of them
+    # and the outputs are collected into lists
+    (mapped_input,) = mapped_inputs
+    if solid.input_def_named(mapped_input).expectations or any(
+        output_def.expectations for output_def in solid.output_dict.values()
+    ):
+        raise DagsterInvalidDefinitionError(
+            'Solid "{solid}" is mapped over input "{input_name}", and so can not declare '
+            'expectations on that input or on its outputs.'.format(
+                solid=solid.name, input_name=mapped_input
+            )
+        )
+
 
 def _validate_input_output_pair(input_def, output_def, from_solid, dep):
     # Currently, we opt to be overly permissive with input/output type mismatches.
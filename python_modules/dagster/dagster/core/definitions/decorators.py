@@ -14,6 +14,7 @@ from . import (
     Result,
     SolidDefinition,
 )
+from .awaitable import PendingAwaitable, is_async_generator, is_awaitable
 
 if hasattr(inspect, 'signature'):
     funcsigs = inspect
@@ -88,12 +89,15 @@ class MultipleResults(namedtuple('_MultipleResults', 'results')):
 
 
 class _LambdaSolid(object):
-    def __init__(self, name=None, inputs=None, output=None, description=None):
+    def __init__(self, name=None, inputs=None, output=None, description=None, metadata=None):
         self.name = check.opt_str_param(name, 'name')
         self.input_defs = check.opt_list_param(inputs, 'inputs', InputDefinition)
         self.output_def = check.inst_param(output, 'output', OutputDefinition)
         self.description = check.opt_str_param(description, 'description')
 
+        # metadata will be checked within SolidDefinition
+        self.metadata = metadata
+
     def __call__(self, fn):
         check.callable_param(fn, 'fn')
 
@@ -108,6 +112,7 @@ class _LambdaSolid(object):
             outputs=[self.output_def],
             compute_fn=compute_fn,
             description=self.description,
+            metadata=self.metadata,
         )
 
 
@@ -120,6 +125,7 @@ class _Solid(object):
         description=None,
         resources=None,
         config_field=None,
+        metadata=None,
     ):
         self.name = check.opt_str_param(name, 'name')
         self.input_defs = check.opt_list_param(inputs, 'inputs', InputDefinition)
@@ -133,6 +139,9 @@ class _Solid(object):
         # config_field will be checked within SolidDefinition
         self.config_field = config_field
 
+        # metadata will be checked within SolidDefinition
+        self.metadata = metadata
+
     def __call__(self, fn):
         check.callable_param(fn, 'fn')
 
@@ -149,23 +158,25 @@ class _Solid(object):
             config_field=self.config_field,
             description=self.description,
             resources=self.resources,
+            metadata=self.metadata,
         )
 
 
-def lambda_solid(name=None, inputs=None, output=None, description=None):
+def lambda_solid(name=None, inputs=None, output=None, description=None, metadata=None):
     '''(decorator) Create a simple solid.
 
     This shortcut allows the creation of simple solids that do not require
     configuration and whose implementations do not require a context.
 
     Lambda solids take inputs and produce a single output. The body of the function
-    should return a single value.
+    should return a single value. The function may also be defined with ``async def``.
 
     Args:
         name (str): Name of solid.
         inputs (list[InputDefinition]): List of inputs.
         output (OutputDefinition): The output of the solid. Defaults to ``OutputDefinition()``.
         description (str): Solid description.
+        metadata (dict): Arbitrary metadata for the solid.
 
     Examples:
 
@@ -185,13 +196,22 @@ def lambda_solid(name=None, inputs=None, output=None, description=None):
     if callable(name):
         check.invariant(inputs is None)
         check.invariant(description is None)
+        check.invariant(metadata is None)
         return _LambdaSolid(output=output)(name)
 
-    return _LambdaSolid(name=name, inputs=inputs, output=output, description=description)
+    return _LambdaSolid(
+        name=name, inputs=inputs, output=output, description=description, metadata=metadata
+    )
 
 
 def solid(
-    name=None, inputs=None, outputs=None, config_field=None, description=None, resources=None
+    name=None,
+    inputs=None,
+    outputs=None,
+    config_field=None,
+    description=None,
+    resources=None,
+    metadata=None,
 ):
     '''(decorator) Create a solid with specified parameters.
 
@@ -209,6 +229,11 @@ def solid(
        multiple outputs. Useful for solids that have multiple outputs.
     4. Yield :py:class:`Result`. Same as default compute behaviour.
 
+    The compute function may also be defined with ``async def``, in which case it can either
+    return any of the above or yield :py:class:`Result` objects as an async generator. Such
+    solids can be executed by any engine, and steps of many of them can be interleaved on a
+    single event loop with :py:class:`AsyncioExecutorConfig`.
+
     Args:
         name (str): Name of solid.
         inputs (list[InputDefinition]): List of inputs.
@@ -217,6 +242,8 @@ def solid(
             The configuration for this solid.
         description (str): Description of this solid.
         resources (set[str]): Set of resource instances required by this solid.
+        metadata (dict): Arbitrary metadata for the solid, e.g. the ``resource_pools`` it
+            occupies a slot of while it executes.
 
     Examples:
 
@@ -284,6 +311,7 @@ def solid(
         check.invariant(description is None)
         check.invariant(config_field is None)
         check.invariant(resources is None)
+        check.invariant(metadata is None)
         return _Solid()(name)
 
     return _Solid(
@@ -293,6 +321,7 @@ def solid(
         config_field=config_field,
         description=description,
         resources=resources,
+        metadata=metadata,
     )
 
 
@@ -312,6 +341,12 @@ def _create_lambda_solid_transform_wrapper(fn, input_defs, output_def):
             kwargs[input_name] = inputs[input_name]
 
         result = fn(**kwargs)
+
+        if is_awaitable(result):
+            pending = PendingAwaitable(result)
+            yield pending
+            result = pending.result
+
         yield Result(value=result, output_name=output_def.name)
 
     return transform
@@ -334,9 +369,23 @@ def _create_solid_transform_wrapper(fn, input_defs, output_defs):
 
         result = fn(context, **kwargs)
 
+        if is_awaitable(result):
+            pending = PendingAwaitable(result)
+            yield pending
+            result = pending.result
+
         if inspect.isgenerator(result):
             for item in result:
                 yield item
+        elif is_async_generator(result):
+            while True:
+                pending = PendingAwaitable(result.__anext__())
+                yield pending
+                try:
+                    item = pending.result
+                except StopAsyncIteration:  # pylint: disable=undefined-variable
+                    break
+                yield item
         else:
             if isinstance(result, (Materialization, ExpectationResult)):
                 raise DagsterInvariantViolationError(
@@ -246,13 +246,27 @@ def _create_handle_dict(solid_dict, dep_dict):
     return handle_dict
 
 
+def _mapped_input_handles(solid_dict, dep_dict):
+    return set(
+        solid_dict[solid_name].input_handle(input_name)
+        for solid_name, input_dict in dep_dict.items()
+        for input_name, dep_def in input_dict.items()
+        if isinstance(dep_def, MappedDependencyDefinition)
+    )
+
+
 class DependencyStructure(object):
     @staticmethod
     def from_definitions(solids, dep_dict):
-        return DependencyStructure(_create_handle_dict(solids, dep_dict))
+        return DependencyStructure(
+            _create_handle_dict(solids, dep_dict), _mapped_input_handles(solids, dep_dict)
+        )
 
-    def __init__(self, handle_dict):
+    def __init__(self, handle_dict, mapped_input_handles=None):
         self._handle_dict = check.inst_param(handle_dict, 'handle_dict', InputToOutputHandleDict)
+        self._mapped_input_handles = check.opt_set_param(
+            mapped_input_handles, 'mapped_input_handles', of_type=SolidInputHandle
+        )
 
     def deps_of_solid(self, solid_name):
         check.str_param(solid_name, 'solid_name')
@@ -305,6 +319,11 @@ class DependencyStructure(object):
         check.inst_param(solid_input_handle, 'solid_input_handle', SolidInputHandle)
         return self._handle_dict[solid_input_handle]
 
+    def is_mapped_input(self, solid_input_handle):
+        '''Whether the solid is mapped over the items of the output its input depends on.'''
+        check.inst_param(solid_input_handle, 'solid_input_handle', SolidInputHandle)
+        return solid_input_handle in self._mapped_input_handles
+
     def input_handles(self):
         return list(self._handle_dict.keys())
 
@@ -368,3 +387,55 @@ class MultiDependencyDefinition(
 
     def get_definitions(self):
         return self.dependencies
+
+
+class MappedDependencyDefinition(
+    namedtuple('_MappedDependencyDefinition', 'solid output description'), IDependencyDefinition
+):
+    '''Maps a solid over the items of a list output of another solid.
+
+    Rather than executing once on the whole list, the solid executes once for every item of it,
+    with the item as the value of its input. How many items there are is only known once the
+    list has been produced, so the steps executing the items are created at runtime, and engines
+    that execute steps in parallel execute them in parallel. The items are executed like any other
+    step, each with events and intermediates of its own.
+
+    Every output of the mapped solid is collected into a list, with one value per item in the
+    order of the items, which is what solids depending on the mapped solid receive.
+
+    Args:
+        solid (str):
+            The name of the solid producing the list whose items the solid is mapped over.
+        output (str):
+            The name of the output producing the list. Defaults to "result", the default
+            output name of solids with a single output.
+        description (str):
+            Description of this dependency. Optional.
+
+    Example:
+
+        .. code-block:: python
+
+            pipeline = PipelineDefinition(
+                solids=[list_partitions, process_partition, summarize],
+                dependencies={
+                    'process_partition': {
+                        'partition': MappedDependencyDefinition('list_partitions'),
+                    },
+                    'summarize': {
+                        'processed_partitions': DependencyDefinition('process_partition'),
+                    },
+                },
+            )
+    '''
+
+    def __new__(cls, solid, output=DEFAULT_OUTPUT, description=None):
+        return super(MappedDependencyDefinition, cls).__new__(
+            cls,
+            check.str_param(solid, 'solid'),
+            check.str_param(output, 'output'),
+            check.opt_str_param(description, 'description'),
+        )
+
+    def get_definitions(self):
+        return [self]
@@ -4,11 +4,18 @@ from dagster import check
 from dagster.core.definitions import SolidHandle
 from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.core.types import Bool, Field, List, NamedDict, NamedSelector, String
-from dagster.core.types.config import ALL_CONFIG_BUILTINS, ConfigType, ConfigTypeAttributes
+from dagster.core.types.config import (
+    ALL_CONFIG_BUILTINS,
+    ConfigType,
+    ConfigTypeAttributes,
+    Enum,
+    EnumValue,
+)
 from dagster.core.types.default_applier import apply_default_values
 from dagster.core.types.field_utils import FieldImpl, check_opt_field_param
 from dagster.core.types.iterate_types import iterate_config_types
-from dagster.core.types.runtime import construct_runtime_type_dictionary
+from dagster.core.types.compression import COMPRESSION_CODECS
+from dagster.core.types.runtime import TypeCheckPolicy, construct_runtime_type_dictionary
 from dagster.utils import camelcase, single_item
 
 from .dependency import DependencyStructure, Solid, SolidHandle, SolidInputHandle
@@ -205,6 +212,22 @@ def define_expectations_config_cls(name):
     )
 
 
+# Defined once, since the types of every pipeline share its name
+CompressionCodecConfig = Enum(
+    'CompressionCodec', [EnumValue(codec_name) for codec_name in COMPRESSION_CODECS]
+)
+
+
+def define_compression_field():
+    return Field(
+        CompressionCodecConfig,
+        is_optional=True,
+        description='Compress intermediates with this codec as they are written, unless their '
+        'type compresses them itself. The lz4 and zstd codecs require the lz4 and zstandard '
+        'packages.',
+    )
+
+
 def define_storage_config_cls(name):
     check.str_param(name, 'name')
 
@@ -218,13 +241,24 @@ def define_storage_config_cls(name):
             'filesystem': Field(
                 SystemNamedDict(
                     '{parent_name}.Files'.format(parent_name=name),
-                    {'base_dir': Field(String, is_optional=True)},
+                    {
+                        'base_dir': Field(String, is_optional=True),
+                        'compression': define_compression_field(),
+                    },
                 ),
                 is_optional=True,
             ),
             's3': Field(
                 SystemNamedDict(
-                    '{parent_name}.S3'.format(parent_name=name), {'s3_bucket': Field(String)}
+                    '{parent_name}.S3'.format(parent_name=name),
+                    {'s3_bucket': Field(String), 'compression': define_compression_field()},
+                ),
+                is_optional=True,
+            ),
+            'shared_memory': Field(
+                SystemNamedDict(
+                    '{parent_name}.SharedMem'.format(parent_name=name),
+                    {'base_dir': Field(String, is_optional=True)},
                 ),
                 is_optional=True,
             ),
@@ -362,9 +396,58 @@ def define_solid_dictionary_cls(
     return SystemNamedDict(name, fields)
 
 
+# Defined once, since the types of every pipeline share its name
+TypeCheckPolicyConfig = Enum(
+    'TypeCheckPolicy',
+    [
+        EnumValue(
+            'FULL', python_value=TypeCheckPolicy.FULL, description='Check every item of lists.'
+        ),
+        EnumValue(
+            'SAMPLED',
+            python_value=TypeCheckPolicy.SAMPLED,
+            description='Check a sample of the items of lists, spread evenly across them.',
+        ),
+        EnumValue(
+            'SHAPE_ONLY',
+            python_value=TypeCheckPolicy.SHAPE_ONLY,
+            description='Check that lists are lists, and only their first item.',
+        ),
+    ],
+)
+
+
 def define_execution_config_cls(name):
     check.str_param(name, 'name')
-    return SystemNamedDict(name, {})
+    return SystemNamedDict(
+        name,
+        {
+            'gc_intermediates': Field(
+                Bool,
+                is_optional=True,
+                default_value=False,
+                description='Release each intermediate as soon as every step that consumes it has '
+                'succeeded, rather than keeping all of them until the end of the run. Outputs '
+                'with no downstream consumers, outputs that are materialized and the inputs of '
+                'steps that failed or were skipped are always retained.',
+            ),
+            'memoize_outputs': Field(
+                Bool,
+                is_optional=True,
+                default_value=True,
+                description='Reuse the outputs that earlier runs memoized for the steps of solids '
+                'that declare a version in their metadata, rather than executing those steps '
+                'again, and memoize the outputs of the steps executed. Requires filesystem or '
+                'shared memory storage.',
+            ),
+            'type_check_policy': Field(
+                TypeCheckPolicyConfig,
+                is_optional=True,
+                description='How thoroughly the items of lists passed between solids are type '
+                'checked. Overrides the type check policy of the pipeline.',
+            ),
+        },
+    )
 
 
 def iterate_solid_def_types(solid_def):
@@ -1,5 +1,6 @@
 from collections import namedtuple
 from dagster import check
+from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.core.types.runtime import RuntimeType, resolve_to_runtime_type
 
 from .expectation import ExpectationDefinition
@@ -30,6 +31,14 @@ class OutputDefinition(object):
         self.expectations = check.opt_list_param(
             expectations, 'expectations', of_type=ExpectationDefinition
         )
+        # Expectations are evaluated before the steps downstream read the value, so every chunk
+        # of a stream an expectation read would be held in memory until those steps read it too
+        if self.runtime_type.is_stream and self.expectations:
+            raise DagsterInvalidDefinitionError(
+                'Output "{name}" is a Stream, and so can not declare expectations.'.format(
+                    name=self.name
+                )
+            )
         self.description = check.opt_str_param(description, 'description')
 
         self.optional = check.bool_param(is_optional, 'is_optional')
@@ -1,10 +1,16 @@
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster.core.execution.config import RunConfig
-from dagster.core.types.runtime import construct_runtime_type_dictionary
+from dagster.core.types.runtime import TypeCheckPolicy, construct_runtime_type_dictionary
 
 from .container import IContainSolids, create_execution_structure, validate_dependency_dict
-from .dependency import DependencyDefinition, MultiDependencyDefinition, SolidHandle, SolidInstance
+from .dependency import (
+    DependencyDefinition,
+    MappedDependencyDefinition,
+    MultiDependencyDefinition,
+    SolidHandle,
+    SolidInstance,
+)
 from .mode import ModeDefinition
 from .preset import PresetDefinition
 from .solid import ISolidDefinition
@@ -64,6 +70,9 @@ class PipelineDefinition(IContainSolids, object):
         preset_definitions (Optional[List[PresetDefinition]]):
             Given the different ways a pipeline may execute, presets give you a way to provide
             specific valid collections of configuration.
+        type_check_policy (Optional[TypeCheckPolicy]):
+            How thoroughly the items of lists passed between solids are type checked, by default
+            every one of them. Runs can override this in the execution section of their config.
     '''
 
     def __init__(
@@ -74,9 +83,13 @@ class PipelineDefinition(IContainSolids, object):
         dependencies=None,
         mode_definitions=None,
         preset_definitions=None,
+        type_check_policy=TypeCheckPolicy.FULL,
     ):
         self.name = check.opt_str_param(name, 'name', '<<unnamed>>')
         self.description = check.opt_str_param(description, 'description')
+        self.type_check_policy = check.inst_param(
+            type_check_policy, 'type_check_policy', TypeCheckPolicy
+        )
 
         mode_definitions = check.opt_list_param(
             mode_definitions, 'mode_definitions', of_type=ModeDefinition
@@ -345,8 +358,12 @@ def _build_sub_pipeline(pipeline_def, solid_names):
         for input_handle in solid.input_handles():
             output_handles = _out_handle_of_inp(input_handle)
             if output_handles:
+                if pipeline_def.dependency_structure.is_mapped_input(input_handle):
+                    dep_cls = MappedDependencyDefinition
+                else:
+                    dep_cls = DependencyDefinition
                 inner_dep = (
-                    DependencyDefinition(
+                    dep_cls(
                         solid=output_handles[0].solid.name, output=output_handles[0].output_def.name
                     )
                     if len(output_handles) == 1
@@ -367,6 +384,7 @@ def _build_sub_pipeline(pipeline_def, solid_names):
         solids=list({solid.definition for solid in solids}),
         mode_definitions=pipeline_def.mode_definitions,
         dependencies=deps,
+        type_check_policy=pipeline_def.type_check_policy,
     )
 
 
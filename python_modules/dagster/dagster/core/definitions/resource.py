@@ -18,14 +18,22 @@ class ResourceDefinition(object):
             The type for the configuration data for this resource, passed to ``resource_fn`` via
             ``init_context.resource_config``
         description (str)
+        reusable (bool):
+            Whether the resource may be shared by the runs of a batch executed by
+            ``execute_pipeline_batch``. A reusable resource is then initialized once for every
+            distinct config it is given, rather than once for every run, and cleaned up once the
+            whole batch has executed. Its ``resource_fn`` should therefore not depend on the run
+            id of ``init_context``, and the resource must be safe to use from concurrent runs when
+            the batch executes them concurrently. Defaults to False.
     '''
 
-    def __init__(self, resource_fn, config_field=None, description=None):
+    def __init__(self, resource_fn, config_field=None, description=None, reusable=False):
         self.resource_fn = check.callable_param(resource_fn, 'resource_fn')
         self.config_field = check_user_facing_opt_field_param(
             config_field, 'config_field', 'of a ResourceDefinition or @resource'
         )
         self.description = check.opt_str_param(description, 'description')
+        self.reusable = check.bool_param(reusable, 'reusable')
 
     @staticmethod
     def none_resource(description=None):
@@ -40,7 +48,7 @@ class ResourceDefinition(object):
         )
 
 
-def resource(config_field=None, description=None):
+def resource(config_field=None, description=None, reusable=False):
     '''A decorator for creating a resource. The decorated function will be used as the
     resource_fn in a ResourceDefinition.
     '''
@@ -51,7 +59,7 @@ def resource(config_field=None, description=None):
         return ResourceDefinition(resource_fn=config_field)
 
     def _wrap(resource_fn):
-        return ResourceDefinition(resource_fn, config_field, description)
+        return ResourceDefinition(resource_fn, config_field, description, reusable)
 
     return _wrap
 
@@ -12,6 +12,16 @@ from .output import OutputDefinition, OutputMapping
 from .utils import check_valid_name
 from .container import IContainSolids, create_execution_structure, validate_dependency_dict
 
+# The key of solid metadata under which the resource pools of a solid are declared
+RESOURCE_POOLS_METADATA_KEY = 'resource_pools'
+
+# The key of solid metadata under which a solid declares that it is safe to execute more than once
+IDEMPOTENT_METADATA_KEY = 'idempotent'
+
+# The key of solid metadata under which a solid declares the version of its code. The outputs of
+# the steps of versioned solids are memoized across runs.
+VERSION_METADATA_KEY = 'version'
+
 
 class ISolidDefinition(six.with_metaclass(ABCMeta)):
     def __init__(self, name, input_dict, output_dict, description=None, metadata=None):
@@ -21,6 +31,12 @@ class ISolidDefinition(six.with_metaclass(ABCMeta)):
         self.input_dict = frozendict(input_dict)
         self.output_dict = frozendict(output_dict)
 
+        resource_pools = self.metadata.get(RESOURCE_POOLS_METADATA_KEY, [])
+        if not isinstance(resource_pools, six.string_types):
+            check.list_param(resource_pools, RESOURCE_POOLS_METADATA_KEY, of_type=str)
+        check.bool_param(self.metadata.get(IDEMPOTENT_METADATA_KEY, False), IDEMPOTENT_METADATA_KEY)
+        check.opt_str_param(self.metadata.get(VERSION_METADATA_KEY), VERSION_METADATA_KEY)
+
     def has_input(self, name):
         check.str_param(name, 'name')
         return name in self.input_dict
@@ -45,6 +61,27 @@ class ISolidDefinition(six.with_metaclass(ABCMeta)):
     def has_configurable_outputs(self):
         return any([out.runtime_type.output_schema for out in self.output_dict.values()])
 
+    @property
+    def resource_pools(self):
+        '''The names of the resource pools that executing this solid occupies a slot of, declared
+        as a name or a list of names under the 'resource_pools' key of its metadata.'''
+        resource_pools = self.metadata.get(RESOURCE_POOLS_METADATA_KEY, [])
+        if isinstance(resource_pools, six.string_types):
+            return [resource_pools]
+        return list(resource_pools)
+
+    @property
+    def is_idempotent(self):
+        '''Whether the solid may be executed more than once with the same inputs, with the same
+        effect as executing it once, as declared under the 'idempotent' key of its metadata.'''
+        return self.metadata.get(IDEMPOTENT_METADATA_KEY, False)
+
+    @property
+    def version(self):
+        '''The version of the solid's code, as declared under the 'version' key of its metadata, or
+        None. Changing it invalidates the outputs memoized for the solid by earlier runs.'''
+        return self.metadata.get(VERSION_METADATA_KEY)
+
     @abstractproperty
     def has_config_entry(self):
         raise NotImplementedError()
@@ -89,7 +126,11 @@ class SolidDefinition(ISolidDefinition):
         description (Optional[str]): Description of the solid.
         metadata (Optional[Dict[Any, Any]]):
             Arbitrary metadata for the solid. Some frameworks expect and require
-            certain metadata to be attached to a solid.
+            certain metadata to be attached to a solid. The parallel executors read the
+            ``resource_pools`` key, a name or list of names of the resource pools the solid
+            occupies a slot of while it executes. See ``resource_pool_limits`` of
+            :py:class:`MultiprocessExecutorConfig`. Solids that are safe to execute more than
+            once set ``idempotent`` to True, which allows speculative execution of their steps.
         resources (Optional[Set[str]]): List of resources handles required by this solid.
 
     Examples:
@@ -1,8 +1,10 @@
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 import multiprocessing
+import multiprocessing.connection
 import os
 import sys
+import time
 
 import six
 
@@ -39,104 +41,213 @@ class ChildProcessCrashException(Exception):
     pass
 
 
-def execute_command_in_child_process(queue, command):
+def execute_command_in_child_process(conn, command):
+    check.inst_param(command, 'command', ChildProcessCommand)
+
+    try:
+        send_command_events(conn, command)
+    finally:
+        conn.close()
+
+
+def send_command_events(conn, command):
+    '''Executes command and sends its events over conn, bracketed by a ChildProcessStartEvent and
+    either a ChildProcessDoneEvent or a ChildProcessSystemErrorEvent. This is the protocol that
+    ChildProcessEventStream expects on the other end of the connection.
+    '''
     check.inst_param(command, 'command', ChildProcessCommand)
 
     pid = os.getpid()
-    queue.put(ChildProcessStartEvent(pid=pid))
+    conn.send(ChildProcessStartEvent(pid=pid))
     try:
         for step_event in command.execute():
-            queue.put(step_event)
-        queue.put(ChildProcessDoneEvent(pid=pid))
+            conn.send(step_event)
+        conn.send(ChildProcessDoneEvent(pid=pid))
     except:  # pylint: disable=bare-except
-        queue.put(
+        conn.send(
             ChildProcessSystemErrorEvent(
                 pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
             )
         )
-    finally:
-        queue.close()
 
 
+# Only used on interpreters without multiprocessing.connection.wait, where we fall back to
+# polling every child process on this interval.
 TICK = 20.0 * 1.0 / 1000.0  # 20 MS
 
 PROCESS_DEAD_AND_QUEUE_EMPTY = 'PROCESS_DEAD_AND_QUEUE_EMPTY'
 
 
-def get_next_event(process, queue):
-    try:
-        return queue.get(block=True, timeout=TICK)
-    except multiprocessing.queues.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
+def get_next_event(process, conn):
+    '''Returns the next event sent by the process without blocking, None if no event is
+    available yet, or PROCESS_DEAD_AND_QUEUE_EMPTY once the process has exited and every event it
+    sent has been received.
+    '''
+    if conn.poll():
+        try:
+            return conn.recv()
+        except EOFError:
+            # The child closed its end of the pipe, which it does on exit
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the
+        # process sent another event and then died. In that case
+        # we want to continue draining the pipe.
+        if conn.poll():
             try:
-                return queue.get(block=False)
-            except multiprocessing.queues.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+                return conn.recv()
+            except EOFError:
+                pass
+        # If the pipe is empty we know that there are no more events
+        # and that the process has died.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
 
     return None
 
 
-def execute_child_process_command(command, return_process_events=False):
+class ChildProcessEventStream(six.Iterator):
     '''
-    This function polls the process until it returns a valid
-    item or returns PROCESS_DEAD_AND_QUEUE_EMPTY if it is in
-    a state where the process has terminated and the queue is empty.
+    Iterates over the events a child process sends for a single command, from its
+    ChildProcessStartEvent up to its ChildProcessDoneEvent.
 
-    If wait_mode is set to YIELD, it will yield None while the process is busy executing.
+    Iteration never blocks: None is returned while the process is busy executing. Callers
+    managing several streams at once should pass them to wait_for_child_process_events, which
+    sleeps until any of the processes has sent an event or exited, rather than spinning.
+    '''
 
-    Warning: if the child process is in an infinite loop. This will
-    also infinitely loop.
+    def __init__(self, process, conn, return_process_events=False):
+        self.process = process
+        self.conn = conn
+        self.return_process_events = check.bool_param(
+            return_process_events, 'return_process_events'
+        )
+        self._completed = False
+
+    def __iter__(self):
+        return self
+
+    @property
+    def wait_handles(self):
+        return [self.conn, self.process.sentinel]
+
+    def on_completed(self):
+        '''Invoked once the child has finished the command and all of its events are consumed.
+
+        Closes the reading end of the pipe and reaps the process if it has already exited. This
+        does not wait for the process: interpreter teardown in the child can take hundreds of
+        milliseconds, during which the parent would not be servicing other children. Engines call
+        reap_child_processes once they are done to reap the children that were still exiting.
+        '''
+        self.conn.close()
+        self.process.join(timeout=0)
+
+    def __next__(self):
+        if self._completed:
+            raise StopIteration()
+
+        while True:
+            event = get_next_event(self.process, self.conn)
+
+            # child process is busy executing, return so we (the parent) can continue
+            # other work such as checking other child_process_commands
+            if event is None:
+                return None
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                # TODO Gather up stderr and the process exit code
+                self._completed = True
+                raise ChildProcessCrashException()
+
+            if isinstance(event, ChildProcessDoneEvent):
+                self._completed = True
+                self.on_completed()
+            elif isinstance(event, ChildProcessSystemErrorEvent):
+                self._completed = True
+                raise ChildProcessException(
+                    'Uncaught exception in process {pid} with message "{message}" and error info '
+                    '{error_info}'.format(
+                        pid=event.pid, message=event.error_info.message, error_info=event.error_info
+                    ),
+                    error_info=event.error_info,
+                )
+
+            # If we are configured to return process events by the caller,
+            # return that event to the caller
+            if not isinstance(event, ChildProcessEvents) or self.return_process_events:
+                return event
+
+            if self._completed:
+                raise StopIteration()
+
+
+def wait_for_child_process_events(streams, timeout=None):
+    '''Blocks until at least one of the ChildProcessEventStreams has an event available or its
+    process has exited, or until timeout seconds have passed. Any other stream exposing the
+    wait_handles of the processes it reads from may be passed as well.
     '''
+    check.list_param(streams, 'streams')
+    check.opt_float_param(timeout, 'timeout')
 
+    if not streams:
+        return
+
+    if hasattr(multiprocessing.connection, 'wait'):
+        multiprocessing.connection.wait(
+            [handle for stream in streams for handle in stream.wait_handles], timeout
+        )
+    else:
+        time.sleep(TICK if timeout is None else min(TICK, timeout))
+
+
+def reap_child_processes():
+    '''Joins every child process of this process that has exited, without waiting for the others.'''
+    # Joins the children that have exited as a side effect
+    multiprocessing.active_children()
+
+
+def start_child_process_command(command, return_process_events=False, multiprocessing_context=None):
+    '''Starts a child process executing command and returns the ChildProcessEventStream for it.
+
+    The process is started with multiprocessing_context, which defaults to that of the spawn
+    start method.
+    '''
     check.inst_param(command, 'command', ChildProcessCommand)
     check.bool_param(return_process_events, 'return_process_events')
 
-    multiprocessing_context = get_multiprocessing_context()
-    queue = multiprocessing_context.Queue()
+    if multiprocessing_context is None:
+        multiprocessing_context = get_multiprocessing_context()
+    reader, writer = multiprocessing_context.Pipe(duplex=False)
 
     process = multiprocessing_context.Process(
-        target=execute_command_in_child_process, args=(queue, command)
+        target=execute_command_in_child_process, args=(writer, command)
     )
 
     process.start()
 
-    completed_properly = False
+    # The child holds its own copy of the writing end. Closing ours means we see EOF on the
+    # reading end as soon as the child exits.
+    writer.close()
 
-    while not completed_properly:
-        event = get_next_event(process, queue)
+    return ChildProcessEventStream(process, reader, return_process_events)
 
-        # child process is busy executing, yield so we (the parent) can continue
-        # other work such as checking other child_process_commands
-        if event is None:
-            yield None
-
-        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-            break
-
-        # If we are configured to return process events by the caller,
-        # yield that event to the caller
-        if return_process_events and isinstance(event, ChildProcessEvents):
-            yield event
-
-        if isinstance(event, ChildProcessDoneEvent):
-            completed_properly = True
-        elif isinstance(event, ChildProcessSystemErrorEvent):
-            raise ChildProcessException(
-                'Uncaught exception in process {pid} with message "{message}" and error info {error_info}'.format(
-                    pid=event.pid, message=event.error_info.message, error_info=event.error_info
-                ),
-                error_info=event.error_info,
-            )
-        elif not isinstance(event, ChildProcessEvents):
-            yield event
 
-    if not completed_properly:
-        # TODO Gather up stderr and the process exit code
-        raise ChildProcessCrashException()
+def execute_child_process_command(
+    command, return_process_events=False, multiprocessing_context=None
+):
+    '''
+    Executes command in a child process and yields the events it produces, sleeping while the
+    process is busy executing.
+
+    Warning: if the child process is in an infinite loop. This will
+    also infinitely loop.
+    '''
+    stream = start_child_process_command(command, return_process_events, multiprocessing_context)
+
+    for event in stream:
+        if event is None:
+            wait_for_child_process_events([stream])
+            continue
+        yield event
 
-    process.join()
+    stream.process.join()
@@ -0,0 +1,250 @@
+import asyncio
+from collections import deque, namedtuple
+import sys
+
+import six
+
+from dagster import check
+from dagster.core.definitions.awaitable import PendingAwaitable
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.config import AsyncioExecutorConfig
+from dagster.core.execution.context.system import (
+    SystemPipelineExecutionContext,
+    SystemStepExecutionContext,
+)
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.plan import ExecutionPlan
+
+from .engine_base import IEngine
+from .engine_inprocess import (
+    _assert_missing_inputs_optional,
+    _close_event_loop,
+    execute_step,
+    get_memoization_keys,
+)
+from .intermediates_gc import IntermediatesGarbageCollector
+from .mapping import collect_mapped_steps, start_mapped_step
+
+# Buffered by a step for the engine, for every event of the step, in order
+AsyncStepEvent = namedtuple('AsyncStepEvent', 'step_key event')
+
+# Buffered by a step for the engine once the step has finished. exc_info is set if the step
+# raised rather than reporting its failure through a step failure event.
+AsyncStepDone = namedtuple('AsyncStepDone', 'step_key exc_info')
+
+
+def _iterate_step(step_context, memoization_keys):
+    for step_event in execute_step(
+        step_context,
+        step_context.intermediates_manager,
+        memoization_keys,
+        resolve_awaitables=False,
+    ):
+        yield step_event
+
+
+class AsyncStepDriver(object):
+    '''Drives the execution of a single step on an event loop.
+
+    The step is iterated synchronously until it yields a PendingAwaitable, which is scheduled on
+    the event loop. Once that completes, iteration resumes from a done callback. Steps therefore
+    only yield control of the event loop to one another when they await.
+    '''
+
+    def __init__(self, step_context, memoization_keys, event_loop, on_message):
+        self._step_context = check.inst_param(
+            step_context, 'step_context', SystemStepExecutionContext
+        )
+        self._event_loop = check.inst_param(event_loop, 'event_loop', asyncio.AbstractEventLoop)
+        self._on_message = check.callable_param(on_message, 'on_message')
+        self._step_iter = _iterate_step(step_context, memoization_keys)
+
+    @property
+    def step_key(self):
+        return self._step_context.step.key
+
+    def start(self):
+        self._advance()
+
+    def _advance(self):
+        while True:
+            try:
+                item = next(self._step_iter)
+            except StopIteration:
+                self._on_message(AsyncStepDone(self.step_key, None))
+                return
+            except:  # pylint: disable=bare-except
+                self._on_message(AsyncStepDone(self.step_key, sys.exc_info()))
+                return
+
+            if isinstance(item, PendingAwaitable):
+                future = asyncio.ensure_future(item.awaitable, loop=self._event_loop)
+                future.add_done_callback(lambda future, pending=item: self._resume(pending, future))
+                return
+
+            self._on_message(AsyncStepEvent(self.step_key, item))
+
+    def _resume(self, pending, future):
+        pending.resolve_from_future(future)
+        self._advance()
+
+
+class AsyncioEngine(IEngine):  # pylint: disable=no-init
+    '''Executes the steps of a plan interleaved on a single asyncio event loop, starting each of
+    them as soon as all of the steps it depends on have succeeded.
+
+    Steps of solids with ``async def`` compute functions yield control of the event loop whenever
+    they await, so many of them can wait on I/O concurrently from a single thread.
+    '''
+
+    @staticmethod
+    def execute(pipeline_context, execution_plan, step_keys_to_execute=None):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+        check.param_invariant(
+            isinstance(pipeline_context.executor_config, AsyncioExecutorConfig),
+            'pipeline_context',
+            'Expected executor_config to be AsyncioExecutorConfig got {}'.format(
+                pipeline_context.executor_config
+            ),
+        )
+
+        intermediates_manager = pipeline_context.intermediates_manager
+        limit = pipeline_context.executor_config.max_concurrent
+
+        active_execution = ActiveExecution(
+            execution_plan,
+            step_keys_to_execute,
+            step_durations=pipeline_context.run_storage.get_step_duration_estimates(
+                pipeline_context.pipeline_def.name
+            ),
+            resource_pool_limits=pipeline_context.executor_config.resource_pool_limits,
+        )
+        intermediates_gc = (
+            IntermediatesGarbageCollector(pipeline_context, execution_plan, step_keys_to_execute)
+            if pipeline_context.environment_config.execution.gc_intermediates
+            else None
+        )
+        memoization_keys = get_memoization_keys(pipeline_context, execution_plan)
+
+        event_loop = asyncio.new_event_loop()
+        messages = deque()
+        wakeup = [None]
+
+        def on_message(message):
+            messages.append(message)
+            if wakeup[0] is not None and not wakeup[0].done():
+                wakeup[0].set_result(None)
+
+        running = set()
+        mapped_executions = {}
+        failed_keys = set()
+        error_exc_info = None
+
+        try:
+            while not active_execution.is_complete:
+                for step_event in collect_mapped_steps(
+                    active_execution, mapped_executions, intermediates_gc
+                ):
+                    yield step_event
+
+                for step in active_execution.get_steps_to_skip():
+                    step_context = pipeline_context.for_step(step)
+                    step_context.log.info(
+                        (
+                            'Dependencies for step {step} failed: {failed_inputs}. Not executing.'
+                        ).format(
+                            step=step.key,
+                            failed_inputs=active_execution.failed_or_skipped_upstream(step.key),
+                        )
+                    )
+                    active_execution.mark_skipped(step.key)
+                    yield DagsterEvent.step_skipped_event(step_context)
+
+                # Once a step has raised, wait for the steps that are executing to finish rather
+                # than starting any more of them
+                if error_exc_info is None:
+                    for step in active_execution.get_steps_to_execute(
+                        None if limit is None else limit - len(running)
+                    ):
+                        step_context = pipeline_context.for_step(step)
+
+                        uncovered_inputs = intermediates_manager.uncovered_inputs(
+                            step_context, step
+                        )
+                        if uncovered_inputs:
+                            # In partial pipeline execution, we may end up here without having
+                            # validated the missing dependent outputs were optional
+                            _assert_missing_inputs_optional(
+                                uncovered_inputs, execution_plan, step.key
+                            )
+
+                            step_context.log.info(
+                                (
+                                    'Not all inputs covered for {step}. Not executing. Output '
+                                    'missing for inputs: {uncovered_inputs}'
+                                ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                            )
+                            active_execution.mark_skipped(step.key)
+                            yield DagsterEvent.step_skipped_event(step_context)
+                            continue
+
+                        # Mapped steps are expanded into the steps executing their items, which
+                        # are driven on the event loop like any other step
+                        if step.is_mapped:
+                            try:
+                                for step_event in start_mapped_step(
+                                    step_context,
+                                    intermediates_manager,
+                                    active_execution,
+                                    mapped_executions,
+                                ):
+                                    yield step_event
+                            except Exception:  # pylint: disable=broad-except
+                                error_exc_info = sys.exc_info()
+                                break
+                            continue
+
+                        running.add(step.key)
+                        AsyncStepDriver(
+                            step_context, memoization_keys, event_loop, on_message
+                        ).start()
+
+                if not messages:
+                    if not running:
+                        if error_exc_info is not None:
+                            break
+                        # Only skips and mapped steps to collect are left to process
+                        continue
+
+                    # Run the event loop until any of the steps has something to report
+                    wakeup[0] = event_loop.create_future()
+                    event_loop.run_until_complete(wakeup[0])
+                    wakeup[0] = None
+
+                while messages:
+                    message = messages.popleft()
+                    if isinstance(message, AsyncStepEvent):
+                        if message.event.is_step_failure:
+                            failed_keys.add(message.step_key)
+                        yield message.event
+                        continue
+
+                    check.inst(message, AsyncStepDone)
+                    running.remove(message.step_key)
+                    if message.exc_info is not None:
+                        active_execution.mark_failed(message.step_key)
+                        if error_exc_info is None:
+                            error_exc_info = message.exc_info
+                    elif message.step_key in failed_keys:
+                        active_execution.mark_failed(message.step_key)
+                    else:
+                        active_execution.mark_success(message.step_key)
+                        if intermediates_gc:
+                            intermediates_gc.on_step_success(message.step_key)
+        finally:
+            _close_event_loop(event_loop)
+
+        if error_exc_info is not None:
+            six.reraise(*error_exc_info)
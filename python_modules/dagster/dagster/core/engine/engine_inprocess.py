@@ -1,10 +1,11 @@
+from collections import defaultdict
 import sys
 
 from future.utils import raise_from
 
-from dagster import check
+from dagster import check, seven
 
-from dagster.utils.timing import time_execution_scope
+from dagster.utils.timing import PhaseTimer
 
 from dagster.core.errors import (
     DagsterError,
@@ -16,7 +17,7 @@ from dagster.core.errors import (
     user_code_error_boundary,
 )
 
-from dagster.core.execution.config import ExecutorConfig
+from dagster.core.execution.config import ExecutorConfig, MultiprocessExecutorConfig
 
 from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
@@ -24,10 +25,17 @@ from dagster.core.execution.context.system import (
 )
 
 from dagster.core.definitions import Materialization, ExpectationResult
+from dagster.core.definitions.awaitable import PendingAwaitable
 
 from dagster.core.events import DagsterEvent, DagsterEventType
 
-from dagster.core.storage.intermediates_manager import IntermediatesManager
+from dagster.core.storage.intermediates_manager import (
+    FusedStepsIntermediatesManager,
+    IntermediatesManager,
+)
+
+from dagster.core.types.compression import record_compression_stats
+from dagster.core.types.runtime import TypeCheckPolicy
 
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -36,13 +44,23 @@ from dagster.core.execution.plan.objects import (
     StepOutputHandle,
     StepOutputValue,
     StepOutputData,
+    StepCacheHitData,
     StepFailureData,
+    StepPhase,
     StepSuccessData,
 )
 
+from dagster.core.execution.plan.fusion import fused_step_group
+from dagster.core.execution.plan.mapping import parse_mapped_item_key
+from dagster.core.execution.plan.memoization import (
+    is_step_memoizable,
+    step_output_memoization_keys,
+)
 from dagster.core.execution.plan.plan import ExecutionPlan
 
 from .engine_base import IEngine
+from .intermediates_gc import IntermediatesGarbageCollector
+from .mapping import MappedStepExecution
 
 
 class InProcessEngine(IEngine):  # pylint: disable=no-init
@@ -64,13 +82,21 @@ class InProcessEngine(IEngine):  # pylint: disable=no-init
 
         failed_or_skipped_steps = set()
 
-        step_levels = execution_plan.topological_step_levels()
+        step_levels = _step_levels_to_execute_in_process(execution_plan, step_key_set)
 
         intermediates_manager = pipeline_context.intermediates_manager
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
+        # When a step runs in a child process of the multiprocess engine, the parent process
+        # owns the intermediates and releases them
+        intermediates_gc = (
+            IntermediatesGarbageCollector(pipeline_context, execution_plan, step_keys_to_execute)
+            if pipeline_context.environment_config.execution.gc_intermediates
+            and not isinstance(pipeline_context.executor_config, MultiprocessExecutorConfig)
+            else None
+        )
+
+        memoization_keys = get_memoization_keys(pipeline_context, execution_plan)
+
         for step_level in step_levels:
             for step in step_level:
                 if step_key_set and step.key not in step_key_set:
@@ -109,17 +135,97 @@ class InProcessEngine(IEngine):  # pylint: disable=no-init
                     yield DagsterEvent.step_skipped_event(step_context)
                     continue
 
-                input_values = _create_input_values(step_context, intermediates_manager)
+                if step.is_mapped:
+                    step_events = _execute_mapped_step_in_process(
+                        pipeline_context, step_context, memoization_keys
+                    )
+                else:
+                    step_events = execute_step(
+                        step_context, intermediates_manager, memoization_keys
+                    )
 
-                for step_event in check.generator(
-                    execute_step_in_memory(step_context, input_values, intermediates_manager)
-                ):
+                for step_event in check.generator(step_events):
                     check.inst(step_event, DagsterEvent)
-                    if step_event.is_step_failure:
+                    if step_event.is_step_failure and step_event.step_key == step.key:
                         failed_or_skipped_steps.add(step.key)
 
                     yield step_event
 
+                if intermediates_gc and step.key not in failed_or_skipped_steps:
+                    intermediates_gc.on_step_success(step.key)
+
+
+def _step_levels_to_execute_in_process(execution_plan, step_key_set):
+    # The steps executing the items of a mapped step are not part of the plan. They are executed
+    # by themselves in the child processes of the multiprocess engine, once the parent process has
+    # started the mapped step, and so follow it when their keys are among those to execute.
+    step_levels = execution_plan.topological_step_levels()
+    if not step_key_set:
+        return step_levels
+
+    # mapped step key -> [(index of the item, step executing it)]
+    item_steps = defaultdict(list)
+    for step_key in step_key_set:
+        if step_key in execution_plan.step_dict or not execution_plan.has_step(step_key):
+            continue
+        mapped_step_key, index = parse_mapped_item_key(step_key)
+        item_steps[mapped_step_key].append((index, execution_plan.get_step_by_key(step_key)))
+
+    return [
+        step_level
+        + [
+            item_step
+            for step in step_level
+            for _, item_step in sorted(item_steps[step.key], key=lambda item: item[0])
+        ]
+        for step_level in step_levels
+    ]
+
+
+def _execute_mapped_step_in_process(pipeline_context, step_context, memoization_keys):
+    '''Execute a mapped step, and the steps executing its items one after the other.'''
+    intermediates_manager = step_context.intermediates_manager
+    mapped_execution = MappedStepExecution(step_context, intermediates_manager)
+    for step_event in mapped_execution.start():
+        yield step_event
+
+    if mapped_execution.item_steps is None:
+        return
+
+    failed_item_keys = []
+    for item_step in mapped_execution.item_steps:
+        for step_event in execute_step(
+            pipeline_context.for_step(item_step), intermediates_manager, memoization_keys
+        ):
+            if step_event.is_step_failure:
+                failed_item_keys.append(item_step.key)
+            yield step_event
+
+    for step_event in mapped_execution.collect(failed_item_keys):
+        yield step_event
+
+
+def execute_step_group_in_process(pipeline_context, execution_plan, step_keys):
+    '''Executes the steps of a FusedStepGroup one after the other in this process, handing the
+    values passed between them over in memory.
+    '''
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.list_param(step_keys, 'step_keys', of_type=str)
+
+    if len(step_keys) > 1:
+        group = fused_step_group(execution_plan, step_keys)
+        pipeline_context = pipeline_context.with_intermediates_manager(
+            FusedStepsIntermediatesManager(
+                pipeline_context.intermediates_manager, set(group.memory_only_handles)
+            )
+        )
+
+    for step_event in InProcessEngine.execute(
+        pipeline_context, execution_plan, step_keys_to_execute=step_keys
+    ):
+        yield step_event
+
 
 def _assert_missing_inputs_optional(uncovered_inputs, execution_plan, step_key):
     nonoptionals = [
@@ -154,15 +260,159 @@ def _create_input_values(step_context, intermediates_manager):
     return input_values
 
 
-def execute_step_in_memory(step_context, inputs, intermediates_manager):
+def get_memoization_keys(pipeline_context, execution_plan):
+    '''The memoization keys of the outputs of the steps in the plan, or none if the run does not
+    memoize outputs.'''
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+    if not pipeline_context.environment_config.execution.memoize_outputs:
+        return {}
+    return step_output_memoization_keys(execution_plan, pipeline_context.environment_config)
+
+
+def execute_step(step_context, intermediates_manager, memoization_keys, resolve_awaitables=True):
+    '''Execute a step with inputs read from intermediates_manager, yielding its events.
+
+    If every output of the step has been memoized by an earlier run, the memoized outputs are
+    copied into this run instead, and a step cache hit event is yielded ahead of their output
+    events and the step success event, in place of the events of executing the step. Otherwise
+    the outputs of the step are memoized once it has succeeded.
+
+    Args:
+        memoization_keys (Dict[StepOutputHandle, str]): As returned by get_memoization_keys.
+    '''
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.inst_param(intermediates_manager, 'intermediates_manager', IntermediatesManager)
+    check.dict_param(
+        memoization_keys, 'memoization_keys', key_type=StepOutputHandle, value_type=str
+    )
+
+    step = step_context.step
+    step_memoization_keys = {}
+    if is_step_memoizable(step):
+        for step_output in step.step_outputs:
+            step_output_handle = StepOutputHandle.from_step(step, step_output.name)
+            if step_output_handle in memoization_keys:
+                step_memoization_keys[step_output_handle] = memoization_keys[step_output_handle]
+
+    if len(step_memoization_keys) != len(step.step_outputs):
+        step_memoization_keys = {}
+
+    if step_memoization_keys and all(
+        intermediates_manager.has_memoized_intermediate(step_context, memoization_key)
+        for memoization_key in step_memoization_keys.values()
+    ):
+        for step_event in _reuse_memoized_outputs(
+            step_context, intermediates_manager, step_memoization_keys
+        ):
+            yield step_event
+        return
+
+    phase_timer = create_step_phase_timer()
+    with phase_timer.time_phase(StepPhase.INPUT_LOAD.value):
+        input_values = _create_input_values(step_context, intermediates_manager)
+
+    succeeded = True
+    for step_event in execute_step_in_memory(
+        step_context, input_values, intermediates_manager, resolve_awaitables, phase_timer
+    ):
+        if isinstance(step_event, DagsterEvent) and step_event.is_step_failure:
+            succeeded = False
+        yield step_event
+
+    # Steps that did not yield all of their optional outputs are never memoized
+    if succeeded and all(
+        intermediates_manager.has_intermediate(step_context, step_output_handle)
+        for step_output_handle in step_memoization_keys
+    ):
+        for step_output_handle, memoization_key in step_memoization_keys.items():
+            intermediates_manager.memoize_intermediate(
+                step_context,
+                step.step_output_named(step_output_handle.output_name).runtime_type,
+                step_output_handle,
+                memoization_key,
+            )
+
+
+def _reuse_memoized_outputs(step_context, intermediates_manager, step_memoization_keys):
+    start_time = seven.time_fn()
+    yield DagsterEvent.step_cache_hit_event(
+        step_context,
+        StepCacheHitData(
+            {
+                step_output_handle.output_name: memoization_key
+                for step_output_handle, memoization_key in step_memoization_keys.items()
+            }
+        ),
+    )
+
+    for step_output_handle, memoization_key in step_memoization_keys.items():
+        object_key = intermediates_manager.copy_memoized_intermediate(
+            step_context, memoization_key, step_output_handle
+        )
+        yield DagsterEvent.step_output_event(
+            step_context=step_context,
+            step_output_data=StepOutputData(
+                step_output_handle=step_output_handle,
+                value_repr='<memoized {memoization_key}>'.format(memoization_key=memoization_key),
+                intermediate_materialization=Materialization(path=object_key)
+                if object_key
+                else None,
+            ),
+        )
+
+    # The step completes once its memoized outputs have been copied into the run
+    yield DagsterEvent.step_success_event(
+        step_context, StepSuccessData(duration_ms=(seven.time_fn() - start_time) * 1000)
+    )
+
+
+def create_step_phase_timer():
+    '''A timer of the execution of a step, and of each StepPhase of it.'''
+    return PhaseTimer([phase.value for phase in StepPhase])
+
+
+def execute_step_in_memory(
+    step_context, inputs, intermediates_manager, resolve_awaitables=True, phase_timer=None
+):
+    '''Execute a step, yielding its events.
+
+    Compute functions defined with ``async def`` surface what they are waiting on as
+    PendingAwaitables. By default each of these is run to completion on an event loop private to
+    the step. With resolve_awaitables=False they are yielded instead, and the caller must resolve
+    each of them before resuming iteration.
+
+    Args:
+        phase_timer (Optional[PhaseTimer]): As returned by create_step_phase_timer, if the
+            execution of the step started before inputs were handed to it, e.g. to time loading
+            them.
+    '''
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.dict_param(inputs, 'inputs', key_type=str)
     check.inst_param(intermediates_manager, 'intermediates_manager', IntermediatesManager)
+    check.bool_param(resolve_awaitables, 'resolve_awaitables')
+    phase_timer = check.opt_inst_param(phase_timer, 'phase_timer', PhaseTimer)
+    phase_timer = phase_timer or create_step_phase_timer()
 
+    event_loop = None
     try:
         for step_event in check.generator(
-            _execute_steps_core_loop(step_context, inputs, intermediates_manager)
+            _execute_steps_core_loop(step_context, inputs, intermediates_manager, phase_timer)
         ):
+            if isinstance(step_event, PendingAwaitable):
+                if resolve_awaitables:
+                    if event_loop is None:
+                        import asyncio
+
+                        event_loop = asyncio.new_event_loop()
+                    with phase_timer.time_phase(StepPhase.COMPUTE.value):
+                        step_event.resolve_in_event_loop(event_loop)
+                    continue
+
+                yield step_event
+                continue
+
             if step_event.event_type is DagsterEventType.STEP_OUTPUT:
                 step_context.log.info(
                     'Step {step} emitted {value} for output {output}'.format(
@@ -197,6 +447,16 @@ def execute_step_in_memory(step_context, inputs, intermediates_manager):
             step_context=step_context, step_failure_data=StepFailureData(error=error_info)
         )
         raise
+    finally:
+        if event_loop is not None:
+            _close_event_loop(event_loop)
+
+
+def _close_event_loop(event_loop):
+    # Finalize any async generators the step did not exhaust, e.g. because it raised
+    if hasattr(event_loop, 'shutdown_asyncgens'):
+        event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+    event_loop.close()
 
 
 def _error_check_step_outputs(step_context, step_output_iter):
@@ -256,33 +516,40 @@ def _error_check_step_outputs(step_context, step_output_iter):
                 )
 
 
-def _execute_steps_core_loop(step_context, inputs, intermediates_manager):
+def _execute_steps_core_loop(step_context, inputs, intermediates_manager, phase_timer):
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.dict_param(inputs, 'inputs', key_type=str)
     check.inst_param(intermediates_manager, 'intermediates_manager', IntermediatesManager)
+    check.inst_param(phase_timer, 'phase_timer', PhaseTimer)
 
     evaluated_inputs = {}
     # do runtime type checks of inputs versus step inputs
-    for input_name, input_value in inputs.items():
-        evaluated_inputs[input_name] = _get_evaluated_input(
-            step_context.step, input_name, input_value
-        )
+    with phase_timer.time_phase(StepPhase.TYPE_CHECK.value):
+        for input_name, input_value in inputs.items():
+            evaluated_inputs[input_name] = _get_evaluated_input(
+                step_context.step, input_name, input_value, step_context.type_check_policy
+            )
     yield DagsterEvent.step_start_event(step_context)
 
-    with time_execution_scope() as timer_result:
-        step_output_iterator = check.generator(
-            _iterate_step_outputs_within_boundary(step_context, evaluated_inputs)
-        )
+    # The compute function only runs as the outputs are iterated, so it is timed as each of them
+    # is produced rather than as the generator is created
+    step_output_iterator = check.generator(
+        _iterate_step_outputs_within_boundary(step_context, evaluated_inputs, phase_timer)
+    )
     for step_output in check.generator(
         _error_check_step_outputs(step_context, step_output_iterator)
     ):
 
         if isinstance(step_output, StepOutputValue):
-            yield _create_step_output_event(step_context, step_output, intermediates_manager)
+            yield _create_step_output_event(
+                step_context, step_output, intermediates_manager, phase_timer
+            )
         elif isinstance(step_output, Materialization):
             yield DagsterEvent.step_materialization(step_context, step_output)
         elif isinstance(step_output, ExpectationResult):
             yield DagsterEvent.step_expectation_result(step_context, step_output)
+        elif isinstance(step_output, PendingAwaitable):
+            yield step_output
         else:
             check.failed(
                 'Unexpected step_output {step_output}, should have been caught earlier'.format(
@@ -290,40 +557,55 @@ def _execute_steps_core_loop(step_context, inputs, intermediates_manager):
                 )
             )
 
+    phase_timer.end_time = seven.time_fn()
     yield DagsterEvent.step_success_event(
-        step_context, StepSuccessData(duration_ms=timer_result.millis)
+        step_context,
+        StepSuccessData(
+            duration_ms=phase_timer.millis, phase_durations_ms=phase_timer.millis_by_phase
+        ),
     )
 
 
-def _create_step_output_event(step_context, step_output_value, intermediates_manager):
+def _create_step_output_event(step_context, step_output_value, intermediates_manager, phase_timer):
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.inst_param(step_output_value, 'step_output_value', StepOutputValue)
     check.inst_param(intermediates_manager, 'intermediates_manager', IntermediatesManager)
+    check.inst_param(phase_timer, 'phase_timer', PhaseTimer)
 
     step = step_context.step
     step_output = step.step_output_named(step_output_value.output_name)
 
     try:
-        value = step_output.runtime_type.coerce_runtime_value(step_output_value.value)
+        with phase_timer.time_phase(StepPhase.TYPE_CHECK.value):
+            value = step_output.runtime_type.coerce_runtime_value_with_policy(
+                step_output_value.value, step_context.type_check_policy
+            )
+        value_repr = step_output.runtime_type.summarize_value(value)
+        if step_output.runtime_type.is_stream:
+            value = _iterate_stream_within_boundary(step_context, value)
         step_output_handle = StepOutputHandle.from_step(
             step=step, output_name=step_output_value.output_name
         )
 
-        object_key = intermediates_manager.set_intermediate(
-            context=step_context,
-            runtime_type=step_output.runtime_type,
-            step_output_handle=step_output_handle,
-            value=value,
-        )
+        # The chunks of a stream are produced as they are written, and so count as output storage
+        with phase_timer.time_phase(StepPhase.OUTPUT_STORE.value):
+            with record_compression_stats() as compression_stats:
+                object_key = intermediates_manager.set_intermediate(
+                    context=step_context,
+                    runtime_type=step_output.runtime_type,
+                    step_output_handle=step_output_handle,
+                    value=value,
+                )
 
         return DagsterEvent.step_output_event(
             step_context=step_context,
             step_output_data=StepOutputData(
                 step_output_handle=step_output_handle,
-                value_repr=repr(value),
+                value_repr=value_repr,
                 intermediate_materialization=Materialization(path=object_key)
                 if object_key
                 else None,
+                compression_stats=compression_stats[-1] if compression_stats else None,
             ),
         )
     except DagsterRuntimeCoercionError as e:
@@ -339,13 +621,16 @@ def _create_step_output_event(step_context, step_output_value, intermediates_man
         )
 
 
-def _get_evaluated_input(step, input_name, input_value):
+def _get_evaluated_input(step, input_name, input_value, type_check_policy):
     check.inst_param(step, 'step', ExecutionStep)
     check.str_param(input_name, 'input_name')
+    check.inst_param(type_check_policy, 'type_check_policy', TypeCheckPolicy)
 
     step_input = step.step_input_named(input_name)
     try:
-        return step_input.runtime_type.coerce_runtime_value(input_value)
+        return step_input.runtime_type.coerce_runtime_value_with_policy(
+            input_value, type_check_policy
+        )
     except DagsterRuntimeCoercionError as evaluate_error:
         raise_from(
             DagsterTypeError(
@@ -366,10 +651,7 @@ def _get_evaluated_input(step, input_name, input_value):
         )
 
 
-def _iterate_step_outputs_within_boundary(step_context, evaluated_inputs):
-    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
-    check.dict_param(evaluated_inputs, 'evaluated_inputs', key_type=str)
-
+def _step_user_code_error_boundary(step_context):
     error_str = '''Error occured during the execution of step:
     step key: "{key}"
     solid instance: "{solid}"
@@ -380,15 +662,32 @@ def _iterate_step_outputs_within_boundary(step_context, evaluated_inputs):
         solid=step_context.solid.name,
     )
 
-    with user_code_error_boundary(
+    return user_code_error_boundary(
         DagsterExecutionStepExecutionError,
         error_str,
         step_key=step_context.step.key,
         solid_def_name=step_context.solid_def.name,
         solid_name=step_context.solid.name,
-    ):
-        gen = check.opt_generator(step_context.step.compute_fn(step_context, evaluated_inputs))
+    )
+
+
+def _iterate_stream_within_boundary(step_context, stream):
+    # The chunks of a stream output are produced by user code as they are written to the
+    # intermediates manager, after the compute function has returned
+    with _step_user_code_error_boundary(step_context):
+        for chunk in stream:
+            yield chunk
+
+
+def _iterate_step_outputs_within_boundary(step_context, evaluated_inputs, phase_timer):
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.dict_param(evaluated_inputs, 'evaluated_inputs', key_type=str)
+    check.inst_param(phase_timer, 'phase_timer', PhaseTimer)
+
+    with _step_user_code_error_boundary(step_context):
+        with phase_timer.time_phase(StepPhase.COMPUTE.value):
+            gen = check.opt_generator(step_context.step.compute_fn(step_context, evaluated_inputs))
 
         if gen is not None:
-            for step_output in gen:
+            for step_output in phase_timer.time_iterator(StepPhase.COMPUTE.value, gen):
                 yield step_output
@@ -1,20 +1,33 @@
 import os
+
 from dagster import check
 
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.config import MultiprocessExecutorConfig
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.fusion import fuse_steps
 from dagster.core.execution.plan.plan import ExecutionPlan
 
-from .child_process_executor import ChildProcessCommand, execute_child_process_command
+from .child_process_executor import (
+    ChildProcessCommand,
+    reap_child_processes,
+    start_child_process_command,
+    wait_for_child_process_events,
+)
 from .engine_base import IEngine
-from .engine_inprocess import InProcessEngine
+from .engine_inprocess import execute_step_group_in_process
+from .intermediates_gc import IntermediatesGarbageCollector
+from .mapping import collect_mapped_steps, start_mapped_step
+from .speculation import SpeculativeStepEventStream
+from .worker_pool import StepWorkerPool
 
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
-    def __init__(self, environment_dict, run_config, step_key):
+    def __init__(self, environment_dict, run_config, step_keys):
         self.environment_dict = environment_dict
         self.run_config = run_config
-        self.step_key = step_key
+        self.step_keys = step_keys
 
     def execute(self):
         from dagster.core.execution.api import scoped_pipeline_context
@@ -30,13 +43,13 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
                 pipeline_context.pipeline_def, pipeline_context.environment_config
             )
 
-            for step_event in InProcessEngine.execute(
-                pipeline_context, execution_plan, step_keys_to_execute=[self.step_key]
+            for step_event in execute_step_group_in_process(
+                pipeline_context, execution_plan, self.step_keys
             ):
                 yield step_event
 
 
-def execute_step_out_of_process(step_context, step):
+def execute_steps_out_of_process(step_context, step_keys):
     check.invariant(
         not step_context.run_config.loggers,
         'Cannot inject loggers via RunConfig with the Multiprocess executor',
@@ -47,35 +60,13 @@ def execute_step_out_of_process(step_context, step):
     )
 
     command = InProcessExecutorChildProcessCommand(
-        step_context.environment_dict, step_context.run_config, step.key
+        step_context.environment_dict, step_context.run_config, step_keys
     )
 
-    for step_event in execute_child_process_command(command):
-        yield step_event
-
-
-def bounded_parallel_executor(step_contexts, limit):
-    pending_execution = list(step_contexts)
-    active_iters = {}
-
-    while pending_execution or active_iters:
-        while len(active_iters) < limit and pending_execution:
-            step_context = pending_execution.pop()
-            step = step_context.step
-            active_iters[step.key] = execute_step_out_of_process(step_context, step)
-
-        empty_iters = []
-        for key, step_iter in active_iters.items():
-            try:
-                event_or_none = next(step_iter)
-                if event_or_none is None:
-                    continue
-                yield event_or_none
-            except StopIteration:
-                empty_iters.append(key)
-
-        for key in empty_iters:
-            del active_iters[key]
+    return start_child_process_command(
+        command,
+        multiprocessing_context=step_context.executor_config.get_multiprocessing_context(),
+    )
 
 
 class MultiprocessingEngine(IEngine):  # pylint: disable=no-init
@@ -85,38 +76,203 @@ class MultiprocessingEngine(IEngine):  # pylint: disable=no-init
         check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
         check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
 
-        step_levels = execution_plan.topological_step_levels()
-
         intermediates_manager = pipeline_context.intermediates_manager
 
         limit = pipeline_context.executor_config.max_concurrent
+        speculation_threshold = pipeline_context.executor_config.speculation_threshold
+
+        step_durations = pipeline_context.run_storage.get_step_duration_estimates(
+            pipeline_context.pipeline_def.name
+        )
+
+        # Rather than walking the plan level by level, each step is started as soon as all of
+        # the steps it depends on have completed, bounded by max_concurrent.
+        active_execution = ActiveExecution(
+            execution_plan,
+            step_keys_to_execute,
+            step_durations=step_durations,
+            resource_pool_limits=pipeline_context.executor_config.resource_pool_limits,
+        )
+        active_iters = {}
+        mapped_executions = {}
+        failed_keys = set()
+        skipped_keys = set()
+
+        # head step key -> FusedStepGroup. The steps following the head of a group are never
+        # returned by get_steps_to_execute, since they only become ready once the group completes.
+        step_groups = (
+            fuse_steps(execution_plan, step_keys_to_execute)
+            if pipeline_context.executor_config.fuse_steps
+            else None
+        )
+
+        def _group_step_keys(step_key):
+            # The steps executing the items of mapped steps are not part of any group
+            if step_groups and step_key in step_groups:
+                return step_groups[step_key].step_keys
+            return [step_key]
+
+        worker_pool = (
+            StepWorkerPool(pipeline_context, limit)
+            if pipeline_context.executor_config.persistent_workers
+            else None
+        )
+
+        intermediates_gc = (
+            IntermediatesGarbageCollector(pipeline_context, execution_plan, step_keys_to_execute)
+            if pipeline_context.environment_config.execution.gc_intermediates
+            else None
+        )
+
+        try:
+            while not active_execution.is_complete:
+                for step_event in collect_mapped_steps(
+                    active_execution, mapped_executions, intermediates_gc
+                ):
+                    yield step_event
+
+                for step in active_execution.get_steps_to_skip():
+                    step_context = pipeline_context.for_step(step)
+                    step_context.log.info(
+                        (
+                            'Dependencies for step {step} failed: {failed_inputs}. Not executing.'
+                        ).format(
+                            step=step.key,
+                            failed_inputs=active_execution.failed_or_skipped_upstream(step.key),
+                        )
+                    )
+                    active_execution.mark_skipped(step.key)
+                    yield DagsterEvent.step_skipped_event(step_context)
+
+                for step in active_execution.get_steps_to_execute(
+                    limit - _running_process_count(active_iters)
+                ):
+                    step_context = pipeline_context.for_step(step)
+
+                    if not intermediates_manager.all_inputs_covered(step_context, step):
+                        expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
+
+                        step_context.log.error(
+                            (
+                                'Not all inputs covered for {step}. Not executing.'
+                                'Outputs need for inputs {expected_outputs}'
+                            ).format(expected_outputs=expected_outputs, step=step.key)
+                        )
+                        active_execution.mark_skipped(step.key)
+                        continue
+
+                    # Mapped steps are started in this process, and expanded into the steps
+                    # executing their items, each of which is executed in a process of its own
+                    if step.is_mapped:
+                        for step_event in start_mapped_step(
+                            step_context, intermediates_manager, active_execution, mapped_executions
+                        ):
+                            yield step_event
+                        continue
+
+                    step_keys = _group_step_keys(step.key)
+                    if worker_pool:
+                        active_iters[step.key] = worker_pool.execute_steps(step_keys)
+                    elif speculation_threshold is not None and all(
+                        execution_plan.is_step_idempotent(step_key) and step_key in step_durations
+                        for step_key in step_keys
+                    ):
+                        active_iters[step.key] = SpeculativeStepEventStream(
+                            lambda step_context=step_context, step_keys=step_keys: (
+                                execute_steps_out_of_process(step_context, step_keys)
+                            ),
+                            expected_seconds=sum(step_durations[key] for key in step_keys) / 1000.0,
+                            speculation_threshold=speculation_threshold,
+                        )
+                    else:
+                        active_iters[step.key] = execute_steps_out_of_process(
+                            step_context, step_keys
+                        )
+
+                for key, step_iter in active_iters.items():
+                    if (
+                        isinstance(step_iter, SpeculativeStepEventStream)
+                        and step_iter.is_straggling
+                        and _running_process_count(active_iters) < limit
+                    ):
+                        pipeline_context.for_step(execution_plan.get_step_by_key(key)).log.info(
+                            (
+                                'Step {step} has been executing for longer than expected. '
+                                'Starting a speculative copy of it.'
+                            ).format(step=key)
+                        )
+                        step_iter.speculate()
+
+                received_events = False
+                empty_iters = []
+                for key, step_iter in active_iters.items():
+                    # Drain every event this step has available without blocking
+                    for event_or_none in step_iter:
+                        if event_or_none is None:
+                            break
+                        received_events = True
+                        if event_or_none.is_step_failure:
+                            failed_keys.add(event_or_none.step_key)
+                        elif event_or_none.event_type == DagsterEventType.STEP_SKIPPED:
+                            skipped_keys.add(event_or_none.step_key)
+                        yield event_or_none
+                    else:
+                        empty_iters.append(key)
+
+                if not received_events and not empty_iters:
+                    # Sleep until any child process sends an event or exits, or until the next
+                    # speculatively executed step becomes a straggler while a process is free to
+                    # execute a copy of it
+                    wait_for_child_process_events(
+                        list(active_iters.values()),
+                        _seconds_until_straggling(active_iters)
+                        if _running_process_count(active_iters) < limit
+                        else None,
+                    )
 
-        step_key_set = None if step_keys_to_execute is None else set(step_keys_to_execute)
-
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
-
-        for step_level in step_levels:
-            step_contexts_to_execute = []
-            for step in step_level:
-                if step_key_set and step.key not in step_key_set:
-                    continue
-
-                step_context = pipeline_context.for_step(step)
+                for key in empty_iters:
+                    del active_iters[key]
+                    for step_key in _group_step_keys(key):
+                        if step_key != key:
+                            active_execution.claim_step(step_key)
+
+                        if step_key in failed_keys:
+                            active_execution.mark_failed(step_key)
+                        elif step_key in skipped_keys:
+                            active_execution.mark_skipped(step_key)
+                        else:
+                            active_execution.mark_success(step_key)
+                            if intermediates_gc:
+                                intermediates_gc.on_step_success(step_key)
+        finally:
+            for step_iter in active_iters.values():
+                if isinstance(step_iter, SpeculativeStepEventStream):
+                    step_iter.terminate()
+
+            if worker_pool:
+                worker_pool.shutdown()
+
+            reap_child_processes()
+
+            # The engine owns the intermediates of the run. Shared memory storage releases them
+            # here, while other storage keeps them.
+            intermediates_manager.release_run_intermediates(
+                pipeline_context, execution_plan.get_solid_result_outputs(step_keys_to_execute)
+            )
 
-                if not intermediates_manager.all_inputs_covered(step_context, step):
-                    expected_outputs = [ni.prev_output_handle for ni in step.step_inputs]
 
-                    step_context.log.error(
-                        (
-                            'Not all inputs covered for {step}. Not executing.'
-                            'Outputs need for inputs {expected_outputs}'
-                        ).format(expected_outputs=expected_outputs, step=step.key)
-                    )
-                    continue
+def _running_process_count(active_iters):
+    return sum(
+        len(step_iter.running_copies) if isinstance(step_iter, SpeculativeStepEventStream) else 1
+        for step_iter in active_iters.values()
+    )
 
-                step_contexts_to_execute.append(step_context)
 
-            for step_event in bounded_parallel_executor(step_contexts_to_execute, limit):
-                yield step_event
+def _seconds_until_straggling(active_iters):
+    timeouts = [
+        step_iter.seconds_until_straggling()
+        for step_iter in active_iters.values()
+        if isinstance(step_iter, SpeculativeStepEventStream)
+    ]
+    timeouts = [timeout for timeout in timeouts if timeout is not None]
+    return min(timeouts) if timeouts else None
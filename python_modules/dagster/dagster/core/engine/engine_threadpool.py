@@ -0,0 +1,185 @@
+from collections import namedtuple
+import sys
+import threading
+
+import six
+from six.moves import queue
+
+from dagster import check
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.context.system import (
+    SystemPipelineExecutionContext,
+    SystemStepExecutionContext,
+)
+from dagster.core.execution.config import ThreadPoolExecutorConfig
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.plan import ExecutionPlan
+
+from .engine_base import IEngine
+from .engine_inprocess import _assert_missing_inputs_optional, execute_step, get_memoization_keys
+from .intermediates_gc import IntermediatesGarbageCollector
+from .mapping import collect_mapped_steps, start_mapped_step
+
+
+# Sent from a step thread to the engine for every event of the step, in order
+StepThreadEvent = namedtuple('StepThreadEvent', 'step_key event')
+
+# Sent from a step thread to the engine once the step has finished. exc_info is set if the step
+# raised rather than reporting its failure through a step failure event.
+StepThreadDone = namedtuple('StepThreadDone', 'step_key exc_info')
+
+
+def execute_step_in_thread(step_context, memoization_keys, event_queue):
+    check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+
+    step_key = step_context.step.key
+    exc_info = None
+    try:
+        for step_event in check.generator(
+            execute_step(step_context, step_context.intermediates_manager, memoization_keys)
+        ):
+            event_queue.put(StepThreadEvent(step_key, step_event))
+    except:  # pylint: disable=bare-except
+        exc_info = sys.exc_info()
+    finally:
+        event_queue.put(StepThreadDone(step_key, exc_info))
+
+
+class ThreadPoolEngine(IEngine):  # pylint: disable=no-init
+    '''Executes each step in a thread of its own, up to ThreadPoolExecutorConfig.max_concurrent of
+    them at once, as soon as all of the steps it depends on have succeeded.
+
+    All steps share the pipeline context, its resources and its intermediates manager. Events are
+    forwarded from the step threads to the caller through a single queue, so the events of any one
+    step are yielded in the order that step produced them.
+    '''
+
+    @staticmethod
+    def execute(pipeline_context, execution_plan, step_keys_to_execute=None):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+        check.param_invariant(
+            isinstance(pipeline_context.executor_config, ThreadPoolExecutorConfig),
+            'pipeline_context',
+            'Expected executor_config to be ThreadPoolExecutorConfig got {}'.format(
+                pipeline_context.executor_config
+            ),
+        )
+
+        intermediates_manager = pipeline_context.intermediates_manager
+        limit = pipeline_context.executor_config.max_concurrent
+
+        active_execution = ActiveExecution(
+            execution_plan,
+            step_keys_to_execute,
+            step_durations=pipeline_context.run_storage.get_step_duration_estimates(
+                pipeline_context.pipeline_def.name
+            ),
+            resource_pool_limits=pipeline_context.executor_config.resource_pool_limits,
+        )
+        intermediates_gc = (
+            IntermediatesGarbageCollector(pipeline_context, execution_plan, step_keys_to_execute)
+            if pipeline_context.environment_config.execution.gc_intermediates
+            else None
+        )
+        memoization_keys = get_memoization_keys(pipeline_context, execution_plan)
+
+        event_queue = queue.Queue()
+        running = set()
+        mapped_executions = {}
+        failed_keys = set()
+        error_exc_info = None
+
+        while not active_execution.is_complete:
+            for step_event in collect_mapped_steps(
+                active_execution, mapped_executions, intermediates_gc
+            ):
+                yield step_event
+
+            for step in active_execution.get_steps_to_skip():
+                step_context = pipeline_context.for_step(step)
+                step_context.log.info(
+                    ('Dependencies for step {step} failed: {failed_inputs}. Not executing.').format(
+                        step=step.key,
+                        failed_inputs=active_execution.failed_or_skipped_upstream(step.key),
+                    )
+                )
+                active_execution.mark_skipped(step.key)
+                yield DagsterEvent.step_skipped_event(step_context)
+
+            # Once a step has raised, wait for the steps that are executing to finish rather than
+            # starting any more of them
+            if error_exc_info is None:
+                for step in active_execution.get_steps_to_execute(limit - len(running)):
+                    step_context = pipeline_context.for_step(step)
+
+                    uncovered_inputs = intermediates_manager.uncovered_inputs(step_context, step)
+                    if uncovered_inputs:
+                        # In partial pipeline execution, we may end up here without having
+                        # validated the missing dependent outputs were optional
+                        _assert_missing_inputs_optional(uncovered_inputs, execution_plan, step.key)
+
+                        step_context.log.info(
+                            (
+                                'Not all inputs covered for {step}. Not executing. Output missing '
+                                'for inputs: {uncovered_inputs}'
+                            ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                        )
+                        active_execution.mark_skipped(step.key)
+                        yield DagsterEvent.step_skipped_event(step_context)
+                        continue
+
+                    # Mapped steps are expanded into the steps executing their items, which are
+                    # executed in threads of their own
+                    if step.is_mapped:
+                        try:
+                            for step_event in start_mapped_step(
+                                step_context,
+                                intermediates_manager,
+                                active_execution,
+                                mapped_executions,
+                            ):
+                                yield step_event
+                        except Exception:  # pylint: disable=broad-except
+                            error_exc_info = sys.exc_info()
+                            break
+                        continue
+
+                    thread = threading.Thread(
+                        target=execute_step_in_thread,
+                        args=(step_context, memoization_keys, event_queue),
+                        name='dagster-step-{step_key}'.format(step_key=step.key),
+                    )
+                    thread.daemon = True
+                    thread.start()
+                    running.add(step.key)
+
+            if not running:
+                if error_exc_info is not None:
+                    break
+                # Only skips and mapped steps to collect are left to process
+                continue
+
+            message = event_queue.get()
+            if isinstance(message, StepThreadEvent):
+                if message.event.is_step_failure:
+                    failed_keys.add(message.step_key)
+                yield message.event
+                continue
+
+            check.inst(message, StepThreadDone)
+            running.remove(message.step_key)
+            if message.exc_info is not None:
+                active_execution.mark_failed(message.step_key)
+                if error_exc_info is None:
+                    error_exc_info = message.exc_info
+            elif message.step_key in failed_keys:
+                active_execution.mark_failed(message.step_key)
+            else:
+                active_execution.mark_success(message.step_key)
+                if intermediates_gc:
+                    intermediates_gc.on_step_success(message.step_key)
+
+        if error_exc_info is not None:
+            six.reraise(*error_exc_info)
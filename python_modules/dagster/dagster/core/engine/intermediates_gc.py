@@ -0,0 +1,83 @@
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.objects import StepKind
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.runs import INTERMEDIATE_RELEASED, StepEventRecord
+
+
+class IntermediatesGarbageCollector(object):
+    '''Reference counts the intermediates of an execution plan so that engines can release each
+    of them as soon as it is no longer needed, rather than at the end of the run.
+
+    Every StepOutputHandle is counted against the steps that consume it. Once all of those steps
+    have succeeded the intermediate is removed from the intermediates manager, and its release is
+    recorded to run storage so that resuming the run does not rely on it. The following are never
+    released:
+
+        - outputs that no step consumes, since these are the results of the run
+        - outputs consumed by steps outside of step_keys_to_execute
+        - outputs that are materialized
+        - outputs consumed by a step that failed or was skipped, since reexecuting that step
+          requires them
+        - the items of mapped steps, and the outputs of the steps executing them
+
+    Args:
+        pipeline_context (SystemPipelineExecutionContext): The context whose intermediates manager
+            holds the intermediates.
+        execution_plan (ExecutionPlan): The plan being executed.
+        step_keys_to_execute (Optional[List[str]]): The subset of steps being executed.
+    '''
+
+    def __init__(self, pipeline_context, execution_plan, step_keys_to_execute=None):
+        self._pipeline_context = check.inst_param(
+            pipeline_context, 'pipeline_context', SystemPipelineExecutionContext
+        )
+        check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+
+        step_key_set = set(step_keys_to_execute) if step_keys_to_execute else None
+
+        # step output handle -> keys of the steps that still have to consume it
+        self._consumers = defaultdict(set)
+        self._retained = set()
+        self._step_inputs = {}
+
+        for step in execution_plan.steps:
+            handles = [step_input.prev_output_handle for step_input in step.step_inputs]
+            self._step_inputs[step.key] = handles
+            for handle in handles:
+                if step.kind == StepKind.MATERIALIZATION_THUNK or (
+                    step_key_set is not None and step.key not in step_key_set
+                ):
+                    self._retained.add(handle)
+                else:
+                    self._consumers[handle].add(step.key)
+
+    def on_step_success(self, step_key):
+        '''Release every intermediate whose last remaining consumer is step_key.'''
+        check.str_param(step_key, 'step_key')
+
+        # The steps executing the items of mapped steps are not part of the plan
+        for handle in self._step_inputs.get(step_key, []):
+            consumers = self._consumers[handle]
+            consumers.discard(step_key)
+            if consumers or handle in self._retained:
+                continue
+
+            intermediates_manager = self._pipeline_context.intermediates_manager
+            if intermediates_manager.has_intermediate(self._pipeline_context, handle):
+                self._pipeline_context.log.debug(
+                    'Releasing intermediate {step_key}.{output_name}, all of its consumers have '
+                    'completed'.format(step_key=handle.step_key, output_name=handle.output_name)
+                )
+                intermediates_manager.rm_intermediate(self._pipeline_context, handle)
+                self._pipeline_context.run_storage.write_step_event_record(
+                    StepEventRecord(
+                        run_id=self._pipeline_context.run_id,
+                        step_key=handle.step_key,
+                        event_type_value=INTERMEDIATE_RELEASED,
+                        output_name=handle.output_name,
+                    )
+                )
@@ -0,0 +1,217 @@
+import sys
+
+from dagster import check, seven
+from dagster.core.definitions import Materialization
+from dagster.core.errors import DagsterError
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.context.system import SystemStepExecutionContext
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.mapping import create_mapped_item_step, mapped_item_input_handle
+from dagster.core.execution.plan.objects import (
+    StepFailureData,
+    StepOutputData,
+    StepOutputHandle,
+    StepSuccessData,
+)
+from dagster.core.storage.intermediates_manager import IntermediatesManager
+from dagster.core.types.compression import record_compression_stats
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+from dagster.utils.timing import TimerResult
+
+
+class MappedStepExecution(object):
+    '''Executes a mapped step in the two phases surrounding the execution of its items.
+
+    start writes each item of the mapped input to the intermediates manager, after which
+    item_steps holds the steps executing them. These are executed like any other step, by the
+    engine. collect then gathers the values every item step produced for each output into a list,
+    in the order of the items, and writes these as the outputs of the mapped step.
+
+    The mapped step yields a start event when it starts, and its outputs and a success event once
+    collected, so that its duration spans the execution of all of its items.
+    '''
+
+    def __init__(self, step_context, intermediates_manager):
+        self._step_context = check.inst_param(
+            step_context, 'step_context', SystemStepExecutionContext
+        )
+        self._intermediates_manager = check.inst_param(
+            intermediates_manager, 'intermediates_manager', IntermediatesManager
+        )
+        check.invariant(
+            step_context.step.is_mapped,
+            'Step {key} is not mapped'.format(key=step_context.step.key),
+        )
+        self._timer_result = None
+        self.item_steps = None
+
+    def start(self):
+        # Imported here since the in process engine executes mapped steps through this class
+        from .engine_inprocess import _get_evaluated_input
+
+        step_context = self._step_context
+        step = step_context.step
+        step_input = step.step_input_named(step.mapped_input)
+
+        yield DagsterEvent.step_start_event(step_context)
+        self._timer_result = TimerResult()
+
+        try:
+            items = _get_evaluated_input(
+                step,
+                step_input.name,
+                self._intermediates_manager.get_intermediate(
+                    step_context, step_input.runtime_type, step_input.prev_output_handle
+                ),
+                step_context.type_check_policy,
+            )
+        except DagsterError as dagster_error:
+            yield DagsterEvent.step_failure_event(
+                step_context=step_context,
+                step_failure_data=StepFailureData(
+                    error=serializable_error_info_from_exc_info(sys.exc_info())
+                ),
+            )
+
+            if step_context.executor_config.raise_on_error:
+                raise dagster_error
+
+            return
+
+        for index, item in enumerate(items):
+            self._intermediates_manager.set_intermediate(
+                context=step_context,
+                runtime_type=step_input.runtime_type.inner_type,
+                step_output_handle=mapped_item_input_handle(step, index),
+                value=item,
+            )
+
+        step_context.log.info(
+            'Mapped step {step} over {count} items of input {input_name}'.format(
+                step=step.key, count=len(items), input_name=step_input.name
+            )
+        )
+        self.item_steps = [create_mapped_item_step(step, index) for index in range(len(items))]
+
+    def collect(self, failed_item_keys):
+        '''Collect the outputs of the item steps, or fail the mapped step if any of them, with
+        keys failed_item_keys, failed or was skipped.'''
+        check.list_param(failed_item_keys, 'failed_item_keys', of_type=str)
+        check.invariant(self.item_steps is not None, 'Mapped step has not been started')
+
+        step_context = self._step_context
+        step = step_context.step
+
+        if failed_item_keys:
+            yield DagsterEvent.step_failure_event(
+                step_context=step_context,
+                step_failure_data=StepFailureData(
+                    error=SerializableErrorInfo(
+                        message='Steps {keys} executing items of mapped step {step} did not '
+                        'succeed.'.format(keys=failed_item_keys, step=step.key),
+                        stack=[],
+                        cls_name=None,
+                    )
+                ),
+            )
+            return
+
+        for step_output in step.step_outputs:
+            item_output_handles = [
+                StepOutputHandle.from_step(item_step, step_output.name)
+                for item_step in self.item_steps
+            ]
+            # Items that did not yield an optional output are left out of its list
+            if step_output.optional:
+                item_output_handles = [
+                    handle
+                    for handle in item_output_handles
+                    if self._intermediates_manager.has_intermediate(step_context, handle)
+                ]
+                if self.item_steps and not item_output_handles:
+                    continue
+
+            values = [
+                self._intermediates_manager.get_intermediate(
+                    step_context, step_output.runtime_type.inner_type, handle
+                )
+                for handle in item_output_handles
+            ]
+
+            step_output_handle = StepOutputHandle.from_step(step, step_output.name)
+            with record_compression_stats() as compression_stats:
+                object_key = self._intermediates_manager.set_intermediate(
+                    context=step_context,
+                    runtime_type=step_output.runtime_type,
+                    step_output_handle=step_output_handle,
+                    value=values,
+                )
+            yield DagsterEvent.step_output_event(
+                step_context=step_context,
+                step_output_data=StepOutputData(
+                    step_output_handle=step_output_handle,
+                    value_repr=step_output.runtime_type.summarize_value(values),
+                    intermediate_materialization=Materialization(path=object_key)
+                    if object_key
+                    else None,
+                    compression_stats=compression_stats[-1] if compression_stats else None,
+                ),
+            )
+
+        self._timer_result.end_time = seven.time_fn()
+        yield DagsterEvent.step_success_event(
+            step_context, StepSuccessData(duration_ms=self._timer_result.millis)
+        )
+
+
+def start_mapped_step(step_context, intermediates_manager, active_execution, mapped_executions):
+    '''Start a mapped step that active_execution returned to be executed, yielding its events, and
+    expand it into the steps executing its items. If it fails to start it is marked as failed.
+
+    Args:
+        mapped_executions (Dict[str, MappedStepExecution]): The mapped steps that have started
+            but not yet been collected, by step key. The mapped step is added to it.
+    '''
+    check.inst_param(active_execution, 'active_execution', ActiveExecution)
+    check.dict_param(mapped_executions, 'mapped_executions', key_type=str)
+
+    step_key = step_context.step.key
+    mapped_execution = MappedStepExecution(step_context, intermediates_manager)
+    try:
+        for step_event in mapped_execution.start():
+            yield step_event
+    except Exception:  # pylint: disable=broad-except
+        active_execution.mark_failed(step_key)
+        raise
+
+    if mapped_execution.item_steps is None:
+        active_execution.mark_failed(step_key)
+        return
+
+    mapped_executions[step_key] = mapped_execution
+    active_execution.expand_mapped_step(
+        step_key, [item_step.key for item_step in mapped_execution.item_steps]
+    )
+
+
+def collect_mapped_steps(active_execution, mapped_executions, intermediates_gc=None):
+    '''Collect the outputs of every mapped step whose items have all been executed, yielding the
+    events of the mapped steps, and resolve them.'''
+    check.inst_param(active_execution, 'active_execution', ActiveExecution)
+    check.dict_param(mapped_executions, 'mapped_executions', key_type=str)
+
+    for step in active_execution.get_mapped_steps_to_collect():
+        mapped_execution = mapped_executions.pop(step.key)
+
+        failed = False
+        for step_event in mapped_execution.collect(active_execution.failed_mapped_items(step.key)):
+            if step_event.is_step_failure:
+                failed = True
+            yield step_event
+
+        if failed:
+            active_execution.mark_failed(step.key)
+        else:
+            active_execution.mark_success(step.key)
+            if intermediates_gc:
+                intermediates_gc.on_step_success(step.key)
@@ -0,0 +1,144 @@
+from collections import deque
+import sys
+import time
+
+import six
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+
+from .child_process_executor import ChildProcessCrashException, ChildProcessException
+
+# A step is never considered a straggler before it has been executing for this long, however
+# short its expected duration, so that the cost of starting a process is not paid for nothing
+MIN_SPECULATION_SECONDS = 1.0
+
+# The number of processes executing a step at once, including the original one
+MAX_SPECULATIVE_COPIES = 2
+
+
+class _Copy(object):
+    def __init__(self, stream):
+        self.stream = stream
+        self.events = []
+        self.started_at = None
+        self.failed = False
+        self.exc_info = None
+        self.done = False
+
+    def drain(self):
+        try:
+            for event in self.stream:
+                if event is None:
+                    return
+                self.events.append(event)
+                if self.started_at is None and event.event_type == DagsterEventType.STEP_START:
+                    self.started_at = time.time()
+                if event.is_step_failure:
+                    self.failed = True
+        except (ChildProcessCrashException, ChildProcessException):
+            self.failed = True
+            self.exc_info = sys.exc_info()
+        self.done = True
+
+    def terminate(self):
+        self.stream.process.terminate()
+        self.stream.process.join()
+        self.stream.conn.close()
+
+
+class SpeculativeStepEventStream(six.Iterator):
+    '''The events of a step, or of a group of fused steps, that may be executed by more than one
+    process at once. Used by the MultiprocessingEngine for steps of idempotent solids when
+    MultiprocessExecutorConfig.speculation_threshold is set.
+
+    The step is first executed by a single process. Once that has been executing for longer than
+    speculation_threshold times expected_seconds, is_straggling becomes True and the engine may
+    call speculate to start a copy of it. Events are held back until a copy completes. The events
+    of the first copy to succeed are then returned and any other copy is terminated. If every
+    copy fails, the events of the first one to fail are returned instead.
+
+    Like ChildProcessEventStream, iteration never blocks and returns None while no copy has
+    completed.
+
+    Args:
+        start_copy (Callable[[], ChildProcessEventStream]): Starts a process executing the step.
+        expected_seconds (float): How long the step is expected to execute for.
+        speculation_threshold (float): How many times expected_seconds the step may execute for
+            before it is considered a straggler.
+    '''
+
+    def __init__(self, start_copy, expected_seconds, speculation_threshold):
+        self._start_copy = check.callable_param(start_copy, 'start_copy')
+        check.float_param(expected_seconds, 'expected_seconds')
+        check.float_param(speculation_threshold, 'speculation_threshold')
+
+        self._straggling_after = max(
+            MIN_SPECULATION_SECONDS, expected_seconds * speculation_threshold
+        )
+        self._copies = [_Copy(start_copy())]
+        self._failed_copies = []
+        self._events = None
+
+    def __iter__(self):
+        return self
+
+    @property
+    def running_copies(self):
+        return [copy for copy in self._copies if not copy.done]
+
+    @property
+    def wait_handles(self):
+        return [handle for copy in self.running_copies for handle in copy.stream.wait_handles]
+
+    def seconds_until_straggling(self):
+        '''How long until is_straggling becomes True, or None if it never will. This is only known
+        once the step has started executing.'''
+        if self._events is not None or len(self._copies) >= MAX_SPECULATIVE_COPIES:
+            return None
+
+        started_at = self._copies[0].started_at
+        if started_at is None:
+            return None
+        return max(0.0, started_at + self._straggling_after - time.time())
+
+    @property
+    def is_straggling(self):
+        return self.seconds_until_straggling() == 0.0
+
+    def speculate(self):
+        check.invariant(self.is_straggling, 'Only a straggling step can be executed speculatively')
+        self._copies.append(_Copy(self._start_copy()))
+
+    def terminate(self):
+        for copy in self.running_copies:
+            copy.terminate()
+            copy.done = True
+
+    def __next__(self):
+        if self._events is None:
+            self._events = self._completed_events()
+            if self._events is None:
+                return None
+
+        if self._events:
+            return self._events.popleft()
+        raise StopIteration()
+
+    def _completed_events(self):
+        for copy in self.running_copies:
+            copy.drain()
+            if not copy.done:
+                continue
+            if not copy.failed:
+                self.terminate()
+                return deque(copy.events)
+            self._failed_copies.append(copy)
+
+        if self.running_copies:
+            return None
+
+        first_failed = self._failed_copies[0]
+        if first_failed.exc_info is not None:
+            six.reraise(*first_failed.exc_info)
+        return deque(first_failed.events)
@@ -0,0 +1,205 @@
+from collections import namedtuple
+import os
+import sys
+
+from dagster import check
+from dagster.core.execution.config import MultiprocessExecutorConfig, RunConfig
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+from .child_process_executor import (
+    ChildProcessCommand,
+    ChildProcessCrashException,
+    ChildProcessEventStream,
+    ChildProcessException,
+    ChildProcessStartEvent,
+    ChildProcessSystemErrorEvent,
+    send_command_events,
+)
+from .engine_inprocess import execute_step_group_in_process
+
+WORKER_SHUTDOWN = None
+
+
+class WorkerStepCommand(ChildProcessCommand):
+    '''Executes a single step, or a group of fused steps, inside a worker, against the pipeline
+    context and execution plan the worker built when it started. Unlike other
+    ChildProcessCommands this is never pickled.
+    '''
+
+    def __init__(self, pipeline_context, execution_plan, step_keys):
+        self.pipeline_context = check.inst_param(
+            pipeline_context, 'pipeline_context', SystemPipelineExecutionContext
+        )
+        self.execution_plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        self.step_keys = check.list_param(step_keys, 'step_keys', of_type=str)
+
+    def execute(self):
+        for step_event in execute_step_group_in_process(
+            self.pipeline_context, self.execution_plan, self.step_keys
+        ):
+            yield step_event
+
+
+def execute_steps_in_worker_process(task_queue, event_conn, environment_dict, run_config):
+    '''The target of each worker process. The repository is loaded, the pipeline context is
+    created and the execution plan is built once, after which lists of step keys are read off of
+    task_queue and executed until WORKER_SHUTDOWN is received.
+    '''
+    from dagster.core.execution.api import scoped_pipeline_context
+
+    check.inst_param(run_config, 'run_config', RunConfig)
+    check.inst(run_config.executor_config, MultiprocessExecutorConfig)
+
+    shutdown_received = False
+    try:
+        pipeline = run_config.executor_config.handle.build_pipeline_definition()
+
+        with scoped_pipeline_context(
+            pipeline, environment_dict, run_config.with_tags(pid=str(os.getpid()))
+        ) as pipeline_context:
+            execution_plan = ExecutionPlan.build(
+                pipeline_context.pipeline_def, pipeline_context.environment_config
+            )
+
+            while True:
+                step_keys = task_queue.get()
+                if step_keys is WORKER_SHUTDOWN:
+                    shutdown_received = True
+                    break
+
+                send_command_events(
+                    event_conn, WorkerStepCommand(pipeline_context, execution_plan, step_keys)
+                )
+    except:  # pylint: disable=bare-except
+        # The worker could not set up (or tear down) the pipeline context. Report the error for
+        # every step that is sent our way so the parent surfaces it as it would for a single
+        # step child process.
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        while not shutdown_received:
+            step_keys = task_queue.get()
+            if step_keys is WORKER_SHUTDOWN:
+                break
+            event_conn.send(ChildProcessStartEvent(pid=os.getpid()))
+            event_conn.send(ChildProcessSystemErrorEvent(pid=os.getpid(), error_info=error_info))
+    finally:
+        event_conn.close()
+
+
+class _Worker(namedtuple('_Worker', 'process task_queue event_conn')):
+    pass
+
+
+class _WorkerStepEventStream(ChildProcessEventStream):
+    '''The events of a single step executed by a worker. The worker is returned to the pool,
+    rather than joined, once the step completes, or once it reports a system error executing the
+    step. A worker that dies executing the step is replaced.
+    '''
+
+    def __init__(self, worker, pool):
+        self._worker = check.inst_param(worker, 'worker', _Worker)
+        self._pool = check.inst_param(pool, 'pool', StepWorkerPool)
+        super(_WorkerStepEventStream, self).__init__(worker.process, worker.event_conn)
+
+    def on_completed(self):
+        self._pool.return_worker(self._worker)
+
+    def __next__(self):
+        try:
+            return super(_WorkerStepEventStream, self).__next__()
+        except ChildProcessException:
+            # The worker survives errors executing steps, and reports them for every step sent
+            # its way if it could not set up the pipeline context
+            self._pool.return_worker(self._worker)
+            raise
+        except ChildProcessCrashException:
+            self._pool.replace_worker(self._worker)
+            raise
+
+
+class StepWorkerPool(object):
+    '''A pool of long-lived worker processes used by the MultiprocessingEngine when
+    MultiprocessExecutorConfig.persistent_workers is set.
+
+    Spawning a process per step means paying for interpreter startup, loading the repository,
+    evaluating config, initializing resources and building the execution plan for every single
+    step. Workers in this pool do that once per run and then execute step keys sent to them.
+    '''
+
+    def __init__(self, pipeline_context, size):
+        check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+        check.int_param(size, 'size')
+        check.invariant(size > 0, 'Worker pool size must be greater than 0')
+
+        check.invariant(
+            not pipeline_context.run_config.loggers,
+            'Cannot inject loggers via RunConfig with the Multiprocess executor',
+        )
+        check.invariant(
+            not pipeline_context.event_callback,
+            'Cannot use event_callback across this process currently',
+        )
+
+        self._pipeline_context = pipeline_context
+        self._multiprocessing_context = (
+            pipeline_context.executor_config.get_multiprocessing_context()
+        )
+
+        self._idle_workers = []
+        self._workers = []
+        for _ in range(size):
+            self._idle_workers.append(self._start_worker())
+
+    def _start_worker(self):
+        task_queue = self._multiprocessing_context.Queue()
+        event_reader, event_writer = self._multiprocessing_context.Pipe(duplex=False)
+        process = self._multiprocessing_context.Process(
+            target=execute_steps_in_worker_process,
+            args=(
+                task_queue,
+                event_writer,
+                self._pipeline_context.environment_dict,
+                self._pipeline_context.run_config,
+            ),
+        )
+        process.start()
+        event_writer.close()
+        worker = _Worker(process, task_queue, event_reader)
+        self._workers.append(worker)
+        return worker
+
+    def return_worker(self, worker):
+        '''Return a worker that has finished executing the steps sent to it to the pool.'''
+        check.inst_param(worker, 'worker', _Worker)
+        self._idle_workers.append(worker)
+
+    def replace_worker(self, worker):
+        '''Replace a worker that died executing the steps sent to it with a new one.'''
+        check.inst_param(worker, 'worker', _Worker)
+        self._workers.remove(worker)
+        worker.event_conn.close()
+        worker.process.join()
+        self._idle_workers.append(self._start_worker())
+
+    def execute_steps(self, step_keys):
+        '''Sends step_keys, a single step or a group of fused steps, to an idle worker and returns
+        the ChildProcessEventStream of the events it produces for them.
+        '''
+        check.list_param(step_keys, 'step_keys', of_type=str)
+        check.invariant(self._idle_workers, 'No idle workers available in the pool')
+
+        worker = self._idle_workers.pop()
+        worker.task_queue.put(step_keys)
+
+        return _WorkerStepEventStream(worker, self)
+
+    def shutdown(self, timeout=5.0):
+        for worker in self._workers:
+            if worker.process.is_alive():
+                worker.task_queue.put(WORKER_SHUTDOWN)
+
+        for worker in self._workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
@@ -15,6 +15,7 @@ class DagsterEventType(Enum):
     STEP_SKIPPED = 'STEP_SKIPPED'
     STEP_MATERIALIZATION = 'STEP_MATERIALIZATION'
     STEP_EXPECTATION_RESULT = 'STEP_EXPECTATION_RESULT'
+    STEP_CACHE_HIT = 'STEP_CACHE_HIT'
 
     PIPELINE_INIT_FAILURE = 'PIPELINE_INIT_FAILURE'
 
@@ -34,6 +35,7 @@ STEP_EVENTS = {
     DagsterEventType.STEP_SKIPPED,
     DagsterEventType.STEP_MATERIALIZATION,
     DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_CACHE_HIT,
 }
 
 FAILURE_EVENTS = {
@@ -53,7 +55,12 @@ def _assert_type(method, expected_type, actual_type):
 
 
 def _validate_event_specific_data(event_type, event_specific_data):
-    from dagster.core.execution.plan.objects import StepOutputData, StepFailureData, StepSuccessData
+    from dagster.core.execution.plan.objects import (
+        StepCacheHitData,
+        StepOutputData,
+        StepFailureData,
+        StepSuccessData,
+    )
 
     if event_type == DagsterEventType.STEP_OUTPUT:
         check.inst_param(event_specific_data, 'event_specific_data', StepOutputData)
@@ -61,6 +68,8 @@ def _validate_event_specific_data(event_type, event_specific_data):
         check.inst_param(event_specific_data, 'event_specific_data', StepFailureData)
     elif event_type == DagsterEventType.STEP_SUCCESS:
         check.inst_param(event_specific_data, 'event_specific_data', StepSuccessData)
+    elif event_type == DagsterEventType.STEP_CACHE_HIT:
+        check.inst_param(event_specific_data, 'event_specific_data', StepCacheHitData)
     elif event_type == DagsterEventType.STEP_MATERIALIZATION:
         check.inst_param(event_specific_data, 'event_specific_data', StepMaterializationData)
     elif event_type == DagsterEventType.PIPELINE_PROCESS_STARTED:
@@ -204,6 +213,11 @@ class DagsterEvent(
         _assert_type('step_failure_data', DagsterEventType.STEP_FAILURE, self.event_type)
         return self.event_specific_data
 
+    @property
+    def step_cache_hit_data(self):
+        _assert_type('step_cache_hit_data', DagsterEventType.STEP_CACHE_HIT, self.event_type)
+        return self.event_specific_data
+
     @property
     def pipeline_process_started_data(self):
         _assert_type(
@@ -261,6 +275,14 @@ class DagsterEvent(
             event_type=DagsterEventType.STEP_SKIPPED, step_context=step_context
         )
 
+    @staticmethod
+    def step_cache_hit_event(step_context, step_cache_hit_data):
+        return DagsterEvent.from_step(
+            event_type=DagsterEventType.STEP_CACHE_HIT,
+            step_context=step_context,
+            event_specific_data=step_cache_hit_data,
+        )
+
     @staticmethod
     def step_materialization(step_context, materialization):
         check.inst_param(materialization, 'materialization', Materialization)
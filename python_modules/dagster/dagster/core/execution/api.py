@@ -12,8 +12,15 @@ will not invoke *any* outputs (and their APIs don't allow the user to).
 
 '''
 
+from multiprocessing.pool import ThreadPool
+
 from dagster import check
-from dagster.core.definitions import PipelineDefinition
+from dagster.core.definitions import (
+    IContainSolids,
+    PipelineDefinition,
+    SolidDefinition,
+    create_environment_type,
+)
 from dagster.core.errors import (
     DagsterExecutionStepNotFoundError,
     DagsterInvariantViolationError,
@@ -24,9 +31,30 @@ from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.engine.engine_multiprocessing import MultiprocessingEngine
 from dagster.core.engine.engine_inprocess import InProcessEngine
+from dagster.core.engine.engine_threadpool import ThreadPoolEngine
+from dagster.core.execution.plan.resume import plan_resumption
+from dagster.core.storage.runs import (
+    RunStorageMode,
+    StepDurationRecord,
+    StepEventRecord,
+    construct_run_storage,
+)
+from dagster.core.utils import make_new_run_id
+from dagster.utils import merge_dicts
 
-from .context_creation_pipeline import create_environment_config, scoped_pipeline_context
-from .config import RunConfig, InProcessExecutorConfig, MultiprocessExecutorConfig
+from .context_creation_pipeline import (
+    SharedResources,
+    create_environment_config,
+    scoped_pipeline_context,
+)
+from .config import (
+    AsyncioExecutorConfig,
+    RunConfig,
+    InProcessExecutorConfig,
+    MultiprocessExecutorConfig,
+    ReexecutionConfig,
+    ThreadPoolExecutorConfig,
+)
 from .context.system import SystemPipelineExecutionContext
 from .results import PipelineExecutionResult
 
@@ -71,7 +99,7 @@ def create_execution_plan(pipeline, environment_dict=None, mode=None):
     return ExecutionPlan.build(pipeline, environment_config)
 
 
-def _execute_pipeline_iterator(context_or_failure_event):
+def _execute_pipeline_iterator(context_or_failure_event, execution_plan=None):
     # Due to use of context managers, if the user land code in context or resource init fails
     # we can get either a pipeline_context or the failure event here.
     if (
@@ -83,9 +111,10 @@ def _execute_pipeline_iterator(context_or_failure_event):
 
     pipeline_context = context_or_failure_event
     check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.opt_inst_param(execution_plan, 'execution_plan', ExecutionPlan)
     yield DagsterEvent.pipeline_start(pipeline_context)
 
-    execution_plan = ExecutionPlan.build(
+    execution_plan = execution_plan or ExecutionPlan.build(
         pipeline_context.pipeline_def, pipeline_context.environment_config
     )
 
@@ -172,8 +201,25 @@ def execute_pipeline(pipeline, environment_dict=None, run_config=None):
     environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
     run_config = check_run_config_param(run_config, pipeline)
 
-    with scoped_pipeline_context(pipeline, environment_dict, run_config) as pipeline_context:
-        event_list = list(_execute_pipeline_iterator(pipeline_context))
+    return _execute_pipeline(pipeline, environment_dict, run_config)
+
+
+def _execute_pipeline(
+    pipeline,
+    environment_dict,
+    run_config,
+    execution_plan=None,
+    environment_config=None,
+    shared_resources=None,
+):
+    with scoped_pipeline_context(
+        pipeline,
+        environment_dict,
+        run_config,
+        environment_config=environment_config,
+        shared_resources=shared_resources,
+    ) as pipeline_context:
+        event_list = list(_execute_pipeline_iterator(pipeline_context, execution_plan))
 
         return PipelineExecutionResult(
             pipeline,
@@ -188,6 +234,122 @@ def execute_pipeline(pipeline, environment_dict=None, run_config=None):
         )
 
 
+def execute_pipeline_batch(pipeline, environment_dicts, run_config=None, max_concurrent=1):
+    '''Execute a pipeline once for each of many environment configs.
+
+    The work the runs have in common is done once for the whole batch, rather than once for
+    every run as when executing each of them with :py:func:`execute_pipeline`:
+
+    - The environment type every config is evaluated against is created once, and every config
+      is evaluated before any run starts, so that an invalid config fails the batch upfront.
+    - Resources declared ``reusable`` are initialized once for every distinct config they are
+      given, shared by the runs of the batch, and cleaned up once every run has executed. Other
+      resources are initialized for every run, as they otherwise are.
+    - Runs whose configs build the same execution plan, since they only differ in config the plan
+      does not depend on such as that of solids and resources, execute the same plan.
+
+    Every run is given a run id of its own, and is otherwise executed with run_config.
+
+    Parameters:
+      pipeline (PipelineDefinition): Pipeline to run
+      environment_dicts (List[dict]): The enviroment configuration of each run
+      run_config (RunConfig): Configuration for how every run will be executed
+      max_concurrent (int): How many runs to execute concurrently, in a pool of threads. Reusable
+        resources are then used from concurrent runs. Defaults to 1, executing the runs one after
+        the other.
+
+    Returns:
+      List[PipelineExecutionResult]: The result of the run of each environment configuration, in
+        order.
+    '''
+    check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+    check.list_param(environment_dicts, 'environment_dicts', of_type=dict)
+    run_config = check_run_config_param(run_config, pipeline)
+    check.int_param(max_concurrent, 'max_concurrent')
+    check.param_invariant(max_concurrent > 0, 'max_concurrent', 'Must be at least 1')
+
+    environment_type = create_environment_type(pipeline, run_config.mode)
+    environment_configs = [
+        create_environment_config(
+            pipeline, environment_dict, run_config.mode, environment_type=environment_type
+        )
+        for environment_dict in environment_dicts
+    ]
+    execution_plans = _build_batch_execution_plans(pipeline, environment_configs)
+
+    with SharedResources() as shared_resources:
+
+        def _execute_run(index):
+            return _execute_pipeline(
+                pipeline,
+                environment_dicts[index],
+                RunConfig(**merge_dicts(run_config._asdict(), {'run_id': make_new_run_id()})),
+                execution_plan=execution_plans[index],
+                environment_config=environment_configs[index],
+                shared_resources=shared_resources,
+            )
+
+        if max_concurrent == 1 or len(environment_dicts) <= 1:
+            return [_execute_run(index) for index in range(len(environment_dicts))]
+
+        pool = ThreadPool(min(max_concurrent, len(environment_dicts)))
+        try:
+            return pool.map(_execute_run, range(len(environment_dicts)))
+        finally:
+            pool.close()
+            pool.join()
+
+
+def _build_batch_execution_plans(pipeline, environment_configs):
+    '''The execution plan of each of environment_configs, built once for every distinct part of
+    them the plan depends on.'''
+    if _has_step_metadata_fn(pipeline):
+        # The metadata of a step may depend on any part of the config
+        return [
+            ExecutionPlan.build(pipeline, environment_config)
+            for environment_config in environment_configs
+        ]
+
+    plan_templates = []
+    execution_plans = []
+    for environment_config in environment_configs:
+        plan_key = _execution_plan_key(environment_config)
+        for template_key, template_plan in plan_templates:
+            if template_key == plan_key:
+                execution_plans.append(template_plan)
+                break
+        else:
+            execution_plan = ExecutionPlan.build(pipeline, environment_config)
+            plan_templates.append((plan_key, execution_plan))
+            execution_plans.append(execution_plan)
+
+    return execution_plans
+
+
+def _execution_plan_key(environment_config):
+    '''The parts of environment_config an execution plan is built from: the inputs and
+    materializations configured for solids, whether expectations are evaluated, and the storage
+    intermediates are persisted to.'''
+    return (
+        {
+            name: (solid_config.inputs, solid_config.outputs)
+            for name, solid_config in environment_config.solids.items()
+            if solid_config.inputs or solid_config.outputs
+        },
+        environment_config.expectations.evaluate,
+        environment_config.storage.storage_mode,
+    )
+
+
+def _has_step_metadata_fn(container):
+    for solid in container.solids:
+        if isinstance(solid.definition, SolidDefinition) and solid.definition.step_metadata_fn:
+            return True
+        if isinstance(solid.definition, IContainSolids) and _has_step_metadata_fn(solid.definition):
+            return True
+    return False
+
+
 def invoke_executor_on_plan(pipeline_context, execution_plan, step_keys_to_execute=None):
     if step_keys_to_execute:
         for step_key in step_keys_to_execute:
@@ -200,13 +362,163 @@ def invoke_executor_on_plan(pipeline_context, execution_plan, step_keys_to_execu
             return InProcessEngine
         elif isinstance(cfg, MultiprocessExecutorConfig):
             return MultiprocessingEngine
+        elif isinstance(cfg, ThreadPoolExecutorConfig):
+            return ThreadPoolEngine
+        elif isinstance(cfg, AsyncioExecutorConfig):
+            # asyncio is not available on Python 2
+            from dagster.core.engine.engine_asyncio import AsyncioEngine
+
+            return AsyncioEngine
         else:
             check.failed('Unsupported config {}'.format(cfg))
 
     # Engine execution returns a generator of yielded events, so returning here means this function
     # also returns a generator
-    return get_engine_for_config(pipeline_context.executor_config).execute(
-        pipeline_context, execution_plan, step_keys_to_execute
+    return _record_step_events(
+        pipeline_context,
+        get_engine_for_config(pipeline_context.executor_config).execute(
+            pipeline_context, execution_plan, step_keys_to_execute
+        ),
+    )
+
+
+# The step events recorded to run storage, from which resume_run works out what a run completed
+RECORDED_STEP_EVENT_TYPES = (
+    DagsterEventType.STEP_OUTPUT,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_CACHE_HIT,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+)
+
+
+def _record_step_events(pipeline_context, step_events):
+    '''Record how long each successful step took, so that engines executing steps in parallel
+    can prioritize the longest chains of steps in later runs, and which steps completed and which
+    of their outputs were persisted, so that the run can be resumed.'''
+    # Steps reusing memoized outputs take no time to speak of, which says nothing of how long
+    # they take to execute
+    cache_hit_step_keys = set()
+    for step_event in step_events:
+        if step_event.event_type == DagsterEventType.STEP_CACHE_HIT:
+            cache_hit_step_keys.add(step_event.step_key)
+
+        if step_event.event_type in RECORDED_STEP_EVENT_TYPES and (
+            step_event.event_type != DagsterEventType.STEP_OUTPUT
+            or step_event.step_output_data.intermediate_materialization
+        ):
+            pipeline_context.run_storage.write_step_event_record(
+                StepEventRecord(
+                    run_id=pipeline_context.run_id,
+                    step_key=step_event.step_key,
+                    event_type_value=step_event.event_type_value,
+                    output_name=step_event.step_output_data.output_name
+                    if step_event.event_type == DagsterEventType.STEP_OUTPUT
+                    else None,
+                )
+            )
+
+        if (
+            step_event.event_type == DagsterEventType.STEP_SUCCESS
+            and step_event.step_key not in cache_hit_step_keys
+        ):
+            pipeline_context.run_storage.write_step_duration_record(
+                StepDurationRecord(
+                    run_id=pipeline_context.run_id,
+                    pipeline_name=pipeline_context.pipeline_def.name,
+                    step_key=step_event.step_key,
+                    duration_ms=step_event.event_specific_data.duration_ms,
+                )
+            )
+        yield step_event
+
+
+def resume_run(pipeline, previous_run_id, environment_dict=None, run_config=None):
+    '''Resume an earlier run of a pipeline that did not complete.
+
+    The steps of the earlier run that succeeded are not executed again. The outputs they persisted
+    that the steps executed again consume are instead brought over from the earlier run, and only
+    the steps that failed, were skipped or never started are executed, together with the steps
+    downstream of them.
+
+    The earlier run must have used persistent storage, and environment_dict should be the one it
+    was executed with.
+
+    Parameters:
+      pipeline (PipelineDefinition): Pipeline to run
+      previous_run_id (str): The id of the run to resume
+      environment_dict (dict): The enviroment configuration that parameterizes this run
+      run_config (RunConfig): Configuration for how this pipeline will be executed
+
+    Returns:
+      :py:class:`PipelineExecutionResult`
+    '''
+    check.inst_param(pipeline, 'pipeline', PipelineDefinition)
+    check.str_param(previous_run_id, 'previous_run_id')
+    environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
+    run_config = check_run_config_param(run_config, pipeline)
+    check.param_invariant(
+        run_config.reexecution_config is None and run_config.step_keys_to_execute is None,
+        'run_config',
+        'The steps to execute when resuming a run are those the run did not complete',
+    )
+
+    environment_config = create_environment_config(pipeline, environment_dict, run_config.mode)
+    run_storage = construct_run_storage(
+        run_config.storage_mode
+        or RunStorageMode.from_environment_config(environment_config.storage.storage_mode)
+    )
+
+    if not run_storage.is_persistent:
+        raise DagsterInvariantViolationError('Cannot resume a run with non persistent run storage.')
+
+    if not run_storage.has_run(previous_run_id):
+        raise DagsterRunNotFoundError(
+            'Run id {} set as the run to resume was not found in run storage'.format(
+                previous_run_id
+            ),
+            invalid_run_id=previous_run_id,
+        )
+
+    resumption_plan = plan_resumption(
+        ExecutionPlan.build(pipeline, environment_config),
+        run_storage.get_step_event_records(previous_run_id),
+    )
+
+    if not resumption_plan.step_keys_to_execute:
+        raise DagsterInvariantViolationError(
+            'Run {run_id} of pipeline {name} completed every step: there is nothing to '
+            'resume.'.format(run_id=previous_run_id, name=pipeline.name)
+        )
+
+    # The completed steps whose outputs are not brought over are recorded as completed by the run
+    # here, and the others as their outputs are brought over, so that the run can in turn be
+    # resumed
+    step_keys_brought_over = set(handle.step_key for handle in resumption_plan.step_output_handles)
+    for step_key in resumption_plan.completed_step_keys:
+        if step_key not in step_keys_brought_over:
+            run_storage.write_step_event_record(
+                StepEventRecord(
+                    run_id=run_config.run_id,
+                    step_key=step_key,
+                    event_type_value=DagsterEventType.STEP_SUCCESS.value,
+                )
+            )
+
+    return execute_pipeline(
+        pipeline,
+        environment_dict,
+        RunConfig(
+            **merge_dicts(
+                run_config._asdict(),
+                {
+                    'reexecution_config': ReexecutionConfig(
+                        previous_run_id, resumption_plan.step_output_handles
+                    ),
+                    'step_keys_to_execute': resumption_plan.step_keys_to_execute,
+                },
+            )
+        ),
     )
 
 
@@ -284,6 +596,28 @@ def _setup_reexecution(run_config, pipeline_context, execution_plan):
                 pipeline_context, run_config.reexecution_config.previous_run_id, step_output_handle
             )
 
+        # The steps whose outputs were brought over count as completed by this run, which can
+        # then itself be resumed
+        for step_output_handle in run_config.reexecution_config.step_output_handles:
+            pipeline_context.run_storage.write_step_event_record(
+                StepEventRecord(
+                    run_id=pipeline_context.run_id,
+                    step_key=step_output_handle.step_key,
+                    event_type_value=DagsterEventType.STEP_OUTPUT.value,
+                    output_name=step_output_handle.output_name,
+                )
+            )
+        for step_key in sorted(
+            set(handle.step_key for handle in run_config.reexecution_config.step_output_handles)
+        ):
+            pipeline_context.run_storage.write_step_event_record(
+                StepEventRecord(
+                    run_id=pipeline_context.run_id,
+                    step_key=step_key,
+                    event_type_value=DagsterEventType.STEP_SUCCESS.value,
+                )
+            )
+
 
 def step_output_event_filter(pipe_iterator):
     for step_event in pipe_iterator:
@@ -1,9 +1,10 @@
 import multiprocessing
+import sys
 
 from collections import namedtuple
 
 from dagster import check
-from dagster.utils import merge_dicts
+from dagster.utils import get_multiprocessing_context, merge_dicts
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.storage.runs import RunStorageMode
 from dagster.core.utils import make_new_run_id
@@ -94,7 +95,54 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, max_concurrent=None):
+    '''
+    Args:
+      handle (ExecutionTargetHandle): Used to load the pipeline in child processes.
+      max_concurrent (int): The maximum number of steps executing at once. Defaults to the
+        number of CPUs.
+      persistent_workers (bool): When set, a pool of max_concurrent long-lived worker processes
+        is started for the run. Each worker loads the pipeline, creates the pipeline context and
+        builds the execution plan once and then executes many steps, instead of a new process
+        doing all of that for every step.
+      fuse_steps (bool): When set, chains of steps where each step is the only consumer of the
+        one before it, such as the compute, expectation and join steps of a solid, are executed
+        one after the other by a single process. Values are handed from one step of a chain to
+        the next in memory. Outputs consumed only by steps of the same solid are then never
+        persisted, so steps that consume them can not be reexecuted on their own later.
+      resource_pool_limits (Dict[str, int]): The maximum number of steps executing at once that
+        occupy a slot of each resource pool, such as a warehouse that allows a limited number of
+        concurrent queries. Solids declare the pools they occupy under the ``resource_pools`` key
+        of their metadata. Steps that do not fit in their pools wait for a free slot, while other
+        steps execute up to max_concurrent.
+      start_method (str): The multiprocessing start method used to create the processes that
+        execute steps, one of 'spawn', 'forkserver' or 'fork' where available on the platform.
+        Defaults to 'spawn', where each process starts from a fresh interpreter and so imports
+        dagster, the repository and everything they depend on anew. With 'forkserver', a server
+        process imports dagster and preload_modules once, and every process is forked from it.
+      preload_modules (List[str]): The modules the forkserver imports ahead of forking processes,
+        typically the module defining the repository and heavy libraries such as pandas. The
+        forkserver is shared by all runs in this process and its preloaded modules are fixed
+        when it first starts.
+      speculation_threshold (float): When set, steps of solids marked idempotent in their
+        metadata are executed speculatively. Once such a step has been executing for this many
+        times its expected duration, recorded from previous runs of the pipeline, a copy of it is
+        started in a new process, as long as fewer than max_concurrent processes are executing.
+        The first copy to succeed wins and the other is terminated. The events of these steps are
+        only reported once a copy has completed. Steps that have never succeeded before are not
+        executed speculatively. Can not be combined with persistent_workers.
+    '''
+
+    def __init__(
+        self,
+        handle,
+        max_concurrent=None,
+        persistent_workers=False,
+        fuse_steps=False,
+        resource_pool_limits=None,
+        start_method=None,
+        preload_modules=None,
+        speculation_threshold=None,
+    ):
         from dagster import ExecutionTargetHandle
 
         self.handle = check.inst_param(handle, 'handle', ExecutionTargetHandle)
@@ -104,8 +152,104 @@ class MultiprocessExecutorConfig(ExecutorConfig):
         )
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
         check.invariant(self.max_concurrent > 0, 'max_concurrent processes must be greater than 0')
+        self.persistent_workers = check.bool_param(persistent_workers, 'persistent_workers')
+        self.fuse_steps = check.bool_param(fuse_steps, 'fuse_steps')
+        self.resource_pool_limits = _check_resource_pool_limits(resource_pool_limits)
+        self.start_method = check.opt_str_param(start_method, 'start_method')
+        if self.start_method is not None and hasattr(multiprocessing, 'get_all_start_methods'):
+            check.param_invariant(
+                self.start_method in multiprocessing.get_all_start_methods(),
+                'start_method',
+                'Start method {method} is not available, expected one of {methods}'.format(
+                    method=self.start_method, methods=multiprocessing.get_all_start_methods()
+                ),
+            )
+        self.preload_modules = check.opt_list_param(preload_modules, 'preload_modules', of_type=str)
+        check.param_invariant(
+            not self.preload_modules or self.start_method == 'forkserver',
+            'preload_modules',
+            'Modules can only be preloaded with the forkserver start method',
+        )
+        self.speculation_threshold = check.opt_float_param(
+            speculation_threshold, 'speculation_threshold'
+        )
+        check.param_invariant(
+            self.speculation_threshold is None or self.speculation_threshold > 1.0,
+            'speculation_threshold',
+            'speculation_threshold must be greater than 1',
+        )
+        check.param_invariant(
+            self.speculation_threshold is None or not self.persistent_workers,
+            'speculation_threshold',
+            'Steps can not be executed speculatively by persistent workers',
+        )
         self.raise_on_error = False
 
+    def get_multiprocessing_context(self):
+        return get_multiprocessing_context(self.start_method, self.preload_modules)
+
+
+class ThreadPoolExecutorConfig(ExecutorConfig):
+    '''
+    Args:
+      max_concurrent (int): The maximum number of steps executing at once, each in its own thread.
+        Defaults to the number of CPUs plus 4, up to 32, since the steps this executor is meant
+        for spend most of their time waiting on I/O rather than holding the GIL.
+      raise_on_error (bool): Whether an error in user code should be raised once the steps that
+        are already executing have finished.
+      resource_pool_limits (Dict[str, int]): The maximum number of steps executing at once that
+        occupy a slot of each resource pool, as for :py:class:`MultiprocessExecutorConfig`.
+    '''
+
+    def __init__(self, max_concurrent=None, raise_on_error=True, resource_pool_limits=None):
+        max_concurrent = (
+            max_concurrent
+            if max_concurrent is not None
+            else min(32, multiprocessing.cpu_count() + 4)
+        )
+        self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        check.invariant(self.max_concurrent > 0, 'max_concurrent threads must be greater than 0')
+        self.raise_on_error = check.bool_param(raise_on_error, 'raise_on_error')
+        self.resource_pool_limits = _check_resource_pool_limits(resource_pool_limits)
+
+
+class AsyncioExecutorConfig(ExecutorConfig):
+    '''
+    Args:
+      max_concurrent (int): The maximum number of steps executing at once. Defaults to no limit.
+      raise_on_error (bool): Whether an error in user code should be raised once the steps that
+        are already executing have finished.
+      resource_pool_limits (Dict[str, int]): The maximum number of steps executing at once that
+        occupy a slot of each resource pool, as for :py:class:`MultiprocessExecutorConfig`.
+
+    All steps are interleaved on a single asyncio event loop, switching between them whenever a
+    solid defined with ``async def`` awaits. Solids with regular compute functions block the
+    event loop for as long as they run.
+    '''
+
+    def __init__(self, max_concurrent=None, raise_on_error=True, resource_pool_limits=None):
+        check.invariant(
+            sys.version_info >= (3, 5), 'AsyncioExecutorConfig requires Python 3.5 or later'
+        )
+        self.max_concurrent = check.opt_int_param(max_concurrent, 'max_concurrent')
+        check.invariant(
+            self.max_concurrent is None or self.max_concurrent > 0,
+            'max_concurrent steps must be greater than 0',
+        )
+        self.raise_on_error = check.bool_param(raise_on_error, 'raise_on_error')
+        self.resource_pool_limits = _check_resource_pool_limits(resource_pool_limits)
+
+
+def _check_resource_pool_limits(resource_pool_limits):
+    resource_pool_limits = check.opt_dict_param(
+        resource_pool_limits, 'resource_pool_limits', key_type=str, value_type=int
+    )
+    for pool, limit in resource_pool_limits.items():
+        check.invariant(
+            limit > 0, 'The limit of resource pool {pool} must be greater than 0'.format(pool=pool)
+        )
+    return resource_pool_limits
+
 
 class ReexecutionConfig:
     def __init__(self, previous_run_id, step_output_handles):
@@ -99,6 +99,15 @@ class SystemPipelineExecutionContext(object):
             self._pipeline_context_data, logging_tags, log_manager, step
         )
 
+    def with_intermediates_manager(self, intermediates_manager):
+        '''A copy of this context that reads and writes intermediates through
+        intermediates_manager instead.'''
+        return SystemPipelineExecutionContext(
+            self._pipeline_context_data._replace(intermediates_manager=intermediates_manager),
+            self._logging_tags,
+            self._log_manager,
+        )
+
     @property
     def executor_config(self):
         return self.run_config.executor_config
@@ -158,6 +167,14 @@ class SystemPipelineExecutionContext(object):
     def intermediates_manager(self):
         return self._pipeline_context_data.intermediates_manager
 
+    @property
+    def type_check_policy(self):
+        '''The TypeCheckPolicy of the run, if its config sets one, or else of the pipeline.'''
+        return (
+            self.environment_config.execution.type_check_policy
+            or self.pipeline_def.type_check_policy
+        )
+
 
 class SystemStepExecutionContext(SystemPipelineExecutionContext):
     __slots__ = ['_step']
@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 import inspect
 import sys
+import threading
 import time
 
 from contextlib2 import ExitStack
@@ -8,7 +9,7 @@ from contextlib2 import ExitStack
 from dagster import check
 from dagster.core.definitions import PipelineDefinition, create_environment_type
 from dagster.core.definitions.mode import ModeDefinition
-from dagster.core.definitions.resource import ResourcesBuilder
+from dagster.core.definitions.resource import ResourceDefinition, ResourcesBuilder
 from dagster.core.errors import (
     DagsterError,
     DagsterUserCodeExecutionError,
@@ -30,6 +31,7 @@ from dagster.core.storage.runs import (
     RunStorageMode,
 )
 from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.types.config import ConfigType
 from dagster.core.types.evaluator import (
     EvaluationError,
     evaluate_config_value,
@@ -67,12 +69,15 @@ class PipelineConfigEvaluationError(Exception):
         super(PipelineConfigEvaluationError, self).__init__(error_msg, *args, **kwargs)
 
 
-def create_environment_config(pipeline, environment_dict=None, mode=None):
+def create_environment_config(pipeline, environment_dict=None, mode=None, environment_type=None):
+    '''Evaluate environment_dict against the environment type of pipeline in mode, which is
+    created unless environment_type is given.'''
     check.inst_param(pipeline, 'pipeline', PipelineDefinition)
     check.opt_dict_param(environment_dict, 'environment')
     mode = check.opt_str_param(mode, 'mode', default=pipeline.get_default_mode_name())
+    check.opt_inst_param(environment_type, 'environment_type', ConfigType)
 
-    environment_type = create_environment_type(pipeline, mode)
+    environment_type = environment_type or create_environment_type(pipeline, mode)
 
     result = evaluate_config_value(environment_type, environment_dict)
 
@@ -82,13 +87,65 @@ def create_environment_config(pipeline, environment_dict=None, mode=None):
     return EnvironmentConfig.from_dict(result.value)
 
 
+class SharedResources(object):
+    '''The reusable resources shared by the runs of a batch.
+
+    Each reusable resource is initialized by the first run that requires it with a given config,
+    and handed to every later run requiring it with an equal config. The resources are cleaned up
+    once the batch exits this context manager.
+    '''
+
+    def __init__(self):
+        self._stack = ExitStack()
+        self._lock = threading.Lock()
+        self._resources = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._stack.__exit__(exc_type, exc_value, traceback)
+
+    def enter_resource(self, resource_def, resource_config, resource_context_manager):
+        '''The shared resource of resource_def with resource_config, which is created by entering
+        resource_context_manager if no run has yet required it.'''
+        check.inst_param(resource_def, 'resource_def', ResourceDefinition)
+        check.invariant(resource_def.reusable, 'Resource is not reusable')
+
+        with self._lock:
+            for shared_def, shared_config, resource_obj in self._resources:
+                if shared_def is resource_def and shared_config == resource_config:
+                    return resource_obj
+
+            resource_obj = self._stack.enter_context(resource_context_manager)
+            self._resources.append((resource_def, resource_config, resource_obj))
+            return resource_obj
+
+
 @contextmanager
-def scoped_pipeline_context(pipeline_def, environment_dict, run_config, intermediates_manager=None):
+def scoped_pipeline_context(
+    pipeline_def,
+    environment_dict,
+    run_config,
+    intermediates_manager=None,
+    environment_config=None,
+    shared_resources=None,
+):
+    '''The context of a run of pipeline_def.
+
+    Args:
+        environment_config (Optional[EnvironmentConfig]): The config environment_dict evaluates
+            to, if it has already been evaluated.
+        shared_resources (Optional[SharedResources]): The resources shared with the other runs of
+            a batch. The reusable resources of the run are taken from it.
+    '''
     check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
     check.dict_param(environment_dict, 'environment_dict', key_type=str)
     check.inst_param(run_config, 'run_config', RunConfig)
+    check.opt_inst_param(environment_config, 'environment_config', EnvironmentConfig)
+    check.opt_inst_param(shared_resources, 'shared_resources', SharedResources)
 
-    environment_config = create_environment_config(
+    environment_config = environment_config or create_environment_config(
         pipeline_def, environment_dict, mode=run_config.mode
     )
 
@@ -120,7 +177,7 @@ def scoped_pipeline_context(pipeline_def, environment_dict, run_config, intermed
         log_manager = DagsterLogManager(run_id=run_config.run_id, logging_tags={}, loggers=loggers)
 
         with _create_resources(
-            pipeline_def, environment_config, run_config, log_manager
+            pipeline_def, environment_config, run_config, log_manager, shared_resources
         ) as resources:
 
             yield construct_pipeline_execution_context(
@@ -188,7 +245,9 @@ def construct_pipeline_execution_context(
 
 
 @contextmanager
-def _create_resources(pipeline_def, environment_config, run_config, log_manager):
+def _create_resources(
+    pipeline_def, environment_config, run_config, log_manager, shared_resources=None
+):
     resources = {}
 
     mode_definition = pipeline_def.get_mode_definition(run_config.mode)
@@ -198,24 +257,26 @@ def _create_resources(pipeline_def, environment_config, run_config, log_manager)
     # can potentially have many resources so we need to use this abstraction.
     with ExitStack() as stack:
         for resource_name, resource_def in sorted(mode_definition.resource_defs.items()):
+            resource_config = environment_config.resources.get(resource_name, {}).get('config')
             user_fn = _create_resource_fn_lambda(
-                pipeline_def,
-                resource_def,
-                environment_config.resources.get(resource_name, {}).get('config'),
-                run_config.run_id,
-                log_manager,
+                pipeline_def, resource_def, resource_config, run_config.run_id, log_manager
             )
 
-            resource_obj = stack.enter_context(
-                user_code_context_manager(
-                    user_fn,
-                    DagsterResourceFunctionError,
-                    'Error executing resource_fn on ResourceDefinition {name}'.format(
-                        name=resource_name
-                    ),
-                )
+            resource_context_manager = user_code_context_manager(
+                user_fn,
+                DagsterResourceFunctionError,
+                'Error executing resource_fn on ResourceDefinition {name}'.format(
+                    name=resource_name
+                ),
             )
 
+            if shared_resources and resource_def.reusable:
+                resource_obj = shared_resources.enter_resource(
+                    resource_def, resource_config, resource_context_manager
+                )
+            else:
+                resource_obj = stack.enter_context(resource_context_manager)
+
             resources[resource_name] = resource_obj
         yield ResourcesBuilder(resources)
 
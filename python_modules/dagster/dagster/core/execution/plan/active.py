@@ -0,0 +1,283 @@
+from collections import defaultdict
+
+from dagster import check
+
+from .plan import ExecutionPlan
+
+
+class ActiveExecution(object):
+    '''Tracks the state of an execution plan while an engine works through it.
+
+    Rather than executing a plan level by level, engines ask this object which steps are ready
+    (all of their upstream steps have succeeded) and report back as steps finish. A step becomes
+    available as soon as its own dependencies are done, regardless of what else is still running.
+
+    Steps downstream of a failed or skipped step are surfaced through get_steps_to_skip so that the
+    engine can emit the appropriate skip events.
+
+    When more steps are ready than an engine can start, those with the longest remaining critical
+    path go first: the most time, according to step_durations, that can still be spent along any
+    chain of steps starting with them. Ties, and all steps when no durations are known, are broken
+    by topological order.
+
+    Steps of solids that declare resource pools occupy a slot of each of those pools while they are
+    in flight. A step is only returned by get_steps_to_execute once all of its pools have a free
+    slot, while steps after it in priority order that do fit are returned in the meantime.
+
+    Mapped steps are expanded by the engine once they have started, through expand_mapped_step,
+    into a step per item. These are ready right away, with the priority of the mapped step, and
+    once all of them have completed the mapped step is returned by get_mapped_steps_to_collect so
+    that the engine can collect their outputs and resolve it.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan being executed.
+        step_keys_to_execute (Optional[List[str]]): The subset of steps to execute. Dependencies
+            on steps outside of this subset are considered already satisfied.
+        step_durations (Optional[Dict[str, float]]): The expected duration of steps, keyed by step
+            key. Steps without one are expected to take the average of the others.
+        resource_pool_limits (Optional[Dict[str, int]]): The number of slots of each resource
+            pool. Pools without a limit are not limited.
+    '''
+
+    def __init__(
+        self,
+        execution_plan,
+        step_keys_to_execute=None,
+        step_durations=None,
+        resource_pool_limits=None,
+    ):
+        self._plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+        check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+        check.opt_dict_param(step_durations, 'step_durations', key_type=str)
+        self._resource_pool_limits = check.opt_dict_param(
+            resource_pool_limits, 'resource_pool_limits', key_type=str, value_type=int
+        )
+
+        step_order = [step.key for step in self._plan.topological_steps()]
+        step_key_set = set(step_keys_to_execute) if step_keys_to_execute else set(step_order)
+        self._step_index = {
+            key: index for index, key in enumerate(key for key in step_order if key in step_key_set)
+        }
+
+        # step key -> upstream step keys that have not completed yet
+        self._pending = {
+            key: set(dep for dep in self._plan.deps[key] if dep in step_key_set)
+            for key in self._step_index
+        }
+        self._downstream = {key: set() for key in self._step_index}
+        for key, upstream_keys in self._pending.items():
+            for upstream_key in upstream_keys:
+                self._downstream[upstream_key].add(key)
+
+        self._critical_path = _critical_path_lengths(
+            sorted(self._step_index, key=self._step_index.get), self._downstream, step_durations
+        )
+
+        # step key -> the limited resource pools it occupies a slot of
+        self._step_resource_pools = {
+            key: self._limited_resource_pools(key) for key in self._step_index
+        }
+        self._resource_pool_usage = defaultdict(int)
+        self._occupying_resource_pools = set()
+
+        self._ready = set(key for key, upstream_keys in self._pending.items() if not upstream_keys)
+        self._upstream_failed = set()
+
+        self._in_flight = set()
+        self._success = set()
+        self._failed = set()
+        self._skipped = set()
+
+        # item step key -> (mapped step key, index of the item)
+        self._mapped_item_of = {}
+        # mapped step key -> keys of its item steps that have not been resolved yet
+        self._unresolved_mapped_items = {}
+        self._failed_mapped_items = defaultdict(list)
+        self._mapped_steps_to_collect = set()
+
+    def _limited_resource_pools(self, step_key):
+        if not self._resource_pool_limits:
+            return []
+        return [
+            pool
+            for pool in self._plan.get_step_resource_pools(step_key)
+            if pool in self._resource_pool_limits
+        ]
+
+    def _priority(self, step_key):
+        # The items of a mapped step share its priority, and go in the order of the items
+        item_index = self._mapped_item_of[step_key][1] if step_key in self._mapped_item_of else -1
+        return (-self._critical_path[step_key], self._step_index[step_key], item_index)
+
+    def _take(self, step_keys):
+        steps = []
+        for step_key in sorted(step_keys, key=self._priority):
+            del self._pending[step_key]
+            self._ready.remove(step_key)
+            self._in_flight.add(step_key)
+            steps.append(self._plan.get_step_by_key(step_key))
+        return steps
+
+    def get_steps_to_execute(self, limit=None):
+        '''Return the steps whose dependencies have all succeeded, in priority order, and mark them
+        as in flight.
+
+        Args:
+            limit (Optional[int]): Return at most this many steps, those with the longest
+                remaining critical path that have a free slot in each of their resource pools.
+        '''
+        check.opt_int_param(limit, 'limit')
+
+        step_keys = []
+        for step_key in sorted(
+            (key for key in self._ready if key not in self._upstream_failed), key=self._priority
+        ):
+            if limit is not None and len(step_keys) >= limit:
+                break
+            if self._occupy_resource_pools(step_key):
+                step_keys.append(step_key)
+        return self._take(step_keys)
+
+    def _occupy_resource_pools(self, step_key):
+        resource_pools = self._step_resource_pools[step_key]
+        if any(
+            self._resource_pool_usage[pool] >= self._resource_pool_limits[pool]
+            for pool in resource_pools
+        ):
+            return False
+
+        for pool in resource_pools:
+            self._resource_pool_usage[pool] += 1
+        self._occupying_resource_pools.add(step_key)
+        return True
+
+    def get_steps_to_skip(self):
+        '''Return the steps that can not be executed because an upstream step failed or was
+        skipped. The caller is expected to call mark_skipped for each of them.
+        '''
+        return self._take([key for key in self._ready if key in self._upstream_failed])
+
+    def claim_step(self, step_key):
+        '''Mark a ready step as in flight without it being returned by get_steps_to_execute or
+        get_steps_to_skip. Used by engines that execute a chain of steps as a single unit, once
+        the step preceding step_key in the chain has been resolved.
+        '''
+        check.str_param(step_key, 'step_key')
+        check.invariant(
+            step_key in self._ready,
+            'Attempted to claim step {key} which is not ready'.format(key=step_key),
+        )
+        self._take([step_key])
+
+    def _resolve(self, step_key, failed):
+        check.invariant(
+            step_key in self._in_flight,
+            'Attempted to resolve step {key} which is not in flight'.format(key=step_key),
+        )
+        self._in_flight.remove(step_key)
+        if step_key in self._occupying_resource_pools:
+            self._occupying_resource_pools.remove(step_key)
+            for pool in self._step_resource_pools[step_key]:
+                self._resource_pool_usage[pool] -= 1
+
+        for downstream_key in self._downstream[step_key]:
+            self._pending[downstream_key].remove(step_key)
+            if failed:
+                self._upstream_failed.add(downstream_key)
+            if not self._pending[downstream_key]:
+                self._ready.add(downstream_key)
+
+        if step_key in self._mapped_item_of:
+            mapped_step_key, _ = self._mapped_item_of[step_key]
+            self._unresolved_mapped_items[mapped_step_key].remove(step_key)
+            if failed:
+                self._failed_mapped_items[mapped_step_key].append(step_key)
+            if not self._unresolved_mapped_items[mapped_step_key]:
+                self._mapped_steps_to_collect.add(mapped_step_key)
+
+    def mark_success(self, step_key):
+        check.str_param(step_key, 'step_key')
+        self._resolve(step_key, failed=False)
+        self._success.add(step_key)
+
+    def mark_failed(self, step_key):
+        check.str_param(step_key, 'step_key')
+        self._resolve(step_key, failed=True)
+        self._failed.add(step_key)
+
+    def mark_skipped(self, step_key):
+        check.str_param(step_key, 'step_key')
+        self._resolve(step_key, failed=True)
+        self._skipped.add(step_key)
+
+    def expand_mapped_step(self, step_key, item_step_keys):
+        '''Add the steps executing the items of a mapped step, once the engine has started it.
+
+        The mapped step stays in flight until it is returned by get_mapped_steps_to_collect, once
+        every one of its item steps has been resolved. The item steps occupy the resource pools
+        of the solid, while the mapped step itself does not.
+        '''
+        check.str_param(step_key, 'step_key')
+        check.list_param(item_step_keys, 'item_step_keys', of_type=str)
+        check.invariant(
+            step_key in self._in_flight and step_key not in self._unresolved_mapped_items,
+            'Attempted to expand step {key} which is not in flight or already expanded'.format(
+                key=step_key
+            ),
+        )
+
+        for index, item_step_key in enumerate(item_step_keys):
+            self._mapped_item_of[item_step_key] = (step_key, index)
+            self._step_index[item_step_key] = self._step_index[step_key]
+            self._critical_path[item_step_key] = self._critical_path[step_key]
+            self._step_resource_pools[item_step_key] = self._limited_resource_pools(item_step_key)
+            self._pending[item_step_key] = set()
+            self._downstream[item_step_key] = set()
+            self._ready.add(item_step_key)
+
+        self._unresolved_mapped_items[step_key] = set(item_step_keys)
+        if not item_step_keys:
+            self._mapped_steps_to_collect.add(step_key)
+
+    def get_mapped_steps_to_collect(self):
+        '''Return the expanded mapped steps whose item steps have all been resolved. The caller is
+        expected to collect the outputs of the item steps, or to fail the mapped step if any of
+        them failed or was skipped, and to resolve it.
+        '''
+        step_keys = sorted(self._mapped_steps_to_collect, key=self._priority)
+        self._mapped_steps_to_collect.clear()
+        return [self._plan.get_step_by_key(step_key) for step_key in step_keys]
+
+    def failed_mapped_items(self, step_key):
+        '''The item steps of the mapped step step_key that failed or were skipped.'''
+        check.str_param(step_key, 'step_key')
+        return sorted(self._failed_mapped_items[step_key], key=self._priority)
+
+    def failed_or_skipped_upstream(self, step_key):
+        '''The direct upstream steps of step_key that failed or were skipped.'''
+        check.str_param(step_key, 'step_key')
+        return sorted(
+            key for key in self._plan.deps[step_key] if key in self._failed or key in self._skipped
+        )
+
+    @property
+    def in_flight(self):
+        return set(self._in_flight)
+
+    @property
+    def is_complete(self):
+        return not self._pending and not self._in_flight
+
+
+def _critical_path_lengths(step_keys_in_order, downstream, step_durations):
+    if not step_durations:
+        return {step_key: 0 for step_key in step_keys_in_order}
+
+    default_duration = sum(step_durations.values()) / float(len(step_durations))
+
+    critical_path = {}
+    for step_key in reversed(step_keys_in_order):
+        critical_path[step_key] = step_durations.get(step_key, default_duration) + max(
+            [critical_path[downstream_key] for downstream_key in downstream[step_key]] or [0]
+        )
+    return critical_path
@@ -1,17 +1,34 @@
 from dagster import check
 from dagster.core.definitions import ExpectationResult, Materialization, Result, Solid, SolidHandle
+from dagster.core.definitions.awaitable import PendingAwaitable
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution.context.system import SystemTransformExecutionContext
 from dagster.core.execution.context.transform import TransformExecutionContext
+from dagster.core.types.runtime import List
 
 from .objects import ExecutionStep, StepInput, StepKind, StepOutput, StepOutputValue
 
 
-def create_compute_step(pipeline_name, environment_config, solid, step_inputs, handle):
+def create_compute_step(
+    pipeline_name, environment_config, solid, step_inputs, handle, mapped_input=None
+):
     check.str_param(pipeline_name, 'pipeline_name')
     check.inst_param(solid, 'solid', Solid)
     check.list_param(step_inputs, 'step_inputs', of_type=StepInput)
     check.opt_inst_param(handle, 'handle', SolidHandle)
+    check.opt_str_param(mapped_input, 'mapped_input')
+
+    # A mapped step receives the items of its mapped input, and collects the values of its outputs
+    # for every item, as lists
+    if mapped_input is not None:
+        step_inputs = [
+            StepInput(
+                step_input.name, List(step_input.runtime_type), step_input.prev_output_handle
+            )
+            if step_input.name == mapped_input
+            else step_input
+            for step_input in step_inputs
+        ]
 
     return ExecutionStep(
         pipeline_name=pipeline_name,
@@ -19,7 +36,11 @@ def create_compute_step(pipeline_name, environment_config, solid, step_inputs, h
         step_inputs=step_inputs,
         step_outputs=[
             StepOutput(
-                name=name, runtime_type=output_def.runtime_type, optional=output_def.optional
+                name=name,
+                runtime_type=List(output_def.runtime_type)
+                if mapped_input is not None
+                else output_def.runtime_type,
+                optional=output_def.optional,
             )
             for name, output_def in solid.definition.output_dict.items()
         ],
@@ -29,6 +50,7 @@ def create_compute_step(pipeline_name, environment_config, solid, step_inputs, h
         kind=StepKind.COMPUTE,
         solid_handle=handle,
         metadata=solid.step_metadata_fn(environment_config) if solid.step_metadata_fn else {},
+        mapped_input=mapped_input,
     )
 
 
@@ -51,16 +73,15 @@ def _yield_transform_results(transform_context, inputs, compute_fn):
 
     for result in gen:
         if isinstance(result, Result):
+            # The value itself is logged by the engine, once summarized
             transform_context.log.info(
-                'Solid {solid} emitted output "{output}" value {value}'.format(
-                    solid=str(step.solid_handle),
-                    output=result.output_name,
-                    value=repr(result.value),
+                'Solid {solid} emitted output "{output}"'.format(
+                    solid=str(step.solid_handle), output=result.output_name
                 )
             )
             yield StepOutputValue(output_name=result.output_name, value=result.value)
 
-        elif isinstance(result, (Materialization, ExpectationResult)):
+        elif isinstance(result, (Materialization, ExpectationResult, PendingAwaitable)):
             yield result
 
         else:
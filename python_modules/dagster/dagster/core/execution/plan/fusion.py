@@ -0,0 +1,144 @@
+from collections import defaultdict, namedtuple
+
+from dagster import check
+
+from .plan import ExecutionPlan
+
+
+class FusedStepGroup(namedtuple('_FusedStepGroup', 'step_keys memory_only_handles')):
+    '''A chain of steps that an engine schedules as a single unit.
+
+    Each step after the first depends only on the step before it, which in turn is consumed by no
+    other step. Values are handed from one step of the group to the next in memory.
+
+    Args:
+        step_keys (List[str]): The keys of the steps in the group, in execution order.
+        memory_only_handles (Set[StepOutputHandle]): The outputs that only need to exist while the
+            group executes, and so are never written to the intermediates manager of the run:
+            those consumed exclusively within the group by steps of the solid that produced them.
+            Outputs that other solids consume are still persisted so that reexecution of any
+            solid remains possible.
+    '''
+
+    def __new__(cls, step_keys, memory_only_handles):
+        return super(FusedStepGroup, cls).__new__(
+            cls,
+            step_keys=check.list_param(step_keys, 'step_keys', of_type=str),
+            memory_only_handles=frozenset(
+                check.set_param(memory_only_handles, 'memory_only_handles')
+            ),
+        )
+
+    @property
+    def head_key(self):
+        return self.step_keys[0]
+
+
+def fuse_steps(execution_plan, step_keys_to_execute=None):
+    '''Group the steps of an execution plan into linear chains that can each execute as a single
+    unit, typically the compute, expectation, join and thunk steps of a single solid.
+
+    Step B is fused onto step A when A is the only step B depends on and B is the only step
+    consuming any of A's outputs. Consumers outside of step_keys_to_execute count, so no output
+    a later run may read is kept in memory only. Steps that occupy resource pools always start a
+    group, so that engines can wait for a free slot in those pools before launching it. Mapped
+    steps, which engines execute by expanding them into a step per item, form groups of their own.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan to fuse.
+        step_keys_to_execute (Optional[List[str]]): The subset of steps being executed. Steps
+            outside of it are never fused.
+
+    Returns:
+        Dict[str, FusedStepGroup]: The group of every step to execute, keyed by the key of its
+            first step. Steps that can not be fused form groups of their own.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+
+    step_order = [step.key for step in execution_plan.topological_steps()]
+    step_key_set = set(step_keys_to_execute) if step_keys_to_execute else set(step_order)
+
+    handle_consumers = _handle_consumers(execution_plan)
+
+    # step key -> keys of the steps consuming any of its outputs, across the whole plan
+    consumers = defaultdict(set)
+    for handle, consumer_keys in handle_consumers.items():
+        consumers[handle.step_key].update(consumer_keys)
+
+    group_of = {}
+    groups = {}
+    for step_key in step_order:
+        if step_key not in step_key_set:
+            continue
+
+        upstream_keys = execution_plan.deps[step_key]
+        if (
+            len(upstream_keys) == 1
+            and not execution_plan.get_step_resource_pools(step_key)
+            and not execution_plan.get_step_by_key(step_key).is_mapped
+        ):
+            (upstream_key,) = upstream_keys
+            if (
+                upstream_key in group_of
+                and consumers[upstream_key] == {step_key}
+                and not execution_plan.get_step_by_key(upstream_key).is_mapped
+            ):
+                head_key = group_of[upstream_key]
+                groups[head_key].append(step_key)
+                group_of[step_key] = head_key
+                continue
+
+        groups[step_key] = [step_key]
+        group_of[step_key] = step_key
+
+    return {
+        head_key: FusedStepGroup(
+            step_keys,
+            _memory_only_handles(execution_plan, step_keys, handle_consumers),
+        )
+        for head_key, step_keys in groups.items()
+    }
+
+
+def _handle_consumers(execution_plan):
+    # step output handle -> keys of the steps consuming it
+    handle_consumers = defaultdict(set)
+    for step in execution_plan.steps:
+        for step_input in step.step_inputs:
+            handle_consumers[step_input.prev_output_handle].add(step.key)
+    return handle_consumers
+
+
+def _memory_only_handles(execution_plan, step_keys, handle_consumers):
+    group_step_keys = set(step_keys)
+    memory_only_handles = set()
+    for step_key in step_keys:
+        step = execution_plan.get_step_by_key(step_key)
+        for step_input in step.step_inputs:
+            handle = step_input.prev_output_handle
+            if handle.step_key not in group_step_keys:
+                continue
+
+            producer = execution_plan.get_step_by_key(handle.step_key)
+            if all(
+                consumer_key in group_step_keys
+                and execution_plan.get_step_by_key(consumer_key).solid_handle
+                == producer.solid_handle
+                for consumer_key in handle_consumers[handle]
+            ):
+                memory_only_handles.add(handle)
+    return memory_only_handles
+
+
+def fused_step_group(execution_plan, step_keys):
+    '''The FusedStepGroup for step_keys, a group previously returned by fuse_steps. Used by the
+    processes that execute a group to recover it from the keys of its steps alone.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.list_param(step_keys, 'step_keys', of_type=str)
+
+    return FusedStepGroup(
+        step_keys,
+        _memory_only_handles(execution_plan, step_keys, _handle_consumers(execution_plan)),
+    )
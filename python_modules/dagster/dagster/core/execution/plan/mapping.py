@@ -0,0 +1,75 @@
+import re
+
+from dagster import check
+
+from .objects import ExecutionStep, StepInput, StepKind, StepOutput, StepOutputHandle
+
+# The key of the step executing item i of mapped step key is key[i]
+MAPPED_ITEM_KEY_RE = re.compile(r'^(?P<step_key>.+)\[(?P<index>\d+)\]$')
+
+
+def mapped_item_key(step_key, index):
+    check.str_param(step_key, 'step_key')
+    check.int_param(index, 'index')
+    return '{step_key}[{index}]'.format(step_key=step_key, index=index)
+
+
+def parse_mapped_item_key(key):
+    '''The key of the mapped step and the index of the item executed by the step with key, or None
+    if key is not that of an item of a mapped step.'''
+    check.str_param(key, 'key')
+    match = MAPPED_ITEM_KEY_RE.match(key)
+    if not match:
+        return None
+    return match.group('step_key'), int(match.group('index'))
+
+
+def mapped_item_input_handle(step, index):
+    '''The handle under which the mapped step writes the item its step at index receives.'''
+    check.inst_param(step, 'step', ExecutionStep)
+    check.invariant(step.is_mapped, 'Step {key} is not mapped'.format(key=step.key))
+    check.int_param(index, 'index')
+
+    return StepOutputHandle(
+        step.key, '{input_name}[{index}]'.format(input_name=step.mapped_input, index=index)
+    )
+
+
+def create_mapped_item_step(step, index):
+    '''The step executing the compute function of a mapped step on the item at index.
+
+    It consumes the item through the handle the mapped step writes it to, and the other inputs of
+    the mapped step as they are. Its inputs and outputs have the types of the items of those of
+    the mapped step.
+    '''
+    check.inst_param(step, 'step', ExecutionStep)
+    check.invariant(step.is_mapped, 'Step {key} is not mapped'.format(key=step.key))
+    check.int_param(index, 'index')
+
+    return ExecutionStep(
+        pipeline_name=step.pipeline_name,
+        key_suffix=mapped_item_key(step.key_suffix, index),
+        step_inputs=[
+            StepInput(
+                step_input.name,
+                step_input.runtime_type.inner_type,
+                mapped_item_input_handle(step, index),
+            )
+            if step_input.name == step.mapped_input
+            else step_input
+            for step_input in step.step_inputs
+        ],
+        step_outputs=[
+            StepOutput(
+                name=step_output.name,
+                runtime_type=step_output.runtime_type.inner_type,
+                optional=step_output.optional,
+            )
+            for step_output in step.step_outputs
+        ],
+        compute_fn=step.compute_fn,
+        kind=StepKind.MAPPED_COMPUTE,
+        solid_handle=step.solid_handle,
+        logging_tags={'mapped_step': step.key, 'mapped_item': str(index)},
+        metadata=step.metadata,
+    )
@@ -0,0 +1,97 @@
+import hashlib
+import json
+
+from dagster import check
+from dagster.core.system_config.objects import EnvironmentConfig
+from dagster.core.types.compression import CompressedSerializationStrategy
+
+from .objects import StepKind, StepOutputHandle
+from .plan import ExecutionPlan
+
+
+def step_output_memoization_keys(execution_plan, environment_config):
+    '''The keys under which the outputs of steps are memoized across runs.
+
+    The key of an output hashes the version declared by the solid of its step, the name of the
+    solid's definition, the config of the solid (including that of its inputs and outputs), the
+    step itself and the keys of the outputs the step consumes. Two steps with the same key are
+    therefore expected to produce the same outputs. The key of an output also hashes how it is
+    stored: the serialization strategy of its type, and the codec the storage compresses it with,
+    so that a run never reads an output memoized by a run that stored it differently.
+
+    Steps of solids that do not declare a version have no keys, and neither do the steps
+    downstream of them. Neither do mapped steps, whose outputs are collected from the steps
+    executing their items rather than produced by the step itself.
+
+    Returns:
+        Dict[StepOutputHandle, str]: The memoization key of every output that has one.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.inst_param(environment_config, 'environment_config', EnvironmentConfig)
+
+    compression = environment_config.storage.storage_config.get('compression')
+
+    memoization_keys = {}
+    for step in execution_plan.topological_steps():
+        solid_def = execution_plan.pipeline_def.get_solid(step.solid_handle).definition
+        if solid_def.version is None or step.is_mapped:
+            continue
+
+        input_keys = {
+            step_input.name: memoization_keys.get(step_input.prev_output_handle)
+            for step_input in step.step_inputs
+        }
+        if None in input_keys.values():
+            continue
+
+        solid_config = environment_config.solids.get(str(step.solid_handle))
+        step_key = _hash(
+            [
+                solid_def.name,
+                solid_def.version,
+                step.key_suffix,
+                solid_config._asdict() if solid_config else None,
+                input_keys,
+            ]
+        )
+        for step_output in step.step_outputs:
+            memoization_keys[StepOutputHandle.from_step(step, step_output.name)] = _hash(
+                [
+                    step_key,
+                    step_output.name,
+                    _describe_serialization_strategy(
+                        step_output.runtime_type.serialization_strategy
+                    ),
+                    compression,
+                ]
+            )
+
+    return memoization_keys
+
+
+def is_step_memoizable(step):
+    '''Whether the outputs of the step may be reused rather than executing it. Materialization
+    thunks are always executed, since they exist for their side effects.'''
+    return step.kind != StepKind.MATERIALIZATION_THUNK
+
+
+def _describe_serialization_strategy(serialization_strategy):
+    if isinstance(serialization_strategy, CompressedSerializationStrategy):
+        return [
+            _describe_serialization_strategy(serialization_strategy.serialization_strategy),
+            serialization_strategy.codec.name,
+            serialization_strategy.level,
+        ]
+    return [
+        type(serialization_strategy).__module__,
+        type(serialization_strategy).__name__,
+        getattr(serialization_strategy, 'protocol', None),
+    ]
+
+
+def _hash(value):
+    # Config values that are not JSON serializable, such as those of custom config types, are
+    # hashed by their repr
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=repr).encode('utf-8')
+    ).hexdigest()
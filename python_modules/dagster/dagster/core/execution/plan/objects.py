@@ -5,6 +5,7 @@ from enum import Enum
 from dagster import check
 from dagster.core.definitions import SolidHandle
 from dagster.core.definitions.materialization import Materialization
+from dagster.core.types.compression import CompressionStats
 from dagster.core.types.runtime import RuntimeType
 from dagster.utils import merge_dicts
 from dagster.utils.error import SerializableErrorInfo
@@ -45,9 +46,25 @@ class SingleOutputStepCreationData(namedtuple('SingleOutputStepCreationData', 's
 
 
 class StepOutputData(
-    namedtuple('_StepOutputData', 'step_output_handle value_repr intermediate_materialization')
+    namedtuple(
+        '_StepOutputData',
+        'step_output_handle value_repr intermediate_materialization compression_stats',
+    )
 ):
-    def __new__(cls, step_output_handle, value_repr, intermediate_materialization):
+    '''A step yielded an output.
+
+    Args:
+        step_output_handle (StepOutputHandle): The output.
+        value_repr (str): A bounded summary of the value of the output.
+        intermediate_materialization (Optional[Materialization]): Where the intermediate holding
+            the value was written, if it was written to an object store.
+        compression_stats (Optional[CompressionStats]): How the intermediate was compressed, if
+            it was.
+    '''
+
+    def __new__(
+        cls, step_output_handle, value_repr, intermediate_materialization, compression_stats=None
+    ):
         return super(StepOutputData, cls).__new__(
             cls,
             step_output_handle=check.inst_param(
@@ -57,6 +74,9 @@ class StepOutputData(
             intermediate_materialization=check.opt_inst_param(
                 intermediate_materialization, 'intermediate_materialization', Materialization
             ),
+            compression_stats=check.opt_inst_param(
+                compression_stats, 'compression_stats', CompressionStats
+            ),
         )
 
     @property
@@ -71,10 +91,52 @@ class StepFailureData(namedtuple('_StepFailureData', 'error')):
         )
 
 
-class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms')):
-    def __new__(cls, duration_ms):
+class StepPhase(Enum):
+    '''The phases of executing a step that are timed separately.'''
+
+    INPUT_LOAD = 'INPUT_LOAD'
+    TYPE_CHECK = 'TYPE_CHECK'
+    COMPUTE = 'COMPUTE'
+    OUTPUT_STORE = 'OUTPUT_STORE'
+
+
+class StepSuccessData(namedtuple('_StepSuccessData', 'duration_ms phase_durations_ms')):
+    '''A step succeeded.
+
+    Args:
+        duration_ms (float): How long the step took to execute, from loading its inputs to
+            storing its last output.
+        phase_durations_ms (Optional[Dict[str, float]]): How much of duration_ms was spent in
+            each StepPhase, by the value of the phase: loading the inputs from the intermediates
+            manager, type checking the inputs and outputs, executing the compute function, and
+            writing the outputs to the intermediates manager. The remainder is spent by dagster
+            itself, e.g. creating and logging events.
+    '''
+
+    def __new__(cls, duration_ms, phase_durations_ms=None):
         return super(StepSuccessData, cls).__new__(
-            cls, duration_ms=check.float_param(duration_ms, 'duration_ms')
+            cls,
+            duration_ms=check.float_param(duration_ms, 'duration_ms'),
+            phase_durations_ms=check.opt_dict_param(
+                phase_durations_ms, 'phase_durations_ms', key_type=str, value_type=float
+            ),
+        )
+
+
+class StepCacheHitData(namedtuple('_StepCacheHitData', 'memoization_keys')):
+    '''The outputs of a step were memoized by an earlier run, and were reused rather than executing
+    the step.
+
+    Args:
+        memoization_keys (Dict[str, str]): The memoization key of each output, by output name.
+    '''
+
+    def __new__(cls, memoization_keys):
+        return super(StepCacheHitData, cls).__new__(
+            cls,
+            memoization_keys=check.dict_param(
+                memoization_keys, 'memoization_keys', key_type=str, value_type=str
+            ),
         )
 
 
@@ -89,6 +151,7 @@ class StepKind(Enum):
     VALUE_THUNK = 'VALUE_THUNK'
     UNMARSHAL_INPUT = 'UNMARSHAL_INPUT'
     MARSHAL_OUTPUT = 'MARSHAL_OUTPUT'
+    MAPPED_COMPUTE = 'MAPPED_COMPUTE'
 
 
 class StepInput(namedtuple('_StepInput', 'name runtime_type prev_output_handle')):
@@ -118,10 +181,19 @@ class ExecutionStep(
         '_ExecutionStep',
         (
             'pipeline_name key_suffix step_inputs step_input_dict step_outputs step_output_dict '
-            'compute_fn kind solid_handle logging_tags metadata'
+            'compute_fn kind solid_handle logging_tags metadata mapped_input'
         ),
     )
 ):
+    '''A unit of work of an execution plan.
+
+    Args:
+        mapped_input (Optional[str]): Set on the compute step of a solid mapped over the items of
+            one of its inputs, to the name of that input. The step receives all of the items as a
+            list, and collects every output into a list with one value per item. Each item is
+            executed by a MAPPED_COMPUTE step created at runtime, see plan/mapping.py.
+    '''
+
     def __new__(
         cls,
         pipeline_name,
@@ -133,6 +205,7 @@ class ExecutionStep(
         solid_handle,
         logging_tags=None,
         metadata=None,
+        mapped_input=None,
     ):
         return super(ExecutionStep, cls).__new__(
             cls,
@@ -155,6 +228,7 @@ class ExecutionStep(
                 check.opt_dict_param(logging_tags, 'logging_tags'),
             ),
             metadata=check.opt_dict_param(metadata, 'metadata', key_type=str, value_type=str),
+            mapped_input=check.opt_str_param(mapped_input, 'mapped_input'),
         )
 
     @property
@@ -165,6 +239,10 @@ class ExecutionStep(
     def solid_name(self):
         return self.solid_handle.name
 
+    @property
+    def is_mapped(self):
+        return self.mapped_input is not None
+
     @property
     def solid_definition_name(self):
         return self.solid_handle.definition_name
@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 
 from dagster import check
 from dagster.core.definitions import (
@@ -20,6 +20,7 @@ from dagster.core.utils import toposort
 from .compute import create_compute_step
 from .expectations import create_expectations_subplan, decorate_with_expectations
 from .input_thunk import create_input_thunk_execution_step
+from .mapping import create_mapped_item_step, parse_mapped_item_key
 from .materialization_thunk import decorate_with_output_materializations
 from .objects import ExecutionStep, ExecutionValueSubplan, StepInput, StepKind, StepOutputHandle
 from .utility import create_join_outputs_step
@@ -147,7 +148,12 @@ class _PlanBuilder:
             # recurse over the solids in a CompositeSolid
             if isinstance(solid.definition, SolidDefinition):
                 solid_transform_step = create_compute_step(
-                    self.pipeline_name, self.environment_config, solid, step_inputs, handle
+                    self.pipeline_name,
+                    self.environment_config,
+                    solid,
+                    step_inputs,
+                    handle,
+                    mapped_input=self._get_mapped_input(solid, dependency_structure, handle),
                 )
                 self.add_step(solid_transform_step)
                 terminal_transform_step = solid_transform_step
@@ -184,6 +190,33 @@ class _PlanBuilder:
 
         return terminal_transform_step
 
+    def _get_mapped_input(self, solid, dependency_structure, handle):
+        mapped_inputs = [
+            input_handle.input_def.name
+            for input_handle in solid.input_handles()
+            if dependency_structure.is_mapped_input(input_handle)
+        ]
+        if not mapped_inputs:
+            return None
+
+        # Output materializations are configured for a single value, while the outputs of a
+        # mapped solid are lists of them
+        solid_config = self.environment_config.solids.get(str(handle))
+        if solid_config and solid_config.outputs:
+            raise DagsterInvariantViolationError(
+                (
+                    'In pipeline {pipeline_name} solid {solid_name} is mapped over input '
+                    '{input_name}, and so its outputs can not be materialized.'
+                ).format(
+                    pipeline_name=self.pipeline_name,
+                    solid_name=solid.name,
+                    input_name=mapped_inputs[0],
+                )
+            )
+
+        (mapped_input,) = mapped_inputs
+        return mapped_input
+
 
 def create_subplan_for_input(
     pipeline_name, environment_config, solid, prev_step_output_handle, input_def, handle
@@ -318,12 +351,81 @@ class ExecutionPlan(
 
     def has_step(self, key):
         check.str_param(key, 'key')
-        return key in self.step_dict
+        return key in self.step_dict or self._get_mapped_item_step(key) is not None
 
     def get_step_by_key(self, key):
+        '''The step with key. This includes the steps executing the items of mapped steps, which
+        are not part of the plan itself since they are only known at runtime.'''
         check.str_param(key, 'key')
+        if key not in self.step_dict:
+            mapped_item_step = self._get_mapped_item_step(key)
+            if mapped_item_step is not None:
+                return mapped_item_step
         return self.step_dict[key]
 
+    def _get_mapped_item_step(self, key):
+        parsed = parse_mapped_item_key(key)
+        if parsed is None:
+            return None
+
+        step_key, index = parsed
+        step = self.step_dict.get(step_key)
+        if step is None or not step.is_mapped:
+            return None
+        return create_mapped_item_step(step, index)
+
+    def get_step_resource_pools(self, key):
+        '''The resource pools the step occupies a slot of while it executes. Those declared by a
+        solid are occupied by its compute step only, or by the steps executing its items when it
+        is mapped.'''
+        step = self.get_step_by_key(key)
+        if step.kind not in (StepKind.COMPUTE, StepKind.MAPPED_COMPUTE) or step.is_mapped:
+            return []
+        return self.pipeline_def.get_solid(step.solid_handle).definition.resource_pools
+
+    def is_step_idempotent(self, key):
+        '''Whether the step may be executed more than once, which holds for every step of an
+        idempotent solid.'''
+        step = self.get_step_by_key(key)
+        return self.pipeline_def.get_solid(step.solid_handle).definition.is_idempotent
+
+    def get_solid_result_outputs(self, step_keys_to_execute=None):
+        '''The outputs of the compute steps executed that no other solid consumes, either directly
+        or through the other steps of their own solid. These are the results of the run.
+
+        Returns:
+            Dict[StepOutputHandle, RuntimeType]: The runtime type of each result output.
+        '''
+        check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+
+        handle_consumers = defaultdict(list)
+        for step in self.steps:
+            for step_input in step.step_inputs:
+                handle_consumers[step_input.prev_output_handle].append(step)
+
+        def _consumed_by_other_solid(step_output_handle, solid_handle):
+            for consumer in handle_consumers[step_output_handle]:
+                if consumer.solid_handle != solid_handle or any(
+                    _consumed_by_other_solid(
+                        StepOutputHandle.from_step(consumer, step_output.name), solid_handle
+                    )
+                    for step_output in consumer.step_outputs
+                ):
+                    return True
+            return False
+
+        result_outputs = {}
+        for step in self.steps:
+            if step.kind != StepKind.COMPUTE or (
+                step_keys_to_execute and step.key not in step_keys_to_execute
+            ):
+                continue
+            for step_output in step.step_outputs:
+                step_output_handle = StepOutputHandle.from_step(step, step_output.name)
+                if not _consumed_by_other_solid(step_output_handle, step.solid_handle):
+                    result_outputs[step_output_handle] = step_output.runtime_type
+        return result_outputs
+
     def topological_steps(self):
         return [step for step_level in self.topological_step_levels() for step in step_level]
 
@@ -0,0 +1,116 @@
+from collections import defaultdict, namedtuple
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+from dagster.core.storage.runs import INTERMEDIATE_RELEASED, StepEventRecord
+
+from .objects import StepOutputHandle
+from .plan import ExecutionPlan
+
+
+class ResumptionPlan(
+    namedtuple('_ResumptionPlan', 'step_keys_to_execute step_output_handles completed_step_keys')
+):
+    '''How to resume an earlier run of a pipeline.
+
+    Args:
+        step_keys_to_execute (List[str]): The keys of the steps to execute again, in topological
+            order.
+        step_output_handles (List[StepOutputHandle]): The outputs the earlier run persisted that
+            the steps executed again consume. They are brought over from it.
+        completed_step_keys (List[str]): The keys of the steps that are not executed again, in
+            topological order. The run resuming the earlier one records them as completed, so
+            that it can in turn be resumed.
+    '''
+
+    def __new__(cls, step_keys_to_execute, step_output_handles, completed_step_keys):
+        return super(ResumptionPlan, cls).__new__(
+            cls,
+            step_keys_to_execute=check.list_param(
+                step_keys_to_execute, 'step_keys_to_execute', of_type=str
+            ),
+            step_output_handles=check.list_param(
+                step_output_handles, 'step_output_handles', of_type=StepOutputHandle
+            ),
+            completed_step_keys=check.list_param(
+                completed_step_keys, 'completed_step_keys', of_type=str
+            ),
+        )
+
+
+def plan_resumption(execution_plan, step_event_records):
+    '''Work out which steps of an earlier run need to execute again for the run to complete.
+
+    A step of the earlier run is reused if it succeeded, or reused memoized outputs, and every
+    output it produced that a step executed again consumes was persisted, and not released during
+    the earlier run by the garbage collection of intermediates. Every other step is
+    executed again: those that failed, were skipped or never started, those downstream of them,
+    and those whose outputs were only handed over in memory to a step executed again.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan of the run that resumes the earlier one.
+        step_event_records (List[StepEventRecord]): The step events the earlier run recorded.
+
+    Returns:
+        ResumptionPlan
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.list_param(step_event_records, 'step_event_records', of_type=StepEventRecord)
+
+    succeeded = set()
+    failed = set()
+    persisted = set()
+    for record in step_event_records:
+        if record.event_type_value in (
+            DagsterEventType.STEP_SUCCESS.value,
+            DagsterEventType.STEP_CACHE_HIT.value,
+        ):
+            succeeded.add(record.step_key)
+        elif record.event_type_value == DagsterEventType.STEP_FAILURE.value:
+            failed.add(record.step_key)
+        elif record.event_type_value == DagsterEventType.STEP_OUTPUT.value:
+            persisted.add(StepOutputHandle(record.step_key, record.output_name))
+        elif record.event_type_value == INTERMEDIATE_RELEASED:
+            persisted.discard(StepOutputHandle(record.step_key, record.output_name))
+
+    steps = execution_plan.topological_steps()
+    consumers = defaultdict(list)
+    for step in steps:
+        for step_input in step.step_inputs:
+            consumers[step_input.prev_output_handle.step_key].append(step.key)
+
+    to_execute = set(step.key for step in steps if step.key not in succeeded or step.key in failed)
+    changed = True
+    while changed:
+        changed = False
+        for step in steps:
+            if step.key not in to_execute:
+                continue
+            for step_key in consumers[step.key]:
+                if step_key not in to_execute:
+                    to_execute.add(step_key)
+                    changed = True
+            for step_input in step.step_inputs:
+                if (
+                    step_input.prev_output_handle not in persisted
+                    and step_input.prev_output_handle.step_key not in to_execute
+                ):
+                    to_execute.add(step_input.prev_output_handle.step_key)
+                    changed = True
+
+    step_output_handles = []
+    for step in steps:
+        if step.key not in to_execute:
+            continue
+        for step_input in step.step_inputs:
+            if (
+                step_input.prev_output_handle.step_key not in to_execute
+                and step_input.prev_output_handle not in step_output_handles
+            ):
+                step_output_handles.append(step_input.prev_output_handle)
+
+    return ResumptionPlan(
+        step_keys_to_execute=[step.key for step in steps if step.key in to_execute],
+        step_output_handles=step_output_handles,
+        completed_step_keys=[step.key for step in steps if step.key not in to_execute],
+    )
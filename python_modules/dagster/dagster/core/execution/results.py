@@ -108,6 +108,11 @@ class SolidExecutionResult(object):
     def transforms(self):
         return self.step_events_by_kind.get(StepKind.COMPUTE, [])
 
+    @property
+    def mapped_transforms(self):
+        '''The events of the steps executing the items of a solid mapped over one of its inputs.'''
+        return self.step_events_by_kind.get(StepKind.MAPPED_COMPUTE, [])
+
     @property
     def input_expectations(self):
         return self.step_events_by_kind.get(StepKind.INPUT_EXPECTATION, [])
@@ -125,7 +130,11 @@ class SolidExecutionResult(object):
         ):
             if step_event.event_type == DagsterEventType.STEP_FAILURE:
                 return False
-            if step_event.event_type == DagsterEventType.STEP_SUCCESS:
+            # Steps whose outputs were memoized by an earlier run succeeded in that run
+            if step_event.event_type in (
+                DagsterEventType.STEP_SUCCESS,
+                DagsterEventType.STEP_CACHE_HIT,
+            ):
                 any_success = True
 
         return any_success
@@ -197,6 +206,17 @@ class SolidExecutionResult(object):
             return None
 
     def _get_value(self, context, step_output_data):
+        if not context.intermediates_manager.has_intermediate(
+            context, step_output_data.step_output_handle
+        ):
+            raise DagsterInvariantViolationError(
+                (
+                    'Intermediate {output_name} of solid {self.solid.name} is no longer available. '
+                    'It was released during execution because execution.gc_intermediates is set, '
+                    'or at the end of the run because it was stored in shared memory.'
+                ).format(output_name=step_output_data.output_name, self=self)
+            )
+
         return context.intermediates_manager.get_intermediate(
             context=context,
             runtime_type=self.solid.output_def_named(step_output_data.output_name).runtime_type,
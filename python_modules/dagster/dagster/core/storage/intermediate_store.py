@@ -5,19 +5,38 @@ from abc import ABCMeta, abstractmethod
 import six
 
 from dagster import check, seven
+from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.types.compression import CompressedSerializationStrategy
+from dagster.core.types.marshal import StreamSerializationStrategy
 from dagster.core.types.runtime import RuntimeType, resolve_to_runtime_type
 
-from .object_store import ObjectStore, FileSystemObjectStore
+from .object_store import ObjectStore, FileSystemObjectStore, SharedMemoryObjectStore
 from .runs import RunStorageMode
 from .type_storage import TypeStoragePluginRegistry
 
 
 class IntermediateStore(six.with_metaclass(ABCMeta)):
-    def __init__(self, object_store, root, types_to_register=None):
+    '''Stores objects under paths relative to root in an object store.
+
+    Args:
+        compression (Optional[str]): A codec of COMPRESSION_CODECS compressing every object,
+            unless its type compresses its values itself or serializes a stream.
+    '''
+
+    def __init__(self, object_store, root, types_to_register=None, compression=None):
         self.root = check.str_param(root, 'root')
         self.object_store = check.inst_param(object_store, 'object_store', ObjectStore)
         self.registry = TypeStoragePluginRegistry(types_to_register)
+        self.compression = check.opt_str_param(compression, 'compression')
+
+    def _serialization_strategy(self, runtime_type):
+        serialization_strategy = runtime_type.serialization_strategy
+        if not self.compression or isinstance(
+            serialization_strategy, (CompressedSerializationStrategy, StreamSerializationStrategy)
+        ):
+            return serialization_strategy
+        return CompressedSerializationStrategy(serialization_strategy, self.compression)
 
     def uri_for_paths(self, paths, protocol=None):
         check.list_param(paths, 'paths', of_type=str)
@@ -32,7 +51,7 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.set_object(
-            key, obj, serialization_strategy=runtime_type.serialization_strategy
+            key, obj, serialization_strategy=self._serialization_strategy(runtime_type)
         )
 
     def get_object(self, context, runtime_type, paths):
@@ -42,7 +61,7 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.inst_param(runtime_type, 'runtime_type', RuntimeType)
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.get_object(
-            key, serialization_strategy=runtime_type.serialization_strategy
+            key, serialization_strategy=self._serialization_strategy(runtime_type)
         )
 
     def has_object(self, context, paths):
@@ -63,6 +82,36 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
     def copy_object_from_prev_run(self, context, previous_run_id, paths):
         pass
 
+    def release_run(self, context, paths_to_retain):
+        '''Called by engines that own the objects of the run once it has completed. Objects are
+        kept after the run by default.
+
+        Args:
+            paths_to_retain (List[Tuple[List[str], RuntimeType]]): The objects that should remain
+                readable from this store, if it releases the others.
+        '''
+
+    def has_memoized_object(self, context, memoization_key):
+        '''Whether an earlier run memoized an object under memoization_key. Stores that do not
+        memoize objects across runs never have one.'''
+        return False
+
+    def memoize_object(self, context, memoization_key, paths):
+        '''Memoize the object at paths under memoization_key, so that later runs can reuse it.'''
+
+    def copy_memoized_object(self, context, memoization_key, paths):
+        '''Copy the object memoized under memoization_key to paths, returning its key.'''
+        check.failed(
+            '{store} does not memoize objects across runs'.format(store=type(self).__name__)
+        )
+
+    def rm_memoized_object(self, context, memoization_key):
+        '''Evict the object memoized under memoization_key, if any, so that the next run
+        executing its step produces it again.'''
+
+    def rm_memoized_objects(self, context):
+        '''Evict every object memoized by this store.'''
+
     def set_value(self, obj, context, runtime_type, paths):
         if self.registry.is_registered(runtime_type):
             return self.registry.get(runtime_type.name).set_object(
@@ -103,8 +152,11 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         )
 
 
+DEFAULT_SHARED_MEMORY_DIR = '/dev/shm'
+
+
 class FileSystemIntermediateStore(IntermediateStore):
-    def __init__(self, run_id, types_to_register=None, base_dir=None):
+    def __init__(self, run_id, types_to_register=None, base_dir=None, compression=None):
         self.run_id = check.str_param(run_id, 'run_id')
         self.storage_mode = RunStorageMode.FILESYSTEM
 
@@ -126,7 +178,7 @@ class FileSystemIntermediateStore(IntermediateStore):
         root = object_store.key_for_paths([self.base_dir, 'dagster', 'runs', run_id, 'files'])
 
         super(FileSystemIntermediateStore, self).__init__(
-            object_store, root=root, types_to_register=types_to_register
+            object_store, root=root, types_to_register=types_to_register, compression=compression
         )
 
     @property
@@ -148,4 +200,106 @@ class FileSystemIntermediateStore(IntermediateStore):
 
         src = os.path.join(prev_run_files_dir, *paths)
         dst = os.path.join(self.root, *paths)
-        self.object_store.cp_object(src, dst)
+        if not self.object_store.has_object(src):
+            raise DagsterInvariantViolationError(
+                'Can not copy {key} from run {previous_run_id}: the run has no object at '
+                '{src}'.format(
+                    key=self.object_store.key_for_paths(paths),
+                    previous_run_id=previous_run_id,
+                    src=src,
+                )
+            )
+        # Intermediates are never modified once written, so the earlier run's are referenced
+        # rather than copied where the filesystem allows it
+        self.object_store.link_object(src, dst)
+
+    def _memoized_key(self, memoization_key):
+        return self.object_store.key_for_paths(
+            [self.base_dir, 'dagster', 'memoized', memoization_key]
+        )
+
+    def has_memoized_object(self, context, memoization_key):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(memoization_key, 'memoization_key')
+
+        return self.object_store.has_object(self._memoized_key(memoization_key))
+
+    def memoize_object(self, context, memoization_key, paths):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(memoization_key, 'memoization_key')
+        check.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+
+        self.object_store.link_object(
+            self.object_store.key_for_paths([self.root] + paths),
+            self._memoized_key(memoization_key),
+        )
+
+    def copy_memoized_object(self, context, memoization_key, paths):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(memoization_key, 'memoization_key')
+        check.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+
+        key = self.object_store.key_for_paths([self.root] + paths)
+        self.object_store.link_object(self._memoized_key(memoization_key), key)
+        return key
+
+    def rm_memoized_object(self, context, memoization_key):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(memoization_key, 'memoization_key')
+
+        self.object_store.rm_object(self._memoized_key(memoization_key))
+
+    def rm_memoized_objects(self, context):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+
+        self.object_store.rm_object(
+            self.object_store.key_for_paths([self.base_dir, 'dagster', 'memoized'])
+        )
+
+
+class SharedMemoryIntermediateStore(FileSystemIntermediateStore):
+    '''An intermediate store for the multiprocess engine, which keeps intermediates in files on a
+    shared memory filesystem rather than on disk, and maps them into the processes that read them.
+
+    The engine releases all of the intermediates of a run once it completes, apart from the
+    outputs it is asked to retain. Those are mapped into the engine's process, from which they
+    remain readable through this store. Objects are never memoized across runs, since memoized
+    objects would keep the memory backing them in use after the run.
+    '''
+
+    def __init__(self, run_id, types_to_register=None, base_dir=None):
+        base_dir = check.opt_nonempty_str_param(base_dir, 'base_dir', DEFAULT_SHARED_MEMORY_DIR)
+        super(SharedMemoryIntermediateStore, self).__init__(
+            run_id, types_to_register=types_to_register, base_dir=base_dir
+        )
+        self.storage_mode = RunStorageMode.SHARED_MEMORY
+        self.object_store = SharedMemoryObjectStore()
+
+    def copy_object_from_prev_run(self, context, previous_run_id, paths):
+        check.failed(
+            'Can not copy intermediates from run {previous_run_id}: shared memory intermediates '
+            'are released once a run completes'.format(previous_run_id=previous_run_id)
+        )
+
+    def has_memoized_object(self, context, memoization_key):
+        return False
+
+    def memoize_object(self, context, memoization_key, paths):
+        pass
+
+    def copy_memoized_object(self, context, memoization_key, paths):
+        check.failed('Shared memory intermediates are never memoized across runs')
+
+    def release_run(self, context, paths_to_retain):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(paths_to_retain, 'paths_to_retain', of_type=tuple)
+
+        for paths, runtime_type in paths_to_retain:
+            key = self.object_store.key_for_paths([self.root] + paths)
+            if self.object_store.has_object(key):
+                self.object_store.detach_object(key, runtime_type.serialization_strategy)
+
+        # root is <base_dir>/dagster/runs/<run_id>/files
+        self.object_store.rm_object(os.path.dirname(self.root))
@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+import threading
 
 import six
 
@@ -7,7 +8,11 @@ from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.types.runtime import RuntimeType
 
-from .intermediate_store import IntermediateStore, FileSystemIntermediateStore
+from .intermediate_store import (
+    IntermediateStore,
+    FileSystemIntermediateStore,
+    SharedMemoryIntermediateStore,
+)
 from .runs import RunStorageMode
 from .type_storage import construct_type_storage_plugin_registry
 
@@ -29,6 +34,37 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         pass
 
+    @abstractmethod
+    def rm_intermediate(self, context, step_output_handle):
+        pass
+
+    def has_memoized_intermediate(self, context, memoization_key):
+        '''Whether an earlier run memoized an intermediate under memoization_key. Managers that do
+        not memoize intermediates across runs never have one.'''
+        return False
+
+    def memoize_intermediate(self, context, runtime_type, step_output_handle, memoization_key):
+        '''Memoize the intermediate for step_output_handle under memoization_key, so that later
+        runs can reuse it.'''
+
+    def copy_memoized_intermediate(self, context, memoization_key, step_output_handle):
+        '''Set the intermediate for step_output_handle to the one memoized under memoization_key,
+        returning the key of the object now holding it.'''
+        check.failed(
+            '{manager} does not memoize intermediates across runs'.format(
+                manager=type(self).__name__
+            )
+        )
+
+    def release_run_intermediates(self, context, step_outputs_to_retain):
+        '''Called by engines that own the intermediates of the run once it has completed.
+        Intermediates are kept after the run unless the manager says otherwise.
+
+        Args:
+            step_outputs_to_retain (Dict[StepOutputHandle, RuntimeType]): The intermediates that
+                should remain readable from this manager, if it releases the others.
+        '''
+
     def all_inputs_covered(self, context, step):
         return len(self.uncovered_inputs(context, step)) == 0
 
@@ -49,6 +85,9 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         self.values = {}
         self.storage_mode = RunStorageMode.IN_MEMORY
 
+        # Steps executed by the ThreadPoolEngine share this manager
+        self._lock = threading.Lock()
+
     # Note:
     # For the in-memory manager context and runtime are currently optional
     # because they are not strictly required. So we allow one to access
@@ -60,22 +99,34 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.opt_inst_param(runtime_type, 'runtime_type', RuntimeType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
-        return self.values[step_output_handle]
+        with self._lock:
+            return self.values[step_output_handle]
 
     def set_intermediate(self, context, runtime_type, step_output_handle, value):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.opt_inst_param(runtime_type, 'runtime_type', RuntimeType)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
-        self.values[step_output_handle] = value
+        if runtime_type is not None and runtime_type.is_stream:
+            # Every solid consuming a stream iterates it, so its chunks are kept
+            value = list(value)
+        with self._lock:
+            self.values[step_output_handle] = value
 
     def has_intermediate(self, context, step_output_handle):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
-        return step_output_handle in self.values
+        with self._lock:
+            return step_output_handle in self.values
 
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        with self._lock:
+            self.values.pop(step_output_handle, None)
+
 
 class IntermediateStoreIntermediatesManager(IntermediatesManager):
     def __init__(self, intermediate_store):
@@ -126,6 +177,127 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
             context, previous_run_id, self._get_paths(step_output_handle)
         )
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.rm_object(context, self._get_paths(step_output_handle))
+
+    def has_memoized_intermediate(self, context, memoization_key):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(memoization_key, 'memoization_key')
+
+        return self._intermediate_store.has_memoized_object(context, memoization_key)
+
+    def memoize_intermediate(self, context, runtime_type, step_output_handle, memoization_key):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(runtime_type, 'runtime_type', RuntimeType)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        check.str_param(memoization_key, 'memoization_key')
+
+        return self._intermediate_store.memoize_object(
+            context, memoization_key, self._get_paths(step_output_handle)
+        )
+
+    def copy_memoized_intermediate(self, context, memoization_key, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.str_param(memoization_key, 'memoization_key')
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        return self._intermediate_store.copy_memoized_object(
+            context, memoization_key, self._get_paths(step_output_handle)
+        )
+
+    def release_run_intermediates(self, context, step_outputs_to_retain):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.dict_param(
+            step_outputs_to_retain,
+            'step_outputs_to_retain',
+            key_type=StepOutputHandle,
+            value_type=RuntimeType,
+        )
+
+        self._intermediate_store.release_run(
+            context,
+            [
+                (self._get_paths(step_output_handle), runtime_type)
+                for step_output_handle, runtime_type in step_outputs_to_retain.items()
+            ],
+        )
+
+
+class FusedStepsIntermediatesManager(IntermediatesManager):
+    '''Used while executing a FusedStepGroup. Every intermediate the steps of the group set is
+    also kept in memory, so the next step in the group reads it from there rather than from the
+    underlying intermediates manager. Intermediates in memory_only_handles are never written to
+    the underlying intermediates manager at all.
+    '''
+
+    def __init__(self, intermediates_manager, memory_only_handles):
+        self._intermediates_manager = check.inst_param(
+            intermediates_manager, 'intermediates_manager', IntermediatesManager
+        )
+        self._memory_only_handles = frozenset(
+            check.set_param(memory_only_handles, 'memory_only_handles', of_type=StepOutputHandle)
+        )
+        self._in_memory = InMemoryIntermediatesManager()
+        self.storage_mode = intermediates_manager.storage_mode
+
+    def get_intermediate(self, context, runtime_type, step_output_handle):
+        if self._in_memory.has_intermediate(context, step_output_handle):
+            return self._in_memory.get_intermediate(context, runtime_type, step_output_handle)
+        return self._intermediates_manager.get_intermediate(
+            context, runtime_type, step_output_handle
+        )
+
+    def set_intermediate(self, context, runtime_type, step_output_handle, value):
+        if step_output_handle in self._memory_only_handles:
+            self._in_memory.set_intermediate(context, runtime_type, step_output_handle, value)
+            return None
+        # A stream can only be iterated once, when it is written to the underlying intermediates
+        # manager, and so the next step reads it back from there one chunk at a time
+        if not runtime_type.is_stream:
+            self._in_memory.set_intermediate(context, runtime_type, step_output_handle, value)
+        return self._intermediates_manager.set_intermediate(
+            context, runtime_type, step_output_handle, value
+        )
+
+    def has_intermediate(self, context, step_output_handle):
+        return self._in_memory.has_intermediate(
+            context, step_output_handle
+        ) or self._intermediates_manager.has_intermediate(context, step_output_handle)
+
+    def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
+        return self._intermediates_manager.copy_intermediate_from_prev_run(
+            context, previous_run_id, step_output_handle
+        )
+
+    def has_memoized_intermediate(self, context, memoization_key):
+        return self._intermediates_manager.has_memoized_intermediate(context, memoization_key)
+
+    def memoize_intermediate(self, context, runtime_type, step_output_handle, memoization_key):
+        if step_output_handle in self._memory_only_handles:
+            # Memoized intermediates are copied from the underlying intermediates manager
+            self._intermediates_manager.set_intermediate(
+                context,
+                runtime_type,
+                step_output_handle,
+                self._in_memory.get_intermediate(context, runtime_type, step_output_handle),
+            )
+        return self._intermediates_manager.memoize_intermediate(
+            context, runtime_type, step_output_handle, memoization_key
+        )
+
+    def copy_memoized_intermediate(self, context, memoization_key, step_output_handle):
+        return self._intermediates_manager.copy_memoized_intermediate(
+            context, memoization_key, step_output_handle
+        )
+
+    def rm_intermediate(self, context, step_output_handle):
+        self._in_memory.rm_intermediate(context, step_output_handle)
+        if step_output_handle not in self._memory_only_handles:
+            self._intermediates_manager.rm_intermediate(context, step_output_handle)
+
 
 def ensure_dagster_aws_requirements():
     try:
@@ -154,12 +326,25 @@ def construct_intermediates_manager(storage_mode, run_id, environment_config, pi
 
     if storage_mode == RunStorageMode.FILESYSTEM:
         return IntermediateStoreIntermediatesManager(
-            FileSystemIntermediateStore(run_id, type_storage_plugin_registry)
+            FileSystemIntermediateStore(
+                run_id,
+                type_storage_plugin_registry,
+                compression=environment_config.storage.storage_config.get('compression'),
+            )
         )
 
     elif storage_mode == RunStorageMode.IN_MEMORY:
         return InMemoryIntermediatesManager()
 
+    elif storage_mode == RunStorageMode.SHARED_MEMORY:
+        return IntermediateStoreIntermediatesManager(
+            SharedMemoryIntermediateStore(
+                run_id,
+                type_storage_plugin_registry,
+                base_dir=environment_config.storage.storage_config.get('base_dir'),
+            )
+        )
+
     elif storage_mode == RunStorageMode.S3:
         ensure_dagster_aws_requirements()
         from dagster_aws.s3.intermediate_store import S3IntermediateStore
@@ -169,6 +354,7 @@ def construct_intermediates_manager(storage_mode, run_id, environment_config, pi
                 environment_config.storage.storage_config['s3_bucket'],
                 run_id,
                 type_storage_plugin_registry,
+                compression=environment_config.storage.storage_config.get('compression'),
             )
         )
 
@@ -7,7 +7,13 @@ from abc import ABCMeta, abstractmethod
 import six
 
 from dagster import check
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.types.marshal import (
+    OutOfBandPickleSerializationStrategy,
+    PickleSerializationStrategy,
+    SerializationStrategy,
+    map_file,
+)
 from dagster.utils import mkdir_p
 
 
@@ -56,17 +62,17 @@ class FileSystemObjectStore(ObjectStore):  # pylint: disable=no-init
         )
 
         if os.path.exists(key):
-            logging.warning('Removing existing path {path}'.format(path=key))
-            os.unlink(key)
+            logging.warning('Replacing existing path {path}'.format(path=key))
 
         # Ensure path exists
         mkdir_p(os.path.dirname(key))
 
         if serialization_strategy:
-            serialization_strategy.serialize_to_file(obj, key)
+            _write_file_atomically(
+                key, lambda path: serialization_strategy.serialize_to_file(obj, path)
+            )
         else:
-            with open(key, 'wb') as f:
-                f.write(obj)
+            _write_file_atomically(key, lambda path: _write_bytes(obj, path))
 
         return key
 
@@ -74,6 +80,11 @@ class FileSystemObjectStore(ObjectStore):  # pylint: disable=no-init
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
+        if serialization_strategy and serialization_strategy.supports_mmap:
+            mapped = map_file(key)
+            if mapped is not None:
+                return serialization_strategy.deserialize_from_mmap(mapped)
+
         if serialization_strategy:
             return serialization_strategy.deserialize_from_file(key)
         else:
@@ -108,9 +119,143 @@ class FileSystemObjectStore(ObjectStore):  # pylint: disable=no-init
         elif os.path.isdir(src):
             shutil.copytree(src, dst)
         else:
-            check.failed('should not get here')
+            raise DagsterInvariantViolationError(
+                'Can not copy {src} to {dst}: there is no object at {src}'.format(src=src, dst=dst)
+            )
+
+    def link_object(self, src, dst):
+        '''Like cp_object, but hard links src to dst rather than copying it where possible if it is
+        a file, and replaces dst if it exists. Files are written atomically and never modified in
+        place afterwards, so neither path observes a change made through the other.'''
+        check.str_param(src, 'src')
+        check.str_param(dst, 'dst')
+
+        mkdir_p(os.path.dirname(dst))
+
+        if os.path.isfile(src):
+            _write_file_atomically(dst, lambda path: _link_or_copy_file(src, path))
+        elif os.path.isdir(src):
+            temp_path = '{dst}.{pid}.tmp'.format(dst=dst, pid=os.getpid())
+            shutil.copytree(src, temp_path)
+            self.rm_object(dst)
+            try:
+                _replace_file(temp_path, dst)
+            except OSError:
+                # A directory can not be renamed over another one, which another process may have
+                # written to dst in the meantime
+                shutil.rmtree(temp_path)
+                if not os.path.isdir(dst):
+                    raise
+        else:
+            raise DagsterInvariantViolationError(
+                'Can not link {src} to {dst}: there is no object at {src}'.format(src=src, dst=dst)
+            )
 
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, 'key')
         protocol = check.opt_str_param(protocol, 'protocol', default='file://')
         return protocol + '/' + key
+
+
+def _write_bytes(obj, path):
+    with open(path, 'wb') as f:
+        f.write(obj)
+
+
+def _write_file_atomically(key, write_fn):
+    # Write through a temporary file next to key that is then renamed over it. Readers, and other
+    # processes writing the same key, such as speculative copies of a step, never see a partially
+    # written file. A process terminated while writing leaves only its temporary file behind.
+    temp_path = '{key}.{pid}.tmp'.format(key=key, pid=os.getpid())
+    try:
+        write_fn(temp_path)
+        _replace_file(temp_path, key)
+    except:  # pylint: disable=bare-except
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+# os.rename does not replace an existing file on Windows, and os.replace is Python 3 only
+_replace_file = getattr(os, 'replace', os.rename)
+
+
+def _link_or_copy_file(src, dst):
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):
+        # Hard links are not supported across filesystems, by some filesystems, or on Windows
+        # under Python 2
+        shutil.copy(src, dst)
+
+
+class SharedMemoryObjectStore(FileSystemObjectStore):  # pylint: disable=no-init
+    '''Stores objects as files on a shared memory filesystem, such as /dev/shm on Linux, so that
+    exchanging them between processes never touches disk.
+
+    Objects serialized with a PickleSerializationStrategy are serialized with an
+    OutOfBandPickleSerializationStrategy: buffer-backed values such as NumPy arrays, Arrow buffers
+    or anything else supporting pickle protocol 5 are mapped into the reading process without
+    being copied. Objects with other serialization strategies are written with those strategies.
+
+    A detached object has been read into this process and its file removed. It remains readable
+    from this object store, and the memory backing it is freed once it is no longer referenced.
+    '''
+
+    def __init__(self):
+        super(SharedMemoryObjectStore, self).__init__()
+        self._detached = {}
+
+    def set_object(self, key, obj, serialization_strategy=None):
+        check.str_param(key, 'key')
+        check.opt_inst_param(
+            serialization_strategy, 'serialization_strategy', SerializationStrategy
+        )
+
+        if not isinstance(serialization_strategy, PickleSerializationStrategy):
+            return super(SharedMemoryObjectStore, self).set_object(key, obj, serialization_strategy)
+
+        self._detached.pop(key, None)
+        if os.path.exists(key):
+            logging.warning('Replacing existing path {path}'.format(path=key))
+
+        mkdir_p(os.path.dirname(key))
+        segment_strategy = OutOfBandPickleSerializationStrategy(serialization_strategy.protocol)
+        _write_file_atomically(key, lambda path: segment_strategy.serialize_to_file(obj, path))
+        return key
+
+    def get_object(self, key, serialization_strategy=None):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        if key in self._detached:
+            return self._detached[key]
+
+        if not isinstance(serialization_strategy, PickleSerializationStrategy):
+            return super(SharedMemoryObjectStore, self).get_object(key, serialization_strategy)
+
+        return super(SharedMemoryObjectStore, self).get_object(
+            key, OutOfBandPickleSerializationStrategy()
+        )
+
+    def has_object(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        return key in self._detached or os.path.exists(key)
+
+    def rm_object(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        self._detached.pop(key, None)
+        super(SharedMemoryObjectStore, self).rm_object(key)
+
+    def detach_object(self, key, serialization_strategy=None):
+        '''Read the object at key into this process, and remove its file.'''
+        check.str_param(key, 'key')
+
+        obj = self.get_object(key, serialization_strategy)
+        super(SharedMemoryObjectStore, self).rm_object(key)
+        self._detached[key] = obj
+        return obj
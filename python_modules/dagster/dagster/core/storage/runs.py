@@ -20,6 +20,14 @@ def meta_file(base_dir):
     return os.path.join(base_dir, 'runmeta.jsonl')
 
 
+def step_durations_file(base_dir, pipeline_name):
+    return os.path.join(base_dir, 'step_durations', '{}.jsonl'.format(pipeline_name))
+
+
+def step_events_file(base_dir, run_id):
+    return os.path.join(base_dir, run_id, 'step_events.jsonl')
+
+
 class DagsterRunMeta(namedtuple('_DagsterRunMeta', 'run_id timestamp pipeline_name')):
     def __new__(cls, run_id, timestamp, pipeline_name):
         return super(DagsterRunMeta, cls).__new__(
@@ -30,11 +38,91 @@ class DagsterRunMeta(namedtuple('_DagsterRunMeta', 'run_id timestamp pipeline_na
         )
 
 
+# The number of most recent durations of a step that its duration estimate is based on
+STEP_DURATION_HISTORY = 10
+
+
+class StepDurationRecord(
+    namedtuple('_StepDurationRecord', 'run_id pipeline_name step_key duration_ms')
+):
+    def __new__(cls, run_id, pipeline_name, step_key, duration_ms):
+        return super(StepDurationRecord, cls).__new__(
+            cls,
+            check.str_param(run_id, 'run_id'),
+            check.str_param(pipeline_name, 'pipeline_name'),
+            check.str_param(step_key, 'step_key'),
+            check.float_param(duration_ms, 'duration_ms'),
+        )
+
+
+# Recorded as the event type of an output of a run that was released during it, so that the run
+# is not resumed from an output that no longer exists
+INTERMEDIATE_RELEASED = 'INTERMEDIATE_RELEASED'
+
+
+class StepEventRecord(
+    namedtuple('_StepEventRecord', 'run_id step_key event_type_value output_name')
+):
+    '''A step event of a run, as recorded so that the run can later be resumed.
+
+    Args:
+        event_type_value (str): The value of the DagsterEventType of the event, or
+            INTERMEDIATE_RELEASED.
+        output_name (Optional[str]): The name of the output, for step output events and released
+            intermediates.
+    '''
+
+    def __new__(cls, run_id, step_key, event_type_value, output_name=None):
+        return super(StepEventRecord, cls).__new__(
+            cls,
+            check.str_param(run_id, 'run_id'),
+            check.str_param(step_key, 'step_key'),
+            check.str_param(event_type_value, 'event_type_value'),
+            check.opt_str_param(output_name, 'output_name'),
+        )
+
+
 class RunStorage(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     @abstractmethod
     def write_dagster_run_meta(self, dagster_run_meta):
         pass
 
+    def write_step_duration_record(self, step_duration_record):
+        '''Record how long a step took. Run storages that do not record step durations discard
+        them, and their runs are scheduled without historical durations.'''
+
+    def get_step_duration_records(self, pipeline_name):
+        '''The StepDurationRecords of the runs of the pipeline, oldest first. Only the most recent
+        STEP_DURATION_HISTORY records of each step need to be kept.'''
+        return []
+
+    def write_step_event_record(self, step_event_record):
+        '''Record a step event of a run. Run storages that do not record step events discard
+        them, and resuming their runs executes every step again.'''
+
+    def get_step_event_records(self, run_id):
+        '''The StepEventRecords of the run, in the order they were written.'''
+        return []
+
+    def get_step_duration_estimates(self, pipeline_name):
+        '''The expected duration in milliseconds of each step of the pipeline that has succeeded
+        before, based on the most recent STEP_DURATION_HISTORY times it did.
+
+        Returns:
+            Dict[str, float]: Estimated durations keyed by step key.
+        '''
+        check.str_param(pipeline_name, 'pipeline_name')
+
+        durations_by_step_key = {}
+        for record in self.get_step_duration_records(pipeline_name):
+            durations_by_step_key.setdefault(record.step_key, []).append(record.duration_ms)
+
+        return {
+            step_key: sum(durations[-STEP_DURATION_HISTORY:])
+            / len(durations[-STEP_DURATION_HISTORY:])
+            for step_key, durations in durations_by_step_key.items()
+        }
+
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
         return run_id in self.get_run_ids()
@@ -61,11 +149,27 @@ class RunStorage(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
         pass
 
 
+def _most_recent_step_duration_records(step_duration_records):
+    # The most recent STEP_DURATION_HISTORY records of each step, oldest first
+    counts = {}
+    most_recent = []
+    for record in reversed(step_duration_records):
+        counts[record.step_key] = counts.get(record.step_key, 0) + 1
+        if counts[record.step_key] <= STEP_DURATION_HISTORY:
+            most_recent.append(record)
+    return list(reversed(most_recent))
+
+
+# os.rename does not replace an existing file on Windows, and os.replace is Python 3 only
+_replace_file = getattr(os, 'replace', os.rename)
+
+
 class FileSystemRunStorage(RunStorage):
     def __init__(self, base_dir=None):
         self._base_dir = check.opt_str_param(base_dir, 'base_dir', base_run_directory())
         mkdir_p(base_run_directory())
         self._meta_file = meta_file(self._base_dir)
+        self._compacted_pipeline_names = set()
 
     def write_dagster_run_meta(self, dagster_run_meta):
         check.inst_param(dagster_run_meta, 'dagster_run_meta', DagsterRunMeta)
@@ -77,6 +181,77 @@ class FileSystemRunStorage(RunStorage):
         with open(self._meta_file, 'a+') as ff:
             ff.write(seven.json.dumps(dagster_run_meta._asdict()) + '\n')
 
+    def write_step_duration_record(self, step_duration_record):
+        check.inst_param(step_duration_record, 'step_duration_record', StepDurationRecord)
+
+        durations_file = step_durations_file(self._base_dir, step_duration_record.pipeline_name)
+        mkdir_p(os.path.dirname(durations_file))
+
+        # Records are appended to the file, which is compacted the first time this storage writes
+        # to it, i.e. once per run. It therefore holds the most recent records of each step, and
+        # those of the run, rather than growing with every run of the pipeline.
+        if step_duration_record.pipeline_name not in self._compacted_pipeline_names:
+            self._compacted_pipeline_names.add(step_duration_record.pipeline_name)
+            self._compact_step_duration_records(step_duration_record.pipeline_name)
+
+        with open(durations_file, 'a+') as ff:
+            ff.write(seven.json.dumps(step_duration_record._asdict()) + '\n')
+
+    def _compact_step_duration_records(self, pipeline_name):
+        records = self.get_step_duration_records(pipeline_name)
+        most_recent = _most_recent_step_duration_records(records)
+        if len(most_recent) == len(records):
+            return
+
+        # Replaced rather than rewritten in place, so that runs reading the file never see it
+        # partially written. Records appended by another run while the file is compacted are lost,
+        # which only makes the estimates of their steps less precise.
+        durations_file = step_durations_file(self._base_dir, pipeline_name)
+        temp_file = '{path}.{pid}.tmp'.format(path=durations_file, pid=os.getpid())
+        with open(temp_file, 'w') as ff:
+            for record in most_recent:
+                ff.write(seven.json.dumps(record._asdict()) + '\n')
+        _replace_file(temp_file, durations_file)
+
+    def get_step_duration_records(self, pipeline_name):
+        check.str_param(pipeline_name, 'pipeline_name')
+
+        durations_file = step_durations_file(self._base_dir, pipeline_name)
+        if not os.path.exists(durations_file):
+            return []
+
+        records = []
+        with open(durations_file, 'r') as ff:
+            for line in ff:
+                if line.strip():
+                    records.append(StepDurationRecord(**json.loads(line)))
+
+        return records
+
+    def write_step_event_record(self, step_event_record):
+        check.inst_param(step_event_record, 'step_event_record', StepEventRecord)
+
+        events_file = step_events_file(self._base_dir, step_event_record.run_id)
+        mkdir_p(os.path.dirname(events_file))
+
+        with open(events_file, 'a+') as ff:
+            ff.write(seven.json.dumps(step_event_record._asdict()) + '\n')
+
+    def get_step_event_records(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        events_file = step_events_file(self._base_dir, run_id)
+        if not os.path.exists(events_file):
+            return []
+
+        records = []
+        with open(events_file, 'r') as ff:
+            for line in ff:
+                if line.strip():
+                    records.append(StepEventRecord(**json.loads(line)))
+
+        return records
+
     def get_run_ids(self):
         return list_pull(self.get_run_metas(), 'run_id')
 
@@ -119,11 +294,33 @@ class FileSystemRunStorage(RunStorage):
 class InMemoryRunStorage(RunStorage):
     def __init__(self):
         self._run_metas = OrderedDict()
+        self._step_duration_records = []
+        self._step_event_records = []
 
     def write_dagster_run_meta(self, dagster_run_meta):
         check.inst_param(dagster_run_meta, 'dagster_run_meta', DagsterRunMeta)
         self._run_metas[dagster_run_meta.run_id] = dagster_run_meta
 
+    def write_step_duration_record(self, step_duration_record):
+        check.inst_param(step_duration_record, 'step_duration_record', StepDurationRecord)
+        self._step_duration_records.append(step_duration_record)
+
+    def get_step_duration_records(self, pipeline_name):
+        check.str_param(pipeline_name, 'pipeline_name')
+        return [
+            record
+            for record in self._step_duration_records
+            if record.pipeline_name == pipeline_name
+        ]
+
+    def write_step_event_record(self, step_event_record):
+        check.inst_param(step_event_record, 'step_event_record', StepEventRecord)
+        self._step_event_records.append(step_event_record)
+
+    def get_step_event_records(self, run_id):
+        check.str_param(run_id, 'run_id')
+        return [record for record in self._step_event_records if record.run_id == run_id]
+
     def get_run_ids(self):
         return list_pull(self.get_run_metas(), 'run_id')
 
@@ -136,6 +333,8 @@ class InMemoryRunStorage(RunStorage):
 
     def nuke(self):
         self._run_metas = OrderedDict()
+        self._step_duration_records = []
+        self._step_event_records = []
 
     @property
     def is_persistent(self):
@@ -146,6 +345,7 @@ class RunStorageMode(Enum):
     IN_MEMORY = 'IN_MEMORY'
     FILESYSTEM = 'FILESYSTEM'
     S3 = 'S3'
+    SHARED_MEMORY = 'SHARED_MEMORY'
 
     @classmethod
     def from_environment_config(cls, mode):
@@ -157,6 +357,8 @@ class RunStorageMode(Enum):
             return RunStorageMode.IN_MEMORY
         elif mode == 's3':
             return RunStorageMode.S3
+        elif mode == 'shared_memory':
+            return RunStorageMode.SHARED_MEMORY
         elif mode is None:
             return RunStorageMode.IN_MEMORY
         else:
@@ -183,5 +385,7 @@ def construct_run_storage(run_storage_mode):
     elif run_storage_mode == RunStorageMode.S3:
         # TODO: Revisit whether we want to use S3 run storage
         return FileSystemRunStorage()
+    elif run_storage_mode == RunStorageMode.SHARED_MEMORY:
+        return FileSystemRunStorage()
     else:
         check.failed('Unexpected enum {}'.format(run_storage_mode))
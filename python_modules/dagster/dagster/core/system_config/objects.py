@@ -5,6 +5,7 @@ from dagster import check
 from dagster.core.definitions.dependency import SolidHandle
 from dagster.core.storage.runs import InMemoryRunStorage, FileSystemRunStorage
 from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.types.runtime import TypeCheckPolicy
 from dagster.utils import single_item
 
 
@@ -102,9 +103,18 @@ class ExpectationsConfig(namedtuple('_ExpecationsConfig', 'evaluate')):
         )
 
 
-class ExecutionConfig(namedtuple('_ExecutionConfig', '')):
-    def __new__(cls):
-        return super(ExecutionConfig, cls).__new__(cls)
+class ExecutionConfig(
+    namedtuple('_ExecutionConfig', 'gc_intermediates memoize_outputs type_check_policy')
+):
+    def __new__(cls, gc_intermediates=False, memoize_outputs=True, type_check_policy=None):
+        return super(ExecutionConfig, cls).__new__(
+            cls,
+            gc_intermediates=check.bool_param(gc_intermediates, 'gc_intermediates'),
+            memoize_outputs=check.bool_param(memoize_outputs, 'memoize_outputs'),
+            type_check_policy=check.opt_inst_param(
+                type_check_policy, 'type_check_policy', TypeCheckPolicy
+            ),
+        )
 
 
 class StorageConfig(namedtuple('_FilesConfig', 'storage_mode storage_config')):
@@ -123,6 +133,8 @@ class StorageConfig(namedtuple('_FilesConfig', 'storage_mode storage_config')):
         elif self.storage_mode == 's3':
             # TODO: Revisit whether we want to use S3 run storage
             return FileSystemRunStorage()
+        elif self.storage_mode == 'shared_memory':
+            return FileSystemRunStorage()
         elif self.storage_mode is None:
             return InMemoryRunStorage()
         else:
@@ -0,0 +1,261 @@
+'''Serialization strategies compressing the output of other strategies as it is written.
+
+Values are compressed while they are serialized, and decompressed while they are deserialized,
+so that neither their serialized nor their compressed form needs to fit in memory. The zlib and
+lzma codecs are part of the standard library, and the lz4 and zstd codecs are available when the
+lz4 and zstandard packages are installed.
+'''
+
+from collections import namedtuple
+from contextlib import contextmanager
+import gzip
+import io
+import threading
+import zlib
+
+from dagster import check, seven
+
+from .marshal import SerializationStrategy, StreamSerializationStrategy
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+COMPRESSION_CODECS = ['zlib', 'lzma', 'lz4', 'zstd']
+
+
+class _LZ4Compressor(object):
+    def __init__(self, level):
+        self._compressor = lz4.frame.LZ4FrameCompressor(
+            compression_level=0 if level is None else level
+        )
+        self._started = False
+
+    def compress(self, data):
+        header = b''
+        if not self._started:
+            header = self._compressor.begin()
+            self._started = True
+        return header + self._compressor.compress(data)
+
+    def flush(self):
+        header = b'' if self._started else self._compressor.begin()
+        return header + self._compressor.flush()
+
+
+class CompressionCodec(namedtuple('_CompressionCodec', 'name compressor_fn reader_fn')):
+    '''A codec, with compressor_fn creating an incremental compressor, with compress and flush
+    methods, from a compression level or None for the default level, and reader_fn wrapping a file
+    object holding compressed data in a file object reading it decompressed.'''
+
+    def __new__(cls, name, compressor_fn, reader_fn):
+        return super(CompressionCodec, cls).__new__(
+            cls,
+            name=check.str_param(name, 'name'),
+            compressor_fn=check.callable_param(compressor_fn, 'compressor_fn'),
+            reader_fn=check.callable_param(reader_fn, 'reader_fn'),
+        )
+
+
+def _define_codecs():
+    # The zlib codec writes the gzip format, which gzip.GzipFile reads incrementally
+    codecs = [
+        CompressionCodec(
+            'zlib',
+            lambda level: zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION if level is None else level,
+                zlib.DEFLATED,
+                16 + zlib.MAX_WBITS,
+            ),
+            lambda read_file_obj: gzip.GzipFile(fileobj=read_file_obj, mode='rb'),
+        )
+    ]
+    if lzma:
+        codecs.append(
+            CompressionCodec('lzma', lambda level: lzma.LZMACompressor(preset=level), lzma.LZMAFile)
+        )
+    if lz4:
+        codecs.append(
+            CompressionCodec(
+                'lz4',
+                _LZ4Compressor,
+                lambda read_file_obj: lz4.frame.LZ4FrameFile(read_file_obj, mode='rb'),
+            )
+        )
+    if zstandard:
+        codecs.append(
+            CompressionCodec(
+                'zstd',
+                lambda level: zstandard.ZstdCompressor(
+                    level=3 if level is None else level
+                ).compressobj(),
+                lambda read_file_obj: io.BufferedReader(
+                    zstandard.ZstdDecompressor().stream_reader(read_file_obj)
+                ),
+            )
+        )
+    return {codec.name: codec for codec in codecs}
+
+
+_CODECS = _define_codecs()
+
+
+def available_compression_codecs():
+    '''The names of the codecs of COMPRESSION_CODECS that are installed.'''
+    return [name for name in COMPRESSION_CODECS if name in _CODECS]
+
+
+def get_compression_codec(name):
+    check.str_param(name, 'name')
+    check.param_invariant(
+        name in COMPRESSION_CODECS,
+        'name',
+        'Unknown compression codec {name}, expected one of {codecs}'.format(
+            name=name, codecs=COMPRESSION_CODECS
+        ),
+    )
+    check.invariant(
+        name in _CODECS,
+        'Compression codec {name} requires the {package} package, which is not installed'.format(
+            name=name, package={'lz4': 'lz4', 'zstd': 'zstandard'}.get(name, name)
+        ),
+    )
+    return _CODECS[name]
+
+
+class CompressionStats(
+    namedtuple('_CompressionStats', 'codec uncompressed_size compressed_size codec_ms')
+):
+    '''How a value was compressed: the number of bytes its serialization wrote before and after
+    compression, and the time spent in the codec, excluding serialization and writing.'''
+
+    def __new__(cls, codec, uncompressed_size, compressed_size, codec_ms):
+        return super(CompressionStats, cls).__new__(
+            cls,
+            codec=check.str_param(codec, 'codec'),
+            uncompressed_size=check.int_param(uncompressed_size, 'uncompressed_size'),
+            compressed_size=check.int_param(compressed_size, 'compressed_size'),
+            codec_ms=check.float_param(codec_ms, 'codec_ms'),
+        )
+
+    @property
+    def ratio(self):
+        if not self.compressed_size:
+            return None
+        return float(self.uncompressed_size) / self.compressed_size
+
+
+_recorders = threading.local()
+
+
+@contextmanager
+def record_compression_stats():
+    '''Collect the CompressionStats of the values this thread compresses within the block into
+    the list yielded.
+
+    Usage:
+
+    with record_compression_stats() as compression_stats:
+        intermediate_store.set_object(obj, context, runtime_type, paths)
+    '''
+    compression_stats = []
+    if not hasattr(_recorders, 'active'):
+        _recorders.active = []
+    _recorders.active.append(compression_stats)
+    try:
+        yield compression_stats
+    finally:
+        _recorders.active.remove(compression_stats)
+
+
+def _record(stats):
+    for compression_stats in getattr(_recorders, 'active', []):
+        compression_stats.append(stats)
+
+
+class _CompressingWriter(object):
+    def __init__(self, compressor, write_file_obj):
+        self._compressor = compressor
+        self._write_file_obj = write_file_obj
+        self.uncompressed_size = 0
+        self.compressed_size = 0
+        self.codec_seconds = 0.0
+
+    def _write_compressed(self, compressed):
+        if compressed:
+            self._write_file_obj.write(compressed)
+            self.compressed_size += len(compressed)
+
+    def write(self, data):
+        # Pickle protocol 5 writes the buffers of values as memoryviews of any format
+        size = memoryview(data).nbytes
+        start_time = seven.time_fn()
+        compressed = self._compressor.compress(data)
+        self.codec_seconds += seven.time_fn() - start_time
+
+        self._write_compressed(compressed)
+        self.uncompressed_size += size
+        return size
+
+    def close(self):
+        start_time = seven.time_fn()
+        compressed = self._compressor.flush()
+        self.codec_seconds += seven.time_fn() - start_time
+
+        self._write_compressed(compressed)
+
+
+class CompressedSerializationStrategy(SerializationStrategy):
+    '''Compresses the output of another serialization strategy with a codec as it is written, and
+    decompresses it as it is read.
+
+    Every value this strategy serializes records its CompressionStats, which the engine attaches
+    to the output events of steps.
+
+    Args:
+        serialization_strategy (SerializationStrategy): The strategy serializing values.
+        codec (Optional[str]): One of COMPRESSION_CODECS, by default zlib.
+        level (Optional[int]): The compression level of the codec, by default its own default.
+    '''
+
+    def __init__(self, serialization_strategy, codec='zlib', level=None):
+        self.serialization_strategy = check.inst_param(
+            serialization_strategy, 'serialization_strategy', SerializationStrategy
+        )
+        # Streams are read lazily, after the file they are read from would be closed
+        check.param_invariant(
+            not isinstance(serialization_strategy, StreamSerializationStrategy),
+            'serialization_strategy',
+            'Streams can not be compressed',
+        )
+        self.codec = get_compression_codec(codec)
+        self.level = check.opt_int_param(level, 'level')
+
+    def serialize(self, value, write_file_obj):
+        writer = _CompressingWriter(self.codec.compressor_fn(self.level), write_file_obj)
+        self.serialization_strategy.serialize(value, writer)
+        writer.close()
+
+        stats = CompressionStats(
+            codec=self.codec.name,
+            uncompressed_size=writer.uncompressed_size,
+            compressed_size=writer.compressed_size,
+            codec_ms=writer.codec_seconds * 1000,
+        )
+        _record(stats)
+        return stats
+
+    def deserialize(self, read_file_obj):
+        return self.serialization_strategy.deserialize(self.codec.reader_fn(read_file_obj))
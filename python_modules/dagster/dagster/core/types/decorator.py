@@ -21,6 +21,7 @@ def _decorate_as_dagster_type(
     output_schema=None,
     serialization_strategy=None,
     storage_plugins=None,
+    value_summarizer=None,
 ):
     _ObjectType = _create_object_type_class(
         key=key,
@@ -31,6 +32,7 @@ def _decorate_as_dagster_type(
         output_schema=output_schema,
         serialization_strategy=serialization_strategy,
         storage_plugins=storage_plugins,
+        value_summarizer=value_summarizer,
     )
 
     type_inst = _ObjectType.inst()
@@ -46,6 +48,7 @@ def dagster_type(
     output_schema=None,
     serialization_strategy=None,
     storage_plugins=None,
+    value_summarizer=None,
 ):
     '''
     Decorator version of as_dagster_type. See documentation for :py:func:`as_dagster_type` .
@@ -63,6 +66,7 @@ def dagster_type(
             output_schema=output_schema,
             serialization_strategy=serialization_strategy,
             storage_plugins=storage_plugins,
+            value_summarizer=value_summarizer,
         )
 
     # check for no args, no parens case
@@ -103,6 +107,7 @@ def as_dagster_type(
     output_schema=None,
     serialization_strategy=None,
     storage_plugins=None,
+    value_summarizer=None,
 ):
     '''
     Takes a python cls and creates a type for it in the Dagster domain.
@@ -128,6 +133,11 @@ def as_dagster_type(
             Storage type specific overrides for the serialization strategy.
             This allows for storage specific optimzations such as effecient
             distributed storage on S3.
+
+        value_summarizer (Optional[Callable[[Any], str]]):
+            Summarizes a value of this type for display in events and logs, in place of its repr.
+            This should be cheap even for large values, e.g. describing a table by its shape rather
+            than its contents. By default values are summarized by a size-bounded repr.
     '''
     check.type_param(existing_type, 'existing_type')
     check.opt_str_param(name, 'name')
@@ -141,6 +151,7 @@ def as_dagster_type(
         default=PickleSerializationStrategy(),
     )
     storage_plugins = check.opt_dict_param(storage_plugins, 'storage_plugins')
+    check.opt_callable_param(value_summarizer, 'value_summarizer')
 
     name = name or existing_type.__name__
 
@@ -153,4 +164,5 @@ def as_dagster_type(
         output_schema=output_schema,
         serialization_strategy=serialization_strategy,
         storage_plugins=storage_plugins,
+        value_summarizer=value_summarizer,
     )
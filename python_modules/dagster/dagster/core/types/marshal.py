@@ -1,11 +1,26 @@
 from abc import ABCMeta, abstractmethod
+import io
+import mmap
+import os
 import pickle
+import struct
 
 import six
 
 from dagster import check
 from dagster.utils import PICKLE_PROTOCOL
 
+# Pickle protocol 5 (Python 3.8+) lets buffer-backed values hand their buffers over out-of-band
+HAS_OUT_OF_BAND_PICKLE = pickle.HIGHEST_PROTOCOL >= 5
+
+# Out-of-band buffers are aligned within a segment so that, e.g., NumPy arrays mapped from it are
+# aligned for their dtype
+SEGMENT_BUFFER_ALIGNMENT = 64
+
+# length of the pickle stream, number of out-of-band buffers
+_SEGMENT_HEADER = struct.Struct('<QQ')
+_SEGMENT_BUFFER_LENGTH = struct.Struct('<Q')
+
 
 class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     '''This is the base class for serialization / deserialization of dagster objects. The primary
@@ -33,10 +48,191 @@ class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-
         with open(read_path, 'rb') as read_obj:
             return self.deserialize(read_obj)
 
+    @property
+    def supports_mmap(self):
+        '''Whether values can be deserialized from a memory mapping of a file, with
+        deserialize_from_mmap. Object stores reading files prefer this to deserialize_from_file.'''
+        return False
+
+    def deserialize_from_mmap(self, mapped):
+        '''Deserialize a value from mapped, a private, copy-on-write mmap of a file. Values may be
+        views of mapped rather than copies of it, e.g. NumPy arrays or Arrow buffers, so that
+        processes reading the same file share its pages in the page cache. By default the value
+        is deserialized from a copy of mapped.'''
+        return self.deserialize(io.BytesIO(mapped))
+
+
+class PickleSerializationStrategy(SerializationStrategy):
+    '''Serializes values with pickle.
+
+    Args:
+        protocol (Optional[int]): The pickle protocol to write, by default PICKLE_PROTOCOL, the
+            highest protocol this interpreter supports. Pin a lower protocol for values that
+            interpreters older than the writing one must read.
+    '''
+
+    def __init__(self, protocol=None):
+        self.protocol = _check_pickle_protocol(protocol)
 
-class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
     def serialize(self, value, write_file_obj):
-        pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+        pickle.dump(value, write_file_obj, self.protocol)
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+class OutOfBandPickleSerializationStrategy(SerializationStrategy):
+    '''Serializes values with pickle protocol 5, writing the buffers of buffer-backed values such
+    as NumPy arrays or Arrow buffers after the pickle stream rather than copying them into it.
+
+    Deserialized from a file, the file is mapped rather than read, and these values are
+    reconstructed directly on top of the mapping. The values are written in the segment format of
+    write_pickle_segment, which only this strategy reads.
+
+    Args:
+        protocol (Optional[int]): The pickle protocol to write on interpreters without protocol 5,
+            by default PICKLE_PROTOCOL.
+    '''
+
+    def __init__(self, protocol=None):
+        self.protocol = _check_pickle_protocol(protocol)
+
+    def serialize(self, value, write_file_obj):
+        write_pickle_segment(value, write_file_obj, self.protocol)
+
+    def deserialize(self, read_file_obj):
+        # The buffers of the values are views of this copy, writable like those of a mapping
+        return load_pickle_segment(bytearray(read_file_obj.read()))
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        # Segments are never empty, and so can always be mapped
+        return self.deserialize_from_mmap(map_file(read_path))
+
+    @property
+    def supports_mmap(self):
+        return True
+
+    def deserialize_from_mmap(self, mapped):
+        return load_pickle_segment(mapped)
+
+
+class StreamSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes a stream of chunks as a sequence of pickles, one per chunk.
+
+    Chunks are pulled from the stream and written one at a time, and deserializing returns an
+    iterator that reads them back one at a time, so a stream never needs to fit in memory.
+    '''
+
+    def serialize(self, value, write_file_obj):
+        for chunk in value:
+            pickle.dump(chunk, write_file_obj, PICKLE_PROTOCOL)
+
+    def deserialize(self, read_file_obj):
+        return _iterate_pickles(read_file_obj)
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        # The file is opened right away rather than once iteration starts, so the stream remains
+        # readable if the file is removed in the meantime
+        return _iterate_pickles(open(read_path, 'rb'), close=True)
+
+
+def _iterate_pickles(read_file_obj, close=False):
+    try:
+        while True:
+            try:
+                yield pickle.load(read_file_obj)
+            except EOFError:
+                return
+    finally:
+        if close:
+            read_file_obj.close()
+
+
+def _check_pickle_protocol(protocol):
+    protocol = PICKLE_PROTOCOL if protocol is None else check.int_param(protocol, 'protocol')
+    check.param_invariant(
+        0 <= protocol <= pickle.HIGHEST_PROTOCOL,
+        'protocol',
+        'Pickle protocol {protocol} is not supported by this interpreter'.format(protocol=protocol),
+    )
+    return protocol
+
+
+def _aligned(offset):
+    return -(-offset // SEGMENT_BUFFER_ALIGNMENT) * SEGMENT_BUFFER_ALIGNMENT
+
+
+def write_pickle_segment(obj, write_file_obj, protocol=None):
+    '''Pickle obj to write_file_obj, with the buffers of buffer-backed values written after the
+    pickle stream rather than copied into it.
+
+    The segment starts with a header holding the length of the pickle stream, the number of
+    out-of-band buffers and the length of each of them. The pickle stream follows, and then each
+    buffer starting at a multiple of SEGMENT_BUFFER_ALIGNMENT from the start of the segment.
+    Without protocol 5, obj is pickled with protocol, by default PICKLE_PROTOCOL, and has no
+    out-of-band buffers.
+    '''
+    protocol = PICKLE_PROTOCOL if protocol is None else check.int_param(protocol, 'protocol')
+
+    buffers = []
+    if HAS_OUT_OF_BAND_PICKLE:
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    else:
+        data = pickle.dumps(obj, protocol)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
+    write_file_obj.write(_SEGMENT_HEADER.pack(len(data), len(raw_buffers)))
+    for raw_buffer in raw_buffers:
+        write_file_obj.write(_SEGMENT_BUFFER_LENGTH.pack(raw_buffer.nbytes))
+    write_file_obj.write(data)
+
+    offset = _SEGMENT_HEADER.size + _SEGMENT_BUFFER_LENGTH.size * len(raw_buffers) + len(data)
+    for raw_buffer in raw_buffers:
+        write_file_obj.write(b'\0' * (_aligned(offset) - offset))
+        write_file_obj.write(raw_buffer)
+        offset = _aligned(offset) + raw_buffer.nbytes
+
+
+def load_pickle_segment(segment):
+    '''Unpickle the object written by write_pickle_segment to segment, any object supporting the
+    buffer protocol. Buffer-backed values are reconstructed on top of views of segment.'''
+    view = memoryview(segment)
+    data_length, num_buffers = _SEGMENT_HEADER.unpack_from(segment, 0)
+    offset = _SEGMENT_HEADER.size
+
+    buffer_lengths = []
+    for _ in range(num_buffers):
+        buffer_lengths.append(_SEGMENT_BUFFER_LENGTH.unpack_from(segment, offset)[0])
+        offset += _SEGMENT_BUFFER_LENGTH.size
+
+    data = view[offset : offset + data_length]
+    offset += data_length
+
+    if not num_buffers:
+        return pickle.loads(data.tobytes() if six.PY2 else data)
+
+    buffers = []
+    for buffer_length in buffer_lengths:
+        offset = _aligned(offset)
+        buffers.append(view[offset : offset + buffer_length])
+        offset += buffer_length
+    return pickle.loads(data, buffers=buffers)
+
+
+def map_file(path):
+    '''Map the file at path into memory, or return None if it is empty and so can not be mapped.
+
+    The mapping is private and copy-on-write, so modifying values backed by it does not modify the
+    file or any other process's view of it, while the pages no value modifies are shared with the
+    page cache.
+    '''
+    check.str_param(path, 'path')
+
+    with open(path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
@@ -1,3 +1,4 @@
+from enum import Enum
 from functools import partial
 from io import BytesIO
 import six
@@ -15,11 +16,37 @@ from .config import Nullable as ConfigNullable
 
 from .config_schema import InputSchema, OutputSchema
 
-from .marshal import SerializationStrategy, PickleSerializationStrategy
+from .marshal import (
+    SerializationStrategy,
+    PickleSerializationStrategy,
+    StreamSerializationStrategy,
+)
 from .dagster_type import check_dagster_type_param
+from .summary import join_summaries, summarize_value, truncate_summary
 from .wrapping import WrappingListType, WrappingNullableType
 
 
+class TypeCheckPolicy(Enum):
+    '''How thoroughly the values of collection types are type checked at runtime.
+
+    FULL checks every item of a list. SAMPLED checks up to MAX_SAMPLED_ITEMS items spread evenly
+    across it, and SHAPE_ONLY checks that the value is a list, and its first item. Since the
+    coercion of some types converts their values, e.g. bytes to BytesIO, every item is checked if
+    any checked item was converted.
+
+    Under FULL a list is coerced to a new list. Under SAMPLED and SHAPE_ONLY it is checked in place
+    and the list itself is returned unless an item was converted, so solids consuming it share it
+    with the solid producing it when intermediates are kept in memory.
+    '''
+
+    FULL = 'FULL'
+    SAMPLED = 'SAMPLED'
+    SHAPE_ONLY = 'SHAPE_ONLY'
+
+
+MAX_SAMPLED_ITEMS = 100
+
+
 def check_opt_config_cls_param(config_cls, param_name):
     if config_cls is None:
         return config_cls
@@ -43,6 +70,7 @@ class RuntimeType(object):
         output_schema=None,
         serialization_strategy=None,
         storage_plugins=None,
+        value_summarizer=None,
     ):
 
         type_obj = type(self)
@@ -66,6 +94,7 @@ class RuntimeType(object):
             PickleSerializationStrategy(),
         )
         self.storage_plugins = check.opt_dict_param(storage_plugins, 'storage_plugins')
+        self.value_summarizer = check.opt_callable_param(value_summarizer, 'value_summarizer')
 
         self.is_builtin = check.bool_param(is_builtin, 'is_builtin')
 
@@ -89,6 +118,27 @@ class RuntimeType(object):
     def coerce_runtime_value(self, value):
         return value
 
+    def coerce_runtime_value_with_policy(self, value, type_check_policy):
+        '''Coerce value as coerce_runtime_value does, checking collections only as thoroughly as
+        type_check_policy, a TypeCheckPolicy, requires.'''
+        check.inst_param(type_check_policy, 'type_check_policy', TypeCheckPolicy)
+        return self.coerce_runtime_value(value)
+
+    def summarize_value(self, value):
+        '''A bounded repr of a value of this type, displayed in events and logs in place of its
+        full repr. This uses the value_summarizer of the type if it has one.'''
+        if not self.value_summarizer:
+            return summarize_value(value)
+
+        summary = self.value_summarizer(value)
+        check.invariant(
+            isinstance(summary, six.string_types),
+            'The value_summarizer of type {name} returned {summary}, rather than a string'.format(
+                name=self.name, summary=type(summary)
+            ),
+        )
+        return truncate_summary(summary)
+
     def throw_if_false(self, fn, value):
         if not fn(value):
             raise DagsterRuntimeCoercionError(
@@ -126,6 +176,10 @@ class RuntimeType(object):
     def is_nothing(self):
         return False
 
+    @property
+    def is_stream(self):
+        return False
+
 
 class BuiltinScalarRuntimeType(RuntimeType):
     def __init__(self, *args, **kwargs):
@@ -212,6 +266,35 @@ class Bytes(RuntimeType, BytesIO):
             return BytesIO(value)
 
 
+class Stream(RuntimeType):
+    '''A stream of chunks, such as the lines of a large log file, that can be processed one chunk
+    at a time.
+
+    A solid outputs a stream as any iterable, typically a generator, and the solids consuming it
+    receive an iterable of its chunks. With persistent storage the chunks are written to the
+    intermediate store one at a time as they are produced, and read back one at a time as they are
+    consumed, so that the stream never needs to fit in memory. Chunks may be any picklable value.
+
+    A stream can only be iterated once by each solid consuming it.
+    '''
+
+    def __init__(self):
+        super(Stream, self).__init__(
+            'Stream', 'Stream', serialization_strategy=StreamSerializationStrategy()
+        )
+
+    def coerce_runtime_value(self, value):
+        # Checking the chunks themselves would consume the stream
+        return self.throw_if_false(
+            lambda v: hasattr(v, '__iter__') and not isinstance(v, (six.string_types, bytes, dict)),
+            value,
+        )
+
+    @property
+    def is_stream(self):
+        return True
+
+
 class Anyish(RuntimeType):
     def __init__(
         self, key, name, input_schema=None, output_schema=None, is_builtin=False, description=None
@@ -308,6 +391,14 @@ class NullableType(RuntimeType):
     def coerce_runtime_value(self, value):
         return None if value is None else self.inner_type.coerce_runtime_value(value)
 
+    def coerce_runtime_value_with_policy(self, value, type_check_policy):
+        if value is None:
+            return None
+        return self.inner_type.coerce_runtime_value_with_policy(value, type_check_policy)
+
+    def summarize_value(self, value):
+        return 'None' if value is None else self.inner_type.summarize_value(value)
+
     @property
     def is_nullable(self):
         return True
@@ -348,8 +439,51 @@ class ListType(RuntimeType):
         return '[' + self.inner_type.display_name + ']'
 
     def coerce_runtime_value(self, value):
+        return self.coerce_runtime_value_with_policy(value, TypeCheckPolicy.FULL)
+
+    def coerce_runtime_value_with_policy(self, value, type_check_policy):
+        check.inst_param(type_check_policy, 'type_check_policy', TypeCheckPolicy)
         value = self.throw_if_false(lambda v: isinstance(value, list), value)
-        return [self.inner_type.coerce_runtime_value(item) for item in value]
+
+        if type_check_policy == TypeCheckPolicy.FULL:
+            return [
+                self.inner_type.coerce_runtime_value_with_policy(item, type_check_policy)
+                for item in value
+            ]
+
+        if type_check_policy == TypeCheckPolicy.SAMPLED:
+            indices = _sample_indices(len(value))
+        else:
+            indices = range(min(len(value), 1))
+
+        coerced = self._coerce_items(value, indices, type_check_policy)
+        if coerced is value:
+            return value
+
+        # The items are converted by their coercion, and so all of them must be
+        return self._coerce_items(value, range(len(value)), type_check_policy)
+
+    def _coerce_items(self, value, indices, type_check_policy):
+        # The list is checked in place, and only copied if the coercion of an item converts it
+        coerced = value
+        for index in indices:
+            item = value[index]
+            coerced_item = self.inner_type.coerce_runtime_value_with_policy(item, type_check_policy)
+            if coerced_item is not item:
+                if coerced is value:
+                    coerced = list(value)
+                coerced[index] = coerced_item
+        return coerced
+
+    def summarize_value(self, value):
+        # The items are summarized as their type summarizes them
+        if not isinstance(value, list):
+            return super(ListType, self).summarize_value(value)
+        return truncate_summary(
+            '['
+            + join_summaries((self.inner_type.summarize_value(item) for item in value), len(value))
+            + ']'
+        )
 
     @property
     def is_list(self):
@@ -360,6 +494,15 @@ class ListType(RuntimeType):
         return [self.inner_type] + self.inner_type.inner_types
 
 
+def _sample_indices(length):
+    if length <= MAX_SAMPLED_ITEMS:
+        return range(length)
+    # Spread evenly from the first item to the last
+    return sorted(
+        set(index * (length - 1) // (MAX_SAMPLED_ITEMS - 1) for index in range(MAX_SAMPLED_ITEMS))
+    )
+
+
 def Nullable(inner_type):
     check.inst_param(inner_type, 'inner_type', RuntimeType)
 
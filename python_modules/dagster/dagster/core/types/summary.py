@@ -0,0 +1,122 @@
+'''Bounded summaries of values, displayed in place of their full repr in events and logs.
+
+The repr of a large value, e.g. a DataFrame with millions of rows or a long list, can take
+seconds to compute and hundreds of megabytes to hold. A summary is instead cut short once it has
+covered MAX_SUMMARY_ITEMS items of any container or reached MAX_SUMMARY_LENGTH characters, and
+values that look like DataFrames or arrays are summarized by their shape alone.
+'''
+
+import itertools
+
+import six
+
+MAX_SUMMARY_LENGTH = 1000
+
+MAX_SUMMARY_ITEMS = 50
+
+MAX_SUMMARY_DEPTH = 4
+
+TRUNCATION_MARKER = '...'
+
+
+def summarize_value(value):
+    '''A repr of value, bounded to MAX_SUMMARY_LENGTH characters.'''
+    return truncate_summary(_summarize(value, 0))
+
+
+def truncate_summary(summary):
+    if len(summary) <= MAX_SUMMARY_LENGTH:
+        return summary
+    return summary[: MAX_SUMMARY_LENGTH - len(TRUNCATION_MARKER)] + TRUNCATION_MARKER
+
+
+def _is_data_frame(value):
+    return hasattr(value, 'shape') and hasattr(value, 'columns') and hasattr(value, 'dtypes')
+
+
+def _is_array(value):
+    return hasattr(value, 'shape') and hasattr(value, 'dtype')
+
+
+def _summarize_data_frame(value):
+    columns = list(itertools.islice(value.columns, MAX_SUMMARY_ITEMS))
+    return '<{type_name} shape={shape} columns=[{columns}{more}]>'.format(
+        type_name=type(value).__name__,
+        shape=tuple(value.shape),
+        columns=', '.join(str(column) for column in columns),
+        more=', ' + TRUNCATION_MARKER if len(value.columns) > len(columns) else '',
+    )
+
+
+def _summarize_array(value):
+    return '<{type_name} shape={shape} dtype={dtype}>'.format(
+        type_name=type(value).__name__, shape=tuple(value.shape), dtype=value.dtype
+    )
+
+
+def join_summaries(summaries, length):
+    '''Join the summaries of the first MAX_SUMMARY_ITEMS of the length items of a container.'''
+    summaries = list(itertools.islice(summaries, MAX_SUMMARY_ITEMS))
+    if length > MAX_SUMMARY_ITEMS:
+        summaries.append(TRUNCATION_MARKER)
+    return ', '.join(summaries)
+
+
+def _summarize(value, depth):
+    if isinstance(value, (six.string_types, bytes)):
+        if len(value) > MAX_SUMMARY_LENGTH:
+            return repr(value[:MAX_SUMMARY_LENGTH]) + TRUNCATION_MARKER
+        return repr(value)
+
+    if _is_data_frame(value):
+        return _summarize_data_frame(value)
+
+    if _is_array(value):
+        return _summarize_array(value)
+
+    # Only the builtin containers are summarized item by item, since the repr of subclasses such
+    # as OrderedDict or namedtuples differs from theirs
+    container_type = type(value)
+    if container_type in (list, tuple, set, frozenset, dict):
+        if depth >= MAX_SUMMARY_DEPTH and value:
+            return TRUNCATION_MARKER
+
+        if container_type is dict:
+            return (
+                '{'
+                + join_summaries(
+                    (
+                        '{key}: {item}'.format(
+                            key=_summarize(key, depth + 1), item=_summarize(item, depth + 1)
+                        )
+                        for key, item in six.iteritems(value)
+                    ),
+                    len(value),
+                )
+                + '}'
+            )
+
+        items = join_summaries((_summarize(item, depth + 1) for item in value), len(value))
+        if container_type is list:
+            return '[' + items + ']'
+        if container_type is tuple:
+            return '(' + items + (',)' if len(value) == 1 else ')')
+        if not value:
+            return container_type.__name__ + '()'
+        if container_type is set:
+            return '{' + items + '}'
+        return 'frozenset({' + items + '})'
+
+    if hasattr(value, '__len__') and _safe_len(value) > MAX_SUMMARY_ITEMS:
+        return '<{type_name} of {length} items>'.format(
+            type_name=type(value).__name__, length=_safe_len(value)
+        )
+
+    return repr(value)
+
+
+def _safe_len(value):
+    try:
+        return len(value)
+    except Exception:  # pylint: disable=broad-except
+        return 0
@@ -3,6 +3,7 @@ import errno
 import inspect
 import multiprocessing
 import os
+import pickle
 import re
 import subprocess
 
@@ -14,7 +15,8 @@ from dagster.seven.abc import Mapping
 from .yaml_utils import load_yaml_from_glob_list, load_yaml_from_globs, load_yaml_from_path
 
 
-PICKLE_PROTOCOL = 2
+# The protocol pickles are written with unless pinned, e.g. by a PickleSerializationStrategy
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
 
 
 DEFAULT_REPOSITORY_YAML_FILENAME = 'repository.yaml'
@@ -184,17 +186,37 @@ def list_pull(alist, key):
     return list(map(lambda elem: get_prop_or_key(elem, key), alist))
 
 
-def get_multiprocessing_context():
-    # Set execution method to spawn, to avoid fork and to have same behavior between platforms.
-    # Older versions are stuck with whatever is the default on their platform (fork on
+DEFAULT_START_METHOD = 'spawn'
+
+# Always imported by the forkserver, ahead of any user modules, when it is used to start processes
+FORKSERVER_PRELOAD_MODULES = ['dagster']
+
+
+def get_multiprocessing_context(start_method=None, preload_modules=None):
+    # Default the execution method to spawn, to avoid fork and to have same behavior between
+    # platforms. Older versions are stuck with whatever is the default on their platform (fork on
     # Unix-like and spawn on windows)
     #
     # https://docs.python.org/3/library/multiprocessing.html#multiprocessing.get_context
-    if hasattr(multiprocessing, 'get_context'):
-        return multiprocessing.get_context('spawn')
-    else:
+    #
+    # With forkserver, dagster and preload_modules are imported once by the server process, which
+    # then forks every new process from that warm interpreter. The preloaded modules are fixed
+    # once the server has started, which it does the first time it is used by this process.
+    check.opt_str_param(start_method, 'start_method')
+    check.opt_list_param(preload_modules, 'preload_modules', of_type=str)
+
+    if not hasattr(multiprocessing, 'get_context'):
+        check.invariant(
+            start_method is None,
+            'Selecting a start method for processes requires Python 3.4 or later',
+        )
         return multiprocessing
 
+    context = multiprocessing.get_context(start_method or DEFAULT_START_METHOD)
+    if context.get_start_method() == 'forkserver':
+        context.set_forkserver_preload(FORKSERVER_PRELOAD_MODULES + (preload_modules or []))
+    return context
+
 
 def all_none(kwargs):
     for value in kwargs.values():
@@ -36,3 +36,51 @@ def time_execution_scope():
     timer_result = TimerResult()
     yield timer_result
     timer_result.end_time = seven.time_fn()
+
+
+class PhaseTimer(TimerResult):
+    '''Times an operation as a whole, like TimerResult, as well as the time spent in each of a set
+    of phases of it, each of which may be entered any number of times.
+
+    Usage:
+
+    phase_timer = PhaseTimer(['load', 'compute'])
+    with phase_timer.time_phase('load'):
+        load_some_data()
+
+    for item in phase_timer.time_iterator('compute', compute_some_items()):
+        # The time spent here, between items, is not counted
+        ...
+
+    phase_timer.end_time = seven.time_fn()
+    print(phase_timer.millis, phase_timer.millis_by_phase)
+    '''
+
+    def __init__(self, phases):
+        super(PhaseTimer, self).__init__()
+        check.list_param(phases, 'phases', of_type=str)
+        self._seconds_by_phase = {phase: 0.0 for phase in phases}
+
+    @contextmanager
+    def time_phase(self, phase):
+        check.invariant(phase in self._seconds_by_phase, 'Unknown phase {}'.format(phase))
+        start_time = seven.time_fn()
+        try:
+            yield
+        finally:
+            self._seconds_by_phase[phase] += seven.time_fn() - start_time
+
+    def time_iterator(self, phase, iterator):
+        '''Iterate over iterator, timing the production of each of its items as phase.'''
+        iterator = iter(iterator)
+        while True:
+            with self.time_phase(phase):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    @property
+    def millis_by_phase(self):
+        return {phase: seconds * 1000 for phase, seconds in self._seconds_by_phase.items()}
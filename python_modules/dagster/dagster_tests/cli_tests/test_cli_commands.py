@@ -6,7 +6,12 @@ import pytest
 
 from click.testing import CliRunner
 
-from dagster import lambda_solid, PipelineDefinition, RepositoryDefinition
+from dagster import (
+    DagsterInvariantViolationError,
+    lambda_solid,
+    PipelineDefinition,
+    RepositoryDefinition,
+)
 from dagster.core.storage.runs import base_run_directory
 from dagster.cli.load_handle import CliUsageError
 from dagster.cli.pipeline import (
@@ -390,3 +395,37 @@ def test_override_with_filesystem_storage():
     run_dir = os.path.join(base_run_directory(), result.run_id)
 
     assert os.path.exists(run_dir)
+
+
+def test_resume_run_option():
+    cli_args = {
+        'repository_yaml': script_relative_path('repository_file.yaml'),
+        'pipeline_name': ('foo',),
+        'python_file': None,
+        'module_name': None,
+        'fn_name': None,
+    }
+    env = [script_relative_path('filesystem_env.yaml')]
+    result = execute_execute_command(env=env, raise_on_error=True, cli_args=cli_args)
+    assert result.success
+
+    with pytest.raises(DagsterInvariantViolationError, match='nothing to resume'):
+        execute_execute_command(
+            env=env, raise_on_error=True, cli_args=cli_args, resume_run_id=result.run_id
+        )
+
+    runner = CliRunner()
+    cli_result = runner.invoke(
+        pipeline_execute_command,
+        [
+            '-y',
+            script_relative_path('repository_file.yaml'),
+            'foo',
+            '-p',
+            'some_preset',
+            '--resume-run',
+            result.run_id,
+        ],
+    )
+    assert cli_result.exit_code == 2
+    assert 'Can not use --preset with --resume-run' in cli_result.output
@@ -67,9 +67,18 @@ def test_basic_solids_config():
         'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
         'solids': {'required_field_solid': {'config': {'required_int': 0}}},
         'expectations': {'evaluate': True},
-        'execution': {},
+        'execution': {
+            'gc_intermediates': True,
+            'memoize_outputs': True,
+            'type_check_policy': 'FULL|SAMPLED|SHAPE_ONLY',
+        },
         'resources': {},
-        'storage': {'filesystem': {'base_dir': ''}, 'in_memory': {}, 's3': {'s3_bucket': ''}},
+        'storage': {
+            'filesystem': {'base_dir': '', 'compression': 'lz4|lzma|zlib|zstd'},
+            'in_memory': {},
+            's3': {'s3_bucket': '', 'compression': 'lz4|lzma|zlib|zstd'},
+            'shared_memory': {'base_dir': ''},
+        },
     }
 
 
@@ -101,8 +110,17 @@ def test_two_modes():
         'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
         'solids': {},
         'expectations': {'evaluate': True},
-        'storage': {'in_memory': {}, 'filesystem': {'base_dir': ''}, 's3': {'s3_bucket': ''}},
-        'execution': {},
+        'storage': {
+            'in_memory': {},
+            'filesystem': {'base_dir': '', 'compression': 'lz4|lzma|zlib|zstd'},
+            's3': {'s3_bucket': '', 'compression': 'lz4|lzma|zlib|zstd'},
+            'shared_memory': {'base_dir': ''},
+        },
+        'execution': {
+            'gc_intermediates': True,
+            'memoize_outputs': True,
+            'type_check_policy': 'FULL|SAMPLED|SHAPE_ONLY',
+        },
         'resources': {'value': {'config': {'mode_one_field': ''}}},
     }
 
@@ -113,8 +131,17 @@ def test_two_modes():
     assert scaffold_pipeline_config(pipeline_def, mode='mode_two', skip_optional=False) == {
         'solids': {},
         'expectations': {'evaluate': True},
-        'storage': {'in_memory': {}, 'filesystem': {'base_dir': ''}, 's3': {'s3_bucket': ''}},
-        'execution': {},
+        'storage': {
+            'in_memory': {},
+            'filesystem': {'base_dir': '', 'compression': 'lz4|lzma|zlib|zstd'},
+            's3': {'s3_bucket': '', 'compression': 'lz4|lzma|zlib|zstd'},
+            'shared_memory': {'base_dir': ''},
+        },
+        'execution': {
+            'gc_intermediates': True,
+            'memoize_outputs': True,
+            'type_check_policy': 'FULL|SAMPLED|SHAPE_ONLY',
+        },
         'resources': {'value': {'config': {'mode_two_field': 0}}},
         'loggers': {'console': {'config': {'log_level': '', 'name': ''}}},
     }
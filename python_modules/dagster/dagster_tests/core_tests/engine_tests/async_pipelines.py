@@ -0,0 +1,89 @@
+'''Pipelines with ``async def`` solids. Only importable on Python 3.6 or later.'''
+
+import asyncio
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    Materialization,
+    OutputDefinition,
+    PipelineDefinition,
+    Result,
+    SolidInstance,
+    lambda_solid,
+    solid,
+)
+
+
+def define_async_fan_out_pipeline(num_steps, sleep_seconds):
+    @solid(outputs=[OutputDefinition(Int)])
+    async def wait_on_api(context):
+        await asyncio.sleep(sleep_seconds)
+        return int(context.solid.name.split('_')[-1])
+
+    return PipelineDefinition(
+        name='async_fan_out_pipeline',
+        solids=[wait_on_api],
+        dependencies={
+            SolidInstance('wait_on_api', alias='wait_on_api_{i}'.format(i=i)): {}
+            for i in range(num_steps)
+        },
+    )
+
+
+def define_async_diamond_pipeline():
+    @lambda_solid
+    async def return_two():
+        await asyncio.sleep(0)
+        return 2
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    async def mult_three(num):
+        await asyncio.sleep(0)
+        return num * 3
+
+    @solid(
+        inputs=[InputDefinition('left'), InputDefinition('right')],
+        outputs=[OutputDefinition(name='total'), OutputDefinition(name='difference')],
+    )
+    async def adder(_context, left, right):
+        yield Materialization(path='/path/to/total', description='the total')
+        await asyncio.sleep(0)
+        yield Result(left + right, 'total')
+        await asyncio.sleep(0)
+        yield Result(right - left, 'difference')
+
+    return PipelineDefinition(
+        name='async_diamond_pipeline',
+        solids=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+    )
+
+
+def define_async_error_pipeline():
+    @lambda_solid
+    async def throw_error():
+        await asyncio.sleep(0)
+        raise Exception('bad programmer')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    async def downstream(num):
+        return num
+
+    return PipelineDefinition(
+        name='async_error_pipeline',
+        solids=[throw_error, downstream],
+        dependencies={'downstream': {'num': DependencyDefinition('throw_error')}},
+    )
@@ -0,0 +1,129 @@
+import sys
+import time
+
+import pytest
+
+from dagster import (
+    AsyncioExecutorConfig,
+    DagsterEventType,
+    DagsterExecutionStepExecutionError,
+    InProcessExecutorConfig,
+    RunConfig,
+    ThreadPoolExecutorConfig,
+    execute_pipeline,
+)
+
+from .test_multiprocessing import define_diamond_pipeline
+
+if sys.version_info >= (3, 6):
+    from .async_pipelines import (
+        define_async_diamond_pipeline,
+        define_async_error_pipeline,
+        define_async_fan_out_pipeline,
+    )
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 6), reason='async def solids require Python 3.6 or later'
+)
+
+
+def _assert_async_diamond_result(result):
+    assert result.success
+    assert result.result_for_solid('return_two').transformed_value() == 2
+    assert result.result_for_solid('mult_three').transformed_value() == 6
+    assert result.result_for_solid('adder').transformed_value('total') == 11
+    assert result.result_for_solid('adder').transformed_value('difference') == 1
+    assert [
+        event.event_specific_data.materialization.path
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_MATERIALIZATION
+    ] == ['/path/to/total']
+
+
+@pytest.mark.parametrize(
+    'executor_config',
+    [
+        InProcessExecutorConfig(),
+        ThreadPoolExecutorConfig(max_concurrent=2),
+        AsyncioExecutorConfig(),
+        AsyncioExecutorConfig(max_concurrent=1),
+    ],
+)
+def test_async_solids(executor_config):
+    _assert_async_diamond_result(
+        execute_pipeline(
+            define_async_diamond_pipeline(), run_config=RunConfig(executor_config=executor_config)
+        )
+    )
+
+
+def test_asyncio_engine_sync_solids():
+    result = execute_pipeline(
+        define_diamond_pipeline(), run_config=RunConfig(executor_config=AsyncioExecutorConfig())
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_asyncio_engine_interleaves_steps():
+    num_steps = 200
+    sleep_seconds = 0.5
+
+    start_time = time.time()
+    result = execute_pipeline(
+        define_async_fan_out_pipeline(num_steps, sleep_seconds),
+        run_config=RunConfig(executor_config=AsyncioExecutorConfig()),
+    )
+    elapsed = time.time() - start_time
+
+    assert result.success
+    assert result.result_for_solid('wait_on_api_42').transformed_value() == 42
+    # sequentially this would take num_steps * sleep_seconds = 100 seconds
+    assert elapsed < 20
+
+
+def test_asyncio_engine_events_ordered_per_step():
+    result = execute_pipeline(
+        define_async_fan_out_pipeline(10, 0.01),
+        run_config=RunConfig(executor_config=AsyncioExecutorConfig()),
+    )
+    assert result.success
+
+    event_types_by_step = {}
+    for event in result.step_event_list:
+        event_types_by_step.setdefault(event.step_key, []).append(event.event_type)
+
+    assert len(event_types_by_step) == 10
+    for event_types in event_types_by_step.values():
+        assert event_types == [
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_OUTPUT,
+            DagsterEventType.STEP_SUCCESS,
+        ]
+
+
+@pytest.mark.parametrize(
+    'executor_config',
+    [InProcessExecutorConfig(raise_on_error=False), AsyncioExecutorConfig(raise_on_error=False)],
+)
+def test_async_solid_failure_skips_downstream(executor_config):
+    result = execute_pipeline(
+        define_async_error_pipeline(), run_config=RunConfig(executor_config=executor_config)
+    )
+    assert not result.success
+
+    failure_event = result.result_for_solid('throw_error').failure_data
+    assert 'bad programmer' in failure_event.error.message
+    assert [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_SKIPPED
+    ] == ['downstream.compute']
+
+
+def test_asyncio_engine_raise_on_error():
+    with pytest.raises(DagsterExecutionStepExecutionError):
+        execute_pipeline(
+            define_async_error_pipeline(),
+            run_config=RunConfig(executor_config=AsyncioExecutorConfig()),
+        )
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import time
 import pytest
@@ -9,6 +10,9 @@ from dagster.core.engine.child_process_executor import (
     ChildProcessDoneEvent,
     ChildProcessException,
     ChildProcessCrashException,
+    reap_child_processes,
+    start_child_process_command,
+    wait_for_child_process_events,
 )
 
 
@@ -79,6 +83,70 @@ def test_child_process_crashy_process():
         list(execute_child_process_command(CrashyCommand()))
 
 
+class SleepThenEmitCommand(ChildProcessCommand):
+    def __init__(self, seconds, value):
+        self.seconds = seconds
+        self.value = value
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield self.value
+
+
+def test_multiplexed_wait_on_child_processes():
+    streams = [
+        start_child_process_command(SleepThenEmitCommand(0.5, 'slow')),
+        start_child_process_command(SleepThenEmitCommand(0.0, 'fast')),
+    ]
+
+    # iterating a stream never blocks, None means the child is still busy
+    assert next(streams[0]) is None
+
+    events = []
+    while streams:
+        wait_for_child_process_events(streams, timeout=10.0)
+        for stream in list(streams):
+            for event in stream:
+                if event is None:
+                    break
+                events.append(event)
+            else:
+                streams.remove(stream)
+
+    assert events == ['fast', 'slow']
+
+
+def test_wait_returns_on_child_process_exit():
+    stream = start_child_process_command(CrashyCommand())
+
+    start = time.time()
+    with pytest.raises(ChildProcessCrashException):
+        while next(stream) is None:
+            wait_for_child_process_events([stream], timeout=10.0)
+            assert time.time() - start < 10.0
+
+
+def test_completed_child_process_released():
+    stream = start_child_process_command(DoubleAStringChildProcessCommand('aa'))
+
+    events = []
+    for event in stream:
+        if event is None:
+            wait_for_child_process_events([stream], timeout=10.0)
+            continue
+        events.append(event)
+    assert events == ['aaaa']
+    assert stream.conn.closed
+
+    # The child may still be exiting once it has sent all of its events
+    start = time.time()
+    while stream.process in multiprocessing.process._children:  # pylint: disable=no-member
+        assert time.time() - start < 10.0
+        time.sleep(0.01)
+        reap_child_processes()
+    assert stream.process.exitcode == 0
+
+
 @pytest.mark.skip('too long')
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
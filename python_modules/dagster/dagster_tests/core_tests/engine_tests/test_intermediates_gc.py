@@ -0,0 +1,110 @@
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    MultiprocessExecutorConfig,
+    PipelineDefinition,
+    RunConfig,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.storage.intermediate_store import FileSystemIntermediateStore
+from dagster.core.storage.runs import RunStorageMode
+
+from dagster_tests.core_tests.engine_tests.test_multiprocessing import define_diamond_pipeline
+
+GC_ENVIRONMENT = {'execution': {'gc_intermediates': True}}
+
+
+def test_gc_in_memory_intermediates():
+    result = execute_pipeline(define_diamond_pipeline(), environment_dict=GC_ENVIRONMENT)
+    assert result.success
+
+    # terminal outputs are retained
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+    for solid_name in ['return_two', 'add_three', 'mult_three']:
+        with pytest.raises(DagsterInvariantViolationError, match='gc_intermediates'):
+            result.result_for_solid(solid_name).transformed_value()
+
+
+def test_no_gc_by_default():
+    result = execute_pipeline(define_diamond_pipeline())
+    assert result.success
+    assert result.result_for_solid('return_two').transformed_value() == 2
+    assert result.result_for_solid('add_three').transformed_value() == 5
+
+
+def define_failing_consumer_pipeline():
+    @lambda_solid
+    def produce():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def consume_ok(num):
+        return num
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def consume_error(num):
+        raise Exception('bad programmer {num}'.format(num=num))
+
+    return PipelineDefinition(
+        name='failing_consumer_pipeline',
+        solids=[produce, consume_ok, consume_error],
+        dependencies={
+            'consume_ok': {'num': DependencyDefinition('produce')},
+            'consume_error': {'num': DependencyDefinition('produce')},
+        },
+    )
+
+
+def test_gc_retains_inputs_of_failed_steps():
+    result = execute_pipeline(
+        define_failing_consumer_pipeline(),
+        environment_dict=GC_ENVIRONMENT,
+        run_config=RunConfig.nonthrowing_in_process(),
+    )
+    assert not result.success
+
+    # consume_error needs this to be reexecuted
+    assert result.result_for_solid('produce').transformed_value() == 1
+
+
+def test_gc_retains_materialized_outputs(tmpdir):
+    environment_dict = dict(
+        GC_ENVIRONMENT,
+        solids={
+            'return_two': {
+                'outputs': [{'result': {'json': {'path': str(tmpdir.join('return_two.json'))}}}]
+            }
+        },
+    )
+    result = execute_pipeline(define_diamond_pipeline(), environment_dict=environment_dict)
+    assert result.success
+
+    assert result.result_for_solid('return_two').transformed_value() == 2
+    with pytest.raises(DagsterInvariantViolationError):
+        result.result_for_solid('add_three').transformed_value()
+
+
+def test_gc_multiprocess_intermediates():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict=dict(GC_ENVIRONMENT, storage={'filesystem': {}}),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline)
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+
+    intermediate_store = FileSystemIntermediateStore(result.run_id)
+    assert intermediate_store.has_intermediate(None, 'adder.compute')
+    assert not intermediate_store.has_intermediate(None, 'return_two.compute')
+    assert not intermediate_store.has_intermediate(None, 'add_three.compute')
+    assert not intermediate_store.has_intermediate(None, 'mult_three.compute')
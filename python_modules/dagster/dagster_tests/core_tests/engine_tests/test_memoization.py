@@ -0,0 +1,280 @@
+import uuid
+
+from dagster import (
+    DagsterEventType,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    ExpectationDefinition,
+    ExpectationResult,
+    Field,
+    InputDefinition,
+    Int,
+    MultiprocessExecutorConfig,
+    OutputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    String,
+    ThreadPoolExecutorConfig,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.storage.runs import RunStorageMode, construct_run_storage
+
+
+def define_memoized_pipeline(executions, version):
+    @solid(config_field=Field(Int), outputs=[OutputDefinition()], metadata={'version': version})
+    def produce(context):
+        executions.append('produce')
+        return context.solid_config
+
+    @lambda_solid(inputs=[InputDefinition('num')], metadata={'version': '1'})
+    def add_one(num):
+        executions.append('add_one')
+        return num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def unversioned(num):
+        executions.append('unversioned')
+        return num * 2
+
+    @lambda_solid(inputs=[InputDefinition('num')], metadata={'version': '1'})
+    def downstream_of_unversioned(num):
+        executions.append('downstream_of_unversioned')
+        return num + 3
+
+    return PipelineDefinition(
+        name='memoized_pipeline',
+        solids=[produce, add_one, unversioned, downstream_of_unversioned],
+        dependencies={
+            'add_one': {'num': DependencyDefinition('produce')},
+            'unversioned': {'num': DependencyDefinition('add_one')},
+            'downstream_of_unversioned': {'num': DependencyDefinition('unversioned')},
+        },
+    )
+
+
+def _environment(value=1, memoize_outputs=True):
+    return {
+        'solids': {'produce': {'config': value}},
+        'storage': {'filesystem': {}},
+        'execution': {'memoize_outputs': memoize_outputs},
+    }
+
+
+def _unique_version():
+    # Outputs are memoized across every run using the same storage, so each test declares
+    # versions no other run has used
+    return str(uuid.uuid4())
+
+
+def _execute(pipeline, environment_dict, executor_config=None):
+    run_config = RunConfig(storage_mode=RunStorageMode.FILESYSTEM)
+    if executor_config is not None:
+        run_config = RunConfig(
+            storage_mode=RunStorageMode.FILESYSTEM, executor_config=executor_config
+        )
+    result = execute_pipeline(pipeline, environment_dict=environment_dict, run_config=run_config)
+    assert result.success
+    return result
+
+
+def _cache_hit_step_keys(result):
+    return [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_CACHE_HIT
+    ]
+
+
+def test_memoized_steps_are_not_executed_again():
+    version = _unique_version()
+    executions = []
+
+    first = _execute(define_memoized_pipeline(executions, version), _environment())
+    assert _cache_hit_step_keys(first) == []
+    assert executions == ['produce', 'add_one', 'unversioned', 'downstream_of_unversioned']
+
+    executions[:] = []
+    second = _execute(define_memoized_pipeline(executions, version), _environment())
+    assert set(_cache_hit_step_keys(second)) == {'produce.compute', 'add_one.compute'}
+    # Steps downstream of an unversioned solid are executed every time
+    assert executions == ['unversioned', 'downstream_of_unversioned']
+
+    assert second.result_for_solid('produce').success
+    assert second.result_for_solid('add_one').success
+    # Steps reusing memoized outputs succeed once those are copied into the run
+    assert [
+        event.event_type
+        for event in second.event_list
+        if event.step_key == 'add_one.compute' and event.is_step_event
+    ] == [
+        DagsterEventType.STEP_CACHE_HIT,
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.STEP_SUCCESS,
+    ]
+    # Their durations say nothing of how long they take to execute
+    assert 'add_one.compute' not in [
+        record.step_key
+        for record in construct_run_storage(RunStorageMode.FILESYSTEM).get_step_duration_records(
+            'memoized_pipeline'
+        )
+        if record.run_id == second.run_id
+    ]
+    assert second.result_for_solid('add_one').transformed_value() == 2
+    assert second.result_for_solid('downstream_of_unversioned').transformed_value() == 7
+
+
+def test_memoization_keyed_by_config_and_version():
+    version = _unique_version()
+    executions = []
+
+    _execute(define_memoized_pipeline(executions, version), _environment())
+
+    executions[:] = []
+    changed_config = _execute(define_memoized_pipeline(executions, version), _environment(2))
+    assert _cache_hit_step_keys(changed_config) == []
+    assert changed_config.result_for_solid('add_one').transformed_value() == 3
+    assert executions == ['produce', 'add_one', 'unversioned', 'downstream_of_unversioned']
+
+    executions[:] = []
+    changed_version = _execute(
+        define_memoized_pipeline(executions, _unique_version()), _environment()
+    )
+    assert _cache_hit_step_keys(changed_version) == []
+    assert executions == ['produce', 'add_one', 'unversioned', 'downstream_of_unversioned']
+
+
+def test_memoization_keyed_by_compression():
+    version = _unique_version()
+    executions = []
+
+    def _compressed_environment(compression):
+        environment_dict = _environment()
+        environment_dict['storage'] = {'filesystem': {'compression': compression}}
+        return environment_dict
+
+    _execute(define_memoized_pipeline(executions, version), _compressed_environment('zlib'))
+
+    # Outputs compressed by an earlier run are not read as if they were not
+    executions[:] = []
+    uncompressed = _execute(define_memoized_pipeline(executions, version), _environment())
+    assert _cache_hit_step_keys(uncompressed) == []
+    assert uncompressed.result_for_solid('add_one').transformed_value() == 2
+    assert executions == ['produce', 'add_one', 'unversioned', 'downstream_of_unversioned']
+
+    executions[:] = []
+    compressed = _execute(
+        define_memoized_pipeline(executions, version), _compressed_environment('zlib')
+    )
+    assert set(_cache_hit_step_keys(compressed)) == {'produce.compute', 'add_one.compute'}
+    assert compressed.result_for_solid('downstream_of_unversioned').transformed_value() == 7
+
+
+def test_memoize_outputs_disabled():
+    version = _unique_version()
+    executions = []
+
+    _execute(define_memoized_pipeline(executions, version), _environment(memoize_outputs=False))
+
+    executions[:] = []
+    result = _execute(define_memoized_pipeline(executions, version), _environment())
+    assert _cache_hit_step_keys(result) == []
+    assert executions == ['produce', 'add_one', 'unversioned', 'downstream_of_unversioned']
+
+    executions[:] = []
+    result = _execute(
+        define_memoized_pipeline(executions, version), _environment(memoize_outputs=False)
+    )
+    assert _cache_hit_step_keys(result) == []
+    assert len(executions) == 4
+
+
+def test_memoization_in_memory_storage():
+    version = _unique_version()
+    executions = []
+    environment_dict = {'solids': {'produce': {'config': 1}}}
+
+    execute_pipeline(
+        define_memoized_pipeline(executions, version), environment_dict=environment_dict
+    )
+    result = execute_pipeline(
+        define_memoized_pipeline(executions, version), environment_dict=environment_dict
+    )
+    assert result.success
+    assert _cache_hit_step_keys(result) == []
+    assert len(executions) == 8
+
+
+def test_memoization_threadpool():
+    version = _unique_version()
+    executions = []
+
+    _execute(
+        define_memoized_pipeline(executions, version),
+        _environment(),
+        ThreadPoolExecutorConfig(max_concurrent=2),
+    )
+
+    executions[:] = []
+    result = _execute(
+        define_memoized_pipeline(executions, version),
+        _environment(),
+        ThreadPoolExecutorConfig(max_concurrent=2),
+    )
+    assert set(_cache_hit_step_keys(result)) == {'produce.compute', 'add_one.compute'}
+    assert executions == ['unversioned', 'downstream_of_unversioned']
+
+
+def define_versioned_multiprocess_pipeline():
+    # The config of return_two is only there to key its output uniquely
+    @solid(config_field=Field(String), outputs=[OutputDefinition()], metadata={'version': '1'})
+    def return_two(_context):
+        return 2
+
+    # The output of the compute step of add_three is only consumed by its expectation, and so is
+    # handed over in memory within the group of fused steps of the solid
+    @lambda_solid(
+        inputs=[InputDefinition('num')],
+        output=OutputDefinition(
+            expectations=[
+                ExpectationDefinition(
+                    'positive', lambda _context, value: ExpectationResult(success=value > 0)
+                )
+            ]
+        ),
+        metadata={'version': '1'},
+    )
+    def add_three(num):
+        return num + 3
+
+    return PipelineDefinition(
+        name='versioned_multiprocess_pipeline',
+        solids=[return_two, add_three],
+        dependencies={'add_three': {'num': DependencyDefinition('return_two')}},
+    )
+
+
+def test_memoization_multiprocess():
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_versioned_multiprocess_pipeline)
+    environment_dict = {
+        'solids': {'return_two': {'config': _unique_version()}},
+        'storage': {'filesystem': {}},
+    }
+
+    results = [
+        _execute(
+            define_versioned_multiprocess_pipeline(),
+            environment_dict,
+            MultiprocessExecutorConfig(handle),
+        )
+        for _ in range(2)
+    ]
+    assert _cache_hit_step_keys(results[0]) == []
+    assert set(_cache_hit_step_keys(results[1])) == {
+        'return_two.compute',
+        'add_three.compute',
+        'add_three.output.result.expectation.positive',
+        'add_three.output.result.expectations.join',
+    }
+    assert results[1].result_for_solid('add_three').transformed_value() == 5
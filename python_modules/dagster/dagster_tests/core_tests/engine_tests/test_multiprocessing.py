@@ -1,16 +1,44 @@
+import multiprocessing
+import os
+import tempfile
+import time
+
+import pytest
+
 from dagster import (
+    DagsterEventType,
     DependencyDefinition,
     ExecutionTargetHandle,
+    Field,
     InProcessExecutorConfig,
     InputDefinition,
     MultiprocessExecutorConfig,
     PipelineDefinition,
     RunConfig,
+    SolidInstance,
+    String,
+    check,
     execute_pipeline,
     lambda_solid,
+    solid,
 )
 
-from dagster.core.storage.runs import RunStorageMode
+from dagster.core.engine.child_process_executor import (
+    ChildProcessCrashException,
+    ChildProcessException,
+    wait_for_child_process_events,
+)
+from dagster.core.engine.worker_pool import StepWorkerPool
+from dagster.core.execution.api import scoped_pipeline_context
+from dagster.core.storage.runs import (
+    STEP_DURATION_HISTORY,
+    FileSystemRunStorage,
+    RunStorageMode,
+    StepDurationRecord,
+)
+from dagster_tests.core_tests.execution_plan_tests.test_fusion import (
+    define_expectations_pipeline,
+)
 
 
 def test_diamond_simple_execution():
@@ -50,6 +78,28 @@ def test_diamond_multi_execution():
     assert len(set(pids_by_solid.values())) == len(pipeline.solids)
 
 
+def test_diamond_persistent_workers_execution():
+    pipeline = define_diamond_pipeline()
+    result = execute_pipeline(
+        pipeline,
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline),
+                max_concurrent=2,
+                persistent_workers=True,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+
+    pids = set(transform_event(result, solid.name).logging_tags['pid'] for solid in pipeline.solids)
+
+    # four solids shared the two long-lived workers, none of which is this process
+    assert 1 <= len(pids) <= 2
+    assert str(os.getpid()) not in pids
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -81,6 +131,83 @@ def define_diamond_pipeline():
     )
 
 
+def test_error_pipeline_persistent_workers():
+    pipeline = define_error_downstream_pipeline()
+    result = execute_pipeline(
+        pipeline,
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_error_downstream_pipeline),
+                persistent_workers=True,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert not result.success
+    assert result.result_for_solid('downstream').skipped
+
+
+def define_crashing_pipeline():
+    @lambda_solid
+    def crash():
+        os._exit(1)  # pylint: disable=protected-access
+
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='crashing_pipeline',
+        solids=[crash, return_one, add_one],
+        dependencies={'add_one': {'num': DependencyDefinition('return_one')}},
+    )
+
+
+def _drain(step_event_stream):
+    step_events = []
+    for step_event in step_event_stream:
+        if step_event is None:
+            wait_for_child_process_events([step_event_stream])
+            continue
+        step_events.append(step_event)
+    return step_events
+
+
+def test_worker_pool_keeps_workers_after_errors():
+    run_config = RunConfig(
+        executor_config=MultiprocessExecutorConfig(
+            ExecutionTargetHandle.for_pipeline_fn(define_crashing_pipeline),
+            persistent_workers=True,
+        ),
+        storage_mode=RunStorageMode.FILESYSTEM,
+    )
+    with scoped_pipeline_context(
+        define_crashing_pipeline(), {'storage': {'filesystem': {}}}, run_config
+    ) as pipeline_context:
+        worker_pool = StepWorkerPool(pipeline_context, 1)
+        try:
+            # Workers that die are replaced
+            for _ in range(2):
+                with pytest.raises(ChildProcessCrashException):
+                    _drain(worker_pool.execute_steps(['crash.compute']))
+
+            # Workers reporting system errors, here executing a step before its inputs exist,
+            # are returned to the pool
+            for _ in range(2):
+                with pytest.raises(ChildProcessException, match='missing'):
+                    _drain(worker_pool.execute_steps(['add_one.compute']))
+
+            for step_key in ['return_one.compute', 'add_one.compute']:
+                step_events = _drain(worker_pool.execute_steps([step_key]))
+                assert step_events[-1].event_type == DagsterEventType.STEP_SUCCESS
+        finally:
+            worker_pool.shutdown()
+
+
 def define_error_pipeline():
     @lambda_solid
     def throw_error():
@@ -110,3 +237,349 @@ def test_error_pipeline_multiprocess():
         ),
     )
     assert not result.success
+
+
+def define_skewed_pipeline():
+    @lambda_solid
+    def slow():
+        time.sleep(4)
+        return 1
+
+    @lambda_solid
+    def fast():
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def after_fast(num):
+        return num + 1
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def joined(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='skewed_execution',
+        solids=[slow, fast, after_fast, joined],
+        dependencies={
+            'after_fast': {'num': DependencyDefinition('fast')},
+            'joined': {
+                'left': DependencyDefinition('slow'),
+                'right': DependencyDefinition('after_fast'),
+            },
+        },
+    )
+
+
+def test_multiprocess_does_not_wait_on_unrelated_steps():
+    result = execute_pipeline(
+        define_skewed_pipeline(),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_skewed_pipeline), max_concurrent=4
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+
+    event_order = [
+        (event.step_key, event.event_type)
+        for event in result.event_list
+        if event.event_type in (DagsterEventType.STEP_START, DagsterEventType.STEP_SUCCESS)
+    ]
+
+    # after_fast only depends on fast, so it starts while slow, a step from the previous
+    # topological level, is still running
+    assert event_order.index(('after_fast.compute', DagsterEventType.STEP_START)) < (
+        event_order.index(('slow.compute', DagsterEventType.STEP_SUCCESS))
+    )
+
+
+def test_multiprocess_failure_skips_downstream():
+    pipeline = define_error_downstream_pipeline()
+    result = execute_pipeline(
+        pipeline,
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_error_downstream_pipeline)
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert not result.success
+    assert [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_SKIPPED
+    ] == ['downstream.compute']
+
+
+def define_error_downstream_pipeline():
+    @lambda_solid
+    def throw_error():
+        raise Exception('bad programmer')
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream(num):
+        return num
+
+    return PipelineDefinition(
+        name='error_downstream_pipeline',
+        solids=[throw_error, downstream],
+        dependencies={'downstream': {'num': DependencyDefinition('throw_error')}},
+    )
+
+
+def test_multiprocess_fuse_steps():
+    pipeline = define_expectations_pipeline()
+    result = execute_pipeline(
+        pipeline,
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_expectations_pipeline),
+                fuse_steps=True,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+
+    pids_by_step = {
+        event.step_key: event.logging_tags['pid']
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_SUCCESS
+    }
+    assert len(pids_by_step) == 7
+
+    # every step still reports its own events, but those of a solid share a process
+    assert len(set(pids_by_step.values())) == 3
+    assert (
+        pids_by_step['return_two.compute']
+        == pids_by_step['return_two.output.result.expectations.join']
+    )
+
+    output_events = {
+        event.step_key: event.event_specific_data
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_OUTPUT
+    }
+    # handed to the expectation in memory
+    assert output_events['return_two.compute'].intermediate_materialization is None
+    # consumed by other solids, so persisted
+    assert output_events['return_two.output.result.expectations.join'].intermediate_materialization
+
+
+def test_multiprocess_fuse_steps_persistent_workers():
+    result = execute_pipeline(
+        define_expectations_pipeline(),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_expectations_pipeline),
+                max_concurrent=2,
+                persistent_workers=True,
+                fuse_steps=True,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('add_one').transformed_value() == 3
+
+
+def test_multiprocess_fuse_steps_failure_skips_downstream():
+    result = execute_pipeline(
+        define_error_downstream_pipeline(),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_error_downstream_pipeline),
+                fuse_steps=True,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert not result.success
+    assert [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_SKIPPED
+    ] == ['downstream.compute']
+
+
+@pytest.mark.skipif(not os.path.isdir('/dev/shm'), reason='requires a shared memory filesystem')
+def test_multiprocess_shared_memory_storage():
+    pipeline = define_diamond_pipeline()
+    run_config = RunConfig(
+        executor_config=MultiprocessExecutorConfig(
+            ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline)
+        ),
+        storage_mode=RunStorageMode.SHARED_MEMORY,
+    )
+    result = execute_pipeline(pipeline, run_config=run_config)
+    assert result.success
+
+    # the segments of the run are released once it completes
+    assert not os.path.exists(os.path.join('/dev/shm', 'dagster', 'runs', run_config.run_id))
+
+    # apart from the results of the run, which were mapped into this process
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def define_resource_pool_pipeline():
+    @lambda_solid(metadata={'resource_pools': 'warehouse'})
+    def query_warehouse():
+        start = time.time()
+        time.sleep(0.2)
+        return (start, time.time())
+
+    return PipelineDefinition(
+        name='resource_pool_pipeline',
+        solids=[query_warehouse],
+        dependencies={
+            SolidInstance('query_warehouse', alias='query_warehouse_{i}'.format(i=i)): {}
+            for i in range(2)
+        },
+    )
+
+
+def test_multiprocess_resource_pool_limits():
+    result = execute_pipeline(
+        define_resource_pool_pipeline(),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_resource_pool_pipeline),
+                max_concurrent=2,
+                resource_pool_limits={'warehouse': 1},
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+
+    intervals = sorted(
+        result.result_for_solid('query_warehouse_{i}'.format(i=i)).transformed_value()
+        for i in range(2)
+    )
+    # the second query only started once the first one had finished
+    assert intervals[0][1] <= intervals[1][0]
+
+
+def _start_method_available(start_method):
+    return hasattr(multiprocessing, 'get_all_start_methods') and (
+        start_method in multiprocessing.get_all_start_methods()
+    )
+
+
+@pytest.mark.skipif(
+    not _start_method_available('forkserver'), reason='requires the forkserver start method'
+)
+@pytest.mark.parametrize('persistent_workers', [False, True])
+def test_multiprocess_forkserver(persistent_workers):
+    pipeline = define_diamond_pipeline()
+    result = execute_pipeline(
+        pipeline,
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline),
+                persistent_workers=persistent_workers,
+                start_method='forkserver',
+                preload_modules=['dagster_tests.core_tests.engine_tests.test_multiprocessing'],
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_multiprocess_start_method_config():
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline)
+
+    with pytest.raises(check.ParameterCheckError):
+        MultiprocessExecutorConfig(handle, start_method='teleport')
+
+    with pytest.raises(check.ParameterCheckError):
+        MultiprocessExecutorConfig(handle, preload_modules=['pandas'])
+
+
+def define_straggler_pipeline():
+    @solid(config_field=Field(String), metadata={'idempotent': True})
+    def sometimes_stuck(context):
+        # The first process to execute this gets stuck, while any copy of it finishes quickly
+        marker_path = context.solid_config
+        if not os.path.exists(marker_path):
+            with open(marker_path, 'w') as marker:
+                marker.write(str(os.getpid()))
+            time.sleep(60)
+        return os.getpid()
+
+    @lambda_solid(inputs=[InputDefinition('pid')])
+    def downstream(pid):
+        return pid
+
+    return PipelineDefinition(
+        name='straggler_pipeline',
+        solids=[sometimes_stuck, downstream],
+        dependencies={'downstream': {'pid': DependencyDefinition('sometimes_stuck')}},
+    )
+
+
+def test_multiprocess_speculative_execution():
+    pipeline = define_straggler_pipeline()
+    for _ in range(STEP_DURATION_HISTORY):
+        FileSystemRunStorage().write_step_duration_record(
+            StepDurationRecord(
+                run_id='previous_run',
+                pipeline_name=pipeline.name,
+                step_key='sometimes_stuck.compute',
+                duration_ms=100.0,
+            )
+        )
+
+    marker_path = os.path.join(tempfile.mkdtemp(), 'marker')
+    started_at = time.time()
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={'solids': {'sometimes_stuck': {'config': marker_path}}},
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_straggler_pipeline),
+                max_concurrent=2,
+                speculation_threshold=2.0,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert time.time() - started_at < 30
+    assert result.success
+
+    with open(marker_path) as marker:
+        stuck_pid = int(marker.read())
+
+    # only the events of the copy that won are reported, and its output is used downstream
+    winning_pid = result.result_for_solid('downstream').transformed_value()
+    assert winning_pid != stuck_pid
+    assert [
+        event.logging_tags['pid']
+        for event in result.event_list
+        if event.step_key == 'sometimes_stuck.compute'
+        and event.event_type == DagsterEventType.STEP_SUCCESS
+    ] == [str(winning_pid)]
+
+    # the stuck process was terminated
+    with pytest.raises(OSError):
+        os.kill(stuck_pid, 0)
+
+
+def test_multiprocess_speculation_requires_idempotent_solids():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        run_config=RunConfig(
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline),
+                speculation_threshold=2.0,
+            ),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    DagsterExecutionStepExecutionError,
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    ThreadPoolExecutorConfig,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.storage.runs import RunStorageMode
+
+from .test_multiprocessing import define_diamond_pipeline, define_error_downstream_pipeline
+
+
+def test_diamond_threadpool_execution():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(max_concurrent=2)),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def test_diamond_threadpool_filesystem_execution():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={'storage': {'filesystem': {}}},
+        run_config=RunConfig(
+            executor_config=ThreadPoolExecutorConfig(max_concurrent=2),
+            storage_mode=RunStorageMode.FILESYSTEM,
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').transformed_value() == 11
+
+
+def define_rendezvous_pipeline(timeout, metadata=None):
+    left_arrived = threading.Event()
+    right_arrived = threading.Event()
+
+    @lambda_solid(metadata=metadata)
+    def left():
+        left_arrived.set()
+        return right_arrived.wait(timeout)
+
+    @lambda_solid(metadata=metadata)
+    def right():
+        right_arrived.set()
+        return left_arrived.wait(timeout)
+
+    @lambda_solid(inputs=[InputDefinition('left'), InputDefinition('right')])
+    def both(left, right):
+        return bool(left and right)
+
+    return PipelineDefinition(
+        name='rendezvous_pipeline',
+        solids=[left, right, both],
+        dependencies={
+            'both': {'left': DependencyDefinition('left'), 'right': DependencyDefinition('right')}
+        },
+    )
+
+
+def test_threadpool_executes_ready_steps_concurrently():
+    result = execute_pipeline(
+        define_rendezvous_pipeline(timeout=10),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(max_concurrent=2)),
+    )
+    assert result.success
+    # each of left and right only returns True if the other one was running at the same time
+    assert result.result_for_solid('both').transformed_value() is True
+
+
+def test_threadpool_max_concurrent():
+    result = execute_pipeline(
+        define_rendezvous_pipeline(timeout=0.1),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(max_concurrent=1)),
+    )
+    assert result.success
+    assert result.result_for_solid('both').transformed_value() is False
+
+
+def test_threadpool_resource_pool_limits():
+    result = execute_pipeline(
+        define_rendezvous_pipeline(timeout=0.1, metadata={'resource_pools': 'warehouse'}),
+        run_config=RunConfig(
+            executor_config=ThreadPoolExecutorConfig(
+                max_concurrent=2, resource_pool_limits={'warehouse': 1}
+            )
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('both').transformed_value() is False
+
+
+def test_threadpool_unlimited_resource_pool():
+    result = execute_pipeline(
+        define_rendezvous_pipeline(timeout=10, metadata={'resource_pools': ['warehouse']}),
+        run_config=RunConfig(
+            executor_config=ThreadPoolExecutorConfig(
+                max_concurrent=2, resource_pool_limits={'api': 1}
+            )
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('both').transformed_value() is True
+
+
+def test_threadpool_events_ordered_per_step():
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(max_concurrent=2)),
+    )
+    assert result.success
+
+    event_types_by_step = {}
+    for event in result.step_event_list:
+        event_types_by_step.setdefault(event.step_key, []).append(event.event_type)
+
+    for event_types in event_types_by_step.values():
+        assert event_types == [
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_OUTPUT,
+            DagsterEventType.STEP_SUCCESS,
+        ]
+
+
+def test_threadpool_failure_skips_downstream():
+    result = execute_pipeline(
+        define_error_downstream_pipeline(),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(raise_on_error=False)),
+    )
+    assert not result.success
+    assert [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_SKIPPED
+    ] == ['downstream.compute']
+
+
+def test_threadpool_raise_on_error():
+    with pytest.raises(DagsterExecutionStepExecutionError):
+        execute_pipeline(
+            define_error_downstream_pipeline(),
+            run_config=RunConfig(executor_config=ThreadPoolExecutorConfig()),
+        )
@@ -0,0 +1,143 @@
+import pytest
+
+from dagster import PipelineDefinition, SolidInstance, check, lambda_solid
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.active import ActiveExecution
+from ..engine_tests.test_multiprocessing import define_diamond_pipeline
+
+
+def _keys(steps):
+    return [step.key for step in steps]
+
+
+def test_active_execution_diamond():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+
+    assert _keys(active_execution.get_steps_to_execute()) == ['return_two.compute']
+    assert active_execution.get_steps_to_execute() == []
+    assert not active_execution.is_complete
+
+    active_execution.mark_success('return_two.compute')
+    assert _keys(active_execution.get_steps_to_execute()) == [
+        'add_three.compute',
+        'mult_three.compute',
+    ]
+
+    # adder only depends on its own inputs, not on the rest of a "level"
+    active_execution.mark_success('add_three.compute')
+    assert active_execution.get_steps_to_execute() == []
+    active_execution.mark_success('mult_three.compute')
+    assert _keys(active_execution.get_steps_to_execute()) == ['adder.compute']
+
+    active_execution.mark_success('adder.compute')
+    assert active_execution.is_complete
+
+
+def test_active_execution_limit():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+    active_execution.mark_success(active_execution.get_steps_to_execute()[0].key)
+
+    assert _keys(active_execution.get_steps_to_execute(limit=1)) == ['add_three.compute']
+    assert _keys(active_execution.get_steps_to_execute(limit=1)) == ['mult_three.compute']
+    assert active_execution.in_flight == {'add_three.compute', 'mult_three.compute'}
+
+
+def test_active_execution_failure_skips_downstream():
+    active_execution = ActiveExecution(create_execution_plan(define_diamond_pipeline()))
+    active_execution.mark_success(active_execution.get_steps_to_execute()[0].key)
+    active_execution.get_steps_to_execute()
+
+    active_execution.mark_failed('add_three.compute')
+    active_execution.mark_success('mult_three.compute')
+
+    assert active_execution.get_steps_to_execute() == []
+    assert _keys(active_execution.get_steps_to_skip()) == ['adder.compute']
+    assert active_execution.failed_or_skipped_upstream('adder.compute') == ['add_three.compute']
+
+    active_execution.mark_skipped('adder.compute')
+    assert active_execution.is_complete
+
+
+def test_active_execution_subset():
+    active_execution = ActiveExecution(
+        create_execution_plan(define_diamond_pipeline()),
+        step_keys_to_execute=['add_three.compute', 'adder.compute'],
+    )
+
+    assert _keys(active_execution.get_steps_to_execute()) == ['add_three.compute']
+    active_execution.mark_success('add_three.compute')
+    assert _keys(active_execution.get_steps_to_execute()) == ['adder.compute']
+    active_execution.mark_success('adder.compute')
+    assert active_execution.is_complete
+
+
+def test_active_execution_critical_path():
+    active_execution = ActiveExecution(
+        create_execution_plan(define_diamond_pipeline()),
+        step_durations={'add_three.compute': 10.0, 'mult_three.compute': 1000.0},
+    )
+    active_execution.mark_success(active_execution.get_steps_to_execute()[0].key)
+
+    # mult_three is on the longer path to adder, so it goes first despite the topological order
+    assert _keys(active_execution.get_steps_to_execute(limit=1)) == ['mult_three.compute']
+    assert _keys(active_execution.get_steps_to_execute(limit=1)) == ['add_three.compute']
+
+
+def define_resource_pool_pipeline():
+    @lambda_solid(metadata={'resource_pools': ['warehouse', 'api']})
+    def query_warehouse():
+        return 1
+
+    @lambda_solid(metadata={'resource_pools': 'api'})
+    def call_api():
+        return 2
+
+    @lambda_solid
+    def compute_locally():
+        return 3
+
+    return PipelineDefinition(
+        name='resource_pool_pipeline',
+        solids=[query_warehouse, call_api, compute_locally],
+        dependencies={
+            SolidInstance('query_warehouse', alias='query_warehouse_1'): {},
+            SolidInstance('query_warehouse', alias='query_warehouse_2'): {},
+            'call_api': {},
+            'compute_locally': {},
+        },
+    )
+
+
+def test_active_execution_resource_pool_limits():
+    active_execution = ActiveExecution(
+        create_execution_plan(define_resource_pool_pipeline()),
+        resource_pool_limits={'warehouse': 1, 'api': 2},
+    )
+
+    # the second query has to wait for the warehouse, steps outside of it do not
+    assert sorted(_keys(active_execution.get_steps_to_execute())) == [
+        'call_api.compute',
+        'compute_locally.compute',
+        'query_warehouse_1.compute',
+    ]
+
+    # the api has a free slot again, but the warehouse is still full
+    active_execution.mark_success('call_api.compute')
+    assert active_execution.get_steps_to_execute() == []
+
+    active_execution.mark_failed('query_warehouse_1.compute')
+    assert _keys(active_execution.get_steps_to_execute()) == ['query_warehouse_2.compute']
+
+
+def test_resource_pools_metadata():
+    @lambda_solid(metadata={'resource_pools': 'warehouse'})
+    def query_warehouse():
+        return 1
+
+    assert query_warehouse.resource_pools == ['warehouse']
+
+    with pytest.raises(check.CheckError):
+
+        @lambda_solid(metadata={'resource_pools': [1]})
+        def _bad_pools():
+            return 1
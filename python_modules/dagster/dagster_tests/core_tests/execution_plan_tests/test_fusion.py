@@ -0,0 +1,110 @@
+from dagster import (
+    DependencyDefinition,
+    ExpectationDefinition,
+    ExpectationResult,
+    InputDefinition,
+    Int,
+    OutputDefinition,
+    PipelineDefinition,
+    lambda_solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.active import ActiveExecution
+from dagster.core.execution.plan.fusion import fuse_steps
+from dagster.core.execution.plan.objects import StepOutputHandle
+
+
+def define_expectations_pipeline():
+    @lambda_solid(
+        output=OutputDefinition(
+            Int,
+            expectations=[
+                ExpectationDefinition(
+                    'positive', lambda _context, value: ExpectationResult(value > 0)
+                )
+            ],
+        )
+    )
+    def return_two():
+        return 2
+
+    @lambda_solid(
+        inputs=[
+            InputDefinition(
+                'num',
+                Int,
+                expectations=[
+                    ExpectationDefinition(
+                        'small', lambda _context, value: ExpectationResult(value < 10)
+                    )
+                ],
+            )
+        ],
+        output=OutputDefinition(Int),
+    )
+    def add_one(num):
+        return num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def mult_two(num):
+        return num * 2
+
+    return PipelineDefinition(
+        name='expectations_pipeline',
+        solids=[return_two, add_one, mult_two],
+        dependencies={
+            'add_one': {'num': DependencyDefinition('return_two')},
+            'mult_two': {'num': DependencyDefinition('return_two')},
+        },
+    )
+
+
+def test_fuse_steps():
+    groups = fuse_steps(create_execution_plan(define_expectations_pipeline()))
+
+    assert {head_key: group.step_keys for head_key, group in groups.items()} == {
+        'return_two.compute': [
+            'return_two.compute',
+            'return_two.output.result.expectation.positive',
+            'return_two.output.result.expectations.join',
+        ],
+        'add_one.output.num.expectation.small': [
+            'add_one.output.num.expectation.small',
+            'add_one.output.num.expectations.join',
+            'add_one.compute',
+        ],
+        'mult_two.compute': ['mult_two.compute'],
+    }
+
+    # the output of the join is consumed by other solids, so it is still persisted
+    assert groups['return_two.compute'].memory_only_handles == {
+        StepOutputHandle('return_two.compute', 'result'),
+        StepOutputHandle('return_two.output.result.expectation.positive', 'expectation_value'),
+    }
+    assert groups['mult_two.compute'].memory_only_handles == set()
+
+
+def test_fuse_steps_subset():
+    groups = fuse_steps(
+        create_execution_plan(define_expectations_pipeline()),
+        ['return_two.output.result.expectations.join', 'mult_two.compute'],
+    )
+
+    assert {head_key: group.step_keys for head_key, group in groups.items()} == {
+        'return_two.output.result.expectations.join': [
+            'return_two.output.result.expectations.join'
+        ],
+        'mult_two.compute': ['mult_two.compute'],
+    }
+
+
+def test_active_execution_claim_step():
+    active_execution = ActiveExecution(create_execution_plan(define_expectations_pipeline()))
+    active_execution.get_steps_to_execute()
+
+    active_execution.mark_failed('return_two.compute')
+    active_execution.claim_step('return_two.output.result.expectation.positive')
+
+    # claimed steps are neither executed nor skipped by the engine
+    assert active_execution.get_steps_to_skip() == []
+    assert active_execution.in_flight == {'return_two.output.result.expectation.positive'}
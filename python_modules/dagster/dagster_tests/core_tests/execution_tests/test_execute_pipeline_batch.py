@@ -0,0 +1,184 @@
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    Field,
+    InProcessExecutorConfig,
+    InputDefinition,
+    Int,
+    ModeDefinition,
+    PipelineDefinition,
+    PipelineConfigEvaluationError,
+    RunConfig,
+    String,
+    execute_pipeline_batch,
+    lambda_solid,
+    resource,
+    solid,
+)
+from dagster.core.execution.api import _build_batch_execution_plans
+from dagster.core.execution.context_creation_pipeline import create_environment_config
+
+
+def define_batch_pipeline(events):
+    @resource(config_field=Field(String), reusable=True)
+    def connection(init_context):
+        events.append(('init', 'connection', init_context.resource_config))
+        yield init_context.resource_config
+        events.append(('teardown', 'connection', init_context.resource_config))
+
+    @resource
+    def session(init_context):
+        events.append(('init', 'session', init_context.run_id))
+        yield init_context.run_id
+        events.append(('teardown', 'session', init_context.run_id))
+
+    @solid(config_field=Field(Int))
+    def customer(context):
+        return '{connection}:{customer}'.format(
+            connection=context.resources.connection, customer=context.solid_config
+        )
+
+    @lambda_solid(inputs=[InputDefinition('value')])
+    def report(value):
+        return value.upper()
+
+    return PipelineDefinition(
+        name='batch_pipeline',
+        solids=[customer, report],
+        dependencies={'report': {'value': DependencyDefinition('customer')}},
+        mode_definitions=[ModeDefinition(resources={'connection': connection, 'session': session})],
+    )
+
+
+def _environment_dict(customer, connection='db'):
+    return {
+        'solids': {'customer': {'config': customer}},
+        'resources': {'connection': {'config': connection}},
+    }
+
+
+def _init_events(events, resource_name):
+    return [event for event in events if event[0] == 'init' and event[1] == resource_name]
+
+
+def test_execute_pipeline_batch():
+    events = []
+    results = execute_pipeline_batch(
+        define_batch_pipeline(events), [_environment_dict(customer) for customer in range(3)]
+    )
+
+    assert [result.success for result in results] == [True, True, True]
+    assert len(set(result.run_id for result in results)) == 3
+
+    # The reusable resource is shared by the whole batch, while the other is created for each run
+    assert _init_events(events, 'connection') == [('init', 'connection', 'db')]
+    assert [event[2] for event in _init_events(events, 'session')] == [
+        result.run_id for result in results
+    ]
+    assert events[-1] == ('teardown', 'connection', 'db')
+
+    assert [result.result_for_solid('report').transformed_value() for result in results] == [
+        'DB:0',
+        'DB:1',
+        'DB:2',
+    ]
+
+
+def test_execute_pipeline_batch_resource_config():
+    events = []
+    results = execute_pipeline_batch(
+        define_batch_pipeline(events),
+        [
+            _environment_dict(0, connection='east'),
+            _environment_dict(1, connection='west'),
+            _environment_dict(2, connection='east'),
+        ],
+    )
+
+    # A reusable resource is shared by the runs that configure it in the same way
+    assert _init_events(events, 'connection') == [
+        ('init', 'connection', 'east'),
+        ('init', 'connection', 'west'),
+    ]
+    assert [result.result_for_solid('customer').transformed_value() for result in results] == [
+        'east:0',
+        'west:1',
+        'east:2',
+    ]
+
+
+def test_execute_pipeline_batch_concurrent():
+    events = []
+    results = execute_pipeline_batch(
+        define_batch_pipeline(events),
+        [_environment_dict(customer) for customer in range(6)],
+        max_concurrent=3,
+    )
+
+    assert _init_events(events, 'connection') == [('init', 'connection', 'db')]
+    assert len(_init_events(events, 'session')) == 6
+    assert [result.result_for_solid('report').transformed_value() for result in results] == [
+        'DB:{customer}'.format(customer=customer) for customer in range(6)
+    ]
+
+
+def test_execute_pipeline_batch_invalid_config():
+    events = []
+    # Every config is evaluated before any run executes
+    with pytest.raises(PipelineConfigEvaluationError):
+        execute_pipeline_batch(
+            define_batch_pipeline(events), [_environment_dict(0), _environment_dict('not an int')]
+        )
+    assert events == []
+
+    assert execute_pipeline_batch(define_batch_pipeline(events), []) == []
+
+
+def test_execute_pipeline_batch_resource_failure():
+    @resource(config_field=Field(Int), reusable=True)
+    def flaky(init_context):
+        if init_context.resource_config == 0:
+            raise Exception('could not connect')
+        return init_context.resource_config
+
+    @solid
+    def use_flaky(context):
+        return context.resources.flaky
+
+    pipeline = PipelineDefinition(
+        name='flaky_pipeline',
+        solids=[use_flaky],
+        mode_definitions=[ModeDefinition(resources={'flaky': flaky})],
+    )
+
+    results = execute_pipeline_batch(
+        pipeline,
+        [{'resources': {'flaky': {'config': config}}} for config in [1, 0, 1]],
+        run_config=RunConfig(executor_config=InProcessExecutorConfig(raise_on_error=False)),
+    )
+    assert [result.success for result in results] == [True, False, True]
+    assert results[2].result_for_solid('use_flaky').transformed_value() == 1
+
+
+def test_batch_execution_plans():
+    pipeline = define_batch_pipeline([])
+    environment_configs = [
+        create_environment_config(pipeline, environment_dict)
+        for environment_dict in [
+            _environment_dict(0),
+            _environment_dict(1, connection='other'),
+            {
+                'solids': {'customer': {'config': 2}},
+                'resources': {'connection': {'config': 'db'}},
+                'storage': {'filesystem': {}},
+            },
+        ]
+    ]
+
+    execution_plans = _build_batch_execution_plans(pipeline, environment_configs)
+    # The plan does not depend on the config of solids and resources, but does on storage
+    assert execution_plans[0] is execution_plans[1]
+    assert execution_plans[0] is not execution_plans[2]
+    assert not execution_plans[0].artifacts_persisted
+    assert execution_plans[2].artifacts_persisted
@@ -0,0 +1,301 @@
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    ExpectationDefinition,
+    ExpectationResult,
+    InProcessExecutorConfig,
+    InputDefinition,
+    MultiprocessExecutorConfig,
+    OutputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    execute_pipeline,
+    lambda_solid,
+    resume_run,
+)
+from dagster.core.errors import DagsterRunNotFoundError
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.execution.plan.resume import plan_resumption
+from dagster.core.storage.runs import RunStorageMode, StepEventRecord, construct_run_storage
+from dagster.core.execution.api import create_execution_plan
+
+
+def define_flaky_pipeline(executions, failing):
+    @lambda_solid
+    def produce():
+        executions.append('produce')
+        return 1
+
+    @lambda_solid
+    def independent():
+        executions.append('independent')
+        return 'independent'
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def flaky(num):
+        executions.append('flaky')
+        if failing:
+            raise Exception('flaky failed')
+        return num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def downstream(num):
+        executions.append('downstream')
+        return num * 2
+
+    return PipelineDefinition(
+        name='flaky_pipeline',
+        solids=[produce, independent, flaky, downstream],
+        dependencies={
+            'flaky': {'num': DependencyDefinition('produce')},
+            'downstream': {'num': DependencyDefinition('flaky')},
+        },
+    )
+
+
+FILESYSTEM_ENV = {'storage': {'filesystem': {}}}
+
+
+def _run_config():
+    return RunConfig(executor_config=InProcessExecutorConfig(raise_on_error=False))
+
+
+def _executed_step_keys(result):
+    return [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_START
+    ]
+
+
+def test_resume_run():
+    executions = []
+    failed_run = execute_pipeline(
+        define_flaky_pipeline(executions, failing=True), FILESYSTEM_ENV, _run_config()
+    )
+    assert not failed_run.success
+    assert sorted(executions) == ['flaky', 'independent', 'produce']
+
+    executions[:] = []
+    resumed_run = resume_run(
+        define_flaky_pipeline(executions, failing=False),
+        failed_run.run_id,
+        FILESYSTEM_ENV,
+        _run_config(),
+    )
+    assert resumed_run.success
+    assert resumed_run.run_id != failed_run.run_id
+    assert executions == ['flaky', 'downstream']
+    assert _executed_step_keys(resumed_run) == ['flaky.compute', 'downstream.compute']
+    assert resumed_run.result_for_solid('downstream').transformed_value() == 4
+
+
+def test_resume_resumed_run():
+    executions = []
+    failed_run = execute_pipeline(
+        define_flaky_pipeline(executions, failing=True), FILESYSTEM_ENV, _run_config()
+    )
+    still_failing_run = resume_run(
+        define_flaky_pipeline(executions, failing=True),
+        failed_run.run_id,
+        FILESYSTEM_ENV,
+        _run_config(),
+    )
+    assert not still_failing_run.success
+
+    executions[:] = []
+    resumed_run = resume_run(
+        define_flaky_pipeline(executions, failing=False),
+        still_failing_run.run_id,
+        FILESYSTEM_ENV,
+        _run_config(),
+    )
+    assert resumed_run.success
+    assert executions == ['flaky', 'downstream']
+    assert resumed_run.result_for_solid('downstream').transformed_value() == 4
+
+    with pytest.raises(DagsterInvariantViolationError, match='nothing to resume'):
+        resume_run(
+            define_flaky_pipeline(executions, failing=False),
+            resumed_run.run_id,
+            FILESYSTEM_ENV,
+            _run_config(),
+        )
+
+
+def define_chain_pipeline(executions, failing):
+    @lambda_solid
+    def first():
+        executions.append('first')
+        return 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def second(num):
+        executions.append('second')
+        return num + 1
+
+    @lambda_solid(inputs=[InputDefinition('num')])
+    def third(num):
+        executions.append('third')
+        if failing:
+            raise Exception('third failed')
+        return num * 2
+
+    return PipelineDefinition(
+        name='chain_pipeline',
+        solids=[first, second, third],
+        dependencies={
+            'second': {'num': DependencyDefinition('first')},
+            'third': {'num': DependencyDefinition('second')},
+        },
+    )
+
+
+def test_resume_run_after_gc():
+    environment_dict = {'storage': {'filesystem': {}}, 'execution': {'gc_intermediates': True}}
+    executions = []
+    failed_run = execute_pipeline(
+        define_chain_pipeline(executions, failing=True), environment_dict, _run_config()
+    )
+    assert not failed_run.success
+
+    # The output of first was released once second succeeded
+    records = construct_run_storage(RunStorageMode.FILESYSTEM).get_step_event_records(
+        failed_run.run_id
+    )
+    resumption_plan = plan_resumption(
+        create_execution_plan(define_chain_pipeline([], failing=False), environment_dict), records
+    )
+    assert resumption_plan.step_keys_to_execute == ['third.compute']
+    assert resumption_plan.step_output_handles == [StepOutputHandle('second.compute')]
+    assert resumption_plan.completed_step_keys == ['first.compute', 'second.compute']
+
+    still_failing_run = resume_run(
+        define_chain_pipeline(executions, failing=True),
+        failed_run.run_id,
+        environment_dict,
+        _run_config(),
+    )
+    assert not still_failing_run.success
+
+    executions[:] = []
+    resumed_run = resume_run(
+        define_chain_pipeline(executions, failing=False),
+        still_failing_run.run_id,
+        environment_dict,
+        _run_config(),
+    )
+    assert resumed_run.success
+    assert executions == ['third']
+    assert resumed_run.result_for_solid('third').transformed_value() == 4
+
+
+def test_resume_completed_run():
+    pipeline = define_flaky_pipeline([], failing=False)
+    result = execute_pipeline(pipeline, FILESYSTEM_ENV)
+    assert result.success
+
+    with pytest.raises(DagsterInvariantViolationError, match='nothing to resume'):
+        resume_run(pipeline, result.run_id, FILESYSTEM_ENV)
+
+
+def test_resume_run_errors():
+    pipeline = define_flaky_pipeline([], failing=True)
+    result = execute_pipeline(pipeline, run_config=_run_config())
+
+    with pytest.raises(DagsterInvariantViolationError, match='non persistent run storage'):
+        resume_run(pipeline, result.run_id)
+
+    with pytest.raises(DagsterRunNotFoundError):
+        resume_run(pipeline, 'not_a_run_id', FILESYSTEM_ENV)
+
+
+def define_expectation_pipeline():
+    @lambda_solid
+    def produce():
+        return 1
+
+    # The output of the compute step of checked is only consumed by its expectation, and so is
+    # handed over in memory within the group of fused steps of the solid
+    @lambda_solid(
+        inputs=[InputDefinition('num')],
+        output=OutputDefinition(
+            expectations=[
+                ExpectationDefinition(
+                    'positive', lambda _context, value: ExpectationResult(success=value > 0)
+                )
+            ]
+        ),
+    )
+    def checked(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='expectation_pipeline',
+        solids=[produce, checked],
+        dependencies={'checked': {'num': DependencyDefinition('produce')}},
+    )
+
+
+def test_plan_resumption_executes_producers_of_outputs_not_persisted():
+    execution_plan = create_execution_plan(define_expectation_pipeline())
+    run_id = 'some_run'
+    records = [
+        StepEventRecord(run_id, 'produce.compute', DagsterEventType.STEP_OUTPUT.value, 'result'),
+        StepEventRecord(run_id, 'produce.compute', DagsterEventType.STEP_SUCCESS.value),
+        StepEventRecord(run_id, 'checked.compute', DagsterEventType.STEP_SUCCESS.value),
+        StepEventRecord(
+            run_id,
+            'checked.output.result.expectation.positive',
+            DagsterEventType.STEP_FAILURE.value,
+        ),
+    ]
+
+    resumption_plan = plan_resumption(execution_plan, records)
+    assert resumption_plan.step_keys_to_execute == [
+        'checked.compute',
+        'checked.output.result.expectation.positive',
+        'checked.output.result.expectations.join',
+    ]
+    assert resumption_plan.step_output_handles == [StepOutputHandle('produce.compute')]
+
+
+def test_plan_resumption_of_run_that_never_started():
+    execution_plan = create_execution_plan(define_expectation_pipeline())
+
+    resumption_plan = plan_resumption(execution_plan, [])
+    assert resumption_plan.step_keys_to_execute == [
+        step.key for step in execution_plan.topological_steps()
+    ]
+    assert resumption_plan.step_output_handles == []
+
+
+def test_step_events_recorded_by_multiprocess_run():
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_expectation_pipeline)
+    run_config = RunConfig(
+        storage_mode=RunStorageMode.FILESYSTEM, executor_config=MultiprocessExecutorConfig(handle)
+    )
+    result = execute_pipeline(define_expectation_pipeline(), FILESYSTEM_ENV, run_config)
+    assert result.success
+
+    records = construct_run_storage(RunStorageMode.FILESYSTEM).get_step_event_records(result.run_id)
+    # Only the outputs the run persisted are recorded
+    assert set(
+        StepOutputHandle(record.step_key, record.output_name)
+        for record in records
+        if record.event_type_value == DagsterEventType.STEP_OUTPUT.value
+    ) == set(
+        event.step_output_data.step_output_handle
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_OUTPUT
+        and event.step_output_data.intermediate_materialization
+    )
+    assert set(
+        record.step_key
+        for record in records
+        if record.event_type_value == DagsterEventType.STEP_SUCCESS.value
+    ) == set(step.key for step in create_execution_plan(define_expectation_pipeline()).steps)
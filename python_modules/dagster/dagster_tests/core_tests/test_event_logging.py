@@ -1,19 +1,26 @@
 import logging
+import time
 
 from collections import defaultdict
 
 from dagster import (
+    as_dagster_type,
+    DependencyDefinition,
     execute_pipeline,
     InProcessExecutorConfig,
+    InputDefinition,
     lambda_solid,
     ModeDefinition,
+    OutputDefinition,
     PipelineDefinition,
     RunConfig,
 )
 
 from dagster.core.events.log import construct_event_logger, EventRecord
 from dagster.core.events import DagsterEventType
+from dagster.core.execution.plan.objects import StepPhase
 from dagster.core.loggers import colored_console_logger
+from dagster.core.types.marshal import PickleSerializationStrategy
 
 
 def mode_def(event_callback):
@@ -139,3 +146,61 @@ def test_single_solid_pipeline_failure():
     assert failure_event.dagster_event.solid_name == 'solid_one'
     assert failure_event.dagster_event.solid_definition_name == 'solid_one'
     assert failure_event.level == logging.ERROR
+
+
+class SlowValue(object):
+    pass
+
+
+class SlowSerializationStrategy(PickleSerializationStrategy):  # pylint: disable=no-init
+    def serialize(self, value, write_file_obj):
+        time.sleep(0.05)
+        return super(SlowSerializationStrategy, self).serialize(value, write_file_obj)
+
+    def deserialize(self, read_file_obj):
+        time.sleep(0.05)
+        return super(SlowSerializationStrategy, self).deserialize(read_file_obj)
+
+
+SlowType = as_dagster_type(SlowValue, serialization_strategy=SlowSerializationStrategy())
+
+
+def test_step_phase_durations():
+    @lambda_solid(output=OutputDefinition(SlowType))
+    def produce():
+        time.sleep(0.1)
+        return SlowValue()
+
+    @lambda_solid(inputs=[InputDefinition('value', SlowType)])
+    def consume(value):
+        return value
+
+    result = execute_pipeline(
+        PipelineDefinition(
+            name='phase_pipeline',
+            solids=[produce, consume],
+            dependencies={'consume': {'value': DependencyDefinition('produce')}},
+        ),
+        {'storage': {'filesystem': {}}},
+    )
+    assert result.success
+
+    success_data = {
+        event.step_key: event.step_success_data
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_SUCCESS
+    }
+    produce_data = success_data['produce.compute']
+    consume_data = success_data['consume.compute']
+    assert set(produce_data.phase_durations_ms.keys()) == {phase.value for phase in StepPhase}
+
+    # Storing and loading the value is timed apart from the compute function
+    assert produce_data.phase_durations_ms[StepPhase.COMPUTE.value] >= 100
+    assert produce_data.phase_durations_ms[StepPhase.OUTPUT_STORE.value] >= 50
+    assert produce_data.phase_durations_ms[StepPhase.INPUT_LOAD.value] < 50
+    assert produce_data.duration_ms >= 150
+    assert produce_data.duration_ms >= sum(produce_data.phase_durations_ms.values())
+
+    assert consume_data.phase_durations_ms[StepPhase.INPUT_LOAD.value] >= 50
+    assert consume_data.phase_durations_ms[StepPhase.COMPUTE.value] < 50
+    assert consume_data.duration_ms >= 50
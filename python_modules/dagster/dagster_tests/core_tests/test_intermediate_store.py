@@ -1,14 +1,24 @@
+import mmap
 import os
+import pickle
 import shutil
 import tempfile
 import uuid
 
 import pytest
 
-from dagster import check, String, Nullable, seven, List, Bool
-from dagster.core.storage.intermediate_store import FileSystemIntermediateStore
+from dagster import check, String, Nullable, seven, List, Bool, DagsterInvariantViolationError
+from dagster.core.storage.intermediate_store import (
+    FileSystemIntermediateStore,
+    SharedMemoryIntermediateStore,
+)
+from dagster.core.storage.object_store import FileSystemObjectStore
 from dagster.core.storage.type_storage import TypeStoragePlugin
-from dagster.core.types.marshal import SerializationStrategy
+from dagster.core.types.marshal import (
+    HAS_OUT_OF_BAND_PICKLE,
+    OutOfBandPickleSerializationStrategy,
+    SerializationStrategy,
+)
 from dagster.core.types.runtime import (
     Bool as RuntimeBool,
     resolve_to_runtime_type,
@@ -228,3 +238,214 @@ def test_file_system_intermediate_store_with_composite_type_storage_plugin():
             intermediate_store.set_value(
                 ['hello'], context, resolve_to_runtime_type(Nullable(List(String))), ['obj_name']
             )
+
+
+class OutOfBandBuffer(object):
+    '''Hands its buffer to pickle protocol 5 out-of-band, as NumPy arrays do.'''
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return OutOfBandBuffer, (pickle.PickleBuffer(self.buffer),)
+        return OutOfBandBuffer, (bytes(self.buffer),)
+
+
+def test_shared_memory_intermediate_store():
+    run_id = str(uuid.uuid4())
+    tempdir = tempfile.mkdtemp()
+
+    intermediate_store = SharedMemoryIntermediateStore(run_id=run_id, base_dir=tempdir)
+    assert intermediate_store.root == os.path.join(tempdir, 'dagster', 'runs', run_id, 'files')
+
+    with yield_empty_pipeline_context(run_id=run_id) as context:
+        try:
+            intermediate_store.set_object(True, context, RuntimeBool.inst(), ['true'])
+            assert intermediate_store.has_object(context, ['true'])
+            assert intermediate_store.get_object(context, RuntimeBool.inst(), ['true']) is True
+            intermediate_store.rm_object(context, ['true'])
+            assert not intermediate_store.has_object(context, ['true'])
+
+            intermediate_store.set_value('Foo', context, LowercaseString.inst(), ['foo'])
+            assert intermediate_store.get_value(context, LowercaseString.inst(), ['foo']) == 'foo'
+        finally:
+            shutil.rmtree(tempdir)
+
+
+def test_shared_memory_intermediate_store_release_run():
+    run_id = str(uuid.uuid4())
+    tempdir = tempfile.mkdtemp()
+
+    intermediate_store = SharedMemoryIntermediateStore(run_id=run_id, base_dir=tempdir)
+
+    with yield_empty_pipeline_context(run_id=run_id) as context:
+        try:
+            intermediate_store.set_object('kept', context, RuntimeString.inst(), ['kept'])
+            intermediate_store.set_object('released', context, RuntimeString.inst(), ['released'])
+
+            intermediate_store.release_run(context, [(['kept'], RuntimeString.inst())])
+
+            assert not os.path.exists(os.path.join(tempdir, 'dagster', 'runs', run_id))
+            assert not intermediate_store.has_object(context, ['released'])
+            assert intermediate_store.has_object(context, ['kept'])
+            assert intermediate_store.get_object(context, RuntimeString.inst(), ['kept']) == 'kept'
+        finally:
+            shutil.rmtree(tempdir)
+
+
+def test_file_system_intermediate_store_memoized_objects():
+    run_id = str(uuid.uuid4())
+    tempdir = tempfile.mkdtemp()
+
+    intermediate_store = FileSystemIntermediateStore(run_id=run_id, base_dir=tempdir)
+
+    with yield_empty_pipeline_context(run_id=run_id) as context:
+        try:
+            intermediate_store.set_object('one', context, RuntimeString.inst(), ['one'])
+            intermediate_store.set_object('two', context, RuntimeString.inst(), ['two'])
+            intermediate_store.memoize_object(context, 'one_key', ['one'])
+            intermediate_store.memoize_object(context, 'two_key', ['two'])
+            assert intermediate_store.has_memoized_object(context, 'one_key')
+
+            intermediate_store.copy_memoized_object(context, 'one_key', ['copied'])
+            assert intermediate_store.get_object(context, RuntimeString.inst(), ['copied']) == 'one'
+
+            intermediate_store.rm_memoized_object(context, 'one_key')
+            assert not intermediate_store.has_memoized_object(context, 'one_key')
+            assert intermediate_store.has_memoized_object(context, 'two_key')
+
+            intermediate_store.rm_memoized_objects(context)
+            assert not intermediate_store.has_memoized_object(context, 'two_key')
+            # Evicting memoized objects leaves those of the run alone
+            assert intermediate_store.get_object(context, RuntimeString.inst(), ['two']) == 'two'
+        finally:
+            shutil.rmtree(tempdir)
+
+
+def test_shared_memory_intermediate_store_does_not_memoize():
+    run_id = str(uuid.uuid4())
+    tempdir = tempfile.mkdtemp()
+
+    intermediate_store = SharedMemoryIntermediateStore(run_id=run_id, base_dir=tempdir)
+
+    with yield_empty_pipeline_context(run_id=run_id) as context:
+        try:
+            intermediate_store.set_object('one', context, RuntimeString.inst(), ['one'])
+            intermediate_store.memoize_object(context, 'one_key', ['one'])
+            assert not intermediate_store.has_memoized_object(context, 'one_key')
+
+            intermediate_store.release_run(context, [])
+            assert os.listdir(os.path.join(tempdir, 'dagster')) == ['runs']
+        finally:
+            shutil.rmtree(tempdir)
+
+
+@pytest.mark.skipif(not HAS_OUT_OF_BAND_PICKLE, reason='requires pickle protocol 5')
+def test_pickle_segment_maps_out_of_band_buffers():
+    tempdir = tempfile.mkdtemp()
+    path = os.path.join(tempdir, 'segment')
+    serialization_strategy = OutOfBandPickleSerializationStrategy()
+    try:
+        serialization_strategy.serialize_to_file(OutOfBandBuffer(bytearray(b'abc' * 1000)), path)
+
+        value = serialization_strategy.deserialize_from_file(path)
+        assert bytes(value.buffer) == b'abc' * 1000
+        # backed by the mapping of the segment rather than a copy of it
+        assert isinstance(value.buffer.obj, mmap.mmap)
+
+        # the mapping is copy-on-write
+        value.buffer[0:3] = b'xyz'
+        assert bytes(serialization_strategy.deserialize_from_file(path).buffer[0:3]) == b'abc'
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_file_system_object_store_replaces_atomically():
+    tempdir = tempfile.mkdtemp()
+    key = os.path.join(tempdir, 'key')
+    object_store = FileSystemObjectStore()
+    try:
+        object_store.set_object(key, b'first')
+        object_store.set_object(key, b'second')
+        assert object_store.get_object(key) == b'second'
+        # written through a temporary file, which is renamed over the key
+        assert os.listdir(tempdir) == ['key']
+
+        with pytest.raises(Exception, match='serialization failed'):
+            object_store.set_object(key, 'third', FailingSerializationStrategy())
+        assert object_store.get_object(key) == b'second'
+        assert os.listdir(tempdir) == ['key']
+    finally:
+        shutil.rmtree(tempdir)
+
+
+def test_file_system_intermediate_store_copy_missing_object_from_prev_run():
+    previous_run_id = str(uuid.uuid4())
+    run_id = str(uuid.uuid4())
+    tempdir = tempfile.mkdtemp()
+    try:
+        previous_intermediate_store = FileSystemIntermediateStore(
+            run_id=previous_run_id, base_dir=tempdir
+        )
+        intermediate_store = FileSystemIntermediateStore(run_id=run_id, base_dir=tempdir)
+        with yield_empty_pipeline_context(run_id=previous_run_id) as context:
+            previous_intermediate_store.set_object(True, context, RuntimeBool.inst(), ['true'])
+
+        with yield_empty_pipeline_context(run_id=run_id) as context:
+            intermediate_store.copy_object_from_prev_run(context, previous_run_id, ['true'])
+            assert intermediate_store.get_object(context, RuntimeBool.inst(), ['true']) is True
+
+            with pytest.raises(DagsterInvariantViolationError, match=previous_run_id):
+                intermediate_store.copy_object_from_prev_run(context, previous_run_id, ['false'])
+
+        with pytest.raises(DagsterInvariantViolationError, match='there is no object at'):
+            FileSystemObjectStore().link_object(
+                os.path.join(tempdir, 'missing'), os.path.join(tempdir, 'dst')
+            )
+    finally:
+        shutil.rmtree(tempdir)
+
+
+class FailingSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(b'partial')
+        raise Exception('serialization failed')
+
+    def deserialize(self, read_file_obj):
+        return read_file_obj.read()
+
+
+class MappedBytesSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Deserializes a view of the mapping of a file, as strategies for arrays would.'''
+
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(value)
+
+    def deserialize(self, read_file_obj):
+        return read_file_obj.read()
+
+    @property
+    def supports_mmap(self):
+        return True
+
+    def deserialize_from_mmap(self, mapped):
+        return memoryview(mapped)
+
+
+def test_file_system_object_store_maps_files():
+    tempdir = tempfile.mkdtemp()
+    key = os.path.join(tempdir, 'key')
+    object_store = FileSystemObjectStore()
+    serialization_strategy = MappedBytesSerializationStrategy()
+    try:
+        object_store.set_object(key, b'abc' * 1000, serialization_strategy)
+        value = object_store.get_object(key, serialization_strategy)
+        assert isinstance(value.obj, mmap.mmap)
+        assert value.tobytes() == b'abc' * 1000
+
+        # empty files can not be mapped, and are read instead
+        object_store.set_object(key, b'', serialization_strategy)
+        assert object_store.get_object(key, serialization_strategy) == b''
+    finally:
+        shutil.rmtree(tempdir)
@@ -0,0 +1,266 @@
+import pytest
+
+from dagster import (
+    AsyncioExecutorConfig,
+    DagsterEventType,
+    DagsterInvalidDefinitionError,
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    ExpectationDefinition,
+    ExpectationResult,
+    InProcessExecutorConfig,
+    InputDefinition,
+    Int,
+    List,
+    MappedDependencyDefinition,
+    MultiprocessExecutorConfig,
+    OutputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    ThreadPoolExecutorConfig,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.errors import DagsterTypeError
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.objects import StepKind, StepOutputHandle
+from dagster.core.storage.runs import RunStorageMode
+
+
+def define_mapped_pipeline(numbers=None, fail_on=None):
+    @lambda_solid(output=OutputDefinition(List(Int)))
+    def produce_numbers():
+        return [1, 2, 3, 4] if numbers is None else numbers
+
+    @lambda_solid(inputs=[InputDefinition('num', Int)], output=OutputDefinition(Int))
+    def double(num):
+        if num == fail_on:
+            raise Exception('failed on {num}'.format(num=num))
+        return num * 2
+
+    @lambda_solid(inputs=[InputDefinition('nums', List(Int))], output=OutputDefinition(Int))
+    def total(nums):
+        return sum(nums)
+
+    return PipelineDefinition(
+        name='mapped_pipeline',
+        solids=[produce_numbers, double, total],
+        dependencies={
+            'double': {'num': MappedDependencyDefinition('produce_numbers')},
+            'total': {'nums': DependencyDefinition('double')},
+        },
+    )
+
+
+def _step_keys(result, event_type):
+    return [event.step_key for event in result.event_list if event.event_type == event_type]
+
+
+def _check_mapped_result(result):
+    assert result.success
+    assert result.result_for_solid('double').transformed_value() == [2, 4, 6, 8]
+    assert result.result_for_solid('total').transformed_value() == 20
+
+    item_keys = ['double.compute[{index}]'.format(index=index) for index in range(4)]
+    assert set(_step_keys(result, DagsterEventType.STEP_SUCCESS)) == set(
+        ['produce_numbers.compute', 'double.compute', 'total.compute'] + item_keys
+    )
+    # Every item has events of its own, while the mapped step succeeds once all of them have
+    item_output_keys = [
+        event.step_key
+        for event in result.result_for_solid('double').mapped_transforms
+        if event.event_type == DagsterEventType.STEP_OUTPUT
+    ]
+    assert sorted(item_output_keys) == item_keys
+    success_keys = _step_keys(result, DagsterEventType.STEP_SUCCESS)
+    assert all(
+        success_keys.index(item_key) < success_keys.index('double.compute')
+        for item_key in item_keys
+    )
+
+
+def test_mapped_plan():
+    execution_plan = create_execution_plan(define_mapped_pipeline())
+    step = execution_plan.get_step_by_key('double.compute')
+    assert step.is_mapped
+    assert step.step_input_named('num').runtime_type.is_list
+    assert step.step_output_named('result').runtime_type.is_list
+
+    # The steps executing the items are created at runtime, and not part of the plan
+    assert [step.key for step in execution_plan.topological_steps()] == [
+        'produce_numbers.compute',
+        'double.compute',
+        'total.compute',
+    ]
+    item_step = execution_plan.get_step_by_key('double.compute[2]')
+    assert item_step.kind == StepKind.MAPPED_COMPUTE
+    assert not item_step.is_mapped
+    assert item_step.step_input_named('num').prev_output_handle == StepOutputHandle(
+        'double.compute', 'num[2]'
+    )
+    assert item_step.step_output_named('result').runtime_type.name == 'Int'
+    assert execution_plan.has_step('double.compute[2]')
+    assert not execution_plan.has_step('total.compute[2]')
+
+
+def test_mapped_in_process():
+    _check_mapped_result(execute_pipeline(define_mapped_pipeline()))
+
+
+def test_mapped_filesystem_intermediates():
+    result = execute_pipeline(define_mapped_pipeline(), {'storage': {'filesystem': {}}})
+    _check_mapped_result(result)
+
+    # The items of the mapped input and the outputs of each of them are kept
+    outputs = {
+        event.step_key: event.step_output_data
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_OUTPUT
+    }
+    assert outputs['double.compute[3]'].intermediate_materialization
+    assert outputs['double.compute[3]'].value_repr == '8'
+    assert outputs['double.compute'].value_repr == '[2, 4, 6, 8]'
+
+
+@pytest.mark.parametrize(
+    'executor_config',
+    [ThreadPoolExecutorConfig(max_concurrent=2), AsyncioExecutorConfig(max_concurrent=2)],
+)
+def test_mapped_concurrent_engines(executor_config):
+    _check_mapped_result(
+        execute_pipeline(
+            define_mapped_pipeline(), run_config=RunConfig(executor_config=executor_config)
+        )
+    )
+
+
+def test_mapped_multiprocess():
+    handle = ExecutionTargetHandle.for_pipeline_fn(define_mapped_pipeline)
+    result = execute_pipeline(
+        define_mapped_pipeline(),
+        {'storage': {'filesystem': {}}},
+        RunConfig(
+            storage_mode=RunStorageMode.FILESYSTEM,
+            executor_config=MultiprocessExecutorConfig(handle, max_concurrent=2),
+        ),
+    )
+    _check_mapped_result(result)
+
+
+def test_mapped_empty_collection():
+    result = execute_pipeline(define_mapped_pipeline(numbers=[]))
+    assert result.success
+    assert result.result_for_solid('double').transformed_value() == []
+    assert result.result_for_solid('total').transformed_value() == 0
+
+    result = execute_pipeline(
+        define_mapped_pipeline(numbers=[]),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(max_concurrent=2)),
+    )
+    assert result.success
+    assert result.result_for_solid('total').transformed_value() == 0
+
+
+@pytest.mark.parametrize(
+    'executor_config',
+    [
+        InProcessExecutorConfig(raise_on_error=False),
+        ThreadPoolExecutorConfig(max_concurrent=2, raise_on_error=False),
+    ],
+)
+def test_mapped_item_failure(executor_config):
+    result = execute_pipeline(
+        define_mapped_pipeline(fail_on=3), run_config=RunConfig(executor_config=executor_config)
+    )
+    assert not result.success
+    assert set(_step_keys(result, DagsterEventType.STEP_FAILURE)) == {
+        'double.compute[2]',
+        'double.compute',
+    }
+    # The other items are executed regardless
+    assert set(_step_keys(result, DagsterEventType.STEP_SUCCESS)) == {
+        'produce_numbers.compute',
+        'double.compute[0]',
+        'double.compute[1]',
+        'double.compute[3]',
+    }
+    assert _step_keys(result, DagsterEventType.STEP_SKIPPED) == ['total.compute']
+    assert not result.result_for_solid('double').success
+
+
+def define_untyped_mapped_pipeline():
+    @lambda_solid
+    def produce_numbers():
+        return [1, 'two']
+
+    @lambda_solid(inputs=[InputDefinition('num', Int)])
+    def double(num):
+        return num * 2
+
+    @lambda_solid(inputs=[InputDefinition('nums')])
+    def total(nums):
+        return sum(nums)
+
+    return PipelineDefinition(
+        name='untyped_mapped_pipeline',
+        solids=[produce_numbers, double, total],
+        dependencies={
+            'double': {'num': MappedDependencyDefinition('produce_numbers')},
+            'total': {'nums': DependencyDefinition('double')},
+        },
+    )
+
+
+def test_mapped_over_invalid_collection():
+    # The items are type checked against the mapped input as the mapped step starts
+    with pytest.raises(DagsterTypeError):
+        execute_pipeline(define_untyped_mapped_pipeline())
+
+    result = execute_pipeline(
+        define_untyped_mapped_pipeline(),
+        run_config=RunConfig(executor_config=ThreadPoolExecutorConfig(raise_on_error=False)),
+    )
+    assert not result.success
+    assert _step_keys(result, DagsterEventType.STEP_FAILURE) == ['double.compute']
+    assert _step_keys(result, DagsterEventType.STEP_SKIPPED) == ['total.compute']
+
+
+def test_mapped_dependency_errors():
+    @lambda_solid(output=OutputDefinition(List(Int)))
+    def produce_numbers():
+        return [1]
+
+    @lambda_solid(inputs=[InputDefinition('left', Int), InputDefinition('right', Int)])
+    def add(left, right):
+        return left + right
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='only be mapped over a single input'):
+        PipelineDefinition(
+            solids=[produce_numbers, add],
+            dependencies={
+                'add': {
+                    'left': MappedDependencyDefinition('produce_numbers'),
+                    'right': MappedDependencyDefinition('produce_numbers'),
+                }
+            },
+        )
+
+    @lambda_solid(
+        inputs=[InputDefinition('num', Int)],
+        output=OutputDefinition(
+            Int,
+            expectations=[
+                ExpectationDefinition(
+                    'positive', lambda _context, value: ExpectationResult(success=value > 0)
+                )
+            ],
+        ),
+    )
+    def checked(num):
+        return num
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='can not declare expectations'):
+        PipelineDefinition(
+            solids=[produce_numbers, checked],
+            dependencies={'checked': {'num': MappedDependencyDefinition('produce_numbers')}},
+        )
@@ -10,7 +10,11 @@ from dagster.core.storage.runs import (
     DagsterRunMeta,
     FileSystemRunStorage,
     InMemoryRunStorage,
+    RunStorage,
     RunStorageMode,
+    STEP_DURATION_HISTORY,
+    StepDurationRecord,
+    StepEventRecord,
     base_run_directory,
 )
 
@@ -101,3 +105,163 @@ def do_test_single_write_read(run_storage):
     run_storage.nuke()
 
     assert run_storage.get_run_metas() == []
+
+
+def test_filesystem_step_durations():
+    with temp_run_storage() as run_storage:
+        do_test_step_durations(run_storage)
+
+
+def test_in_memory_step_durations():
+    do_test_step_durations(InMemoryRunStorage())
+
+
+def do_test_step_durations(run_storage):
+    assert run_storage.get_step_duration_estimates('some_pipeline') == {}
+
+    for i in range(STEP_DURATION_HISTORY + 5):
+        run_storage.write_step_duration_record(
+            StepDurationRecord(
+                run_id='run_{i}'.format(i=i),
+                pipeline_name='some_pipeline',
+                step_key='some_step.compute',
+                # only the most recent durations, all of which are 100.0, count
+                duration_ms=1000.0 if i < 5 else 100.0,
+            )
+        )
+    run_storage.write_step_duration_record(
+        StepDurationRecord(
+            run_id='run_0',
+            pipeline_name='other_pipeline',
+            step_key='some_step.compute',
+            duration_ms=5.0,
+        )
+    )
+
+    assert len(run_storage.get_step_duration_records('some_pipeline')) == STEP_DURATION_HISTORY + 5
+    assert run_storage.get_step_duration_estimates('some_pipeline') == {'some_step.compute': 100.0}
+    assert run_storage.get_step_duration_estimates('other_pipeline') == {'some_step.compute': 5.0}
+
+
+def test_filesystem_step_durations_compacted():
+    base_dir = tempfile.mkdtemp()
+    try:
+        run_storage = FileSystemRunStorage(base_dir)
+        for i in range(STEP_DURATION_HISTORY + 5):
+            for step_key in ['some_step.compute', 'other_step.compute']:
+                run_storage.write_step_duration_record(
+                    StepDurationRecord(
+                        run_id='run_{i}'.format(i=i),
+                        pipeline_name='some_pipeline',
+                        step_key=step_key,
+                        duration_ms=float(i),
+                    )
+                )
+        assert len(run_storage.get_step_duration_records('some_pipeline')) == 2 * (
+            STEP_DURATION_HISTORY + 5
+        )
+
+        # The next run compacts the file to the most recent records of each step
+        next_run_storage = FileSystemRunStorage(base_dir)
+        next_record = StepDurationRecord(
+            run_id='next_run',
+            pipeline_name='some_pipeline',
+            step_key='some_step.compute',
+            duration_ms=100.0,
+        )
+        next_run_storage.write_step_duration_record(next_record)
+
+        records = next_run_storage.get_step_duration_records('some_pipeline')
+        assert len(records) == 2 * STEP_DURATION_HISTORY + 1
+        assert records[-1] == next_record
+        assert [
+            record.duration_ms for record in records if record.step_key == 'other_step.compute'
+        ] == [float(i) for i in range(5, STEP_DURATION_HISTORY + 5)]
+    finally:
+        shutil.rmtree(base_dir)
+
+
+def test_filesystem_step_events():
+    with temp_run_storage() as run_storage:
+        do_test_step_events(run_storage)
+
+
+def test_in_memory_step_events():
+    do_test_step_events(InMemoryRunStorage())
+
+
+def do_test_step_events(run_storage):
+    assert run_storage.get_step_event_records('run_0') == []
+
+    records = [
+        StepEventRecord('run_0', 'some_step.compute', 'STEP_OUTPUT', 'result'),
+        StepEventRecord('run_0', 'some_step.compute', 'STEP_SUCCESS'),
+        StepEventRecord('run_1', 'some_step.compute', 'STEP_FAILURE'),
+    ]
+    for record in records:
+        run_storage.write_step_event_record(record)
+
+    assert run_storage.get_step_event_records('run_0') == records[:2]
+    assert run_storage.get_step_event_records('run_1') == records[2:]
+
+
+class MetaOnlyRunStorage(RunStorage):
+    '''A run storage implementing only what run storages had to before step records.'''
+
+    def __init__(self):
+        self._run_metas = {}
+
+    def write_dagster_run_meta(self, dagster_run_meta):
+        self._run_metas[dagster_run_meta.run_id] = dagster_run_meta
+
+    def get_run_ids(self):
+        return list(self._run_metas.keys())
+
+    def get_run_metas(self):
+        return list(self._run_metas.values())
+
+    def get_run_meta(self, run_id):
+        return self._run_metas[run_id]
+
+    def nuke(self):
+        self._run_metas = {}
+
+    @property
+    def is_persistent(self):
+        return False
+
+
+def test_run_storage_without_step_records():
+    run_storage = MetaOnlyRunStorage()
+
+    run_storage.write_step_duration_record(
+        StepDurationRecord('run_0', 'some_pipeline', 'some_step.compute', 5.0)
+    )
+    assert run_storage.get_step_duration_records('some_pipeline') == []
+    assert run_storage.get_step_duration_estimates('some_pipeline') == {}
+
+    run_storage.write_step_event_record(
+        StepEventRecord('run_0', 'some_step.compute', 'STEP_SUCCESS')
+    )
+    assert run_storage.get_step_event_records('run_0') == []
+
+
+def test_step_durations_recorded():
+    @solid
+    def sleepy(_context):
+        time.sleep(0.1)
+
+    pipeline = PipelineDefinition(name='step_durations_recorded_test', solids=[sleepy])
+
+    result = execute_pipeline(pipeline, environment_dict={'storage': {'filesystem': {}}})
+    assert result.success
+
+    records = [
+        record
+        for record in FileSystemRunStorage().get_step_duration_records(pipeline.name)
+        if record.run_id == result.run_id
+    ]
+    assert len(records) == 1
+    assert records[0].step_key == 'sleepy.compute'
+    # the whole compute function is timed
+    assert records[0].duration_ms >= 100
@@ -0,0 +1,141 @@
+from io import BytesIO
+
+import pytest
+
+from dagster import (
+    DagsterEventType,
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    as_dagster_type,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.check import CheckError
+from dagster.core.types.compression import (
+    COMPRESSION_CODECS,
+    CompressedSerializationStrategy,
+    available_compression_codecs,
+    record_compression_stats,
+)
+from dagster.core.types.marshal import PickleSerializationStrategy, StreamSerializationStrategy
+
+
+def _value():
+    return {
+        'rows': [{'id': index, 'name': 'row {index}'.format(index=index)} for index in range(1000)]
+    }
+
+
+@pytest.mark.parametrize('codec', available_compression_codecs())
+def test_compressed_serialization_strategy(codec):
+    serialization_strategy = CompressedSerializationStrategy(PickleSerializationStrategy(), codec)
+    buffer = BytesIO()
+    with record_compression_stats() as compression_stats:
+        stats = serialization_strategy.serialize(_value(), buffer)
+    assert compression_stats == [stats]
+
+    assert stats.codec == codec
+    assert stats.compressed_size == len(buffer.getvalue())
+    uncompressed = BytesIO()
+    PickleSerializationStrategy().serialize(_value(), uncompressed)
+    assert stats.uncompressed_size == len(uncompressed.getvalue())
+    assert stats.ratio > 2
+    assert stats.codec_ms >= 0
+
+    buffer.seek(0)
+    assert serialization_strategy.deserialize(buffer) == _value()
+
+
+def test_compression_codecs():
+    assert available_compression_codecs()[:2] == ['zlib', 'lzma']
+
+    with pytest.raises(CheckError, match='Unknown compression codec'):
+        CompressedSerializationStrategy(PickleSerializationStrategy(), 'gzip')
+
+    for codec in set(COMPRESSION_CODECS) - set(available_compression_codecs()):
+        with pytest.raises(CheckError, match='not installed'):
+            CompressedSerializationStrategy(PickleSerializationStrategy(), codec)
+
+    with pytest.raises(CheckError, match='Streams can not be compressed'):
+        CompressedSerializationStrategy(StreamSerializationStrategy())
+
+    # Values compressed outside of the block are not recorded
+    CompressedSerializationStrategy(PickleSerializationStrategy()).serialize(_value(), BytesIO())
+    with record_compression_stats() as compression_stats:
+        pass
+    assert compression_stats == []
+
+
+class Table(dict):
+    pass
+
+
+CompressedTable = as_dagster_type(
+    Table,
+    serialization_strategy=CompressedSerializationStrategy(
+        PickleSerializationStrategy(), 'lzma', level=1
+    ),
+)
+
+
+def define_compression_pipeline():
+    @lambda_solid
+    def load_rows():
+        return _value()
+
+    @lambda_solid(output=OutputDefinition(CompressedTable))
+    def load_table():
+        return Table(_value())
+
+    @lambda_solid(inputs=[InputDefinition('rows'), InputDefinition('table', CompressedTable)])
+    def count(rows, table):
+        return len(rows['rows']) + len(table['rows'])
+
+    return PipelineDefinition(
+        name='compression_pipeline',
+        solids=[load_rows, load_table, count],
+        dependencies={
+            'count': {
+                'rows': DependencyDefinition('load_rows'),
+                'table': DependencyDefinition('load_table'),
+            }
+        },
+    )
+
+
+def _compression_stats(result):
+    return {
+        event.step_key: event.step_output_data.compression_stats
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_OUTPUT
+    }
+
+
+def test_compressed_intermediates():
+    result = execute_pipeline(
+        define_compression_pipeline(), {'storage': {'filesystem': {'compression': 'zlib'}}}
+    )
+    assert result.success
+    assert result.result_for_solid('count').transformed_value() == 2000
+
+    compression_stats = _compression_stats(result)
+    assert compression_stats['load_rows.compute'].codec == 'zlib'
+    assert compression_stats['load_rows.compute'].ratio > 2
+    # Types compressing their values themselves are compressed as they do
+    assert compression_stats['load_table.compute'].codec == 'lzma'
+
+
+def test_compressed_type_intermediates():
+    result = execute_pipeline(define_compression_pipeline(), {'storage': {'filesystem': {}}})
+    assert result.success
+    assert result.result_for_solid('count').transformed_value() == 2000
+
+    compression_stats = _compression_stats(result)
+    assert compression_stats['load_rows.compute'] is None
+    assert compression_stats['load_table.compute'].codec == 'lzma'
+
+    # Values are not serialized in memory
+    compression_stats = _compression_stats(execute_pipeline(define_compression_pipeline()))
+    assert compression_stats['load_table.compute'] is None
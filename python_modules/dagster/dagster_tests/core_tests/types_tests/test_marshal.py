@@ -1,9 +1,18 @@
+from io import BytesIO
+import pickle
 import tempfile
 import os
 
 import pytest
+import six
 
-from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.check import CheckError
+from dagster.core.types.marshal import (
+    OutOfBandPickleSerializationStrategy,
+    PickleSerializationStrategy,
+    map_file,
+)
+from dagster.utils import PICKLE_PROTOCOL
 
 
 # https://dev.azure.com/elementl/dagster/_build/results?buildId=2941
@@ -15,3 +24,50 @@ def test_serialization_strategy():
     with tempfile.NamedTemporaryFile() as fd:
         serialization_strategy.serialize_to_file('foo', fd.name)
         assert serialization_strategy.deserialize_from_file(fd.name) == 'foo'
+
+
+@pytest.mark.skipif(
+    os.name == 'nt', reason='Azure pipelines does not let us use tempfile.NamedTemporaryFile'
+)
+def test_deserialize_from_mmap():
+    # Strategies that do not support reading from a mapping deserialize a copy of it
+    serialization_strategy = PickleSerializationStrategy()
+    assert not serialization_strategy.supports_mmap
+    with tempfile.NamedTemporaryFile() as fd:
+        serialization_strategy.serialize_to_file({'foo': 'bar'}, fd.name)
+        assert serialization_strategy.deserialize_from_mmap(map_file(fd.name)) == {'foo': 'bar'}
+
+
+class OutOfBandBuffer(object):
+    '''Hands its buffer to pickle protocol 5 out-of-band, as NumPy arrays do.'''
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return OutOfBandBuffer, (pickle.PickleBuffer(self.buffer),)
+        return OutOfBandBuffer, (bytes(self.buffer),)
+
+
+def test_pickle_protocol():
+    assert PickleSerializationStrategy().protocol == PICKLE_PROTOCOL == pickle.HIGHEST_PROTOCOL
+
+    buffer = BytesIO()
+    PickleSerializationStrategy(protocol=2).serialize('foo', buffer)
+    # The second byte of protocol 2+ pickles is the protocol
+    assert six.indexbytes(buffer.getvalue(), 1) == 2
+    buffer.seek(0)
+    assert PickleSerializationStrategy().deserialize(buffer) == 'foo'
+
+    with pytest.raises(CheckError):
+        PickleSerializationStrategy(protocol=pickle.HIGHEST_PROTOCOL + 1)
+
+
+def test_out_of_band_pickle_stream():
+    serialization_strategy = OutOfBandPickleSerializationStrategy()
+    for value in ['foo', OutOfBandBuffer(bytearray(b'abc' * 1000)), [OutOfBandBuffer(b'x')] * 3]:
+        buffer = BytesIO()
+        serialization_strategy.serialize(value, buffer)
+        buffer.seek(0)
+        assert pickle.dumps(serialization_strategy.deserialize(buffer), 2) == pickle.dumps(value, 2)
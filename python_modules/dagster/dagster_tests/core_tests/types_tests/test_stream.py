@@ -0,0 +1,173 @@
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    ExpectationDefinition,
+    ExpectationResult,
+    InProcessExecutorConfig,
+    InputDefinition,
+    Int,
+    MultiprocessExecutorConfig,
+    OutputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    RunStorageMode,
+    Stream,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.errors import (
+    DagsterExecutionStepExecutionError,
+    DagsterInvalidDefinitionError,
+    DagsterRuntimeCoercionError,
+)
+from dagster.core.types.marshal import StreamSerializationStrategy
+from dagster.core.types.runtime import resolve_to_runtime_type
+
+NUM_CHUNKS = 10
+
+
+def define_stream_pipeline(events, fail_at=None):
+    @lambda_solid(output=OutputDefinition(Stream))
+    def produce_chunks():
+        def _chunks():
+            for i in range(NUM_CHUNKS):
+                if i == fail_at:
+                    raise Exception('stream failed')
+                events.append(('produced', i))
+                yield [i] * 3
+
+        return _chunks()
+
+    @lambda_solid(inputs=[InputDefinition('chunks', Stream)], output=OutputDefinition(Int))
+    def sum_chunks(chunks):
+        total = 0
+        for chunk in chunks:
+            events.append(('consumed', chunk[0]))
+            total += sum(chunk)
+        return total
+
+    @lambda_solid(inputs=[InputDefinition('chunks', Stream)], output=OutputDefinition(Int))
+    def count_chunks(chunks):
+        return sum(1 for _ in chunks)
+
+    return PipelineDefinition(
+        name='stream_pipeline',
+        solids=[produce_chunks, sum_chunks, count_chunks],
+        dependencies={
+            'sum_chunks': {'chunks': DependencyDefinition('produce_chunks')},
+            'count_chunks': {'chunks': DependencyDefinition('produce_chunks')},
+        },
+    )
+
+
+def _check_stream_results(result):
+    assert result.success
+    assert result.result_for_solid('sum_chunks').transformed_value() == 3 * sum(range(NUM_CHUNKS))
+    assert result.result_for_solid('count_chunks').transformed_value() == NUM_CHUNKS
+
+
+def test_stream_type():
+    stream_type = resolve_to_runtime_type(Stream)
+    assert stream_type.is_stream
+    assert not resolve_to_runtime_type(Int).is_stream
+
+    chunks = iter([1, 2])
+    assert stream_type.coerce_runtime_value(chunks) is chunks
+
+    with pytest.raises(DagsterRuntimeCoercionError):
+        stream_type.coerce_runtime_value('not a stream')
+
+    with pytest.raises(DagsterRuntimeCoercionError):
+        stream_type.coerce_runtime_value(1)
+
+
+def test_stream_serialization_strategy(tmpdir):
+    path = str(tmpdir.join('stream'))
+    strategy = StreamSerializationStrategy()
+
+    strategy.serialize_to_file((i for i in range(3)), path)
+
+    chunks = strategy.deserialize_from_file(path)
+    assert next(chunks) == 0
+    assert list(chunks) == [1, 2]
+
+
+def test_stream_in_memory():
+    events = []
+    _check_stream_results(execute_pipeline(define_stream_pipeline(events)))
+
+
+def test_stream_filesystem():
+    events = []
+    result = execute_pipeline(
+        define_stream_pipeline(events), environment_dict={'storage': {'filesystem': {}}}
+    )
+    _check_stream_results(result)
+
+    # Chunks are persisted as they are produced, and read back as they are consumed
+    assert events == [('produced', i) for i in range(NUM_CHUNKS)] + [
+        ('consumed', i) for i in range(NUM_CHUNKS)
+    ]
+    assert list(result.result_for_solid('produce_chunks').transformed_value()) == [
+        [i] * 3 for i in range(NUM_CHUNKS)
+    ]
+
+
+def test_stream_failure():
+    events = []
+    result = execute_pipeline(
+        define_stream_pipeline(events, fail_at=5),
+        environment_dict={'storage': {'filesystem': {}}},
+        run_config=RunConfig(executor_config=InProcessExecutorConfig(raise_on_error=False)),
+    )
+    assert not result.success
+    assert not result.result_for_solid('produce_chunks').success
+    assert 'stream failed' in result.result_for_solid('produce_chunks').failure_data.error.message
+
+    with pytest.raises(DagsterExecutionStepExecutionError):
+        execute_pipeline(define_stream_pipeline([], fail_at=5))
+
+
+def define_chunk_count_pipeline():
+    @lambda_solid(output=OutputDefinition(Stream))
+    def produce_chunks():
+        return (i for i in range(NUM_CHUNKS))
+
+    @lambda_solid(inputs=[InputDefinition('chunks', Stream)], output=OutputDefinition(Int))
+    def count_chunks(chunks):
+        return sum(1 for _ in chunks)
+
+    return PipelineDefinition(
+        name='chunk_count_pipeline',
+        solids=[produce_chunks, count_chunks],
+        dependencies={'count_chunks': {'chunks': DependencyDefinition('produce_chunks')}},
+    )
+
+
+def test_stream_expectations_rejected():
+    not_empty = ExpectationDefinition(
+        'not_empty', lambda _context, chunks: ExpectationResult(success=any(True for _ in chunks))
+    )
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='can not declare expectations'):
+        OutputDefinition(Stream, expectations=[not_empty])
+
+    with pytest.raises(DagsterInvalidDefinitionError, match='can not declare expectations'):
+        InputDefinition('chunks', Stream, expectations=[not_empty])
+
+
+def test_stream_multiprocess():
+    result = execute_pipeline(
+        define_chunk_count_pipeline(),
+        environment_dict={'storage': {'filesystem': {}}},
+        run_config=RunConfig(
+            storage_mode=RunStorageMode.FILESYSTEM,
+            executor_config=MultiprocessExecutorConfig(
+                ExecutionTargetHandle.for_pipeline_fn(define_chunk_count_pipeline)
+            ),
+        ),
+    )
+    assert result.success
+    assert result.result_for_solid('count_chunks').transformed_value() == NUM_CHUNKS
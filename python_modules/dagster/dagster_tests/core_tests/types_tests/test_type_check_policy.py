@@ -0,0 +1,172 @@
+from io import BytesIO
+
+import pytest
+
+from dagster import (
+    Bytes,
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    List,
+    Nullable,
+    OutputDefinition,
+    PipelineConfigEvaluationError,
+    PipelineDefinition,
+    TypeCheckPolicy,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.errors import DagsterInvariantViolationError, DagsterRuntimeCoercionError
+from dagster.core.types.runtime import MAX_SAMPLED_ITEMS, resolve_to_runtime_type
+
+
+class CountingInt(object):
+    '''Counts the items checked, by coercing every item to itself.'''
+
+    def __init__(self):
+        self.checked = 0
+
+    def __call__(self, value):
+        self.checked += 1
+        return value
+
+
+def test_list_checked_in_place(monkeypatch):
+    list_type = resolve_to_runtime_type(List(Int))
+    value = list(range(1000))
+    assert list_type.coerce_runtime_value_with_policy(value, TypeCheckPolicy.SAMPLED) is value
+    assert list_type.coerce_runtime_value_with_policy(value, TypeCheckPolicy.SHAPE_ONLY) is value
+
+    # Lists are copied under the default policy
+    for coerced in [
+        list_type.coerce_runtime_value_with_policy(value, TypeCheckPolicy.FULL),
+        list_type.coerce_runtime_value(value),
+    ]:
+        assert coerced is not value
+        assert coerced == value
+
+    counter = CountingInt()
+    monkeypatch.setattr(list_type.inner_type, 'coerce_runtime_value', counter)
+    list_type.coerce_runtime_value_with_policy(value, TypeCheckPolicy.FULL)
+    assert counter.checked == 1000
+
+    counter.checked = 0
+    list_type.coerce_runtime_value_with_policy(value, TypeCheckPolicy.SAMPLED)
+    assert counter.checked == MAX_SAMPLED_ITEMS
+
+    counter.checked = 0
+    list_type.coerce_runtime_value_with_policy(value, TypeCheckPolicy.SHAPE_ONLY)
+    assert counter.checked == 1
+
+
+def test_type_check_policies():
+    list_type = resolve_to_runtime_type(List(Int))
+    invalid_item_value = list(range(1000))
+    invalid_item_value[1] = 'one'
+
+    with pytest.raises(DagsterRuntimeCoercionError):
+        list_type.coerce_runtime_value_with_policy(invalid_item_value, TypeCheckPolicy.FULL)
+
+    # Only the first and last items, and those spread evenly between them, are sampled
+    assert (
+        list_type.coerce_runtime_value_with_policy(invalid_item_value, TypeCheckPolicy.SAMPLED)
+        is invalid_item_value
+    )
+    invalid_item_value[-1] = 'last'
+    with pytest.raises(DagsterRuntimeCoercionError):
+        list_type.coerce_runtime_value_with_policy(invalid_item_value, TypeCheckPolicy.SAMPLED)
+
+    for policy in TypeCheckPolicy:
+        with pytest.raises(DagsterRuntimeCoercionError):
+            list_type.coerce_runtime_value_with_policy((1, 2), policy)
+
+    nullable_type = resolve_to_runtime_type(Nullable(List(Int)))
+    assert nullable_type.coerce_runtime_value_with_policy(None, TypeCheckPolicy.SAMPLED) is None
+    assert nullable_type.coerce_runtime_value_with_policy(
+        invalid_item_value, TypeCheckPolicy.SHAPE_ONLY
+    )
+
+
+def test_converted_items_copied():
+    list_type = resolve_to_runtime_type(List(Bytes))
+    value = [b'foo'] * 1000
+
+    # The items are converted to BytesIO, so all of them are whatever the policy
+    for policy in TypeCheckPolicy:
+        coerced = list_type.coerce_runtime_value_with_policy(value, policy)
+        assert coerced is not value
+        assert all(isinstance(item, BytesIO) for item in coerced)
+        assert value == [b'foo'] * 1000
+
+
+def define_policy_pipeline(type_check_policy=TypeCheckPolicy.FULL):
+    @lambda_solid(output=OutputDefinition(List(Int)))
+    def produce_numbers():
+        return list(range(1000)) + ['not an int']
+
+    @lambda_solid(inputs=[InputDefinition('nums', List(Int))])
+    def count(nums):
+        return len(nums)
+
+    return PipelineDefinition(
+        name='policy_pipeline',
+        solids=[produce_numbers, count],
+        dependencies={'count': {'nums': DependencyDefinition('produce_numbers')}},
+        type_check_policy=type_check_policy,
+    )
+
+
+def define_mutating_pipeline(type_check_policy):
+    @lambda_solid(output=OutputDefinition(List(Int)))
+    def produce_numbers():
+        return [1, 2, 3]
+
+    @lambda_solid(inputs=[InputDefinition('nums', List(Int))], output=OutputDefinition(List(Int)))
+    def append_number(nums):
+        nums.append(4)
+        return nums
+
+    return PipelineDefinition(
+        name='mutating_pipeline',
+        solids=[produce_numbers, append_number],
+        dependencies={'append_number': {'nums': DependencyDefinition('produce_numbers')}},
+        type_check_policy=type_check_policy,
+    )
+
+
+def test_list_inputs_aliasing():
+    result = execute_pipeline(define_mutating_pipeline(TypeCheckPolicy.FULL))
+    assert result.success
+    assert result.result_for_solid('produce_numbers').transformed_value() == [1, 2, 3]
+    assert result.result_for_solid('append_number').transformed_value() == [1, 2, 3, 4]
+
+    # In memory, the solids share the list when it is checked in place
+    result = execute_pipeline(define_mutating_pipeline(TypeCheckPolicy.SHAPE_ONLY))
+    assert result.success
+    assert result.result_for_solid('produce_numbers').transformed_value() == [1, 2, 3, 4]
+
+
+def test_pipeline_type_check_policy():
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(define_policy_pipeline())
+
+    result = execute_pipeline(define_policy_pipeline(TypeCheckPolicy.SHAPE_ONLY))
+    assert result.success
+    assert result.result_for_solid('count').transformed_value() == 1001
+
+
+def test_run_type_check_policy():
+    result = execute_pipeline(
+        define_policy_pipeline(), {'execution': {'type_check_policy': 'SHAPE_ONLY'}}
+    )
+    assert result.success
+
+    # The config of the run overrides the policy of the pipeline
+    with pytest.raises(DagsterInvariantViolationError):
+        execute_pipeline(
+            define_policy_pipeline(TypeCheckPolicy.SHAPE_ONLY),
+            {'execution': {'type_check_policy': 'FULL'}},
+        )
+
+    with pytest.raises(PipelineConfigEvaluationError):
+        execute_pipeline(define_policy_pipeline(), {'execution': {'type_check_policy': 'NONE'}})
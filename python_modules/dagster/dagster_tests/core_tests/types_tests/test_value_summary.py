@@ -0,0 +1,136 @@
+from collections import OrderedDict
+import logging
+
+from dagster import (
+    DagsterEventType,
+    Int,
+    List,
+    OutputDefinition,
+    PipelineDefinition,
+    RunConfig,
+    as_dagster_type,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.types.runtime import resolve_to_runtime_type
+from dagster.core.types.summary import MAX_SUMMARY_ITEMS, MAX_SUMMARY_LENGTH, summarize_value
+
+
+class FakeDataFrame(object):
+    shape = (10000000, 3)
+    columns = ['num1', 'num2', 'sum']
+    dtypes = None
+
+    def __repr__(self):
+        raise Exception('The repr of a DataFrame is too large to compute')
+
+
+class FakeArray(object):
+    shape = (1000, 1000)
+    dtype = 'float64'
+
+    def __repr__(self):
+        raise Exception('The repr of an array is too large to compute')
+
+
+def test_summarize_small_values():
+    for value in [
+        1,
+        'foo',
+        None,
+        [1, 2, 3],
+        (1,),
+        (1, 2),
+        {'foo': [1, 'bar']},
+        set(),
+        {1},
+        frozenset([1]),
+        OrderedDict([('num1', '1'), ('num2', '2')]),
+    ]:
+        assert summarize_value(value) == repr(value)
+
+
+def test_summarize_large_values():
+    summary = summarize_value(list(range(1000000)))
+    assert summary.startswith('[0, 1, 2')
+    assert summary.endswith(', ...]')
+    assert summary.count(',') == MAX_SUMMARY_ITEMS
+
+    summary = summarize_value({i: str(i) for i in range(1000)})
+    assert summary.startswith("{0: '0', 1: '1'")
+    assert summary.endswith(', ...}')
+
+    summary = summarize_value('x' * 10000000)
+    assert len(summary) == MAX_SUMMARY_LENGTH
+    assert summary.endswith('...')
+
+    assert summarize_value([[[[[[1]]]]]]) == '[[[[...]]]]'
+    assert summarize_value(OrderedDict((i, i) for i in range(1000))) == (
+        '<OrderedDict of 1000 items>'
+    )
+    assert len(summarize_value([['x' * 100] * 10] * 10)) == MAX_SUMMARY_LENGTH
+
+
+def test_summarize_data_frames_and_arrays():
+    assert summarize_value(FakeDataFrame()) == (
+        '<FakeDataFrame shape=(10000000, 3) columns=[num1, num2, sum]>'
+    )
+    assert summarize_value(FakeArray()) == '<FakeArray shape=(1000, 1000) dtype=float64>'
+    assert summarize_value([FakeArray()]) == '[<FakeArray shape=(1000, 1000) dtype=float64>]'
+
+
+class Table(object):
+    def __init__(self, num_rows):
+        self.num_rows = num_rows
+
+
+TableType = as_dagster_type(
+    Table, value_summarizer=lambda table: '<Table of {} rows>'.format(table.num_rows)
+)
+
+
+def test_type_value_summarizer():
+    runtime_type = resolve_to_runtime_type(TableType)
+    assert runtime_type.summarize_value(Table(10)) == '<Table of 10 rows>'
+    assert resolve_to_runtime_type(List(TableType)).summarize_value([Table(1), Table(2)]) == (
+        '[<Table of 1 rows>, <Table of 2 rows>]'
+    )
+
+
+def define_table_pipeline():
+    @lambda_solid(output=OutputDefinition(TableType))
+    def load_table():
+        return Table(10000000)
+
+    @lambda_solid(output=OutputDefinition(List(Int)))
+    def load_numbers():
+        return list(range(1000))
+
+    return PipelineDefinition(name='table_pipeline', solids=[load_table, load_numbers])
+
+
+def _value_reprs(result):
+    return {
+        event.step_key: event.step_output_data.value_repr
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_OUTPUT
+    }
+
+
+def test_step_output_value_repr():
+    value_reprs = _value_reprs(execute_pipeline(define_table_pipeline()))
+    assert value_reprs['load_table.compute'] == '<Table of 10000000 rows>'
+    assert value_reprs['load_numbers.compute'].endswith(', ...]')
+
+
+def test_step_output_value_repr_without_info_logger():
+    logger = logging.getLogger('test_step_output_value_repr_without_info_logger')
+    logger.setLevel(logging.WARNING)
+
+    # The events are returned to the caller, so their values are summarized even if no logger
+    # receives them
+    value_reprs = _value_reprs(
+        execute_pipeline(define_table_pipeline(), run_config=RunConfig(loggers=[logger]))
+    )
+    assert value_reprs['load_table.compute'] == '<Table of 10000000 rows>'
+    assert value_reprs['load_numbers.compute'].endswith(', ...]')
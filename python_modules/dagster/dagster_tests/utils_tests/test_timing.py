@@ -1,6 +1,9 @@
+import time
+
 import pytest
 
-from dagster.utils.timing import time_execution_scope, TimerResult
+from dagster import seven
+from dagster.utils.timing import time_execution_scope, PhaseTimer, TimerResult
 
 
 def test_basic_usage():
@@ -20,3 +23,30 @@ def test_wrong_usage():
     with pytest.raises(Exception):
         timer_result = TimerResult()
         assert timer_result.seconds
+
+
+def test_phase_timer():
+    phase_timer = PhaseTimer(['load', 'compute'])
+
+    with phase_timer.time_phase('load'):
+        time.sleep(0.01)
+
+    def _items():
+        for item in range(2):
+            time.sleep(0.01)
+            yield item
+
+    for _ in phase_timer.time_iterator('compute', _items()):
+        # Time spent consuming the items is not counted
+        time.sleep(0.05)
+
+    phase_timer.end_time = seven.time_fn()
+    millis_by_phase = phase_timer.millis_by_phase
+    assert set(millis_by_phase.keys()) == {'load', 'compute'}
+    assert millis_by_phase['load'] >= 10
+    assert 20 <= millis_by_phase['compute'] < 100
+    assert phase_timer.millis >= 130
+
+    with pytest.raises(Exception):
+        with phase_timer.time_phase('unknown'):
+            pass
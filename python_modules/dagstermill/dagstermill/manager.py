@@ -9,6 +9,7 @@ from dagster import check, Materialization, ModeDefinition, PipelineDefinition,
 from dagster.core.execution.api import scoped_pipeline_context
 from dagster.core.execution.context.logger import InitLoggerContext
 from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.utils import PICKLE_PROTOCOL
 
 from .context import DagstermillInNotebookExecutionContext
 from .errors import DagstermillError
@@ -16,7 +17,6 @@ from .logger import construct_logger
 from .serialize import (
     dict_to_enum,
     is_json_serializable,
-    PICKLE_PROTOCOL,
     SerializableRuntimeType,
     write_value,
 )
@@ -4,9 +4,6 @@ from dagster import check, RuntimeType, seven
 from dagster.core.types.marshal import PickleSerializationStrategy
 
 
-PICKLE_PROTOCOL = 2
-
-
 def is_json_serializable(value):
     try:
         seven.json.dumps(value)
@@ -31,7 +31,7 @@ def test_run_id():
 
 def test_environment_dict():
     assert OUT_OF_PIPELINE_CONTEXT.environment_dict == {
-        'execution': {},
+        'execution': {'gc_intermediates': False, 'memoize_outputs': True},
         'expectations': {'evaluate': True},
         'loggers': {},
         'resources': {},
@@ -5,7 +5,7 @@ from .object_store import S3ObjectStore
 
 
 class S3IntermediateStore(IntermediateStore):
-    def __init__(self, s3_bucket, run_id, types_to_register=None):
+    def __init__(self, s3_bucket, run_id, types_to_register=None, compression=None):
         check.str_param(s3_bucket, 's3_bucket')
         check.str_param(run_id, 'run_id')
         self.storage_mode = RunStorageMode.S3
@@ -14,7 +14,7 @@ class S3IntermediateStore(IntermediateStore):
         root = object_store.key_for_paths(['dagster', 'runs', run_id, 'files'])
 
         super(S3IntermediateStore, self).__init__(
-            object_store, root, types_to_register=types_to_register
+            object_store, root, types_to_register=types_to_register, compression=compression
         )
 
     def copy_object_from_prev_run(